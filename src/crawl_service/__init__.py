@@ -0,0 +1,24 @@
+from .crawl_service import (
+    CrawlService,
+    CrawlJob,
+    iter_crawl_events,
+)
+
+from .models import (
+    CrawlJobRequest,
+    QueuedJob,
+)
+
+from .http_api import (
+    create_server,
+    UnixHTTPServer,
+)
+
+from .job_queue import (
+    JobQueue,
+)
+
+from .worker import (
+    CrawlWorker,
+    run_workers,
+)
\ No newline at end of file
@@ -0,0 +1,17 @@
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_MAX_CONCURRENT_JOBS = 2
+SERVICE_MAX_FINISHED_JOBS = 100
+SERVICE_THREAD_NAME = "crawl-job"
+SERVICE_MAX_REQUEST_BYTES = 64 * 1024
+JSON_CONTENT_TYPE = "application/json"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+UTF8_ENCODING = "utf-8"
+MAX_SUBLINKS = 200
+MAX_PROFILES = 200
+JOB_LEASE_SECONDS = 300
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_DELAY_SECONDS = 30
+JOB_QUEUE_BUSY_TIMEOUT_SECONDS = 30
+WORKER_POLL_SECONDS = 2.0
+WORKER_PROCESS_NAME = "crawl-worker"
\ No newline at end of file
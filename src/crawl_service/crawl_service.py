@@ -0,0 +1,295 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from crawl_service import constants as Constants
+from dataclasses import asdict
+from datetime import datetime, timezone
+from globals.enums import DataRegion, JobStatus, LogLevel
+from globals.run_logger import run_logger
+from linkedin_links import SearchBackend, SearchCache, fetch_links, match_names
+from website import Fetcher, PooledWebDriverFetcher, WebDriverNode, WebsiteInfoAccumulator, iter_parse
+from website.model_registry import model_registry
+from .models import CrawlJobRequest
+import threading
+import uuid
+
+class CrawlJob:
+    """A crawl of the service and the events it produced so far.
+    The events are kept until the job is evicted, so the results can be streamed from the start at any time.
+
+    Attributes:
+        id (str): Identifier of the job
+        request (CrawlJobRequest): The submitted crawl
+        status (JobStatus): The current status
+        error (str | None): The error of the failed job
+
+    Methods:
+        add_event(event): Append an event and wake up the readers
+        finish(status, error): Set the final status and wake up the readers
+        get_events(start, timeout) -> tuple[list[dict], bool]: Return the events from the given index
+        to_dict() -> dict: Return the status of the job as JSON-compatible data
+    """
+
+    def __init__(self, request: CrawlJobRequest):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = JobStatus.QUEUED
+        self.error: str | None = None
+        self._events: list[dict] = []
+        self._pages = 0
+        self._created_at = _get_timestamp()
+        self._started_at: str | None = None
+        self._finished_at: str | None = None
+        self._condition = threading.Condition()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def start(self):
+        """Mark the job as running."""
+        with self._condition:
+            self.status = JobStatus.RUNNING
+            self._started_at = _get_timestamp()
+
+    def add_event(self, event: dict):
+        """Append an event and wake up the readers waiting for it.
+
+        Arguments:
+            event (dict): JSON-compatible event, e.g. the entities of a parsed page
+        """
+        with self._condition:
+            self._events.append(event)
+            if event.get("event") == "page":
+                self._pages += 1
+            self._condition.notify_all()
+
+    def finish(self, status: JobStatus, error: str | None = None):
+        """Set the final status, add the end event and wake up the readers.
+
+        Arguments:
+            status (JobStatus): SUCCEEDED or FAILED
+            error (str | None): The error of the failed job
+        """
+        with self._condition:
+            self.status = status
+            self.error = error
+            self._finished_at = _get_timestamp()
+            self._events.append({"event": "end", "status": status.value, "error": error})
+            self._condition.notify_all()
+
+    def get_events(self, start: int, timeout: float | None = None) -> tuple[list[dict], bool]:
+        """Return the events from the given index, waiting for new events if there are none yet.
+
+        Arguments:
+            start (int): Index of the first event to return
+            timeout (float | None): Maximum seconds to wait for a new event, None waits until one arrives
+
+        Returns:
+            tuple[list[dict], bool]: The events, and True if the job is finished and no more events will come
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._events) > start or self.is_finished, timeout)
+            return self._events[start:], self.is_finished
+
+    def to_dict(self) -> dict:
+        """Return the status of the job as JSON-compatible data."""
+        with self._condition:
+            return {
+                "id": self.id,
+                "status": self.status.value,
+                "request": self.request.to_dict(),
+                "pages": self._pages,
+                "events": len(self._events),
+                "error": self.error,
+                "created_at": self._created_at,
+                "started_at": self._started_at,
+                "finished_at": self._finished_at,
+            }
+
+class CrawlService:
+    """Long-running crawler keeping the NLP models and the browser sessions warm between the jobs.
+    The jobs run on a thread pool and share the fetcher, so a job only pays for the crawling itself.
+    The finished jobs are kept for their results until more than max_finished_jobs jobs are finished.
+    Without a fetcher, the pages are rendered by a PooledWebDriverFetcher on the given WebDriver nodes.
+
+    Attributes:
+        fetcher (Fetcher): Source of the HTML of the pages of every job
+
+    Methods:
+        start(): Load the models and open the browser sessions
+        submit(request) -> CrawlJob: Queue a crawl
+        get_job(job_id) -> CrawlJob: Return a job
+        list_jobs() -> list[CrawlJob]: Return every kept job
+        iter_events(job_id, start) -> Iterator[dict]: Yield the events of a job as they are produced
+        close(): Wait for the running jobs, then close the fetcher
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        regions: Iterable[DataRegion] = tuple(DataRegion),
+        max_concurrent_jobs: int = Constants.SERVICE_MAX_CONCURRENT_JOBS,
+        max_finished_jobs: int = Constants.SERVICE_MAX_FINISHED_JOBS,
+        search_cache: SearchCache | None = None,
+        search_backend: SearchBackend | None = None,
+        webdriver_nodes: Iterable[WebDriverNode] | None = None,
+    ):
+        if fetcher is not None and not isinstance(fetcher, Fetcher):
+            raise TypeError(f"Invalid fetcher type. Expected type: Fetcher, actual type: {type(fetcher)}")
+        if not isinstance(max_concurrent_jobs, int) or max_concurrent_jobs < 1:
+            raise ValueError("The number of concurrent jobs must be a positive integer")
+        if not isinstance(max_finished_jobs, int) or max_finished_jobs < 0:
+            raise ValueError("The number of kept finished jobs must be a non-negative integer")
+
+        if fetcher is None:
+            fetcher = PooledWebDriverFetcher(max_sessions=max_concurrent_jobs, nodes=webdriver_nodes)
+        self.fetcher = fetcher
+        self._regions = tuple(regions)
+        self._max_finished_jobs = max_finished_jobs
+        self._search_cache = search_cache
+        self._search_backend = search_backend
+        self._jobs: OrderedDict[str, CrawlJob] = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_jobs, thread_name_prefix=Constants.SERVICE_THREAD_NAME)
+
+    def __enter__(self) -> "CrawlService":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """Load the NLP models in the background and open the browser sessions."""
+        model_registry.warm_up(self._regions)
+        try:
+            self.fetcher.warm_up()
+        except Exception as e:
+            # The sessions are opened again by the first pages, the service can start without the browser
+            run_logger.log_message(f"Failed to warm up the fetcher: {e}", LogLevel.WARNING)
+
+    def submit(self, request: CrawlJobRequest) -> CrawlJob:
+        """Queue a crawl, it starts as soon as a worker thread is free.
+
+        Arguments:
+            request (CrawlJobRequest): The crawl to run
+
+        Returns:
+            CrawlJob: The queued job
+        """
+        if not isinstance(request, CrawlJobRequest):
+            raise TypeError(f"Invalid request type. Expected type: CrawlJobRequest, actual type: {type(request)}")
+
+        job = CrawlJob(request)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run_job, job)
+        run_logger.log_message(f"Job {job.id} queued: {request.link}")
+        return job
+
+    def get_job(self, job_id: str) -> CrawlJob:
+        """Return a job.
+
+        Arguments:
+            job_id (str): Identifier of the job
+
+        Returns:
+            CrawlJob: The job
+
+        Raises:
+            KeyError: If the job doesn't exist or was evicted
+        """
+        with self._lock:
+            return self._jobs[job_id]
+
+    def list_jobs(self) -> list[CrawlJob]:
+        """Return every kept job in the order they were submitted."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def iter_events(self, job_id: str, start: int = 0) -> Iterator[dict]:
+        """Yield the events of a job as they are produced, until the end event of the job.
+
+        Arguments:
+            job_id (str): Identifier of the job
+            start (int): Index of the first event, so a reader can continue where it stopped
+
+        Returns:
+            Iterator[dict]: The page, profile and end events of the job
+        """
+        job = self.get_job(job_id)
+        is_finished = False
+        while not is_finished:
+            events, is_finished = job.get_events(start)
+            start += len(events)
+            yield from events
+
+    def close(self):
+        """Wait for the running jobs, drop the queued ones, then close the fetcher."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.fetcher.close()
+
+    def _run_job(self, job: CrawlJob):
+        """Crawl the website of the job, then search the LinkedIn profiles if requested."""
+        job.start()
+        try:
+            for event in iter_crawl_events(job.request, self.fetcher, self._search_cache, self._search_backend):
+                job.add_event(event)
+        except Exception as e:
+            run_logger.log_message(f"Job {job.id} failed: {e}", LogLevel.ERROR)
+            job.finish(JobStatus.FAILED, f"{type(e).__name__}: {e}")
+        else:
+            run_logger.log_message(f"Job {job.id} completed", LogLevel.SUCCESS)
+            job.finish(JobStatus.SUCCEEDED)
+        finally:
+            self._evict_finished_jobs()
+
+    def _evict_finished_jobs(self):
+        """Drop the oldest finished jobs above the limit of kept finished jobs."""
+        with self._lock:
+            finished_job_ids = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+            for job_id in finished_job_ids[:max(len(finished_job_ids) - self._max_finished_jobs, 0)]:
+                del self._jobs[job_id]
+
+def iter_crawl_events(
+    request: CrawlJobRequest,
+    fetcher: Fetcher,
+    search_cache: SearchCache | None = None,
+    search_backend: SearchBackend | None = None,
+) -> Iterator[dict]:
+    """Crawl the website of the request, then search the LinkedIn profiles if requested.
+
+    Arguments:
+        request (CrawlJobRequest): The crawl to run
+        fetcher (Fetcher): Source of the HTML of the pages
+        search_cache (SearchCache | None): Cache of the LinkedIn profile searches
+        search_backend (SearchBackend | None): Search engine of the LinkedIn profiles, DuckDuckGo if None
+
+    Returns:
+        Iterator[dict]: A page event per parsed page, then a profiles event if profiles were requested.
+            A failed search doesn't fail the crawl, the profiles event carries its error instead
+    """
+    info = WebsiteInfoAccumulator()
+    for page_result in iter_parse(request.link, request.sublinks, request.region, info, fetcher=fetcher):
+        yield {
+            "event": "page",
+            "url": page_result.url,
+            "entities": {entity_type.value: entities for entity_type, entities in page_result.new_entities.items()},
+            "timings": page_result.timings,
+        }
+
+    if request.company is not None and request.profiles > 0:
+        try:
+            profiles = fetch_links(request.company, request.profiles, request.region, search_cache, search_backend)
+        except Exception as e:
+            # The page events are already sent, retrying the job would crawl the website again
+            run_logger.log_message(f"Failed to search the LinkedIn profile links of {request.company}: {e}", LogLevel.ERROR)
+            yield {"event": "profiles", "profiles": dict(), "matches": [], "error": f"{type(e).__name__}: {e}"}
+            return
+        matches = match_names(info.snapshot().found_names, profiles)
+        yield {"event": "profiles", "profiles": profiles, "matches": [asdict(match) for match in matches], "error": None}
+
+def _get_timestamp() -> str:
+    """Get the current UTC time in ISO 8601 format."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
\ No newline at end of file
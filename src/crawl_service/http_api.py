@@ -0,0 +1,139 @@
+from crawl_service import constants as Constants
+from globals.run_logger import run_logger
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import BaseServer, ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlsplit
+from website import PooledWebDriverFetcher
+from .crawl_service import CrawlService
+from .models import CrawlJobRequest
+import json
+import os
+import re
+
+_JOB_PATH_REGEX = re.compile(r"^/jobs/([0-9a-f]+)(/results)?$")
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """HTTP server listening on a Unix socket, only reachable by the users allowed to open the socket file."""
+
+    daemon_threads = True
+
+def create_server(
+    service: CrawlService, host: str = Constants.SERVICE_HOST, port: int = Constants.SERVICE_PORT, socket_path: str | None = None
+) -> BaseServer:
+    """Create the HTTP server of the crawl service API.
+
+    Endpoints:
+        GET /health: The number of jobs by status, and the load of the WebDriver nodes of a pooled fetcher
+        POST /jobs: Submit a crawl, the body is a CrawlJobRequest as JSON, returns the queued job
+        GET /jobs: The status of every kept job
+        GET /jobs/<id>: The status of a job
+        GET /jobs/<id>/results?start=<index>: Stream the events of a job as JSON lines until the job ends
+
+    Arguments:
+        service (CrawlService): The service running the jobs
+        host (str): Address of the TCP server
+        port (int): Port of the TCP server, a free port is chosen if 0
+        socket_path (str | None): Path of a Unix socket to listen on instead of TCP, replaced if it exists
+
+    Returns:
+        BaseServer: The server, run it with serve_forever
+    """
+    if not isinstance(service, CrawlService):
+        raise TypeError(f"Invalid service type. Expected type: CrawlService, actual type: {type(service)}")
+
+    handler = _get_request_handler(service)
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return UnixHTTPServer(socket_path, handler)
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def _get_request_handler(service: CrawlService) -> type[BaseHTTPRequestHandler]:
+    """Create the request handler class of the API bound to the service."""
+
+    class CrawlServiceRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = urlsplit(self.path).path.rstrip("/") or "/"
+            if path == "/health":
+                status_counts: dict[str, int] = dict()
+                for job in service.list_jobs():
+                    status_counts[job.status.value] = status_counts.get(job.status.value, 0) + 1
+                health = {"status": "ok", "jobs": status_counts}
+                if isinstance(service.fetcher, PooledWebDriverFetcher):
+                    health["webdriver_nodes"] = service.fetcher.get_node_loads()
+                self._send_json(HTTPStatus.OK, health)
+                return
+            if path == "/jobs":
+                self._send_json(HTTPStatus.OK, [job.to_dict() for job in service.list_jobs()])
+                return
+
+            path_match = _JOB_PATH_REGEX.match(path)
+            if path_match is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {path}"})
+                return
+            try:
+                job = service.get_job(path_match.group(1))
+            except KeyError:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown job: {path_match.group(1)}"})
+                return
+
+            if path_match.group(2) is None:
+                self._send_json(HTTPStatus.OK, job.to_dict())
+            else:
+                self._stream_events(job.id)
+
+        def do_POST(self):
+            if urlsplit(self.path).path.rstrip("/") != "/jobs":
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+                return
+
+            content_length = int(self.headers.get("Content-Length") or 0)
+            if content_length > Constants.SERVICE_MAX_REQUEST_BYTES:
+                self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "The request is too large"})
+                return
+            try:
+                request = CrawlJobRequest.from_dict(json.loads(self.rfile.read(content_length) or b"null"))
+            except (json.JSONDecodeError, ValueError) as e:
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+                return
+
+            job = service.submit(request)
+            self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+
+        def log_message(self, format: str, *args):
+            # The client address of a Unix socket is empty, so the default format can't be used
+            run_logger.log_message(f"{self.command} {self.path}: " + format % args)
+
+        def _send_json(self, status: HTTPStatus, data):
+            body = json.dumps(data, ensure_ascii=False).encode(Constants.UTF8_ENCODING)
+            self.send_response(status)
+            self.send_header("Content-Type", Constants.JSON_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream_events(self, job_id: str):
+            start = parse_qs(urlsplit(self.path).query).get("start", ["0"])[0]
+            if not start.isdigit():
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "The start of the results must be a non-negative integer"})
+                return
+
+            # Without a length, the end of the stream is the end of the connection
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", Constants.NDJSON_CONTENT_TYPE)
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            try:
+                for event in service.iter_events(job_id, int(start)):
+                    self.wfile.write(json.dumps(event, ensure_ascii=False).encode(Constants.UTF8_ENCODING) + b"\n")
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # The client stopped reading, it can continue later from the last received event
+                pass
+
+    return CrawlServiceRequestHandler
\ No newline at end of file
@@ -0,0 +1,324 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from crawl_service import constants as Constants
+from globals.enums import JobStatus
+from .models import CrawlJobRequest, QueuedJob
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    available_at REAL NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_index ON jobs (status, available_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id INTEGER NOT NULL REFERENCES jobs (id),
+    event_index INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (job_id, event_index)
+);
+"""
+
+_INSERT_JOB = """
+INSERT INTO jobs (request, status, available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?)
+"""
+_SELECT_CLAIMABLE_JOB = """
+SELECT id, attempts FROM jobs
+WHERE (status = :queued AND available_at <= :now) OR (status = :running AND lease_expires_at <= :now)
+ORDER BY id LIMIT 1
+"""
+_CLAIM_JOB = """
+UPDATE jobs SET status = ?, attempts = attempts + 1, worker_id = ?, lease_expires_at = ?, updated_at = ? WHERE id = ?
+"""
+_EXPIRE_JOB = "UPDATE jobs SET status = ?, lease_expires_at = NULL, error = ?, updated_at = ? WHERE id = ?"
+_RENEW_LEASE = """
+UPDATE jobs SET lease_expires_at = ?, updated_at = ? WHERE id = ? AND worker_id = ? AND status = ?
+"""
+_FINISH_JOB = """
+UPDATE jobs SET status = ?, lease_expires_at = NULL, available_at = ?, error = ?, updated_at = ?
+WHERE id = ? AND worker_id = ? AND status = ?
+"""
+_SELECT_JOB = "SELECT id, request, status, attempts, worker_id, error FROM jobs WHERE id = ?"
+_SELECT_ATTEMPTS = "SELECT attempts FROM jobs WHERE id = ?"
+_DELETE_EVENTS = "DELETE FROM job_events WHERE job_id = ?"
+_INSERT_EVENT = "INSERT INTO job_events (job_id, event_index, event) VALUES (?, ?, ?)"
+_SELECT_EVENTS = "SELECT event FROM job_events WHERE job_id = ? ORDER BY event_index"
+_COUNT_JOBS = "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+
+class JobQueue:
+    """Persistent SQLite queue of crawl jobs shared by the worker processes.
+    A worker claims a job with a lease and renews it while the job runs. A job whose lease expires, e.g. because its
+    worker was killed, is claimed again by another worker. A failed job is retried after an increasing delay until
+    it was attempted max_attempts times. The events of a job are stored with its completion in one transaction.
+    The database is shared by the processes of a single machine and must be on a local file system,
+    the WAL journal relies on memory shared by the processes. The queue is safe to use from several threads.
+
+    Attributes:
+        database_path (str): Path of the SQLite database
+        lease_seconds (float): Time a claimed job is reserved for its worker without a renewal
+        max_attempts (int): Maximum number of times a job is claimed
+        retry_delay_seconds (float): Delay before the first retry of a failed job, doubled by every further attempt
+
+    Methods:
+        enqueue(request) -> int: Add a crawl job, return its identifier
+        enqueue_many(requests) -> list[int]: Add crawl jobs in one transaction
+        claim(worker_id) -> QueuedJob | None: Reserve the oldest available job for the worker
+        renew_lease(job_id, worker_id) -> bool: Extend the lease of a running job
+        complete(job_id, worker_id, events) -> bool: Store the events of a job and mark it succeeded
+        fail(job_id, worker_id, error) -> JobStatus | None: Queue the job for a retry or mark it failed
+        get_job(job_id) -> QueuedJob: Return a job
+        get_events(job_id) -> list[dict]: Return the stored events of a job
+        count_jobs() -> dict[JobStatus, int]: Return the number of jobs by status
+        close(): Close the database
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        lease_seconds: float = Constants.JOB_LEASE_SECONDS,
+        max_attempts: int = Constants.JOB_MAX_ATTEMPTS,
+        retry_delay_seconds: float = Constants.JOB_RETRY_DELAY_SECONDS,
+    ):
+        if not isinstance(database_path, str):
+            raise TypeError(f"Invalid database_path type. Expected type: str, actual type: {type(database_path)}")
+        if not isinstance(lease_seconds, (int, float)) or lease_seconds <= 0:
+            raise ValueError("The lease of a job must be a positive number of seconds")
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("The maximum number of attempts must be a positive integer")
+        if not isinstance(retry_delay_seconds, (int, float)) or retry_delay_seconds < 0:
+            raise ValueError("The retry delay must be a non-negative number of seconds")
+
+        self.database_path = database_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self._lock = threading.Lock()
+        # The transactions are explicit, a claim has to hold the write lock of the database from its select to its update
+        self._connection = sqlite3.connect(
+            database_path, timeout=Constants.JOB_QUEUE_BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False
+        )
+        try:
+            # WAL lets the workers read while a job is claimed, but it doesn't work on network file systems
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        except Exception:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def enqueue(self, request: CrawlJobRequest) -> int:
+        """Add a crawl job, it can be claimed right away.
+
+        Arguments:
+            request (CrawlJobRequest): The crawl to run
+
+        Returns:
+            int: Identifier of the job
+        """
+        return self.enqueue_many([request])[0]
+
+    def enqueue_many(self, requests: Iterable[CrawlJobRequest]) -> list[int]:
+        """Add crawl jobs in one transaction, e.g. the seed URLs of a batch.
+
+        Arguments:
+            requests (Iterable[CrawlJobRequest]): The crawls to run
+
+        Returns:
+            list[int]: Identifiers of the jobs in the order of the requests
+        """
+        requests = list(requests)
+        for request in requests:
+            if not isinstance(request, CrawlJobRequest):
+                raise TypeError(f"Invalid request type. Expected type: CrawlJobRequest, actual type: {type(request)}")
+
+        now = time.time()
+        job_ids = []
+        with self._lock, _transaction(self._connection):
+            for request in requests:
+                cursor = self._connection.execute(
+                    _INSERT_JOB, (json.dumps(request.to_dict(), ensure_ascii=False), JobStatus.QUEUED.value, now, now, now)
+                )
+                job_ids.append(cursor.lastrowid)
+        return job_ids
+
+    def claim(self, worker_id: str) -> QueuedJob | None:
+        """Reserve the oldest available job for the worker: a queued job whose retry delay passed,
+        or a running job whose lease expired. Expired jobs without attempts left are marked failed instead.
+
+        Arguments:
+            worker_id (str): Identifier of the claiming worker
+
+        Returns:
+            QueuedJob | None: The claimed job, None if no job is available
+        """
+        if not isinstance(worker_id, str):
+            raise TypeError(f"Invalid worker_id type. Expected type: str, actual type: {type(worker_id)}")
+
+        with self._lock, _transaction(self._connection, immediate=True):
+            while True:
+                now = time.time()
+                row = self._connection.execute(
+                    _SELECT_CLAIMABLE_JOB, {"queued": JobStatus.QUEUED.value, "running": JobStatus.RUNNING.value, "now": now}
+                ).fetchone()
+                if row is None:
+                    return None
+
+                job_id, attempts = row
+                if attempts >= self.max_attempts:
+                    # The worker of the last attempt stopped renewing the lease, most likely it was killed by the job
+                    self._connection.execute(
+                        _EXPIRE_JOB, (JobStatus.FAILED.value, "The lease of the last attempt expired", now, job_id)
+                    )
+                    continue
+
+                self._connection.execute(
+                    _CLAIM_JOB, (JobStatus.RUNNING.value, worker_id, now + self.lease_seconds, now, job_id)
+                )
+                return self._select_job(job_id)
+
+    def renew_lease(self, job_id: int, worker_id: str) -> bool:
+        """Extend the lease of a running job by lease_seconds.
+
+        Arguments:
+            job_id (int): Identifier of the job
+            worker_id (str): Identifier of the worker running the job
+
+        Returns:
+            bool: False if the worker lost the job, e.g. its lease expired and another worker claimed it
+        """
+        now = time.time()
+        with self._lock, _transaction(self._connection):
+            cursor = self._connection.execute(
+                _RENEW_LEASE, (now + self.lease_seconds, now, job_id, worker_id, JobStatus.RUNNING.value)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, events: Iterable[dict]) -> bool:
+        """Store the events of a job and mark it succeeded, replacing the events of the earlier attempts.
+
+        Arguments:
+            job_id (int): Identifier of the job
+            worker_id (str): Identifier of the worker that ran the job
+            events (Iterable[dict]): JSON-compatible events of the job, e.g. the entities of the parsed pages
+
+        Returns:
+            bool: False if the worker lost the job, the events are discarded then
+        """
+        serialized_events = [
+            (job_id, event_index, json.dumps(event, ensure_ascii=False)) for event_index, event in enumerate(events)
+        ]
+        now = time.time()
+        with self._lock, _transaction(self._connection):
+            cursor = self._connection.execute(
+                _FINISH_JOB, (JobStatus.SUCCEEDED.value, now, None, now, job_id, worker_id, JobStatus.RUNNING.value)
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._connection.execute(_DELETE_EVENTS, (job_id,))
+            self._connection.executemany(_INSERT_EVENT, serialized_events)
+        return True
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> JobStatus | None:
+        """Record a failed attempt: the job is queued again after the retry delay, or marked failed without attempts left.
+
+        Arguments:
+            job_id (int): Identifier of the job
+            worker_id (str): Identifier of the worker that ran the job
+            error (str): The error of the attempt
+
+        Returns:
+            JobStatus | None: QUEUED if the job will be retried, FAILED if not, None if the worker lost the job
+        """
+        now = time.time()
+        with self._lock, _transaction(self._connection):
+            row = self._connection.execute(_SELECT_ATTEMPTS, (job_id,)).fetchone()
+            if row is None:
+                return None
+
+            attempts = row[0]
+            status = JobStatus.QUEUED if attempts < self.max_attempts else JobStatus.FAILED
+            available_at = now + self.retry_delay_seconds * 2 ** (attempts - 1)
+            cursor = self._connection.execute(
+                _FINISH_JOB, (status.value, available_at, error, now, job_id, worker_id, JobStatus.RUNNING.value)
+            )
+        return status if cursor.rowcount == 1 else None
+
+    def get_job(self, job_id: int) -> QueuedJob:
+        """Return a job.
+
+        Arguments:
+            job_id (int): Identifier of the job
+
+        Returns:
+            QueuedJob: The job
+
+        Raises:
+            KeyError: If the job doesn't exist
+        """
+        with self._lock:
+            return self._select_job(job_id)
+
+    def get_events(self, job_id: int) -> list[dict]:
+        """Return the stored events of a succeeded job.
+
+        Arguments:
+            job_id (int): Identifier of the job
+
+        Returns:
+            list[dict]: The events in the order they were produced, empty if the job didn't succeed yet
+        """
+        with self._lock:
+            return [json.loads(row[0]) for row in self._connection.execute(_SELECT_EVENTS, (job_id,))]
+
+    def count_jobs(self) -> dict[JobStatus, int]:
+        """Return the number of jobs by status.
+
+        Returns:
+            dict[JobStatus, int]: Key: status, Value: number of jobs, every status is included
+        """
+        with self._lock:
+            counts = dict(self._connection.execute(_COUNT_JOBS).fetchall())
+        return {status: counts.get(status.value, 0) for status in JobStatus}
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _select_job(self, job_id: int) -> QueuedJob:
+        """Read a job from the database, the lock must be held."""
+        row = self._connection.execute(_SELECT_JOB, (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+
+        job_id, request, status, attempts, worker_id, error = row
+        return QueuedJob(job_id, CrawlJobRequest.from_dict(json.loads(request)), JobStatus(status), attempts, worker_id, error)
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection, immediate: bool = False) -> Iterator[None]:
+    """Run the block in an explicit transaction, committed at its end and rolled back on an error.
+    An immediate transaction takes the write lock of the database at its start.
+    """
+    connection.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
\ No newline at end of file
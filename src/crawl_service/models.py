@@ -0,0 +1,95 @@
+from collections.abc import Mapping
+from crawl_service import constants as Constants
+from dataclasses import dataclass
+from globals.enums import DataRegion, JobStatus
+import validators
+
+@dataclass(frozen=True)
+class CrawlJobRequest:
+    """A crawl submitted to the service, with the same limits as the command line arguments.
+
+    Attributes:
+        link (str): The website URL to parse
+        region (DataRegion): The primary region for data to be found
+        sublinks (int): Maximum number of subpages to visit
+        company (str | None): Company name for LinkedIn search, no profiles are searched if None
+        profiles (int): Maximum number of LinkedIn profiles to fetch
+
+    Methods:
+        from_dict(data) -> CrawlJobRequest: Validate the request body of the API
+        to_dict() -> dict: Return the request as JSON-compatible data
+    """
+
+    link: str
+    region: DataRegion
+    sublinks: int = 0
+    company: str | None = None
+    profiles: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "CrawlJobRequest":
+        """Validate the request body of the API.
+
+        Arguments:
+            data (Mapping): The decoded JSON body, e.g. {"link": "https://example.com", "region": "hu", "sublinks": 10}
+
+        Returns:
+            CrawlJobRequest: The validated request
+
+        Raises:
+            ValueError: If a field is missing or invalid
+        """
+        if not isinstance(data, Mapping):
+            raise ValueError("The request must be a JSON object")
+
+        link = data.get("link")
+        if not isinstance(link, str) or not validators.url(link):
+            raise ValueError(f"URL '{link}' is invalid. Example of a valid URL: 'https://www.company.com/subpage'")
+        try:
+            region = DataRegion(str(data.get("region", "")).lower())
+        except ValueError:
+            raise ValueError("Unsupported region. Supported regions: United States (us), Great Britain (gb), Hungary (hu)") from None
+
+        sublinks = data.get("sublinks", 0)
+        if not isinstance(sublinks, int) or not 0 <= sublinks <= Constants.MAX_SUBLINKS:
+            raise ValueError(f"The maximum number of subpages to visit must be between 0 and {Constants.MAX_SUBLINKS}")
+        profiles = data.get("profiles", 0)
+        if not isinstance(profiles, int) or not 0 <= profiles <= Constants.MAX_PROFILES:
+            raise ValueError(f"The maximum number of LinkedIn profiles to fetch must be between 0 and {Constants.MAX_PROFILES}")
+        company = data.get("company")
+        if company is not None and not isinstance(company, str):
+            raise ValueError("The company must be a string")
+        if (profiles > 0) != (company is not None):
+            raise ValueError("Both company and profiles must be provided for LinkedIn profile fetching")
+
+        return cls(link, region, sublinks, company, profiles)
+
+    def to_dict(self) -> dict:
+        """Return the request as JSON-compatible data."""
+        return {
+            "link": self.link,
+            "region": self.region.value,
+            "sublinks": self.sublinks,
+            "company": self.company,
+            "profiles": self.profiles,
+        }
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """A crawl job of the persistent job queue.
+
+    Attributes:
+        id (int): Identifier of the job
+        request (CrawlJobRequest): The crawl to run
+        status (JobStatus): The current status
+        attempts (int): Number of times a worker claimed the job
+        worker_id (str | None): The worker that last claimed the job
+        error (str | None): The error of the last failed attempt
+    """
+
+    id: int
+    request: CrawlJobRequest
+    status: JobStatus
+    attempts: int
+    worker_id: str | None = None
+    error: str | None = None
\ No newline at end of file
@@ -0,0 +1,229 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from crawl_service import constants as Constants
+from globals.enums import DataRegion, JobStatus, LogLevel, LogMode
+from globals.run_logger import run_logger
+from linkedin_links import SearchBackend, SearchCache
+from website import Fetcher, PooledWebDriverFetcher, WebDriverNode
+from website.model_registry import model_registry
+from .crawl_service import iter_crawl_events
+from .job_queue import JobQueue
+from .models import QueuedJob
+import multiprocessing
+import os
+import socket
+import threading
+import uuid
+
+class CrawlWorker:
+    """Worker running the crawl jobs of the persistent job queue one at a time.
+    The lease of the running job is renewed in a background thread, so the job is only claimed by another worker
+    if this one stops. If the lease is lost anyway, the results of the job are discarded.
+
+    Attributes:
+        worker_id (str): Identifier of the worker in the queue, unique across the processes sharing the queue
+        fetcher (Fetcher): Source of the HTML of the pages
+
+    Methods:
+        run_once() -> bool: Run the next available job, return False if there was none
+        run(stop_event, exit_when_idle) -> int: Run jobs until stopped, return the number of run jobs
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        fetcher: Fetcher,
+        worker_id: str | None = None,
+        search_cache: SearchCache | None = None,
+        search_backend: SearchBackend | None = None,
+        poll_seconds: float = Constants.WORKER_POLL_SECONDS,
+    ):
+        if not isinstance(queue, JobQueue):
+            raise TypeError(f"Invalid queue type. Expected type: JobQueue, actual type: {type(queue)}")
+        if not isinstance(fetcher, Fetcher):
+            raise TypeError(f"Invalid fetcher type. Expected type: Fetcher, actual type: {type(fetcher)}")
+        if not isinstance(poll_seconds, (int, float)) or poll_seconds <= 0:
+            raise ValueError("The polling interval must be a positive number of seconds")
+
+        self.worker_id = worker_id if worker_id is not None else f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.fetcher = fetcher
+        self._queue = queue
+        self._search_cache = search_cache
+        self._search_backend = search_backend
+        self._poll_seconds = poll_seconds
+
+    def run_once(self) -> bool:
+        """Claim and run the next available job.
+
+        Returns:
+            bool: False if no job was available
+        """
+        job = self._queue.claim(self.worker_id)
+        if job is None:
+            return False
+
+        self._run_job(job)
+        return True
+
+    def run(self, stop_event: threading.Event | None = None, exit_when_idle: bool = False) -> int:
+        """Run jobs until the stop event is set, the queue is polled while it's empty.
+
+        Arguments:
+            stop_event (threading.Event | None): Stops the worker after the running job, e.g. a multiprocessing.Event
+            exit_when_idle (bool): Stop when no job is available instead of polling
+
+        Returns:
+            int: Number of run jobs
+        """
+        stop_event = stop_event if stop_event is not None else threading.Event()
+        job_count = 0
+        while not stop_event.is_set():
+            if self.run_once():
+                job_count += 1
+            elif exit_when_idle:
+                break
+            else:
+                stop_event.wait(self._poll_seconds)
+        return job_count
+
+    def _run_job(self, job: QueuedJob):
+        """Run the crawl of the job and store its events, or record the failed attempt."""
+        run_logger.log_message(f"Worker {self.worker_id} started job {job.id} (attempt {job.attempts}): {job.request.link}")
+        try:
+            with _keep_lease(self._queue, job.id, self.worker_id, self._queue.lease_seconds / 3) as lease_lost:
+                events = list(iter_crawl_events(job.request, self.fetcher, self._search_cache, self._search_backend))
+                if lease_lost.is_set():
+                    # The job was claimed by another worker, its results are the ones stored
+                    run_logger.log_message(f"Worker {self.worker_id} lost the lease of job {job.id}", LogLevel.WARNING)
+                    return
+        except Exception as e:
+            status = self._queue.fail(job.id, self.worker_id, f"{type(e).__name__}: {e}")
+            if status == JobStatus.QUEUED:
+                run_logger.log_message(f"Job {job.id} failed, it will be retried: {e}", LogLevel.WARNING)
+            else:
+                run_logger.log_message(f"Job {job.id} failed: {e}", LogLevel.ERROR)
+            return
+
+        if self._queue.complete(job.id, self.worker_id, events):
+            run_logger.log_message(f"Job {job.id} completed with {len(events)} events", LogLevel.SUCCESS)
+        else:
+            run_logger.log_message(f"Worker {self.worker_id} lost the lease of job {job.id}", LogLevel.WARNING)
+
+def run_workers(
+    database_path: str,
+    worker_count: int,
+    regions: Iterable[DataRegion] = tuple(DataRegion),
+    search_cache_path: str | None = None,
+    exit_when_idle: bool = False,
+    log_mode: LogMode = LogMode.QUIET,
+    log_file_path: str | None = None,
+    webdriver_nodes: Iterable[WebDriverNode] | None = None,
+):
+    """Run worker processes on the job queue until they are interrupted, or until the queue is empty.
+    Every process loads the NLP models and opens a browser session once, then runs jobs until it stops.
+
+    Arguments:
+        database_path (str): Path of the SQLite database of the job queue
+        worker_count (int): Number of worker processes, e.g. the number of cores
+        regions (Iterable[DataRegion]): Regions whose models are loaded ahead of the first job
+        search_cache_path (str | None): Path of the SQLite cache of the LinkedIn profile searches, shared by the workers
+        exit_when_idle (bool): Stop every worker when no job is available
+        log_mode (LogMode): Logging mode of the workers, the progress of concurrent crawls can't share the console
+        log_file_path (str | None): Path of the JSON lines log file, appended to by every worker
+        webdriver_nodes (Iterable[WebDriverNode] | None): Selenium servers of the browser sessions, the docker-compose nodes if None
+    """
+    if not isinstance(worker_count, int) or worker_count < 1:
+        raise ValueError("The number of workers must be a positive integer")
+
+    # The models and the browser sessions aren't safe to fork, every worker starts from a fresh interpreter
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    webdriver_nodes = tuple(webdriver_nodes) if webdriver_nodes is not None else None
+    processes = [
+        context.Process(
+            target=_run_worker_process,
+            args=(
+                database_path, tuple(regions), search_cache_path, stop_event, exit_when_idle, log_mode, log_file_path, webdriver_nodes
+            ),
+            name=f"{Constants.WORKER_PROCESS_NAME}-{worker_index}",
+        )
+        for worker_index in range(worker_count)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # The workers finish their running jobs, the jobs of killed workers are claimed again when their lease expires
+        stop_event.set()
+        for process in processes:
+            process.join()
+
+def _run_worker_process(
+    database_path: str,
+    regions: tuple[DataRegion, ...],
+    search_cache_path: str | None,
+    stop_event: threading.Event,
+    exit_when_idle: bool,
+    log_mode: LogMode,
+    log_file_path: str | None,
+    webdriver_nodes: tuple[WebDriverNode, ...] | None,
+):
+    """Entry point of a worker process."""
+    run_logger.configure(log_mode, log_file_path)
+    queue = JobQueue(database_path)
+    search_cache = SearchCache(search_cache_path) if search_cache_path is not None else None
+    fetcher = PooledWebDriverFetcher(max_sessions=1, nodes=webdriver_nodes)
+    try:
+        model_registry.warm_up(regions)
+        try:
+            fetcher.warm_up()
+        except Exception as e:
+            run_logger.log_message(f"Failed to warm up the fetcher: {e}", LogLevel.WARNING)
+        CrawlWorker(queue, fetcher, search_cache=search_cache).run(stop_event, exit_when_idle)
+    except KeyboardInterrupt:
+        # The parent sets the stop event, the interrupt reaches the workers too when it comes from the terminal
+        pass
+    finally:
+        fetcher.close()
+        if search_cache is not None:
+            search_cache.close()
+        queue.close()
+        run_logger.close()
+
+@contextmanager
+def _keep_lease(queue: JobQueue, job_id: int, worker_id: str, interval_seconds: float) -> Iterator[threading.Event]:
+    """Renew the lease of the job in a background thread while the block runs.
+
+    Arguments:
+        queue (JobQueue): The queue of the job
+        job_id (int): Identifier of the job
+        worker_id (str): Identifier of the worker running the job
+        interval_seconds (float): Time between the renewals, a fraction of the lease
+
+    Returns:
+        Iterator[threading.Event]: Set when a renewal finds that the worker lost the job
+    """
+    lease_lost = threading.Event()
+    stop_renewing = threading.Event()
+
+    def renew():
+        while not stop_renewing.wait(interval_seconds):
+            try:
+                is_renewed = queue.renew_lease(job_id, worker_id)
+            except Exception as e:
+                # E.g. the database stayed locked longer than the busy timeout, the lease outlasts a few failed renewals
+                run_logger.log_message(f"Failed to renew the lease of job {job_id}, retrying: {e}", LogLevel.WARNING)
+                continue
+            if not is_renewed:
+                lease_lost.set()
+                return
+
+    renewal_thread = threading.Thread(target=renew, daemon=True)
+    renewal_thread.start()
+    try:
+        yield lease_lost
+    finally:
+        stop_renewing.set()
+        renewal_thread.join()
\ No newline at end of file
@@ -1,8 +1,23 @@
 from .export import (
     export_webparser_data,
+    export_webparser_data_stream,
+    WebparserCsvStreamWriter,
     export_profiles,
 )
 
+from .sqlite_export import (
+    WebparserSqliteWriter,
+)
+
+from .entity_history import (
+    EntityHistory,
+    EntityRecord,
+)
+
+from .models import (
+    ExportOptions,
+)
+
 from .enums import (
     ExportChoice,
 )
\ No newline at end of file
@@ -10,4 +10,14 @@ RESULTS_PROFILES_FOLDER = "results_profiles"
 CSV_EXTENSION = ".csv"
 UTF8_ENCODING = "utf-8"
 MAX_FILE_NAME_LENGTH = 50
-CSV_DELIMITER = ";"
\ No newline at end of file
+CSV_DELIMITER = ";"
+CSV_FLUSH_INTERVAL_ROWS = 100
+WEBPARSER_FILE_PREFIX = "webparser"
+PROFILES_FILE_PREFIX = "profiles"
+PROFILES_OUTPUT_SUFFIX = "_profiles"
+FILE_TIMESTAMP_FORMAT = "%Y_%m_%d_%H%M%S"
+TEMP_FILE_SUFFIX = ".tmp"
+PARTIAL_FILE_SUFFIX = ".part"
+SQLITE_EXTENSION = ".sqlite"
+SQLITE_BATCH_SIZE = 500
+CSV_LIST_SEPARATOR = "; "
\ No newline at end of file
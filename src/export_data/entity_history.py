@@ -0,0 +1,271 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from globals.enums import DataRegion
+from globals.normalization import normalize_email, normalize_phone_number, normalize_text
+from website.enums import EntityType
+from website.models import PageResult, WebsiteInfo
+import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entity_history (
+    id INTEGER PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    run_count INTEGER NOT NULL DEFAULT 1
+);
+CREATE UNIQUE INDEX IF NOT EXISTS entity_history_type_key_index ON entity_history (entity_type, key);
+"""
+
+# The entities of a merge are staged in a temporary table, so the new ones are found with a single indexed join
+_CREATE_STAGED_ENTITIES = """
+CREATE TEMP TABLE IF NOT EXISTS staged_entities (
+    entity_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    PRIMARY KEY (entity_type, key)
+)
+"""
+# Merged entities wait in a temporary table until they are recorded, e.g. once the run was exported
+_CREATE_PENDING_ENTITIES = """
+CREATE TEMP TABLE IF NOT EXISTS pending_entities (
+    entity_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    PRIMARY KEY (entity_type, key)
+)
+"""
+# Only the first occurrence of an entity in a merge is kept
+_STAGE_ENTITY = "INSERT OR IGNORE INTO staged_entities (entity_type, key, value, source_url) VALUES (?, ?, ?, ?)"
+_SELECT_NEW_ENTITIES = """
+SELECT staged.entity_type, staged.value, staged.source_url FROM staged_entities AS staged
+WHERE NOT EXISTS (
+    SELECT 1 FROM entity_history AS history WHERE history.entity_type = staged.entity_type AND history.key = staged.key
+) AND NOT EXISTS (
+    SELECT 1 FROM pending_entities AS pending WHERE pending.entity_type = staged.entity_type AND pending.key = staged.key
+)
+ORDER BY staged.rowid
+"""
+_PEND_STAGED_ENTITIES = """
+INSERT OR IGNORE INTO pending_entities (entity_type, key, value, source_url)
+SELECT entity_type, key, value, source_url FROM staged_entities ORDER BY rowid
+"""
+# The WHERE clause is required by SQLite to parse the upsert of an INSERT ... SELECT
+_UPSERT_PENDING_ENTITIES = """
+INSERT INTO entity_history (entity_type, key, value, source_url, first_seen, last_seen)
+SELECT entity_type, key, value, source_url, :timestamp, :timestamp FROM pending_entities WHERE true
+ON CONFLICT (entity_type, key) DO UPDATE SET last_seen = excluded.last_seen, run_count = run_count + 1
+"""
+
+@dataclass(frozen=True)
+class EntityRecord:
+    """An entity of the history.
+
+    Attributes:
+        entity_type (EntityType): Type of the entity
+        value (str): The entity as it was first found
+        source_url (str): The website's URL where the entity was first found
+        first_seen (str): UTC time of the first merge that contained the entity, in ISO 8601 format
+        last_seen (str): UTC time of the last merge that contained the entity, in ISO 8601 format
+        run_count (int): Number of merges that contained the entity
+    """
+
+    entity_type: EntityType
+    value: str
+    source_url: str
+    first_seen: str
+    last_seen: str
+    run_count: int
+
+class EntityHistory:
+    """Persistent SQLite store of the entities found over several runs.
+    Entities are identified by their normalized key: lowercase emails, E.164 phone numbers,
+    accent-folded names and addresses, so the same entity written differently on different websites is merged.
+    The history is never loaded into memory, only the entities of the merged run are looked up in the database.
+    Merged entities can be kept pending until the run is exported, pending entities are discarded when the history is closed.
+
+    Methods:
+        merge(info, record) -> WebsiteInfo: Merge the entities of a run, return the entities that weren't seen before
+        merge_page(page_result, record) -> PageResult: Merge the new entities of a page, return the page with the ones that weren't seen before
+        record_pending(): Record the pending entities in the history
+        get(entity_type, entity) -> EntityRecord | None: Return the entity of the history
+        get_key(entity_type, entity) -> str: Return the normalized key of the entity
+        close(): Close the database
+    """
+
+    def __init__(self, database_path: str, region: DataRegion):
+        if not isinstance(database_path, str):
+            raise TypeError(f"Invalid database_path type. Expected type: str, actual type: {type(database_path)}")
+        if not isinstance(region, DataRegion):
+            raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+
+        self.database_path = database_path
+        self.region = region
+        self._connection = sqlite3.connect(database_path)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(_CREATE_STAGED_ENTITIES)
+            self._connection.execute(_CREATE_PENDING_ENTITIES)
+        except Exception:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> "EntityHistory":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def merge(self, info: WebsiteInfo, record: bool = True) -> WebsiteInfo:
+        """Merge the entities of a run into the history in a single transaction.
+        Entities seen before get their last seen time updated, new entities are added.
+
+        Arguments:
+            info (WebsiteInfo): The information found during the parsing process
+            record (bool): Record the entities right away, otherwise they are pending until record_pending is called
+
+        Returns:
+            WebsiteInfo: The entities that weren't seen in any earlier merge, with the URL where they were first found.
+                The found URLs are kept as they are
+        """
+        if not isinstance(info, WebsiteInfo):
+            raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
+
+        entities_by_type = {
+            EntityType.NAME: info.found_names,
+            EntityType.EMAIL: info.found_emails,
+            EntityType.PHONE_NUMBER: info.found_phone_numbers,
+            EntityType.ADDRESS: info.found_addresses,
+        }
+        new_entities = {entity_type: dict() for entity_type in EntityType}
+        for entity_type, entity, website_url in self._merge(
+            (
+                (entity_type, entity, website_url)
+                for entity_type, found_entities in entities_by_type.items()
+                for entity, website_url in found_entities.items()
+            ),
+            record,
+        ):
+            new_entities[entity_type][entity] = website_url
+
+        return WebsiteInfo(
+            set(info.found_urls),
+            new_entities[EntityType.EMAIL],
+            new_entities[EntityType.NAME],
+            new_entities[EntityType.PHONE_NUMBER],
+            new_entities[EntityType.ADDRESS],
+        )
+
+    def merge_page(self, page_result: PageResult, record: bool = True) -> PageResult:
+        """Merge the entities found for the first time on the page into the history in a single transaction.
+
+        Arguments:
+            page_result (PageResult): The result of the parsed page
+            record (bool): Record the entities right away, otherwise they are pending until record_pending is called
+
+        Returns:
+            PageResult: The page with only the entities that weren't seen in any earlier merge
+        """
+        if not isinstance(page_result, PageResult):
+            raise TypeError(f"Invalid page_result type. Expected type: PageResult, actual type: {type(page_result)}")
+
+        website_url = page_result.url.rstrip(" /")
+        new_entities = {entity_type: [] for entity_type in page_result.new_entities}
+        for entity_type, entity, _ in self._merge(
+            (
+                (entity_type, entity, website_url)
+                for entity_type, entities in page_result.new_entities.items()
+                for entity in entities
+            ),
+            record,
+        ):
+            new_entities[entity_type].append(entity)
+
+        return replace(page_result, new_entities=new_entities)
+
+    def record_pending(self):
+        """Record the pending entities of the earlier merges in the history in a single transaction."""
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._connection:
+            self._connection.execute(_UPSERT_PENDING_ENTITIES, {"timestamp": timestamp})
+            self._connection.execute("DELETE FROM pending_entities")
+
+    def get(self, entity_type: EntityType, entity: str) -> EntityRecord | None:
+        """Return the entity of the history.
+
+        Arguments:
+            entity_type (EntityType): Type of the entity
+            entity (str): The entity, in any form that has the same normalized key
+
+        Returns:
+            EntityRecord | None: The entity of the history, None if it wasn't seen before
+        """
+        row = self._connection.execute(
+            "SELECT value, source_url, first_seen, last_seen, run_count FROM entity_history WHERE entity_type = ? AND key = ?",
+            (entity_type.value, self.get_key(entity_type, entity)),
+        ).fetchone()
+        if row is None:
+            return None
+        return EntityRecord(entity_type, *row)
+
+    def get_key(self, entity_type: EntityType, entity: str) -> str:
+        """Return the normalized key the entity is identified by in the history.
+
+        Arguments:
+            entity_type (EntityType): Type of the entity
+            entity (str): The entity
+
+        Returns:
+            str: The normalized key of the entity
+        """
+        if not isinstance(entity_type, EntityType):
+            raise TypeError(f"Invalid entity_type type. Expected type: EntityType, actual type: {type(entity_type)}")
+
+        match entity_type:
+            case EntityType.EMAIL:
+                return normalize_email(entity)
+            case EntityType.PHONE_NUMBER:
+                return normalize_phone_number(entity, self.region)
+            case _:
+                return normalize_text(entity)
+
+    def close(self):
+        """Close the database."""
+        if self._connection is None:
+            return
+
+        self._connection.close()
+        self._connection = None
+
+    def _merge(self, entities: Iterable[tuple[EntityType, str, str]], record: bool) -> list[tuple[EntityType, str, str]]:
+        """Add the entities to the pending entities in a single transaction, then record them if requested.
+
+        Arguments:
+            entities (Iterable[tuple[EntityType, str, str]]): The entity types, entities and URLs where they were found
+            record (bool): Record the pending entities in the history
+
+        Returns:
+            list[tuple[EntityType, str, str]]: The entities that weren't seen or merged before, in the order they were given
+        """
+        with self._connection:
+            self._connection.executemany(_STAGE_ENTITY, (
+                (entity_type.value, self.get_key(entity_type, entity), entity, website_url)
+                for entity_type, entity, website_url in entities
+            ))
+            new_entities = [
+                (EntityType(entity_type), entity, website_url)
+                for entity_type, entity, website_url in self._connection.execute(_SELECT_NEW_ENTITIES)
+            ]
+            self._connection.execute(_PEND_STAGED_ENTITIES)
+            self._connection.execute("DELETE FROM staged_entities")
+        if record:
+            self.record_pending()
+        return new_entities
\ No newline at end of file
@@ -10,6 +10,12 @@ class WebparserCsvHeaderText(Enum):
     PHONE_NUMBERS = 'Phone numbers (found at link)'
     ADDRESSES = 'Addresses (found at link)'
 
+class WebparserStreamCsvHeaderText(Enum):
+    ENTITY_TYPE = 'Entity type'
+    VALUE = 'Value'
+    SOURCE_URL = 'Source URL'
+
 class ProfilesCsvHeaderText(Enum):
     NAME = 'Name'
-    LINKEDIN_PROFILE = 'LinkedIn Profile URL'
\ No newline at end of file
+    LINKEDIN_PROFILE = 'LinkedIn Profile URL'
+    MATCHED_NAMES = 'Names on the website (found at link)'
\ No newline at end of file
@@ -1,54 +1,201 @@
 from export_data import constants as Constants
-from export_data.enums import ExportChoice, WebparserCsvHeaderText, ProfilesCsvHeaderText
+from collections.abc import Iterable
+from datetime import datetime
+from export_data.enums import ExportChoice, WebparserCsvHeaderText, WebparserStreamCsvHeaderText, ProfilesCsvHeaderText
+from export_data.models import ExportOptions
+from export_data.sqlite_export import WebparserSqliteWriter
+from globals.enums import ExportFormat
+from globals.tracing import tracer
 from itertools import zip_longest
+from linkedin_links.models import NameMatch
 from rich.console import Console
-from website import WebsiteInfo
+from website.enums import EntityType, PipelineStage
+from website.models import PageResult, WebsiteInfo
 import csv
 import os
 
 console = Console(log_path=False)
 
-def export_webparser_data(info: WebsiteInfo):
-    """Export data found during parsing to a csv file.
-    Only export the data if the user confirms the export and provides valid file names.
+_FILE_EXTENSIONS: dict[ExportFormat, str] = {
+    ExportFormat.CSV: Constants.CSV_EXTENSION,
+    ExportFormat.SQLITE: Constants.SQLITE_EXTENSION,
+}
+
+def export_webparser_data(info: WebsiteInfo, options: ExportOptions | None = None) -> bool:
+    """Export data found during parsing to a csv file or an SQLite database.
+    Only export the data if the user confirms the export and provides valid file names,
+    unless the export options make the export non-interactive.
 
     Arguments:
         info (WebsiteInfo): The information found during the parsing process
+        options (ExportOptions | None): Options replacing the interactive prompts, None asks the user
+
+    Returns:
+        bool: True if the data was exported, False if there was no data, the export was declined or it failed
     """
     if not isinstance(info, WebsiteInfo):
         raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
-    
+    options = _validate_options(options)
+
     # Only export if data has been found during parsing
     # Links don't count as data
-    if info.has_data():
-        is_start_export = _get_export_confirmation()
-        if is_start_export == True:
-            file_path = _get_export_path(Constants.RESULTS_WEBPARSER_FOLDER)
-            file_name = _get_file_name(file_path)
-            if file_name is not None:
-                _export_webparser_data_to_csv(info, file_path, file_name)
-            else:
-                console.print("[red]Export cancelled.[/red]")
-
-def export_profiles(profiles: dict[str, str]):
-    """Export LinkedIn profiles to a csv file.
-    Only export the data if the user confirms the export and provides valid file names.
+    if not info.has_data():
+        return False
+
+    export_file = _get_export_file(options, Constants.RESULTS_WEBPARSER_FOLDER, Constants.WEBPARSER_FILE_PREFIX)
+    if export_file is None:
+        return False
+
+    file_path, file_name = export_file
+    with tracer.span(PipelineStage.EXPORT.value, format=options.export_format.value):
+        if options.export_format == ExportFormat.SQLITE:
+            return _export_webparser_data_to_sqlite(info, os.path.join(file_path, file_name + Constants.SQLITE_EXTENSION))
+        return _export_webparser_data_to_csv(info, file_path, file_name)
+
+def export_webparser_data_stream(pages: Iterable[PageResult], options: ExportOptions | None = None) -> bool:
+    """Export the data of the pages to a csv file or an SQLite database while they are being parsed.
+    The export file is determined before the first page is parsed, then the rows are appended as the pages are yielded,
+    so the results found so far survive an interruption. CSV rows are written to a partial file that is renamed to the
+    export file once all the pages were written, SQLite rows are committed after every page.
+    The pages are consumed even if the export is declined.
+
+    Arguments:
+        pages (Iterable[PageResult]): The results of the parsed pages, e.g. the iterator returned by website.iter_parse
+        options (ExportOptions | None): Options replacing the interactive prompts, None asks the user
+
+    Returns:
+        bool: True if every page was exported, False if the export was declined or it failed
+    """
+    if not isinstance(pages, Iterable):
+        raise TypeError(f"Invalid pages type. Expected type: Iterable, actual type: {type(pages)}")
+    options = _validate_options(options)
+
+    export_file = _get_export_file(options, Constants.RESULTS_WEBPARSER_FOLDER, Constants.WEBPARSER_FILE_PREFIX)
+    if export_file is None:
+        _consume_pages(pages)
+        return False
+
+    file_path, file_name = export_file
+    full_path = os.path.join(file_path, file_name + _FILE_EXTENSIONS[options.export_format])
+    try:
+        if options.export_format == ExportFormat.SQLITE:
+            writer = WebparserSqliteWriter(full_path)
+        else:
+            writer = WebparserCsvStreamWriter(full_path)
+    except Exception as e:
+        console.print(f"[red]Failed to export data to {options.export_format.name}: {e}[/red]")
+        _consume_pages(pages)
+        return False
+
+    with writer:
+        for page_result in pages:
+            with tracer.span(PipelineStage.EXPORT.value, url=page_result.url, format=options.export_format.value):
+                writer.write_page(page_result)
+
+    if writer.failed:
+        return False
+    if writer.rows_written > 0:
+        console.print(f"[green]Export completed successfully to {full_path}[/green]")
+    return True
+
+def export_profiles(profiles: dict[str, str], options: ExportOptions | None = None, matches: Iterable[NameMatch] | None = None):
+    """Export LinkedIn profiles to a csv file or an SQLite database.
+    Only export the data if the user confirms the export and provides valid file names,
+    unless the export options make the export non-interactive.
+    If an output is given, CSV profiles are exported next to it, with a '_profiles' suffix in the file name,
+    SQLite profiles are exported to the same database as the website data.
+    The names of the website matched to the profiles are exported as an extra CSV column, or into the name_matches table.
 
     Arguments:
         profiles (dict): The LinkedIn profiles found during the parsing process
+        options (ExportOptions | None): Options replacing the interactive prompts, None asks the user
+        matches (Iterable[NameMatch] | None): The names of the website matched to the profiles, e.g. the result of match_names
     """
     if not isinstance(profiles, dict):
         raise TypeError(f"Invalid profiles type. Expected type: dict, actual type: {type(profiles)}")
-    
+    options = _validate_options(options)
+    matches = list(matches) if matches is not None else []
+
     if len(profiles) != 0:
+        is_sqlite = options.export_format == ExportFormat.SQLITE
+        output_suffix = "" if is_sqlite else Constants.PROFILES_OUTPUT_SUFFIX
+        export_file = _get_export_file(options, Constants.RESULTS_PROFILES_FOLDER, Constants.PROFILES_FILE_PREFIX, output_suffix)
+        if export_file is None:
+            return
+
+        file_path, file_name = export_file
+        if is_sqlite:
+            _export_profiles_to_sqlite(profiles, os.path.join(file_path, file_name + Constants.SQLITE_EXTENSION), matches)
+        else:
+            _export_profiles_to_csv(profiles, file_path, file_name, matches)
+
+def _validate_options(options: ExportOptions | None) -> ExportOptions:
+    """Validate the export options.
+
+    Returns:
+        ExportOptions: The given options, or the default interactive options if None was given
+    """
+    if options is None:
+        return ExportOptions()
+    if not isinstance(options, ExportOptions):
+        raise TypeError(f"Invalid options type. Expected type: ExportOptions, actual type: {type(options)}")
+    if options.export_format not in _FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported export format: {options.export_format}")
+    return options
+
+def _get_export_file(
+    options: ExportOptions, results_folder_name: str, file_prefix: str, output_suffix: str = ""
+) -> tuple[str, str] | None:
+    """Get the folder and the name of the export file, asking the user only if the options are interactive.
+    Existing SQLite databases are merged with instead of overwritten, so the user isn't asked about them.
+
+    Arguments:
+        options (ExportOptions): The export options
+        results_folder_name (str): Name of the results folder used when no output is given
+        file_prefix (str): Prefix of the timestamped file name used when no output is given
+        output_suffix (str): Suffix appended to the file name of the given output
+
+    Returns:
+        tuple[str, str] | None: The folder and the file name without extension, None if the export is cancelled
+    """
+    extension = _FILE_EXTENSIONS[options.export_format]
+    is_merged = options.export_format == ExportFormat.SQLITE
+
+    if options.is_interactive():
         is_start_export = _get_export_confirmation()
-        if is_start_export == True:
-            file_path = _get_export_path(Constants.RESULTS_PROFILES_FOLDER)
-            file_name = _get_file_name(file_path)
-            if file_name is not None:
-                _export_profiles_to_csv(profiles, file_path, file_name)
-            else:
-                console.print("[red]Export cancelled.[/red]")
+        if is_start_export != True:
+            return None
+
+        file_path = _get_export_path(results_folder_name)
+        file_name = _get_file_name(file_path, options.overwrite or is_merged, extension)
+        if file_name is None:
+            console.print("[red]Export cancelled.[/red]")
+        return None if file_name is None else (file_path, file_name)
+
+    if options.output is not None:
+        file_path, file_name = os.path.split(os.path.abspath(options.output))
+        if file_name.endswith(extension):
+            file_name = os.path.splitext(file_name)[0]
+        file_name += output_suffix
+        try:
+            os.makedirs(file_path, exist_ok=True)
+        except Exception as e:
+            console.print(f"[red]Failed to create output folder: {e}[/red]")
+            raise
+    else:
+        file_path = _get_export_path(results_folder_name)
+        file_name = f"{file_prefix}_{datetime.now().strftime(Constants.FILE_TIMESTAMP_FORMAT)}"
+
+    full_path = os.path.join(file_path, file_name + extension)
+    if os.path.exists(full_path) and not options.overwrite and not is_merged:
+        if options.no_prompt:
+            console.print(f"[red]File {full_path} already exists, use --overwrite to replace it. Export cancelled.[/red]")
+            return None
+        if _ask_overwrite_existing_file() == ExportChoice.NO_EXPORT:
+            console.print("[red]Export cancelled.[/red]")
+            return None
+
+    return file_path, file_name
 
 def _get_export_confirmation() -> bool:
     """Ask the user for confirmation to export data to CSV.
@@ -88,8 +235,9 @@ def _get_export_path(results_folder_name: str) -> str:
     
     return results_folder
 
-def _get_file_name(path: str) -> str | None:
-    """Get the file name from the user for the exported CSV file.
+def _get_file_name(path: str, overwrite: bool = False, extension: str = Constants.CSV_EXTENSION) -> str | None:
+    """Get the file name from the user for the exported file.
+    If overwrite is set, an existing file is overwritten without asking.
     
      Returns:
         str: The file name for the exported CSV file
@@ -121,14 +269,14 @@ def _get_file_name(path: str) -> str | None:
         if not error_occured:
             break
     
-    full_path = os.path.join(path, file_name + Constants.CSV_EXTENSION)
-    if os.path.exists(full_path):
+    full_path = os.path.join(path, file_name + extension)
+    if os.path.exists(full_path) and not overwrite:
         overwrite_choice = _ask_overwrite_existing_file()
         if overwrite_choice == ExportChoice.NO_EXPORT:
             return None
 
-    # Removing the csv extension from the file name if it has one
-    if file_name.endswith(Constants.CSV_EXTENSION):
+    # Removing the extension from the file name if it has one
+    if file_name.endswith(extension):
         file_name = os.path.splitext(file_name)[0]
 
     return file_name
@@ -152,13 +300,16 @@ def _ask_overwrite_existing_file() -> ExportChoice:
         return ExportChoice.NO_EXPORT
     return ExportChoice.EXPORT
 
-def _export_webparser_data_to_csv(info: WebsiteInfo, file_path: str, file_name: str):
+def _export_webparser_data_to_csv(info: WebsiteInfo, file_path: str, file_name: str) -> bool:
     """Export the website information to a CSV file.
     
      Args:
         info (WebsiteInfo): The website information to export
         file_path (str): The file path to export the CSV file to
         file_name (str): The name of the CSV file
+
+    Returns:
+        bool: True if the file was written
     """
     if not isinstance(info, WebsiteInfo):
         raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
@@ -170,9 +321,11 @@ def _export_webparser_data_to_csv(info: WebsiteInfo, file_path: str, file_name:
     if info.has_data():
         data_columns = _get_data_columns(info)
         full_path = os.path.join(file_path, file_name + Constants.CSV_EXTENSION)
+        # Write to a temporary file and rename it, so an existing file is never left half overwritten
+        temp_path = full_path + Constants.TEMP_FILE_SUFFIX
         csv_file = None
         try:
-            with open(full_path, mode='w', newline='', encoding=Constants.UTF8_ENCODING) as csv_file:
+            with open(temp_path, mode='w', newline='', encoding=Constants.UTF8_ENCODING) as csv_file:
                 columns = data_columns.keys()
                 writer = csv.DictWriter(csv_file, fieldnames=columns, delimiter=Constants.CSV_DELIMITER, quoting=csv.QUOTE_NONNUMERIC)
                 writer.writeheader()
@@ -181,26 +334,30 @@ def _export_webparser_data_to_csv(info: WebsiteInfo, file_path: str, file_name:
                 for row_values in zip_longest(*data_columns.values(), fillvalue=""):
                     row = dict(zip(columns, row_values))
                     writer.writerow(row)
+            os.replace(temp_path, full_path)
 
             console.print(f"[green]Export completed successfully to {file_path}/{file_name}{Constants.CSV_EXTENSION}[/green]")
+            return True
         except Exception as e:
             console.print(f"[red]Failed to export data to CSV: {e}[/red]")
-            if csv_file is not None and os.path.exists(full_path):
+            if csv_file is not None and os.path.exists(temp_path):
                 try:
-                    os.remove(full_path)
+                    os.remove(temp_path)
                 except Exception as delete_error:
                     console.print(f"[red]Failed to delete incomplete CSV file: {delete_error}[/red]")
         finally:
-            if csv_file is not None and os.path.exists(full_path):
+            if csv_file is not None:
                 csv_file.close()
+    return False
 
-def _export_profiles_to_csv(profiles: dict[str, str], file_path: str, file_name: str):
+def _export_profiles_to_csv(profiles: dict[str, str], file_path: str, file_name: str, matches: list[NameMatch] | None = None):
     """Export the website information to a CSV file.
     
      Args:
         profiles (dict[str, str]): The profiles information to export
         file_path (str): The file path to export the CSV file to
         file_name (str): The name of the CSV file
+        matches (list[NameMatch] | None): The names of the website matched to the profiles, exported as an extra column
     """
     if not isinstance(profiles, dict):
         raise TypeError(f"Invalid profiles type. Expected type: dict, actual type: {type(profiles)}")
@@ -211,27 +368,89 @@ def _export_profiles_to_csv(profiles: dict[str, str], file_path: str, file_name:
     
     if len(profiles) != 0:
         full_path = os.path.join(file_path, file_name + Constants.CSV_EXTENSION)
+        # Write to a temporary file and rename it, so an existing file is never left half overwritten
+        temp_path = full_path + Constants.TEMP_FILE_SUFFIX
         csv_file = None
         try:
-            with open(full_path, mode='w', newline='', encoding=Constants.UTF8_ENCODING) as csv_file:
+            with open(temp_path, mode='w', newline='', encoding=Constants.UTF8_ENCODING) as csv_file:
                 writer = csv.writer(csv_file, delimiter=Constants.CSV_DELIMITER, quoting=csv.QUOTE_NONNUMERIC)
-                writer.writerow([ProfilesCsvHeaderText.NAME.value, ProfilesCsvHeaderText.LINKEDIN_PROFILE.value])
+                header = [ProfilesCsvHeaderText.NAME.value, ProfilesCsvHeaderText.LINKEDIN_PROFILE.value]
+                matched_names: dict[str, list[str]] = dict()
+                for match in matches or []:
+                    matched_names.setdefault(match.profile_url, []).append(f"{match.name} ({match.source_url})")
+                if matches:
+                    header.append(ProfilesCsvHeaderText.MATCHED_NAMES.value)
+                writer.writerow(header)
 
                 for url, name in profiles.items():
-                    writer.writerow([name, url])
+                    row = [name, url]
+                    if matches:
+                        row.append(Constants.CSV_LIST_SEPARATOR.join(matched_names.get(url, [])))
+                    writer.writerow(row)
+            os.replace(temp_path, full_path)
 
             console.print(f"[green]Export completed successfully to {file_path}/{file_name}{Constants.CSV_EXTENSION}[/green]")
         except Exception as e:
             console.print(f"[red]Failed to export data to CSV: {e}[/red]")
-            if csv_file is not None and os.path.exists(full_path):
+            if csv_file is not None and os.path.exists(temp_path):
                 try:
-                    os.remove(full_path)
+                    os.remove(temp_path)
                 except Exception as delete_error:
                     console.print(f"[red]Failed to delete incomplete CSV file: {delete_error}[/red]")
         finally:
-            if csv_file is not None and os.path.exists(full_path):
+            if csv_file is not None:
                 csv_file.close()
 
+def _export_webparser_data_to_sqlite(info: WebsiteInfo, database_path: str) -> bool:
+    """Upsert the website information into an SQLite database.
+
+    Arguments:
+        info (WebsiteInfo): The website information to export
+        database_path (str): Path of the SQLite database
+
+    Returns:
+        bool: True if every row was committed
+    """
+    try:
+        with WebparserSqliteWriter(database_path) as writer:
+            writer.write_info(info)
+    except Exception as e:
+        console.print(f"[red]Failed to export data to SQLite: {e}[/red]")
+        return False
+
+    if writer.failed:
+        return False
+    console.print(f"[green]Export completed successfully to {database_path}[/green]")
+    return True
+
+def _export_profiles_to_sqlite(profiles: dict[str, str], database_path: str, matches: list[NameMatch] | None = None):
+    """Upsert the LinkedIn profiles and the names matched to them into an SQLite database.
+
+    Arguments:
+        profiles (dict[str, str]): The profiles information to export
+        database_path (str): Path of the SQLite database
+        matches (list[NameMatch] | None): The names of the website matched to the profiles
+    """
+    try:
+        with WebparserSqliteWriter(database_path) as writer:
+            writer.write_profiles(profiles)
+            writer.write_name_matches(matches or [])
+    except Exception as e:
+        console.print(f"[red]Failed to export data to SQLite: {e}[/red]")
+        return
+
+    if not writer.failed:
+        console.print(f"[green]Export completed successfully to {database_path}[/green]")
+
+def _consume_pages(pages: Iterable[PageResult]):
+    """Consume the pages without exporting them, so the parsing still runs to completion.
+
+    Arguments:
+        pages (Iterable[PageResult]): The results of the parsed pages
+    """
+    for _ in pages:
+        pass
+
 def _get_data_columns(info: WebsiteInfo) -> dict[str, list[str]]:
     """Get the data columns from the WebsiteInfo object for CSV export.
 
@@ -254,4 +473,139 @@ def _get_data_columns(info: WebsiteInfo) -> dict[str, list[str]]:
     if info.found_addresses:
         data_columns[WebparserCsvHeaderText.ADDRESSES.value] = [f"{address} ({url})" for address, url in info.found_addresses.items()]
 
-    return data_columns
\ No newline at end of file
+    return data_columns
+
+class WebparserCsvStreamWriter:
+    """Row-oriented CSV writer that appends the found entities while the website is being parsed.
+    The rows are written to a partial file next to the CSV file, which is opened once.
+    Every row contains the entity type, the entity and the URL where it was found.
+    The rows are flushed to the file after every page and every CSV_FLUSH_INTERVAL_ROWS rows,
+    so only a small buffer is kept in memory. On close the partial file is renamed to the CSV file,
+    or removed if no rows were written. If the writer is exited with an exception, the partial file is kept
+    and an existing CSV file is left untouched.
+    If writing fails, the error is printed, the rows written so far are kept in the partial file and the following rows are skipped.
+
+    Attributes:
+        full_path (str): Path of the CSV file
+        partial_path (str): Path of the partial file the rows are written to until the writer is closed
+        rows_written (int): Number of rows written, the header is not included
+        failed (bool): True if writing to the file failed
+
+    Methods:
+        write_page(page_result) -> int: Write the new entities of a page, return the number of rows written
+        write_entity(entity_type, entity, website_url): Write a single entity
+        flush(): Flush the written rows to the file
+        close(keep_partial): Flush and close the file
+    """
+
+    def __init__(self, full_path: str, flush_interval_rows: int = Constants.CSV_FLUSH_INTERVAL_ROWS):
+        if not isinstance(full_path, str):
+            raise TypeError(f"Invalid full_path type. Expected type: str, actual type: {type(full_path)}")
+        if not isinstance(flush_interval_rows, int):
+            raise TypeError(f"Invalid flush_interval_rows type. Expected type: int, actual type: {type(flush_interval_rows)}")
+        if flush_interval_rows < 1:
+            raise ValueError("The flush interval must be at least 1 row")
+
+        self.full_path = full_path
+        self.partial_path = full_path + Constants.PARTIAL_FILE_SUFFIX
+        self.rows_written = 0
+        self.failed = False
+        self._flush_interval_rows = flush_interval_rows
+        self._rows_since_flush = 0
+        self._csv_file = open(self.partial_path, mode='w', newline='', encoding=Constants.UTF8_ENCODING)
+        self._writer = csv.writer(self._csv_file, delimiter=Constants.CSV_DELIMITER, quoting=csv.QUOTE_NONNUMERIC)
+        self._writer.writerow([header.value for header in WebparserStreamCsvHeaderText])
+
+    def __enter__(self) -> "WebparserCsvStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # The rows of an interrupted parsing are incomplete, they must not replace the CSV file
+        self.close(keep_partial=exc_type is not None)
+
+    def write_page(self, page_result: PageResult) -> int:
+        """Write the entities found for the first time on the page and flush them to the file.
+
+        Arguments:
+            page_result (PageResult): The result of the parsed page
+
+        Returns:
+            int: The number of rows written
+        """
+        if not isinstance(page_result, PageResult):
+            raise TypeError(f"Invalid page_result type. Expected type: PageResult, actual type: {type(page_result)}")
+
+        rows_before = self.rows_written
+        website_url = page_result.url.rstrip(" /")
+        for entity_type, entities in page_result.new_entities.items():
+            for entity in entities:
+                self.write_entity(entity_type, entity, website_url)
+        self.flush()
+
+        return self.rows_written - rows_before
+
+    def write_entity(self, entity_type: EntityType, entity: str, website_url: str):
+        """Write a single entity to the file.
+
+        Arguments:
+            entity_type (EntityType): Type of the entity
+            entity (str): The found entity
+            website_url (str): The website's URL where the entity was found
+        """
+        if not isinstance(entity_type, EntityType):
+            raise TypeError(f"Invalid entity_type type. Expected type: EntityType, actual type: {type(entity_type)}")
+        if self.failed:
+            return
+
+        try:
+            self._writer.writerow([entity_type.value, entity, website_url])
+        except Exception as e:
+            self._handle_write_error(e)
+            return
+
+        self.rows_written += 1
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= self._flush_interval_rows:
+            self.flush()
+
+    def flush(self):
+        """Flush the written rows to the file."""
+        if self.failed or self._csv_file.closed or self._rows_since_flush == 0:
+            return
+
+        try:
+            self._csv_file.flush()
+        except Exception as e:
+            self._handle_write_error(e)
+            return
+        self._rows_since_flush = 0
+
+    def close(self, keep_partial: bool = False):
+        """Flush and close the file.
+        The partial file is removed if no rows were written, renamed to the CSV file if writing didn't fail.
+
+        Arguments:
+            keep_partial (bool): Keep the rows in the partial file instead of renaming it, e.g. if the parsing was interrupted
+        """
+        if self._csv_file.closed:
+            return
+
+        self.flush()
+        self._csv_file.close()
+        if keep_partial and self.rows_written > 0:
+            console.print(f"[yellow]Export interrupted, the rows written so far are kept in {self.partial_path}[/yellow]")
+        elif self.rows_written == 0:
+            try:
+                os.remove(self.partial_path)
+            except Exception as delete_error:
+                console.print(f"[red]Failed to delete empty CSV file: {delete_error}[/red]")
+        elif not self.failed:
+            try:
+                os.replace(self.partial_path, self.full_path)
+            except Exception as e:
+                self._handle_write_error(e)
+
+    def _handle_write_error(self, error: Exception):
+        """Print the error and skip the following rows, the rows written before are kept in the partial file."""
+        self.failed = True
+        console.print(f"[red]Failed to export data to CSV, the rows written so far are kept in {self.partial_path}: {error}[/red]")
\ No newline at end of file
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from globals.enums import ExportFormat
+
+@dataclass(frozen=True)
+class ExportOptions:
+    """Options of the export that replace the interactive prompts, e.g. for unattended runs.
+    With the default values the user is asked for confirmation, the file name and overwriting existing files.
+
+    Attributes:
+        output (str | None): Path of the exported file. The confirmation and file name prompts are skipped if it's set
+        export_format (ExportFormat): Format of the exported file
+        overwrite (bool): Overwrite an existing file without asking
+        no_prompt (bool): Never ask the user. Without output the file gets a timestamped name in the results folder,
+            existing files are only overwritten if overwrite is set
+
+    Methods:
+        is_interactive() -> bool: Check if the user has to be asked for the export file
+    """
+
+    output: str | None = None
+    export_format: ExportFormat = ExportFormat.CSV
+    overwrite: bool = False
+    no_prompt: bool = False
+
+    def is_interactive(self) -> bool:
+        """Check if the user has to be asked for confirmation and the file name.
+
+        Returns:
+            bool: True if neither the output nor the no prompt option is set, False otherwise
+        """
+        return self.output is None and not self.no_prompt
\ No newline at end of file
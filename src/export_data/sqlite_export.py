@@ -0,0 +1,319 @@
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from export_data import constants as Constants
+from linkedin_links.models import NameMatch
+from rich.console import Console
+from urllib.parse import urlsplit
+from website.enums import EntityType
+from website.models import PageResult, WebsiteInfo
+import sqlite3
+
+console = Console(log_path=False)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS pages_url_index ON pages (url);
+CREATE INDEX IF NOT EXISTS pages_domain_index ON pages (domain);
+
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    value TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS entities_type_value_domain_index ON entities (entity_type, value, domain);
+-- Covers the lookups of the entities of a domain, so they are answered from the index alone
+CREATE INDEX IF NOT EXISTS entities_domain_type_index ON entities (domain, entity_type, value);
+
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    name TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS profiles_url_index ON profiles (url);
+
+CREATE TABLE IF NOT EXISTS name_matches (
+    id INTEGER PRIMARY KEY,
+    profile_url TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    score REAL NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS name_matches_profile_name_index ON name_matches (profile_url, name);
+"""
+
+# The first URL of a page or an entity is kept, only the last seen timestamp is updated on conflict
+_UPSERT_PAGE = """
+INSERT INTO pages (url, domain, first_seen, last_seen) VALUES (?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET last_seen = excluded.last_seen
+"""
+_UPSERT_ENTITY = """
+INSERT INTO entities (entity_type, value, domain, source_url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (entity_type, value, domain) DO UPDATE SET last_seen = excluded.last_seen
+"""
+_UPSERT_PROFILE = """
+INSERT INTO profiles (url, name, first_seen, last_seen) VALUES (?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET name = excluded.name, last_seen = excluded.last_seen
+"""
+_UPSERT_NAME_MATCH = """
+INSERT INTO name_matches (profile_url, name, source_url, score, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (profile_url, name) DO UPDATE SET score = excluded.score, last_seen = excluded.last_seen
+"""
+
+def get_domain(website_url: str) -> str:
+    """Get the domain of the URL that the pages and entities are indexed by.
+
+    Arguments:
+        website_url (str): The website's URL
+
+    Returns:
+        str: The lowercase host name of the URL without the 'www.' prefix
+    """
+    if not isinstance(website_url, str):
+        raise TypeError(f"Invalid website_url type. Expected type: str, actual type: {type(website_url)}")
+
+    domain = (urlsplit(website_url.strip()).hostname or "").lower()
+    return domain.removeprefix("www.")
+
+class WebparserSqliteWriter:
+    """Writer that upserts the parsed pages, the found entities, the LinkedIn profiles and the names matched to them
+    into an SQLite database.
+    The database is opened in WAL mode and created with the schema if it doesn't exist, an existing database is merged with.
+    Entities are unique by their type, value and domain, pages and profiles by their URL, name matches by their profile and name,
+    so exporting the same website again only updates the last seen timestamps.
+    The rows are buffered and written in a single transaction every SQLITE_BATCH_SIZE rows and on flush.
+    If writing fails, the error is printed, the batches committed so far are kept and the following rows are skipped.
+
+    Attributes:
+        database_path (str): Path of the SQLite database
+        rows_written (int): Number of entity, profile and name match rows written, including the updated ones
+        failed (bool): True if writing to the database failed
+
+    Methods:
+        write_page(page_result) -> int: Write the page and its new entities, return the number of entity rows written
+        write_info(info) -> int: Write the pages and every entity of the website information, return the number of entity rows written
+        write_entity(entity_type, entity, website_url): Write a single entity
+        write_profiles(profiles) -> int: Write the LinkedIn profiles, return the number of rows written
+        write_name_matches(matches) -> int: Write the names matched to the profiles, return the number of rows written
+        flush(): Commit the buffered rows
+        close(): Commit the buffered rows and close the database
+    """
+
+    def __init__(self, database_path: str, batch_size: int = Constants.SQLITE_BATCH_SIZE):
+        if not isinstance(database_path, str):
+            raise TypeError(f"Invalid database_path type. Expected type: str, actual type: {type(database_path)}")
+        if not isinstance(batch_size, int):
+            raise TypeError(f"Invalid batch_size type. Expected type: int, actual type: {type(batch_size)}")
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1 row")
+
+        self.database_path = database_path
+        self.rows_written = 0
+        self.failed = False
+        self._batch_size = batch_size
+        self._pages: list[tuple[str, str, str, str]] = []
+        self._entities: list[tuple[str, str, str, str, str, str]] = []
+        self._profiles: list[tuple[str, str, str, str]] = []
+        self._name_matches: list[tuple[str, str, str, float, str, str]] = []
+        self._connection = sqlite3.connect(database_path)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # With WAL, NORMAL only syncs on checkpoints, a committed batch can't be corrupted, only lost on power failure
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        except Exception:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> "WebparserSqliteWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, page_result: PageResult) -> int:
+        """Write the page and the entities found for the first time on it, then commit them.
+
+        Arguments:
+            page_result (PageResult): The result of the parsed page
+
+        Returns:
+            int: The number of entity rows written
+        """
+        if not isinstance(page_result, PageResult):
+            raise TypeError(f"Invalid page_result type. Expected type: PageResult, actual type: {type(page_result)}")
+
+        rows_before = self.rows_written
+        website_url = page_result.url.rstrip(" /")
+        self._add_page(website_url)
+        for entity_type, entities in page_result.new_entities.items():
+            for entity in entities:
+                self.write_entity(entity_type, entity, website_url)
+        self.flush()
+
+        return self.rows_written - rows_before
+
+    def write_info(self, info: WebsiteInfo) -> int:
+        """Write the pages and every entity of the website information with the URL where it was first found, then commit them.
+        The pages are the URLs of the entity store, or the URLs where the entities were first found if the store wasn't collected.
+        The parsed pages without any entities are only written by write_page.
+
+        Arguments:
+            info (WebsiteInfo): The information found during the parsing process
+
+        Returns:
+            int: The number of entity rows written
+        """
+        if not isinstance(info, WebsiteInfo):
+            raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
+
+        rows_before = self.rows_written
+        entities_by_type = {
+            EntityType.NAME: info.found_names,
+            EntityType.EMAIL: info.found_emails,
+            EntityType.PHONE_NUMBER: info.found_phone_numbers,
+            EntityType.ADDRESS: info.found_addresses,
+        }
+        if info.entity_store is not None:
+            page_urls = info.entity_store.urls()
+        else:
+            page_urls = (website_url for found_entities in entities_by_type.values() for website_url in found_entities.values())
+        # The URLs are stripped the same way as by write_page, so both exports upsert the same page rows
+        for website_url in dict.fromkeys(website_url.rstrip(" /") for website_url in page_urls):
+            self._add_page(website_url)
+        for entity_type, found_entities in entities_by_type.items():
+            for entity, website_url in found_entities.items():
+                self.write_entity(entity_type, entity, website_url.rstrip(" /"))
+        self.flush()
+
+        return self.rows_written - rows_before
+
+    def write_entity(self, entity_type: EntityType, entity: str, website_url: str):
+        """Buffer a single entity, the buffered rows are committed when the batch is full.
+
+        Arguments:
+            entity_type (EntityType): Type of the entity
+            entity (str): The found entity
+            website_url (str): The website's URL where the entity was found
+        """
+        if not isinstance(entity_type, EntityType):
+            raise TypeError(f"Invalid entity_type type. Expected type: EntityType, actual type: {type(entity_type)}")
+        if self.failed:
+            return
+
+        timestamp = _get_timestamp()
+        self._entities.append((entity_type.value, entity, get_domain(website_url), website_url, timestamp, timestamp))
+        self.rows_written += 1
+        self._flush_if_batch_full()
+
+    def write_profiles(self, profiles: dict[str, str]) -> int:
+        """Write the LinkedIn profiles, then commit them.
+
+        Arguments:
+            profiles (dict[str, str]): The LinkedIn profiles. Key: profile URL, Value: name
+
+        Returns:
+            int: The number of profile rows written
+        """
+        if not isinstance(profiles, dict):
+            raise TypeError(f"Invalid profiles type. Expected type: dict, actual type: {type(profiles)}")
+
+        rows_before = self.rows_written
+        for url, name in profiles.items():
+            if self.failed:
+                break
+            timestamp = _get_timestamp()
+            self._profiles.append((url, name, timestamp, timestamp))
+            self.rows_written += 1
+            self._flush_if_batch_full()
+        self.flush()
+
+        return self.rows_written - rows_before
+
+    def write_name_matches(self, matches: Iterable[NameMatch]) -> int:
+        """Write the names of the website matched to the LinkedIn profiles, then commit them.
+
+        Arguments:
+            matches (Iterable[NameMatch]): The matched names, e.g. the result of match_names
+
+        Returns:
+            int: The number of name match rows written
+        """
+        rows_before = self.rows_written
+        for match in matches:
+            if not isinstance(match, NameMatch):
+                raise TypeError(f"Invalid match type. Expected type: NameMatch, actual type: {type(match)}")
+            if self.failed:
+                break
+            timestamp = _get_timestamp()
+            self._name_matches.append((match.profile_url, match.name, match.source_url, match.score, timestamp, timestamp))
+            self.rows_written += 1
+            self._flush_if_batch_full()
+        self.flush()
+
+        return self.rows_written - rows_before
+
+    def flush(self):
+        """Commit the buffered rows in a single transaction."""
+        if self.failed or not (self._pages or self._entities or self._profiles or self._name_matches):
+            return
+
+        try:
+            with self._connection:
+                self._connection.executemany(_UPSERT_PAGE, self._pages)
+                self._connection.executemany(_UPSERT_ENTITY, self._entities)
+                self._connection.executemany(_UPSERT_PROFILE, self._profiles)
+                self._connection.executemany(_UPSERT_NAME_MATCH, self._name_matches)
+        except Exception as e:
+            self.rows_written -= len(self._entities) + len(self._profiles) + len(self._name_matches)
+            self._handle_write_error(e)
+        finally:
+            self._pages.clear()
+            self._entities.clear()
+            self._profiles.clear()
+            self._name_matches.clear()
+
+    def close(self):
+        """Commit the buffered rows and close the database."""
+        if self._connection is None:
+            return
+
+        self.flush()
+        self._connection.close()
+        self._connection = None
+
+    def _add_page(self, website_url: str):
+        """Buffer the page, the buffered rows are committed when the batch is full."""
+        if self.failed:
+            return
+
+        timestamp = _get_timestamp()
+        self._pages.append((website_url, get_domain(website_url), timestamp, timestamp))
+        self._flush_if_batch_full()
+
+    def _flush_if_batch_full(self):
+        """Commit the buffered rows if the batch is full."""
+        if len(self._pages) + len(self._entities) + len(self._profiles) + len(self._name_matches) >= self._batch_size:
+            self.flush()
+
+    def _handle_write_error(self, error: Exception):
+        """Print the error and skip the following rows, the batches committed before are kept."""
+        self.failed = True
+        console.print(f"[red]Failed to export data to SQLite, the rows written so far are kept in {self.database_path}: {error}[/red]")
+
+def _get_timestamp() -> str:
+    """Get the current UTC time in ISO 8601 format, which sorts chronologically as text."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
\ No newline at end of file
@@ -0,0 +1,9 @@
+LOG_BUFFER_SIZE = 1000
+UTF8_ENCODING = "utf-8"
+PROGRESS_REFRESH_SECONDS = 20
+TRACE_CATEGORY = "webparser"
+TIMING_PERCENTILES = (50, 90, 99)
+RESULTS_PROFILING_FOLDER = "results_profiling"
+PROFILE_TOP_N = 30
+PROFILE_SNAPSHOT_PAGES = 3
+PROFILE_FILE_TIMESTAMP_FORMAT = "%Y_%m_%d_%H%M%S"
\ No newline at end of file
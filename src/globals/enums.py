@@ -3,4 +3,30 @@ from enum import Enum
 class DataRegion(Enum):
     HUNGARY = 'hu'
     UNITED_STATES = 'us'
-    GREAT_BRITAIN = 'gb'
\ No newline at end of file
+    GREAT_BRITAIN = 'gb'
+
+class ExportFormat(Enum):
+    CSV = 'csv'
+    SQLITE = 'sqlite'
+
+class LogMode(Enum):
+    RICH = 'rich'
+    QUIET = 'quiet'
+    JSON = 'json'
+
+class LogLevel(Enum):
+    INFO = 'info'
+    SUCCESS = 'success'
+    WARNING = 'warning'
+    ERROR = 'error'
+
+class ProgressDisplay(Enum):
+    RICH = 'rich'
+    PLAIN_TEXT = 'plain_text'
+    NONE = 'none'
+
+class JobStatus(Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
\ No newline at end of file
@@ -0,0 +1,62 @@
+from globals.enums import DataRegion
+import re
+import unicodedata
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PHONE_NUMBER_PATTERN = re.compile(r"[^\d+]")
+
+def normalize_email(email: str) -> str:
+    """Normalize the email for deduplication.
+
+    Arguments:
+        email (str): The email to normalize
+
+    Returns:
+        str: The lowercase email without surrounding whitespace
+    """
+    if not isinstance(email, str):
+        raise TypeError(f"Invalid email type. Expected type: str, actual type: {type(email)}")
+
+    return email.strip().lower()
+
+def normalize_phone_number(phone_number: str, region: DataRegion) -> str:
+    """Normalize the phone number for deduplication.
+    Numbers without a country code are parsed as numbers of the given region.
+
+    Arguments:
+        phone_number (str): The phone number to normalize
+        region (DataRegion): The primary region of the phone number
+
+    Returns:
+        str: The phone number in E.164 format, e.g. '+36301234567',
+            or its digits and the leading '+' if it can't be parsed
+    """
+    if not isinstance(phone_number, str):
+        raise TypeError(f"Invalid phone_number type. Expected type: str, actual type: {type(phone_number)}")
+    if not isinstance(region, DataRegion):
+        raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+
+    import phonenumbers
+
+    try:
+        parsed_number = phonenumbers.parse(phone_number, region.value.upper())
+    except phonenumbers.NumberParseException:
+        return _PHONE_NUMBER_PATTERN.sub("", phone_number)
+    return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
+
+def normalize_text(text: str) -> str:
+    """Normalize a name or an address for deduplication.
+    Accents are removed, so 'Kovács Péter' and 'Kovacs Peter' are the same.
+
+    Arguments:
+        text (str): The text to normalize
+
+    Returns:
+        str: The case-folded text without accents and with single spaces between the words
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"Invalid text type. Expected type: str, actual type: {type(text)}")
+
+    decomposed_text = unicodedata.normalize("NFKD", text)
+    folded_text = "".join(character for character in decomposed_text if not unicodedata.combining(character)).casefold()
+    return _WHITESPACE_PATTERN.sub(" ", folded_text).strip()
\ No newline at end of file
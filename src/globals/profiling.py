@@ -0,0 +1,183 @@
+from collections import Counter
+from datetime import datetime
+from globals import constants as Constants
+from globals.tracing import Tracer, tracer as default_tracer
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+
+class CrawlProfiler:
+    """Profiler of a crawl, writing a cProfile report and the allocations of each stage to the profiling results folder.
+    The allocations are attributed to the stages through the spans of the tracer: everything allocated between the end
+    of the previous span and the end of a span belongs to that span's stage.
+    The net and peak allocations of every stage are measured on every page. The allocating source lines are compared
+    with tracemalloc snapshots only on the first PROFILE_SNAPSHOT_PAGES pages, because a snapshot of a process with
+    the NLP models loaded takes long. cProfile only profiles the thread that started the profiler.
+
+    Attributes:
+        report_paths (list[str]): Paths of the written reports
+
+    Methods:
+        start(): Start profiling
+        stop(): Stop profiling, does nothing if the profiler isn't running
+        write_reports(folder_path) -> list[str]: Write the reports, return their paths
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer = default_tracer,
+        top_n: int = Constants.PROFILE_TOP_N,
+        snapshot_pages: int = Constants.PROFILE_SNAPSHOT_PAGES,
+    ):
+        if not isinstance(top_n, int) or top_n < 1:
+            raise ValueError("The number of reported lines must be a positive integer")
+        if not isinstance(snapshot_pages, int) or snapshot_pages < 0:
+            raise ValueError("The number of snapshot pages must be a non-negative integer")
+
+        self.report_paths: list[str] = []
+        self._tracer = tracer
+        self._top_n = top_n
+        self._snapshot_pages = snapshot_pages
+        self._profile = cProfile.Profile()
+        self._is_running = False
+        self._lock = threading.Lock()
+        self._is_tracemalloc_started = False
+        self._first_stage: str | None = None
+        self._stage_spans: Counter[str] = Counter()
+        self._stage_net_bytes: Counter[str] = Counter()
+        self._stage_peak_bytes: dict[str, int] = dict()
+        self._stage_line_bytes: dict[str, Counter[str]] = dict()
+        self._last_traced_bytes = 0
+        self._last_snapshot: tracemalloc.Snapshot | None = None
+
+    def __enter__(self) -> "CrawlProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start profiling the calling thread and tracing the allocations of every thread."""
+        if self._is_running:
+            raise RuntimeError("The profiler is already running")
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._is_tracemalloc_started = True
+        tracemalloc.reset_peak()
+        self._last_traced_bytes = tracemalloc.get_traced_memory()[0]
+        if self._snapshot_pages > 0:
+            self._last_snapshot = self._take_snapshot()
+        self._tracer.add_listener(self._on_span_end)
+        self._is_running = True
+        self._profile.enable()
+
+    def stop(self):
+        """Stop profiling, does nothing if the profiler isn't running."""
+        if not self._is_running:
+            return
+
+        self._profile.disable()
+        self._is_running = False
+        self._tracer.remove_listener(self._on_span_end)
+        self._last_snapshot = None
+        if self._is_tracemalloc_started:
+            tracemalloc.stop()
+            self._is_tracemalloc_started = False
+
+    def write_reports(self, folder_path: str | None = None) -> list[str]:
+        """Write the cProfile statistics, the cProfile report and the allocation report.
+
+        Arguments:
+            folder_path (str | None): Folder of the reports, the profiling results folder next to the CSV results if None
+
+        Returns:
+            list[str]: Paths of the written reports
+        """
+        if folder_path is None:
+            folder_path = get_profiling_results_path()
+        os.makedirs(folder_path, exist_ok=True)
+        file_prefix = os.path.join(folder_path, f"profile_{datetime.now().strftime(Constants.PROFILE_FILE_TIMESTAMP_FORMAT)}")
+
+        # The binary statistics can be opened with pstats or snakeviz
+        statistics_path = f"{file_prefix}.prof"
+        self._profile.dump_stats(statistics_path)
+
+        cprofile_report_path = f"{file_prefix}_cprofile.txt"
+        report = io.StringIO()
+        pstats.Stats(self._profile, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top_n)
+        with open(cprofile_report_path, mode='w', encoding=Constants.UTF8_ENCODING) as report_file:
+            report_file.write(report.getvalue())
+
+        allocations_report_path = f"{file_prefix}_allocations.txt"
+        with open(allocations_report_path, mode='w', encoding=Constants.UTF8_ENCODING) as report_file:
+            report_file.write(self.get_allocations_report())
+
+        self.report_paths = [statistics_path, cprofile_report_path, allocations_report_path]
+        return self.report_paths
+
+    def get_allocations_report(self) -> str:
+        """Return the allocations of every stage as text.
+
+        Returns:
+            str: The spans, net and peak allocations, and the top allocating lines of every stage
+        """
+        lines = []
+        with self._lock:
+            for stage, span_count in self._stage_spans.items():
+                lines.append(
+                    f"Stage {stage}: {span_count} spans, net {self._stage_net_bytes[stage] / 1024:.1f} KiB, "
+                    f"max peak {self._stage_peak_bytes.get(stage, 0) / 1024:.1f} KiB"
+                )
+                line_bytes = self._stage_line_bytes.get(stage)
+                if line_bytes:
+                    lines.append(f"  Top {self._top_n} allocating lines of the first {self._snapshot_pages} pages:")
+                    for source_line, size in line_bytes.most_common(self._top_n):
+                        lines.append(f"    {size / 1024:10.1f} KiB  {source_line}")
+                lines.append("")
+        return "\n".join(lines)
+
+    def _on_span_end(self, name: str, args: dict):
+        """Attribute the allocations since the end of the previous span to the stage of the span."""
+        with self._lock:
+            traced_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self._stage_spans[name] += 1
+            self._stage_net_bytes[name] += traced_bytes - self._last_traced_bytes
+            self._stage_peak_bytes[name] = max(self._stage_peak_bytes.get(name, 0), peak_bytes - self._last_traced_bytes)
+            self._last_traced_bytes = traced_bytes
+
+            if self._first_stage is None:
+                self._first_stage = name
+            # The first stage of a page starts the next page, snapshots are only compared on the first pages
+            if name == self._first_stage and self._stage_spans[name] > self._snapshot_pages:
+                self._last_snapshot = None
+            if self._last_snapshot is None:
+                return
+
+            snapshot = self._take_snapshot()
+            line_bytes = self._stage_line_bytes.setdefault(name, Counter())
+            for statistic_diff in snapshot.compare_to(self._last_snapshot, "lineno"):
+                if statistic_diff.size_diff > 0:
+                    line_bytes[str(statistic_diff.traceback[0])] += statistic_diff.size_diff
+            self._last_snapshot = snapshot
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot of the traced allocations without the allocations of the profiling itself."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+def get_profiling_results_path() -> str:
+    """Get the profiling results folder next to the CSV results folders.
+
+    Returns:
+        str: The path to the profiling results folder
+    """
+    root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+    return os.path.join(root_path, Constants.RESULTS_PROFILING_FOLDER)
\ No newline at end of file
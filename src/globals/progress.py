@@ -0,0 +1,181 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from globals import constants as Constants
+from globals.enums import LogMode, ProgressDisplay
+from globals.run_logger import console, run_logger
+import threading
+import time
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """The progress of a run at a point in time.
+
+    Attributes:
+        pages_done (int): Number of parsed pages
+        pages_queued (int): Number of pages waiting to be parsed
+        max_pages (int | None): Maximum number of pages of the run, None if it's unknown
+        pages_per_second (float): Parsed pages per second since the start of the run
+        entity_counts (dict[str, int]): Number of new entities found by their type
+        eta_seconds (float | None): Estimated seconds until the run finishes, None if it can't be estimated yet
+    """
+
+    pages_done: int
+    pages_queued: int
+    max_pages: int | None
+    pages_per_second: float
+    entity_counts: dict[str, int]
+    eta_seconds: float | None
+
+    def describe(self) -> str:
+        """Return the progress as a single line of text."""
+        pages = f"{self.pages_done}/{self.max_pages}" if self.max_pages is not None else str(self.pages_done)
+        entities = ", ".join(f"{entity_type}: {count}" for entity_type, count in self.entity_counts.items())
+        eta = f"{self.eta_seconds:.0f}s" if self.eta_seconds is not None else "-"
+        return (
+            f"Pages {pages} done, {self.pages_queued} queued, {self.pages_per_second:.2f} pages/s, "
+            f"ETA {eta}" + (f" | {entities}" if entities else "")
+        )
+
+class ProgressReporter:
+    """Progress of a whole run, updated by the workers as they finish pages.
+    The progress is shown with a rich progress bar on terminals, or printed as plain text lines at regular intervals,
+    by a single thread for the whole run. With the quiet and JSON logging modes nothing is shown,
+    the progress is still counted. The reporter is safe to update from several threads.
+
+    Methods:
+        start(): Start showing the progress
+        page_finished(new_entities, pages_queued): Count a parsed page and its new entities
+        set_pages_queued(pages_queued): Update the number of pages waiting to be parsed
+        snapshot() -> ProgressSnapshot: Return the current progress
+        stop(): Stop showing the progress
+    """
+
+    def __init__(
+        self,
+        max_pages: int | None = None,
+        entity_types: Iterable[Enum] = (),
+        display: ProgressDisplay | None = None,
+        refresh_seconds: float = Constants.PROGRESS_REFRESH_SECONDS,
+    ):
+        if max_pages is not None and (not isinstance(max_pages, int) or max_pages < 0):
+            raise ValueError("The maximum number of pages must be a non-negative integer or None")
+        if display is not None and not isinstance(display, ProgressDisplay):
+            raise TypeError(f"Invalid display type. Expected type: ProgressDisplay, actual type: {type(display)}")
+
+        self.max_pages = max_pages
+        self.display = display if display is not None else _get_default_display()
+        self._refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._pages_done = 0
+        self._pages_queued = 0
+        self._entity_counts: dict[str, int] = {entity_type.value: 0 for entity_type in entity_types}
+        self._start_time = time.perf_counter()
+        self._stop_event = threading.Event()
+        self._plain_text_thread: threading.Thread | None = None
+        self._progress = None
+        self._task_id = None
+
+    def __enter__(self) -> "ProgressReporter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start showing the progress, the pages per second are counted from here."""
+        self._start_time = time.perf_counter()
+        if self.display == ProgressDisplay.RICH:
+            from rich.progress import BarColumn, Progress, TextColumn
+
+            self._progress = Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.fields[status]}"),
+                console=console,
+                transient=True,
+            )
+            self._task_id = self._progress.add_task("Parsing", total=self.max_pages, status="")
+            self._progress.start()
+        elif self.display == ProgressDisplay.PLAIN_TEXT:
+            self._stop_event.clear()
+            self._plain_text_thread = threading.Thread(target=self._print_progress, daemon=True)
+            self._plain_text_thread.start()
+
+    def page_finished(self, new_entities: Mapping[Enum, Iterable[str]] | None = None, pages_queued: int | None = None):
+        """Count a parsed page and the entities found for the first time on it.
+
+        Arguments:
+            new_entities (Mapping[Enum, Iterable[str]] | None): The new entities of the page by their type
+            pages_queued (int | None): Number of pages waiting to be parsed, None keeps the previous number
+        """
+        with self._lock:
+            self._pages_done += 1
+            if pages_queued is not None:
+                self._pages_queued = pages_queued
+            for entity_type, entities in (new_entities or {}).items():
+                self._entity_counts[entity_type.value] = self._entity_counts.get(entity_type.value, 0) + len(list(entities))
+        self._refresh()
+
+    def set_pages_queued(self, pages_queued: int):
+        """Update the number of pages waiting to be parsed.
+
+        Arguments:
+            pages_queued (int): Number of pages waiting to be parsed
+        """
+        with self._lock:
+            self._pages_queued = pages_queued
+        self._refresh()
+
+    def snapshot(self) -> ProgressSnapshot:
+        """Return the current progress.
+
+        Returns:
+            ProgressSnapshot: The current progress
+        """
+        with self._lock:
+            pages_done = self._pages_done
+            pages_queued = self._pages_queued
+            entity_counts = dict(self._entity_counts)
+
+        elapsed_seconds = time.perf_counter() - self._start_time
+        pages_per_second = pages_done / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        pages_left = pages_queued if self.max_pages is None else min(pages_queued, max(self.max_pages - pages_done, 0))
+        eta_seconds = pages_left / pages_per_second if pages_per_second > 0 else None
+
+        return ProgressSnapshot(pages_done, pages_queued, self.max_pages, pages_per_second, entity_counts, eta_seconds)
+
+    def stop(self):
+        """Stop showing the progress."""
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+        if self._plain_text_thread is not None:
+            self._stop_event.set()
+            self._plain_text_thread.join(timeout=1)
+            self._plain_text_thread = None
+
+    def _refresh(self):
+        """Update the rich progress bar with the current progress."""
+        progress = self._progress
+        if progress is None:
+            return
+
+        snapshot = self.snapshot()
+        progress.update(self._task_id, completed=snapshot.pages_done, status=snapshot.describe())
+
+    def _print_progress(self):
+        """Print the progress as plain text at regular intervals until the reporter is stopped."""
+        while not self._stop_event.wait(self._refresh_seconds):
+            console.print(self.snapshot().describe(), markup=False, highlight=False)
+
+def _get_default_display() -> ProgressDisplay:
+    """Get the display matching the logging mode and the output.
+
+    Returns:
+        ProgressDisplay: RICH on terminals and PLAIN_TEXT otherwise with the rich logging mode, NONE with the other modes
+    """
+    if run_logger.mode != LogMode.RICH:
+        return ProgressDisplay.NONE
+    return ProgressDisplay.RICH if console.is_terminal else ProgressDisplay.PLAIN_TEXT
\ No newline at end of file
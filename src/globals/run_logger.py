@@ -0,0 +1,153 @@
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from enum import Enum
+from globals import constants as Constants
+from globals.enums import LogLevel, LogMode
+from rich.console import Console
+from typing import TextIO
+import json
+import threading
+
+console = Console(log_path=False)
+
+_LEVEL_STYLES: dict[LogLevel, str | None] = {
+    LogLevel.INFO: None,
+    LogLevel.SUCCESS: "green",
+    LogLevel.WARNING: "yellow",
+    LogLevel.ERROR: "red",
+}
+
+class RunLogger:
+    """Logger of the events of a run, with a switchable output.
+    - RICH: every event is logged to the console with markup, like the program always did
+    - QUIET: only the warnings, the errors and the summary are printed
+    - JSON: the warnings, the errors and the summary are printed, every event is written to the log file
+      as a JSON line. The lines are buffered and written every LOG_BUFFER_SIZE lines and on flush
+    The logger is safe to use from several threads.
+
+    Attributes:
+        mode (LogMode): The current logging mode
+
+    Methods:
+        configure(mode, log_file_path): Switch the logging mode, JSON lines are written to the given file
+        log_page(website_url): Log the start of parsing a page
+        log_entities(website_url, new_entities): Log the entities found for the first time on a page
+        log_message(message, level): Log a message
+        log_summary(title, counts): Log the summary of the run, printed in every mode
+        flush(): Write the buffered JSON lines to the log file
+        close(): Flush and close the log file, the logging mode is reset to RICH
+    """
+
+    def __init__(self):
+        self.mode = LogMode.RICH
+        self._log_file: TextIO | None = None
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+
+    def configure(self, mode: LogMode, log_file_path: str | None = None):
+        """Switch the logging mode. The log file of the previous mode is closed.
+
+        Arguments:
+            mode (LogMode): The logging mode
+            log_file_path (str | None): Path of the JSON lines log file, required in JSON mode
+        """
+        if not isinstance(mode, LogMode):
+            raise TypeError(f"Invalid mode type. Expected type: LogMode, actual type: {type(mode)}")
+        if mode == LogMode.JSON and not isinstance(log_file_path, str):
+            raise ValueError("A log file is required in JSON logging mode")
+
+        self.close()
+        if mode == LogMode.JSON:
+            self._log_file = open(log_file_path, mode='a', encoding=Constants.UTF8_ENCODING)
+        self.mode = mode
+
+    def log_page(self, website_url: str):
+        """Log the start of parsing a page.
+
+        Arguments:
+            website_url (str): The website's URL
+        """
+        if self.mode == LogMode.RICH:
+            console.log(f"Parsing [link={website_url}]{website_url}[/link]")
+        elif self.mode == LogMode.JSON:
+            self._write({"event": "page", "url": website_url})
+
+    def log_entities(self, website_url: str, new_entities: Mapping[Enum, Iterable[str]]):
+        """Log the entities found for the first time on a page.
+        Called once per page after the extraction, so the extractors aren't slowed down by the output.
+
+        Arguments:
+            website_url (str): The website's URL where the entities were found
+            new_entities (Mapping[Enum, Iterable[str]]): The new entities by their type
+        """
+        if self.mode == LogMode.RICH:
+            for entity_type, entities in new_entities.items():
+                entity_label = entity_type.value.upper().replace("_", " ")
+                for entity in entities:
+                    console.log(f"[yellow]FOUND {entity_label}[/]: [cyan]{entity}[/] on [link={website_url}]{website_url}[/link]")
+        elif self.mode == LogMode.JSON:
+            for entity_type, entities in new_entities.items():
+                for entity in entities:
+                    self._write({"event": "entity", "type": entity_type.value, "value": entity, "url": website_url})
+
+    def log_message(self, message: str, level: LogLevel = LogLevel.INFO):
+        """Log a message. Informational messages are only printed in RICH mode.
+
+        Arguments:
+            message (str): The message without markup
+            level (LogLevel): The level of the message
+        """
+        if not isinstance(level, LogLevel):
+            raise TypeError(f"Invalid level type. Expected type: LogLevel, actual type: {type(level)}")
+
+        if self.mode == LogMode.RICH or level in (LogLevel.WARNING, LogLevel.ERROR):
+            style = _LEVEL_STYLES[level]
+            console.log(f"[{style}]{message}[/{style}]" if style else message)
+        if self.mode == LogMode.JSON:
+            self._write({"event": "message", "level": level.value, "message": message})
+
+    def log_summary(self, title: str, counts: Mapping[str, int | float]):
+        """Log the summary of the run, printed in every mode.
+
+        Arguments:
+            title (str): Title of the summary
+            counts (Mapping[str, int | float]): The counted or measured items of the run, e.g. the number of parsed pages
+        """
+        console.print(f"[bold]{title}[/bold]: " + ", ".join(f"{name}: {count}" for name, count in counts.items()))
+        if self.mode == LogMode.JSON:
+            self._write({"event": "summary", "title": title, "counts": dict(counts)})
+
+    def flush(self):
+        """Write the buffered JSON lines to the log file."""
+        with self._lock:
+            self._flush_buffer()
+
+    def close(self):
+        """Flush and close the log file, the logging mode is reset to RICH."""
+        with self._lock:
+            if self._log_file is not None:
+                self._flush_buffer()
+                self._log_file.close()
+                self._log_file = None
+            self._buffer.clear()
+            self.mode = LogMode.RICH
+
+    def _write(self, event: dict):
+        """Buffer the event as a JSON line, the buffer is written to the log file when it's full."""
+        event = {"time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), **event}
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= Constants.LOG_BUFFER_SIZE:
+                self._flush_buffer()
+
+    def _flush_buffer(self):
+        """Write the buffered JSON lines to the log file, the lock must be held by the caller."""
+        if self._log_file is None or not self._buffer:
+            return
+
+        self._log_file.write("\n".join(self._buffer) + "\n")
+        self._log_file.flush()
+        self._buffer.clear()
+
+run_logger = RunLogger()
\ No newline at end of file
@@ -0,0 +1,192 @@
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from globals import constants as Constants
+import json
+import math
+import os
+import threading
+import time
+
+class Tracer:
+    """Recorder of the time spans of a run, written as a Chrome trace file.
+    The file can be opened in chrome://tracing or https://ui.perfetto.dev to see the stages of every page on a timeline.
+    Listeners are notified of every span as it ends, e.g. by the profiler to attribute allocations to the stages.
+    Recording is disabled by default and then costs a single attribute check. The tracer is safe to use from several threads.
+
+    Attributes:
+        enabled (bool): True if the spans are recorded
+
+    Methods:
+        enable(): Start recording the spans, the timeline starts here
+        disable(): Stop recording and discard the recorded spans
+        add_listener(listener): Call the listener with the name and the arguments of every span as it ends
+        remove_listener(listener): Stop calling the listener
+        record(name, start_seconds, duration_seconds, **args): Record a span measured with time.perf_counter
+        span(name, **args): Context manager recording the time spent in its block
+        write(file_path): Write the recorded spans to a Chrome trace file
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._origin_seconds = 0.0
+        self._events: list[dict] = []
+        self._listeners: list[Callable[[str, dict], None]] = []
+        # True if the spans are recorded or listened to, the only check done by record when tracing is off
+        self._active = False
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Start recording the spans, the timeline starts here."""
+        with self._lock:
+            self._events.clear()
+            self._origin_seconds = time.perf_counter()
+            self.enabled = True
+            self._active = True
+
+    def disable(self):
+        """Stop recording and discard the recorded spans."""
+        with self._lock:
+            self.enabled = False
+            self._events.clear()
+            self._active = bool(self._listeners)
+
+    def add_listener(self, listener: Callable[[str, dict], None]):
+        """Call the listener with the name and the arguments of every span as it ends, in the thread that ran the span.
+
+        Arguments:
+            listener (Callable[[str, dict], None]): The function to call
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            self._active = True
+
+    def remove_listener(self, listener: Callable[[str, dict], None]):
+        """Stop calling the listener.
+
+        Arguments:
+            listener (Callable[[str, dict], None]): The function added with add_listener
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+            self._active = self.enabled or bool(self._listeners)
+
+    def record(self, name: str, start_seconds: float, duration_seconds: float, **args):
+        """Record a span.
+
+        Arguments:
+            name (str): Name of the span, e.g. the pipeline stage
+            start_seconds (float): Start of the span returned by time.perf_counter
+            duration_seconds (float): Duration of the span in seconds
+            args: Details of the span shown in the trace viewer, e.g. the URL of the page
+        """
+        if not self._active:
+            return
+
+        for listener in list(self._listeners):
+            listener(name, args)
+        if not self.enabled:
+            return
+
+        event = {
+            "name": name,
+            "cat": Constants.TRACE_CATEGORY,
+            "ph": "X",
+            "ts": (start_seconds - self._origin_seconds) * 1_000_000,
+            "dur": duration_seconds * 1_000_000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        """Record the time spent in the block of the context manager.
+
+        Arguments:
+            name (str): Name of the span
+            args: Details of the span shown in the trace viewer
+        """
+        if not self._active:
+            yield
+            return
+
+        start_seconds = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start_seconds, time.perf_counter() - start_seconds, **args)
+
+    def write(self, file_path: str):
+        """Write the recorded spans to a Chrome trace file.
+
+        Arguments:
+            file_path (str): Path of the trace file
+        """
+        if not isinstance(file_path, str):
+            raise TypeError(f"Invalid file_path type. Expected type: str, actual type: {type(file_path)}")
+
+        with self._lock:
+            trace = {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+        with open(file_path, mode='w', encoding=Constants.UTF8_ENCODING) as trace_file:
+            json.dump(trace, trace_file)
+
+class StageTimings:
+    """Aggregator of the time spent in each stage of the pages.
+
+    Methods:
+        add(timings): Add the stage timings of a page
+        percentile(stage, percent) -> float: Return the percentile of the stage's durations in seconds
+        summary() -> dict[str, dict[str, float]]: Return the count, total, percentiles and maximum of every stage
+    """
+
+    def __init__(self):
+        self._durations: dict[str, list[float]] = dict()
+
+    def add(self, timings: Mapping[str, float]):
+        """Add the stage timings of a page.
+
+        Arguments:
+            timings (Mapping[str, float]): Seconds spent in each stage, e.g. PageResult.timings
+        """
+        for stage, seconds in timings.items():
+            self._durations.setdefault(stage, []).append(seconds)
+
+    def percentile(self, stage: str, percent: float) -> float:
+        """Return the percentile of the stage's durations with the nearest-rank method.
+
+        Arguments:
+            stage (str): Name of the stage
+            percent (float): The percentile between 0 and 100
+
+        Returns:
+            float: The duration in seconds that the given percent of the pages didn't exceed
+
+        Raises:
+            KeyError: If no timings were added for the stage
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("The percent must be between 0 and 100")
+
+        durations = sorted(self._durations[stage])
+        rank = max(math.ceil(percent / 100 * len(durations)), 1)
+        return durations[rank - 1]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the statistics of every stage in the order the stages were first added.
+
+        Returns:
+            dict[str, dict[str, float]]: Key: stage, Value: count, and the total, p50, p90, p99 and maximum milliseconds
+        """
+        return {
+            stage: {
+                "count": len(durations),
+                "total ms": round(sum(durations) * 1000, 1),
+                **{f"p{percent} ms": round(self.percentile(stage, percent) * 1000, 1) for percent in Constants.TIMING_PERCENTILES},
+                "max ms": round(max(durations) * 1000, 1),
+            }
+            for stage, durations in self._durations.items()
+        }
+
+tracer = Tracer()
\ No newline at end of file
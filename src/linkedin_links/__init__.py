@@ -1,3 +1,30 @@
 from .find_linkedin_links import (
-    fetch_links
+    fetch_links,
+    fetch_links_batch,
+)
+
+from .name_matching import (
+    ProfileNameIndex,
+    match_names,
+)
+
+from .models import (
+    CompanyProfiles,
+    SearchResult,
+    NameMatch,
+)
+
+from .rate_limiter import (
+    RateLimiter,
+)
+
+from .search_cache import (
+    SearchCache,
+)
+
+from .search_backends import (
+    SearchBackend,
+    DdgsSearchBackend,
+    FixtureSearchBackend,
+    RecordingSearchBackend,
 )
\ No newline at end of file
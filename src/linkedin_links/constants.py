@@ -4,4 +4,27 @@ US_REGION = "us-en"
 UK_REGION = "uk-en"
 LINKEDIN_SITE_HU = "site:hu.linkedin.com/in"
 LINKEDIN_SITE_ALL = "site:linkedin.com/in"
-EXCLUDED_PAGES = "-jobs -company -posts"
\ No newline at end of file
+EXCLUDED_PAGES = "-jobs -company -posts"
+BATCH_MAX_WORKERS = 4
+BATCH_THREAD_NAME = "linkedin-search"
+SEARCH_REQUESTS_PER_SECOND = 1.0
+SEARCH_MAX_RETRIES = 3
+SEARCH_BACKOFF_SECONDS = 2.0
+SEARCH_MAX_BACKOFF_SECONDS = 60.0
+SEARCH_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+SEARCH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+SEARCH_FANOUT_WORKERS = 3
+SEARCH_FANOUT_MAX_QUERIES = 12
+SEARCH_TITLE_KEYWORDS_HU = ("ügyvezető", "vezető", "mérnök", "fejlesztő")
+SEARCH_TITLE_KEYWORDS_EN = ("CEO", "manager", "engineer", "developer")
+SEARCH_DEPARTMENT_TERMS_HU = ("értékesítés", "marketing", "HR", "pénzügy")
+SEARCH_DEPARTMENT_TERMS_EN = ("sales", "marketing", "HR", "finance")
+COMPANY_LEGAL_SUFFIXES = ("kft", "zrt", "nyrt", "bt", "kkt", "ltd", "llc", "inc", "plc", "corp", "gmbh")
+LINKEDIN_PROFILE_PATH = "/in/"
+UTF8_ENCODING = "utf-8"
+NAME_MATCH_MIN_SCORE = 0.75
+NAME_MATCH_INITIAL_SCORE = 0.75
+NAME_MATCH_MIN_TOKEN_SIMILARITY = 0.6
+NAME_NGRAM_SIZE = 3
+NAME_NGRAM_CACHE_SIZE = 65536
+NAME_PREFIXES = ("dr", "ifj", "id", "özv", "prof", "mr", "mrs", "ms", "miss", "sir", "phd", "jr", "sr")
\ No newline at end of file
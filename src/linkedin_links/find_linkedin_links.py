@@ -1,15 +1,32 @@
-from globals.enums import DataRegion
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from globals.enums import DataRegion, LogLevel
+from globals.run_logger import run_logger
 from linkedin_links import constants as Constants
-from ddgs import DDGS
-from rich.console import Console
+from .models import CompanyProfiles, SearchResult
+from .rate_limiter import RateLimiter
+from .search_backends import DdgsSearchBackend, SearchBackend
+from .search_cache import SearchCache
+from urllib.parse import unquote, urlsplit
+import random
+import re
+import threading
+import unicodedata
 
-console = Console(log_path=False)
-
-def fetch_links(company: str, profile_count: int, region: DataRegion) -> dict[str, str]:
-    """Get the search links from the user input using DuckDuckGo.
+def fetch_links(
+    company: str, profile_count: int, region: DataRegion, cache: SearchCache | None = None, backend: SearchBackend | None = None
+) -> dict[str, str]:
+    """Get the search links from the user input using DuckDuckGo, or the given search backend.
+    Several variants of the search query are searched in parallel until the profile count is reached.
+    If a cache is given, a search cached earlier is answered from the cache and a new search is cached.
+    Throttled or timed out searches are retried with exponential backoff. If a query variant is still throttled
+    after the last retry, the profiles found by the other variants are returned.
     
      Returns:
         dict[str, str]: The dictionary of profile links and names. Key: url, Value: name
+
+    Raises:
+        RuntimeError: If the search failed without finding any profiles
     """
     if not isinstance(company, str):
         raise TypeError(f"Invalid company type. Expected type: str, actual type: {type(company)}")
@@ -19,11 +36,322 @@ def fetch_links(company: str, profile_count: int, region: DataRegion) -> dict[st
         raise ValueError("The number of profiles to fetch must be at least 1 or more")
     if not isinstance(region, DataRegion):
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+    if cache is not None and not isinstance(cache, SearchCache):
+        raise TypeError(f"Invalid cache type. Expected type: SearchCache, actual type: {type(cache)}")
+    backend = _get_backend(backend)
     
-    console.log(f"Searching for LinkedIn profile links")
+    run_logger.log_message("Searching for LinkedIn profile links")
 
-    profiles = dict()
+    company_profiles = _search_company_with_retries(
+        company, profile_count, region, RateLimiter(Constants.SEARCH_REQUESTS_PER_SECOND), Constants.SEARCH_MAX_RETRIES, cache, backend
+    )
+    if company_profiles.error is not None:
+        raise RuntimeError(f"Searching {company} failed after {company_profiles.attempts} attempts: {company_profiles.error}")
+    if company_profiles.is_cached:
+        run_logger.log_message("The profile links were found in the search cache")
+    profiles = company_profiles.profiles
+
+    run_logger.log_message("Searching completed", LogLevel.SUCCESS)
+    if len(profiles) < profile_count:
+        run_logger.log_message(f"Only {len(profiles)} profile links were found.", LogLevel.WARNING)
+
+    return profiles
+
+def fetch_links_batch(
+    companies: Iterable[str],
+    profile_count: int,
+    region: DataRegion,
+    max_workers: int = Constants.BATCH_MAX_WORKERS,
+    requests_per_second: float = Constants.SEARCH_REQUESTS_PER_SECOND,
+    max_retries: int = Constants.SEARCH_MAX_RETRIES,
+    cache: SearchCache | None = None,
+    backend: SearchBackend | None = None,
+) -> Iterator[CompanyProfiles]:
+    """Search the LinkedIn profile links of many companies concurrently.
+    The searches of every thread share a single rate limit. Throttled or timed out searches are retried
+    with exponential backoff, which also pauses the searches of the other threads.
+    Searches answered from the cache don't count towards the rate limit.
+    The arguments are validated when the function is called, not when the iteration starts.
+
+    Arguments:
+        companies (Iterable[str]): The companies to search, duplicates are searched once
+        profile_count (int): The maximum number of profiles to fetch per company
+        region (DataRegion): The primary region of the profiles
+        max_workers (int): Number of concurrent searches
+        requests_per_second (float): Maximum number of searches started per second by all the threads
+        max_retries (int): Number of retries of a throttled or timed out search
+        cache (SearchCache | None): Cache of the search results, every search is sent to the search engine if None
+        backend (SearchBackend | None): The search engine, DuckDuckGo if None
+
+    Returns:
+        Iterator[CompanyProfiles]: The profiles of every company in the order the searches complete.
+            The companies whose searches failed are returned with the error instead of raising it
+    """
+    if isinstance(companies, str):
+        raise TypeError("Invalid companies type. Expected an iterable of company names, not a single str")
+    companies = list(dict.fromkeys(companies))
+    for company in companies:
+        if not isinstance(company, str):
+            raise TypeError(f"Invalid company type. Expected type: str, actual type: {type(company)}")
+    if not isinstance(profile_count, int):
+        raise TypeError(f"Invalid profile_count type. Expected type: int, actual type: {type(profile_count)}")
+    if profile_count < 1:
+        raise ValueError("The number of profiles to fetch must be at least 1 or more")
+    if not isinstance(region, DataRegion):
+        raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("The number of workers must be a positive integer")
+    if not isinstance(max_retries, int) or max_retries < 0:
+        raise ValueError("The number of retries must be a non-negative integer")
+    if cache is not None and not isinstance(cache, SearchCache):
+        raise TypeError(f"Invalid cache type. Expected type: SearchCache, actual type: {type(cache)}")
+    backend = _get_backend(backend)
+
+    return _iter_batch(companies, profile_count, region, max_workers, RateLimiter(requests_per_second), max_retries, cache, backend)
+
+def _iter_batch(
+    companies: list[str],
+    profile_count: int,
+    region: DataRegion,
+    max_workers: int,
+    rate_limiter: RateLimiter,
+    max_retries: int,
+    cache: SearchCache | None,
+    backend: SearchBackend,
+) -> Iterator[CompanyProfiles]:
+    """Generator doing the searches of fetch_links_batch after the arguments are validated."""
+    run_logger.log_message(f"Searching for the LinkedIn profile links of {len(companies)} companies")
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=Constants.BATCH_THREAD_NAME)
+    try:
+        futures = [
+            executor.submit(_search_company_with_retries, company, profile_count, region, rate_limiter, max_retries, cache, backend)
+            for company in companies
+        ]
+        for future in as_completed(futures):
+            company_profiles: CompanyProfiles = future.result()
+            if company_profiles.error is not None:
+                run_logger.log_message(
+                    f"Searching {company_profiles.company} failed after {company_profiles.attempts} attempts: {company_profiles.error}",
+                    LogLevel.ERROR,
+                )
+            else:
+                run_logger.log_message(f"Found {len(company_profiles.profiles)} profile links of {company_profiles.company}")
+            yield company_profiles
+    finally:
+        # The searches that haven't started yet are dropped if the iteration is stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    run_logger.log_message("Searching completed", LogLevel.SUCCESS)
+
+def _search_company_with_retries(
+    company: str,
+    profile_count: int,
+    region: DataRegion,
+    rate_limiter: RateLimiter,
+    max_retries: int,
+    cache: SearchCache | None,
+    backend: SearchBackend,
+) -> CompanyProfiles:
+    """Search the profiles of a company, retrying the throttled and timed out searches with exponential backoff.
+    The last attempt keeps the profiles found by the query variants that weren't throttled.
+
+    Returns:
+        CompanyProfiles: The found profiles, or the error of the last attempt
+    """
+    from ddgs.exceptions import RatelimitException, TimeoutException
+
+    cached_profiles = _get_cached_profiles(company, profile_count, region, cache)
+    if cached_profiles is not None:
+        return CompanyProfiles(company, cached_profiles, attempts=0, is_cached=True)
+
+    attempt = 0
+    while True:
+        attempt += 1
+        is_last_attempt = attempt > max_retries
+        try:
+            profiles = _search_company(company, profile_count, region, rate_limiter, backend, cache, allow_partial=is_last_attempt)
+            return CompanyProfiles(company, profiles, attempts=attempt)
+        except (RatelimitException, TimeoutException) as e:
+            if is_last_attempt:
+                return CompanyProfiles(company, dict(), f"{type(e).__name__}: {e}", attempt)
+            # Full jitter keeps the retrying threads from hitting the search engine at the same time
+            backoff_seconds = min(Constants.SEARCH_BACKOFF_SECONDS * 2 ** (attempt - 1), Constants.SEARCH_MAX_BACKOFF_SECONDS)
+            rate_limiter.pause(random.uniform(backoff_seconds / 2, backoff_seconds))
+        except Exception as e:
+            return CompanyProfiles(company, dict(), f"{type(e).__name__}: {e}", attempt)
+
+def _get_cached_profiles(company: str, profile_count: int, region: DataRegion, cache: SearchCache | None) -> dict[str, str] | None:
+    """Return the cached profiles of a company.
+
+    Returns:
+        dict[str, str] | None: The dictionary of profile links and names, None if there is no cache or the search isn't cached
+    """
+    if cache is None:
+        return None
+    search_query, search_region = _get_search_query(company, region)
+    return cache.get(search_query, search_region, profile_count)
+
+def _search_company(
+    company: str,
+    profile_count: int,
+    region: DataRegion,
+    rate_limiter: RateLimiter,
+    backend: SearchBackend,
+    cache: SearchCache | None = None,
+    allow_partial: bool = False,
+) -> dict[str, str]:
+    """Search the LinkedIn profile links of a company with several query variants in parallel.
+    The profiles are deduplicated by their normalized URL, and the searches that haven't started yet
+    are cancelled as soon as the profile count is reached.
+
+    Arguments:
+        company (str): The company to search
+        profile_count (int): The maximum number of profiles to fetch
+        region (DataRegion): The primary region of the profiles
+        rate_limiter (RateLimiter): Limiter of the searches, every query variant is a separate search
+        backend (SearchBackend): The search engine
+        cache (SearchCache | None): Cache to store the found profiles in
+        allow_partial (bool): Whether to return the profiles of the other variants instead of raising the throttling errors
+
+    Returns:
+        dict[str, str]: The dictionary of profile links and names. Key: url, Value: name
+
+    Raises:
+        RatelimitException | TimeoutException: If a query variant was throttled or timed out before the profile count was reached,
+            and partial results aren't allowed or no profiles were found
+        Exception: The error of the first failed query variant if every variant failed
+    """
+    from ddgs.exceptions import RatelimitException, TimeoutException
+
+    search_query, search_region = _get_search_query(company, region)
+    profiles: dict[str, str] = dict()
+    profile_keys: set[str] = set()
+    errors: list[Exception] = []
+    stop_event = threading.Event()
+
+    executor = ThreadPoolExecutor(max_workers=Constants.SEARCH_FANOUT_WORKERS, thread_name_prefix=Constants.BATCH_THREAD_NAME)
+    try:
+        futures: list[Future] = [
+            executor.submit(
+                _get_rate_limited_profile_results, rate_limiter, stop_event, backend, query, profile_count, search_region
+            )
+            for query in _get_search_queries(company, region)
+        ]
+        for future in as_completed(futures):
+            try:
+                query_profiles = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+
+            for url, name in query_profiles.items():
+                profile_key = _get_profile_key(url)
+                if profile_key not in profile_keys and len(profiles) < profile_count:
+                    profile_keys.add(profile_key)
+                    profiles[url] = name
+            if len(profiles) >= profile_count:
+                break
+    finally:
+        # The running searches can't be interrupted, their results are dropped
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
+    # The throttling errors reach the retries of the caller, which back off and pause the rate limiter
+    throttling_errors = [error for error in errors if isinstance(error, (RatelimitException, TimeoutException))]
+    if throttling_errors and len(profiles) < profile_count:
+        if not allow_partial or not profiles:
+            raise throttling_errors[0]
+        run_logger.log_message(
+            f"{len(throttling_errors)} query variants of {company} were throttled, the profiles of the other variants are kept",
+            LogLevel.WARNING,
+        )
+    if not profiles and errors and len(errors) == len(futures):
+        raise errors[0]
+    # The profiles of a search with a failed query variant may be incomplete, they aren't cached
+    if cache is not None and not errors:
+        cache.put(search_query, search_region, profile_count, profiles)
+    return profiles
+
+def _get_rate_limited_profile_results(
+    rate_limiter: RateLimiter,
+    stop_event: threading.Event,
+    backend: SearchBackend,
+    search_query: str,
+    profile_count: int,
+    search_region: str,
+) -> dict[str, str]:
+    """Wait for the rate limiter, then get the search results of a query variant unless the search was stopped meanwhile."""
+    rate_limiter.acquire()
+    if stop_event.is_set():
+        return dict()
+    return _get_profile_results(search_query, profile_count, search_region, backend)
+
+def _get_search_queries(company: str, region: DataRegion) -> list[str]:
+    """Get the query variants of a company search in the order of their priority.
+    The first variant is the query of _get_search_query. It's followed by the global site filter for Hungary,
+    the variants of the company name, and the job title and department keywords of the region.
+
+    Arguments:
+        company (str): The company to search
+        region (DataRegion): The primary region of the profiles
+
+    Returns:
+        list[str]: At most SEARCH_FANOUT_MAX_QUERIES distinct search queries
+    """
+    if region == DataRegion.HUNGARY:
+        site_filters = [Constants.LINKEDIN_SITE_HU, Constants.LINKEDIN_SITE_ALL]
+        keywords = Constants.SEARCH_TITLE_KEYWORDS_HU + Constants.SEARCH_DEPARTMENT_TERMS_HU
+    else:
+        site_filters = [Constants.LINKEDIN_SITE_ALL]
+        keywords = Constants.SEARCH_TITLE_KEYWORDS_EN + Constants.SEARCH_DEPARTMENT_TERMS_EN
+
+    queries = [f"\"{company}\" {site_filter} {Constants.EXCLUDED_PAGES}" for site_filter in site_filters]
+    queries.extend(
+        f"\"{company_name}\" {site_filters[0]} {Constants.EXCLUDED_PAGES}" for company_name in _get_company_name_variants(company)
+    )
+    queries.extend(f"\"{company}\" {keyword} {site_filters[0]} {Constants.EXCLUDED_PAGES}" for keyword in keywords)
+    return list(dict.fromkeys(queries))[:Constants.SEARCH_FANOUT_MAX_QUERIES]
+
+def _get_company_name_variants(company: str) -> list[str]:
+    """Get the company name without its legal form and without accents, e.g. "Példa Kft." -> "Példa", "Pelda".
+
+    Arguments:
+        company (str): The company name
+
+    Returns:
+        list[str]: The variants that differ from the company name
+    """
+    suffixes = "|".join(Constants.COMPANY_LEGAL_SUFFIXES)
+    short_name = re.sub(rf"[\s,]+(?:{suffixes})\.?$", "", company.strip(), flags=re.IGNORECASE)
+    variants = [short_name]
+    for name in (company, short_name):
+        variants.append("".join(char for char in unicodedata.normalize("NFKD", name) if not unicodedata.combining(char)))
+    return [variant for variant in dict.fromkeys(variants) if variant and variant != company]
+
+def _get_profile_key(url: str) -> str:
+    """Get the normalized profile URL, the country subdomains, the letter case, the query and the trailing slash
+    of the same profile differ between the searches.
+
+    Arguments:
+        url (str): The profile URL
+
+    Returns:
+        str: The profile path, e.g. "/in/john-doe"
+    """
+    path = unquote(urlsplit(url).path).casefold().rstrip("/")
+    profile_start = path.find(Constants.LINKEDIN_PROFILE_PATH)
+    return path[profile_start:] if profile_start >= 0 else path
+
+def _get_search_query(company: str, region: DataRegion) -> tuple[str, str]:
+    """Get the search query and the search region of a company.
+
+    Arguments:
+        company (str): The company to search
+        region (DataRegion): The primary region of the profiles
+
+    Returns:
+        tuple[str, str]: The search query and the DuckDuckGo search region
+    """
     match region.value.lower():
         case DataRegion.HUNGARY.value:
             search_region = Constants.HU_REGION
@@ -36,21 +364,31 @@ def fetch_links(company: str, profile_count: int, region: DataRegion) -> dict[st
         search_query = f"\"{company}\" {Constants.LINKEDIN_SITE_HU} {Constants.EXCLUDED_PAGES}"
     else:
         search_query = f"\"{company}\" {Constants.LINKEDIN_SITE_ALL} {Constants.EXCLUDED_PAGES}"
-    profiles = _get_profile_results(search_query, profile_count, search_region)
+    return search_query, search_region
 
-    console.log(f"[green]Searching completed[/green]")
-    if len(profiles) < profile_count:
-        console.print(f"[yellow]Only {len(profiles)} profile links were found.[/yellow]")
+def _get_backend(backend: SearchBackend | None) -> SearchBackend:
+    """Validate the given search backend.
 
-    return profiles
+    Arguments:
+        backend (SearchBackend | None): The backend given by the caller
 
-def _get_profile_results(search_query: str, profile_count: int, search_region: str) -> dict[str, str]:
-    """Get the search results from DuckDuckGo based on the search query, profile count and search region.
+    Returns:
+        SearchBackend: The given backend, or the DuckDuckGo backend if None
+    """
+    if backend is None:
+        return DdgsSearchBackend()
+    if not isinstance(backend, SearchBackend):
+        raise TypeError(f"Invalid backend type. Expected type: SearchBackend, actual type: {type(backend)}")
+    return backend
+
+def _get_profile_results(search_query: str, profile_count: int, search_region: str, backend: SearchBackend) -> dict[str, str]:
+    """Get the search results from the search backend based on the search query, profile count and search region.
     
     Arguments:
         search_query (str): The search query to use
         profile_count (int): The maximum number of profiles to fetch
         search_region (str): The region to use for the search
+        backend (SearchBackend): The search engine
 
     Returns:
         dict[str, str]: The dictionary of profile links and names. Key: url, Value: name
@@ -62,17 +400,32 @@ def _get_profile_results(search_query: str, profile_count: int, search_region: s
     if not isinstance(search_region, str):
         raise TypeError(f"Invalid search_region type. Expected type: str, actual type: {type(search_region)}")
     
-    ddgs = DDGS()
-    results = ddgs.text(search_query, max_results=profile_count*2, region=search_region)
+    results = backend.search(search_query, profile_count*2, search_region)
+    return _get_profiles_from_results(results, profile_count)
+
+def _get_profiles_from_results(results: Iterable[SearchResult], profile_count: int) -> dict[str, str]:
+    """Filter the LinkedIn profiles out of the search results and get the names from the result titles.
+
+    Arguments:
+        results (Iterable[SearchResult]): The search results
+        profile_count (int): The maximum number of profiles
+
+    Returns:
+        dict[str, str]: The dictionary of profile links and names. Key: url, Value: name
+    """
     profiles = dict()
+    profile_keys = set()
 
     for result in results:
-        result_url = result['href']
-        result_title = result['title']
+        result_url = result.url
+        result_title = result.title
         
         # Filter to only LinkedIn profile URLs
         if 'linkedin' not in result_url or '/in/' not in result_url:
             continue
+        profile_key = _get_profile_key(result_url)
+        if profile_key in profile_keys:
+            continue
         
         # Get the person's name from the title
         # Title is usually formatted as "Name - Company" or "Name - Title at Company"
@@ -86,6 +439,7 @@ def _get_profile_results(search_query: str, profile_count: int, search_region: s
             result_name = result_name.split(",")[0].strip()
 
         profiles[result_url] = result_name
+        profile_keys.add(profile_key)
 
         if len(profiles) >= profile_count:
             break
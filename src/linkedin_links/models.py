@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class CompanyProfiles:
+    """The LinkedIn profile links found for a company of a batch.
+
+    Attributes:
+        company (str): The searched company
+        profiles (dict[str, str]): The profile links and names. Key: url, Value: name
+        error (str | None): The error of the last search attempt if every attempt failed, None otherwise
+        attempts (int): Number of search attempts, 0 if the profiles were found in the cache
+        is_cached (bool): True if the profiles were found in the search cache
+    """
+
+    company: str
+    profiles: dict[str, str]
+    error: str | None = None
+    attempts: int = 1
+    is_cached: bool = False
+
+@dataclass(frozen=True)
+class SearchResult:
+    """A result of a search engine.
+
+    Attributes:
+        url (str): URL of the result
+        title (str): Title of the result, the name of the person for LinkedIn profiles
+    """
+
+    url: str
+    title: str
+
+@dataclass(frozen=True)
+class NameMatch:
+    """A name found on the website linked to a LinkedIn profile.
+
+    Attributes:
+        name (str): The name found on the website
+        source_url (str): URL of the page where the name was found
+        profile_url (str): URL of the matched profile
+        profile_name (str): Name of the matched profile
+        score (float): Similarity of the names between 0 and 1
+    """
+
+    name: str
+    source_url: str
+    profile_url: str
+    profile_name: str
+    score: float
\ No newline at end of file
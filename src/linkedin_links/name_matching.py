@@ -0,0 +1,184 @@
+from collections.abc import Mapping
+from globals.normalization import normalize_text
+from linkedin_links import constants as Constants
+from .models import NameMatch
+import functools
+import re
+
+_NAME_TOKEN_PATTERN = re.compile(r"[^\W\d_]+\.?")
+
+class ProfileNameIndex:
+    """Blocking index of the LinkedIn profile names, linking the names found on a website to the profiles
+    without comparing every name with every profile.
+    The names are compared by their tokens without accents and in any order, so "Kovács Péter" matches "Peter Kovacs",
+    and an initial matches a token starting with it, e.g. "P. Kovács". The candidates of a name are the profiles
+    sharing one of its full tokens, or, for misspelled tokens, enough n-grams of a token.
+
+    Methods:
+        match(name) -> tuple[str, float] | None: Return the URL and the score of the best matching profile
+    """
+
+    def __init__(self, profiles: Mapping[str, str], min_score: float = Constants.NAME_MATCH_MIN_SCORE):
+        if not isinstance(profiles, Mapping):
+            raise TypeError(f"Invalid profiles type. Expected type: Mapping, actual type: {type(profiles)}")
+        if not isinstance(min_score, (int, float)) or not 0 < min_score <= 1:
+            raise ValueError("The minimum score must be a number between 0 and 1")
+
+        self.min_score = min_score
+        self._profile_urls: list[str] = []
+        self._profile_tokens: list[list[str]] = []
+        self._token_index: dict[str, set[int]] = dict()
+        self._ngram_index: dict[str, set[int]] = dict()
+        for url, name in profiles.items():
+            profile_index = len(self._profile_urls)
+            self._profile_urls.append(url)
+            tokens = get_name_tokens(name)
+            self._profile_tokens.append(tokens)
+            for token in tokens:
+                if _is_initial(token):
+                    continue
+                self._token_index.setdefault(token, set()).add(profile_index)
+                for ngram in _get_ngrams(token):
+                    self._ngram_index.setdefault(ngram, set()).add(profile_index)
+
+    def match(self, name: str) -> tuple[str, float] | None:
+        """Return the best matching profile of a name.
+
+        Arguments:
+            name (str): The name found on the website
+
+        Returns:
+            tuple[str, float] | None: The URL and the score of the profile, None if no profile reaches the minimum score.
+                Of the profiles with the same score, the first one is returned
+        """
+        tokens = get_name_tokens(name)
+        candidates = self._get_candidates(tokens)
+        best_match: tuple[str, float] | None = None
+        # The profiles sharing the most tokens come first, so an exact match usually ends the search early
+        for profile_index in sorted(candidates, key=lambda candidate: (-candidates[candidate], candidate)):
+            score = _get_tokens_score(tokens, self._profile_tokens[profile_index])
+            if score >= self.min_score and (best_match is None or score > best_match[1]):
+                best_match = (self._profile_urls[profile_index], score)
+                if score >= 1:
+                    break
+        return best_match
+
+    def _get_candidates(self, tokens: list[str]) -> dict[int, int]:
+        """Return the profiles sharing a full token or enough n-grams of a token with the name.
+
+        Returns:
+            dict[int, int]: Key: index of the profile, Value: number of full tokens shared with the name
+        """
+        candidates: dict[int, int] = dict()
+        for token in tokens:
+            if _is_initial(token):
+                continue
+            exact_candidates = self._token_index.get(token)
+            if exact_candidates:
+                for profile_index in exact_candidates:
+                    candidates[profile_index] = candidates.get(profile_index, 0) + 1
+                continue
+
+            ngrams = _get_ngrams(token)
+            ngram_counts: dict[int, int] = dict()
+            for ngram in ngrams:
+                for profile_index in self._ngram_index.get(ngram, ()):
+                    ngram_counts[profile_index] = ngram_counts.get(profile_index, 0) + 1
+            min_count = len(ngrams) * Constants.NAME_MATCH_MIN_TOKEN_SIMILARITY
+            for profile_index, count in ngram_counts.items():
+                if count >= min_count:
+                    candidates.setdefault(profile_index, 0)
+        return candidates
+
+def match_names(
+    names: Mapping[str, str], profiles: Mapping[str, str], min_score: float = Constants.NAME_MATCH_MIN_SCORE
+) -> list[NameMatch]:
+    """Link the names found on the website to the LinkedIn profiles.
+
+    Arguments:
+        names (Mapping[str, str]): The names found on the website, e.g. WebsiteInfo.found_names. Key: name, Value: website URL
+        profiles (Mapping[str, str]): The LinkedIn profiles, e.g. the result of fetch_links. Key: url, Value: name
+        min_score (float): The minimum similarity of the linked names between 0 and 1
+
+    Returns:
+        list[NameMatch]: The best matching profile of every name that has one, in the order of the names
+    """
+    if not isinstance(names, Mapping):
+        raise TypeError(f"Invalid names type. Expected type: Mapping, actual type: {type(names)}")
+
+    index = ProfileNameIndex(profiles, min_score)
+    matches = []
+    for name, source_url in names.items():
+        profile_match = index.match(name)
+        if profile_match is not None:
+            profile_url, score = profile_match
+            matches.append(NameMatch(name, source_url, profile_url, profiles[profile_url], round(score, 3)))
+    return matches
+
+def get_name_tokens(name: str) -> list[str]:
+    """Get the comparable tokens of a name.
+
+    Arguments:
+        name (str): The name
+
+    Returns:
+        list[str]: The case-folded tokens without accents and prefixes like "Dr.", initials keep their trailing dot
+    """
+    tokens = _NAME_TOKEN_PATTERN.findall(normalize_text(name))
+    return [token for token in tokens if token.rstrip(".") not in Constants.NAME_PREFIXES]
+
+def _is_initial(token: str) -> bool:
+    """Return True if the token is an initial, e.g. "p." or "p"."""
+    return len(token.rstrip(".")) == 1
+
+@functools.lru_cache(maxsize=Constants.NAME_NGRAM_CACHE_SIZE)
+def _get_ngrams(token: str) -> frozenset[str]:
+    """Get the n-grams of a token, padded so the short tokens have n-grams too. Cached, the tokens repeat across the names."""
+    padded_token = f" {token.rstrip('.')} "
+    return frozenset(padded_token[start:start + Constants.NAME_NGRAM_SIZE] for start in range(len(padded_token) - Constants.NAME_NGRAM_SIZE + 1))
+
+def _get_token_similarity(token: str, other_token: str) -> float:
+    """Return the similarity of two tokens: 1 if they are equal, NAME_MATCH_INITIAL_SCORE if one is the initial
+    of the other, the Dice coefficient of their n-grams if it reaches NAME_MATCH_MIN_TOKEN_SIMILARITY, 0 otherwise."""
+    if token == other_token:
+        return 1.0
+    if _is_initial(token) or _is_initial(other_token):
+        return Constants.NAME_MATCH_INITIAL_SCORE if token[0] == other_token[0] else 0.0
+
+    ngrams = _get_ngrams(token)
+    other_ngrams = _get_ngrams(other_token)
+    similarity = 2 * len(ngrams & other_ngrams) / (len(ngrams) + len(other_ngrams))
+    return similarity if similarity >= Constants.NAME_MATCH_MIN_TOKEN_SIMILARITY else 0.0
+
+def _get_tokens_score(tokens: list[str], profile_tokens: list[str]) -> float:
+    """Return the similarity of two names by pairing their most similar tokens in any order.
+    The sum of the paired tokens' similarities is divided by the token count of the longer name,
+    and at least one pair must be full tokens, so two initials never match on their own."""
+    if not tokens or not profile_tokens:
+        return 0.0
+
+    pairs = sorted(
+        (
+            (_get_token_similarity(token, profile_token), token_index, profile_token_index)
+            for token_index, token in enumerate(tokens)
+            for profile_token_index, profile_token in enumerate(profile_tokens)
+        ),
+        reverse=True,
+    )
+    paired_tokens: set[int] = set()
+    paired_profile_tokens: set[int] = set()
+    total_similarity = 0.0
+    has_full_token_pair = False
+    for similarity, token_index, profile_token_index in pairs:
+        if similarity == 0:
+            break
+        if token_index in paired_tokens or profile_token_index in paired_profile_tokens:
+            continue
+        paired_tokens.add(token_index)
+        paired_profile_tokens.add(profile_token_index)
+        total_similarity += similarity
+        has_full_token_pair = has_full_token_pair or not (_is_initial(tokens[token_index]) or _is_initial(profile_tokens[profile_token_index]))
+
+    if not has_full_token_pair:
+        return 0.0
+    return total_similarity / max(len(tokens), len(profile_tokens))
\ No newline at end of file
@@ -0,0 +1,37 @@
+import threading
+import time
+
+class RateLimiter:
+    """Limiter of the request rate shared by every thread of a batch.
+    The requests are spaced evenly, and a pause after throttling delays the requests of every thread.
+
+    Methods:
+        acquire(): Wait until the next request may start
+        pause(seconds): Delay every following request by the given number of seconds
+    """
+
+    def __init__(self, requests_per_second: float):
+        if not isinstance(requests_per_second, (int, float)) or requests_per_second <= 0:
+            raise ValueError("The number of requests per second must be a positive number")
+
+        self._interval_seconds = 1 / requests_per_second
+        self._next_request_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the next request may start. The time slots are reserved in the order of the calls."""
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time)
+            self._next_request_time = request_time + self._interval_seconds
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def pause(self, seconds: float):
+        """Delay every following request by the given number of seconds from now, e.g. after a throttled request.
+
+        Arguments:
+            seconds (float): Seconds to wait before the next request
+        """
+        with self._lock:
+            self._next_request_time = max(self._next_request_time, time.monotonic() + seconds)
\ No newline at end of file
@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict
+from linkedin_links import constants as Constants
+from .models import SearchResult
+import json
+import threading
+import time
+
+class SearchBackend(ABC):
+    """Search engine returning the results of the LinkedIn profile searches.
+
+    Methods:
+        search(search_query, max_results, search_region) -> list[SearchResult]: Return the results of a search
+    """
+
+    def search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        """Return the results of a search.
+
+        Arguments:
+            search_query (str): The search query
+            max_results (int): The maximum number of results
+            search_region (str): The region of the search, e.g. "hu-hu"
+
+        Returns:
+            list[SearchResult]: The results in the order of the search engine
+        """
+        if not isinstance(search_query, str):
+            raise TypeError(f"Invalid search_query type. Expected type: str, actual type: {type(search_query)}")
+        if not isinstance(max_results, int):
+            raise TypeError(f"Invalid max_results type. Expected type: int, actual type: {type(max_results)}")
+        if not isinstance(search_region, str):
+            raise TypeError(f"Invalid search_region type. Expected type: str, actual type: {type(search_region)}")
+
+        return self._search(search_query, max_results, search_region)
+
+    @abstractmethod
+    def _search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        """Return the results of a search, the arguments are already validated."""
+
+class DdgsSearchBackend(SearchBackend):
+    """Backend searching with DuckDuckGo through the ddgs package."""
+
+    def _search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        from ddgs import DDGS
+
+        results = DDGS().text(search_query, max_results=max_results, region=search_region)
+        return [SearchResult(result['href'], result['title']) for result in results]
+
+class FixtureSearchBackend(SearchBackend):
+    """Offline backend replaying recorded result sets, for the benchmarks and the load tests.
+    The result sets are looked up by the exact search query, the region is ignored.
+
+    Attributes:
+        result_sets (dict[str, list[SearchResult]]): The results of every search query
+        latency_seconds (float): Delay of every search, simulating the round trip to the search engine
+        search_count (int): Number of searches done
+
+    Methods:
+        from_file(file_path, latency_seconds) -> FixtureSearchBackend: Load the result sets saved by RecordingSearchBackend
+    """
+
+    def __init__(self, result_sets: Mapping[str, Sequence[SearchResult]], latency_seconds: float = 0.0):
+        if not isinstance(result_sets, Mapping):
+            raise TypeError(f"Invalid result_sets type. Expected type: Mapping, actual type: {type(result_sets)}")
+        if not isinstance(latency_seconds, (int, float)) or latency_seconds < 0:
+            raise ValueError("The latency must be a non-negative number of seconds")
+
+        self.result_sets = {search_query: list(results) for search_query, results in result_sets.items()}
+        self.latency_seconds = latency_seconds
+        self.search_count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, file_path: str, latency_seconds: float = 0.0) -> "FixtureSearchBackend":
+        """Load the result sets saved by RecordingSearchBackend.save.
+
+        Arguments:
+            file_path (str): Path of the JSON file of the result sets
+            latency_seconds (float): Delay of every search
+
+        Returns:
+            FixtureSearchBackend: The backend replaying the loaded result sets
+        """
+        with open(file_path, mode='r', encoding=Constants.UTF8_ENCODING) as fixture_file:
+            result_sets = json.load(fixture_file)
+        return cls(
+            {search_query: [SearchResult(**result) for result in results] for search_query, results in result_sets.items()},
+            latency_seconds,
+        )
+
+    def _search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        with self._lock:
+            self.search_count += 1
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        return self.result_sets.get(search_query, [])[:max_results]
+
+class RecordingSearchBackend(SearchBackend):
+    """Backend recording the results of another backend, saved for FixtureSearchBackend.
+
+    Methods:
+        save(file_path): Save the recorded result sets as JSON
+    """
+
+    def __init__(self, backend: SearchBackend):
+        if not isinstance(backend, SearchBackend):
+            raise TypeError(f"Invalid backend type. Expected type: SearchBackend, actual type: {type(backend)}")
+
+        self._backend = backend
+        self._result_sets: dict[str, list[SearchResult]] = dict()
+        self._lock = threading.Lock()
+
+    def save(self, file_path: str):
+        """Save the recorded result sets as JSON.
+
+        Arguments:
+            file_path (str): Path of the JSON file
+        """
+        with self._lock:
+            result_sets = {
+                search_query: [asdict(result) for result in results] for search_query, results in self._result_sets.items()
+            }
+        with open(file_path, mode='w', encoding=Constants.UTF8_ENCODING) as fixture_file:
+            json.dump(result_sets, fixture_file, ensure_ascii=False, indent=2)
+
+    def _search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        results = self._backend.search(search_query, max_results, search_region)
+        with self._lock:
+            self._result_sets[search_query] = results
+        return results
\ No newline at end of file
@@ -0,0 +1,174 @@
+from linkedin_links import constants as Constants
+import json
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_results (
+    query_key TEXT NOT NULL,
+    search_region TEXT NOT NULL,
+    profile_count INTEGER NOT NULL,
+    profiles TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (query_key, search_region)
+);
+CREATE INDEX IF NOT EXISTS search_results_last_used_index ON search_results (last_used_at);
+"""
+
+_SELECT_RESULT = """
+SELECT profile_count, profiles FROM search_results
+WHERE query_key = ? AND search_region = ? AND created_at > ? AND profile_count >= ?
+"""
+_UPDATE_LAST_USED = "UPDATE search_results SET last_used_at = ? WHERE query_key = ? AND search_region = ?"
+_UPSERT_RESULT = """
+INSERT INTO search_results (query_key, search_region, profile_count, profiles, size, created_at, last_used_at)
+VALUES (:query_key, :search_region, :profile_count, :profiles, :size, :now, :now)
+ON CONFLICT (query_key, search_region) DO UPDATE SET
+    profile_count = excluded.profile_count, profiles = excluded.profiles, size = excluded.size,
+    created_at = excluded.created_at, last_used_at = excluded.last_used_at
+"""
+_DELETE_EXPIRED = "DELETE FROM search_results WHERE created_at <= ?"
+_SELECT_LEAST_RECENTLY_USED = "SELECT query_key, search_region, size FROM search_results ORDER BY last_used_at"
+_DELETE_RESULT = "DELETE FROM search_results WHERE query_key = ? AND search_region = ?"
+
+class SearchCache:
+    """Persistent SQLite cache of the LinkedIn profile search results.
+    The results are keyed by the normalized search query and the search region, and expire after the TTL.
+    A result found for a larger profile count also answers the searches of smaller profile counts.
+    When the cached results outgrow the size limit, the least recently used ones are evicted.
+    The cache is safe to use from several threads.
+
+    Attributes:
+        hits (int): Number of searches answered from the cache
+        misses (int): Number of searches not found in the cache
+
+    Methods:
+        get(search_query, search_region, profile_count) -> dict[str, str] | None: Return the cached profiles
+        put(search_query, search_region, profile_count, profiles): Cache the profiles found by a search
+        get_key(search_query) -> str: Return the normalized search query
+        close(): Close the database
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        ttl_seconds: float = Constants.SEARCH_CACHE_TTL_SECONDS,
+        max_bytes: int = Constants.SEARCH_CACHE_MAX_BYTES,
+    ):
+        if not isinstance(database_path, str):
+            raise TypeError(f"Invalid database_path type. Expected type: str, actual type: {type(database_path)}")
+        if not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0:
+            raise ValueError("The TTL of the cache must be a positive number of seconds")
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("The size limit of the cache must be a positive integer")
+
+        self.database_path = database_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # The batch searches use the cache from their worker threads, the lock serializes the access
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        except Exception:
+            self._connection.close()
+            raise
+
+    def __enter__(self) -> "SearchCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, search_query: str, search_region: str, profile_count: int) -> dict[str, str] | None:
+        """Return the cached profiles of a search.
+
+        Arguments:
+            search_query (str): The search query
+            search_region (str): The region of the search
+            profile_count (int): The maximum number of profiles of the search
+
+        Returns:
+            dict[str, str] | None: At most profile_count profiles in the order they were found, None if the search isn't
+                cached, expired, or was cached with a smaller profile count
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                _SELECT_RESULT, (self.get_key(search_query), search_region, now - self.ttl_seconds, profile_count)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            with self._connection:
+                self._connection.execute(_UPDATE_LAST_USED, (now, self.get_key(search_query), search_region))
+            self.hits += 1
+
+        profiles = json.loads(row[1])
+        return {url: name for url, name in profiles[:profile_count]}
+
+    def put(self, search_query: str, search_region: str, profile_count: int, profiles: dict[str, str]):
+        """Cache the profiles found by a search, replacing the earlier result of the same search.
+        Expired results and, above the size limit, the least recently used results are evicted.
+
+        Arguments:
+            search_query (str): The search query
+            search_region (str): The region of the search
+            profile_count (int): The maximum number of profiles of the search
+            profiles (dict[str, str]): The found profiles in the order they were found. Key: url, Value: name
+        """
+        if not isinstance(profiles, dict):
+            raise TypeError(f"Invalid profiles type. Expected type: dict, actual type: {type(profiles)}")
+
+        serialized_profiles = json.dumps(list(profiles.items()), ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(_UPSERT_RESULT, {
+                "query_key": self.get_key(search_query),
+                "search_region": search_region,
+                "profile_count": profile_count,
+                "profiles": serialized_profiles,
+                "size": len(serialized_profiles.encode()),
+                "now": now,
+            })
+            self._connection.execute(_DELETE_EXPIRED, (now - self.ttl_seconds,))
+            self._evict()
+
+    def get_key(self, search_query: str) -> str:
+        """Return the normalized search query, searches differing only in case and whitespace share their results.
+
+        Arguments:
+            search_query (str): The search query
+
+        Returns:
+            str: The key of the search query
+        """
+        if not isinstance(search_query, str):
+            raise TypeError(f"Invalid search_query type. Expected type: str, actual type: {type(search_query)}")
+        return " ".join(search_query.casefold().split())
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self):
+        """Delete the least recently used results until the cache fits into the size limit, the lock must be held."""
+        total_bytes = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM search_results").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        evicted = []
+        for query_key, search_region, size in self._connection.execute(_SELECT_LEAST_RECENTLY_USED):
+            if total_bytes <= self.max_bytes:
+                break
+            evicted.append((query_key, search_region))
+            total_bytes -= size
+        self._connection.executemany(_DELETE_RESULT, evicted)
\ No newline at end of file
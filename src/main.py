@@ -1,10 +1,16 @@
-from globals.enums import DataRegion
-from export_data import export_webparser_data, export_profiles
-from linkedin_links import fetch_links
-from website import WebsiteInfo, parse_all
+from collections.abc import Iterator
+from globals.enums import DataRegion, ExportFormat, LogLevel, LogMode
+from typing import TYPE_CHECKING
 import argparse
+import json
 import validators
 
+if TYPE_CHECKING:
+    from export_data import EntityHistory
+    from globals.profiling import CrawlProfiler
+    from globals.tracing import Tracer
+    from website import PageResult
+
 def main() -> None:
     """Main function of the program where the individual methods are called.
     """
@@ -13,23 +19,237 @@ def main() -> None:
     except ValueError as e:
         print(f"Invalid argument: {e}")
         return
+    args.webdriver_nodes = None
+    if args.webdriver_node is not None:
+        from website import WebDriverNode
+
+        try:
+            args.webdriver_nodes = tuple(WebDriverNode.from_string(node) for node in args.webdriver_node)
+        except ValueError as e:
+            print(f"Invalid argument: {e}")
+            return
+    if args.serve:
+        _serve(args)
+        return
+    if args.enqueue:
+        _enqueue(args)
+        return
+    if args.workers is not None:
+        _run_workers(args)
+        return
+
+    # Heavy dependencies (selenium, Spacy, libpostal, etc.) are only imported after the arguments are validated
+    from export_data import EntityHistory, ExportOptions, export_webparser_data, export_webparser_data_stream, export_profiles
+    from globals.profiling import CrawlProfiler
+    from globals.run_logger import run_logger
+    from globals.tracing import tracer
+    from linkedin_links import SearchCache, fetch_links, match_names
+    from website import PooledWebDriverFetcher, WebsiteInfo, WebsiteInfoAccumulator, iter_parse, parse_all
+
+    export_options = ExportOptions(args.output, args.format, args.overwrite, args.no_prompt)
+    run_logger.configure(args.log_mode, args.log_file)
+    if args.trace is not None:
+        tracer.enable()
+    history = EntityHistory(args.history, args.region) if args.history is not None else None
+    # The pages are rendered on the given Selenium nodes, or in a new session of the default Selenium server for every page
+    fetcher = PooledWebDriverFetcher(nodes=args.webdriver_nodes) if args.webdriver_nodes is not None else None
+    search_cache = SearchCache(args.search_cache) if args.search_cache is not None else None
+    # The profiler is scoped to the crawl and the export of the parsed data
+    profiler = CrawlProfiler() if args.profile else None
+    if profiler is not None:
+        profiler.start()
+
+    try:
+        if args.stream_export:
+            # Parse the given website and export the data of every page as soon as it's parsed
+            info = WebsiteInfoAccumulator()
+            pages = iter_parse(args.link, args.sublinks, args.region, info, fetcher)
+            if history is not None:
+                pages = _merge_pages_into_history(pages, history, args.only_new)
+            is_exported = export_webparser_data_stream(pages, export_options)
+            website_info: WebsiteInfo = info.snapshot()
+        else:
+            # Parse the given website
+            website_info: WebsiteInfo = parse_all(args.link, args.sublinks, args.region, fetcher)
+
+            # Merge the parsed data into the history of the earlier runs
+            export_info = website_info
+            if history is not None:
+                new_info = history.merge(website_info, record=False)
+                if args.only_new:
+                    export_info = new_info
+
+            # Export the parsed data to a CSV file, there is nothing to lose if nothing was found
+            is_exported = not export_info.has_data() or export_webparser_data(export_info, export_options)
+
+        # The entities are only recorded once they were exported, so --only-new exports them again after a declined or failed export
+        if history is not None and is_exported:
+            history.record_pending()
+
+        if profiler is not None:
+            profiler.stop()
+
+        if args.profiles and args.company:
+            # The website data is already exported, a failed search doesn't stop the run
+            try:
+                profile_links = fetch_links(args.company, args.profiles, args.region, search_cache)
+            except Exception as e:
+                run_logger.log_message(f"Failed to search the LinkedIn profile links: {e}", LogLevel.ERROR)
+                profile_links = dict()
+            if profile_links:
+                # Link the names found on the website to the profiles
+                name_matches = match_names(website_info.found_names, profile_links)
+                run_logger.log_message(f"Matched {len(name_matches)} names of the website to LinkedIn profiles")
+                export_profiles(profile_links, export_options, name_matches)
+    finally:
+        if fetcher is not None:
+            fetcher.close()
+        if history is not None:
+            history.close()
+        if search_cache is not None:
+            search_cache.close()
+        if profiler is not None:
+            _write_profile(profiler)
+        if args.trace is not None:
+            _write_trace(tracer, args.trace)
+        run_logger.close()
+
+def _merge_pages_into_history(pages: Iterator["PageResult"], history: "EntityHistory", only_new: bool) -> Iterator["PageResult"]:
+    """Merge the entities of every page into the history as the pages are parsed, they are pending until the export completes.
+
+    Arguments:
+        pages (Iterator[PageResult]): The results of the parsed pages
+        history (EntityHistory): The history of the earlier runs
+        only_new (bool): Yield the pages with only the entities that weren't seen in earlier runs
+
+    Returns:
+        Iterator[PageResult]: The results of the parsed pages
+    """
+    for page_result in pages:
+        new_page_result = history.merge_page(page_result, record=False)
+        yield new_page_result if only_new else page_result
+
+def _write_trace(tracer: "Tracer", trace_path: str):
+    """Write the recorded spans of the run to the trace file.
+
+    Arguments:
+        tracer (Tracer): The tracer that recorded the spans
+        trace_path (str): Path of the Chrome trace file
+    """
+    from globals.run_logger import run_logger
+
+    try:
+        tracer.write(trace_path)
+        run_logger.log_message(f"Trace written to {trace_path}", LogLevel.SUCCESS)
+    except Exception as e:
+        run_logger.log_message(f"Failed to write the trace file: {e}", LogLevel.ERROR)
+    finally:
+        tracer.disable()
+
+def _write_profile(profiler: "CrawlProfiler"):
+    """Stop the profiler and write its reports to the profiling results folder.
+
+    Arguments:
+        profiler (CrawlProfiler): The profiler of the crawl
+    """
+    from globals.run_logger import run_logger
+
+    profiler.stop()
+    try:
+        report_paths = profiler.write_reports()
+        run_logger.log_message(f"Profiling reports written to {', '.join(report_paths)}", LogLevel.SUCCESS)
+    except Exception as e:
+        run_logger.log_message(f"Failed to write the profiling reports: {e}", LogLevel.ERROR)
+
+def _serve(args: argparse.Namespace):
+    """Run the crawl service until it's interrupted, the models and the browser sessions stay loaded between the jobs.
+
+    Arguments:
+        args (argparse.Namespace): The parsed arguments
+    """
+    from crawl_service import CrawlService, create_server
+    from globals.run_logger import run_logger
+    from linkedin_links import SearchCache
+
+    # The progress bars of concurrent jobs can't share the console, the rich mode is quiet in the service
+    run_logger.configure(LogMode.QUIET if args.log_mode == LogMode.RICH else args.log_mode, args.log_file)
+    search_cache = SearchCache(args.search_cache) if args.search_cache is not None else None
+    service_options = {"max_concurrent_jobs": args.jobs} if args.jobs is not None else {}
+    server_options = {
+        name: value for name, value in (("host", args.host), ("port", args.port), ("socket_path", args.socket)) if value is not None
+    }
+    service = CrawlService(search_cache=search_cache, webdriver_nodes=args.webdriver_nodes, **service_options)
+    server = None
+    try:
+        service.start()
+        server = create_server(service, **server_options)
+        address = args.socket if args.socket is not None else "http://{}:{}".format(*server.server_address[:2])
+        print(f"Crawl service listening on {address}, stop it with Ctrl+C")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.server_close()
+        service.close()
+        if search_cache is not None:
+            search_cache.close()
+        run_logger.close()
+
+def _enqueue(args: argparse.Namespace):
+    """Add the crawl of the arguments, or the crawls of the seeds file, to the job queue.
+
+    Arguments:
+        args (argparse.Namespace): The parsed arguments
+    """
+    from crawl_service import CrawlJobRequest, JobQueue
+
+    if args.seeds is None:
+        requests = [CrawlJobRequest(args.link, args.region, args.sublinks, args.company, args.profiles)]
+    else:
+        requests = []
+        with open(args.seeds, encoding='utf-8') as seeds_file:
+            for line_number, line in enumerate(seeds_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    requests.append(CrawlJobRequest.from_dict(json.loads(line)))
+                except ValueError as e:
+                    print(f"Invalid seed on line {line_number} of {args.seeds}: {e}")
+                    return
+
+    with JobQueue(args.queue) as queue:
+        job_ids = queue.enqueue_many(requests)
+        job_counts = queue.count_jobs()
+    print(
+        f"Queued {len(job_ids)} jobs in {args.queue}, jobs in the queue: "
+        + ", ".join(f"{status.value}: {count}" for status, count in job_counts.items())
+    )
 
-    # Parse the given website
-    website_info: WebsiteInfo = parse_all(args.link, args.sublinks, args.region)
+def _run_workers(args: argparse.Namespace):
+    """Run the worker processes on the job queue until they are interrupted, or until the queue is empty.
 
-    # Export the parsed data to a CSV file
-    if website_info.has_data():
-        export_webparser_data(website_info)
+    Arguments:
+        args (argparse.Namespace): The parsed arguments
+    """
+    from crawl_service import run_workers
 
-    if args.profiles and args.company:
-        profile_links = fetch_links(args.company, args.profiles, args.region)
-        if profile_links:
-            export_profiles(profile_links)
+    print(f"Running {args.workers} workers on {args.queue}, stop them with Ctrl+C")
+    run_workers(
+        args.queue,
+        args.workers,
+        search_cache_path=args.search_cache,
+        exit_when_idle=args.until_empty,
+        # The progress bars of concurrent workers can't share the console, the rich mode is quiet in the workers
+        log_mode=LogMode.QUIET if args.log_mode == LogMode.RICH else args.log_mode,
+        log_file_path=args.log_file,
+        webdriver_nodes=args.webdriver_nodes,
+    )
 
 def _get_args() -> argparse.Namespace:
     """Get the input arguments from the user using argparse.
     
-    Required arguments:
+    Required arguments, unless --serve, --workers or --seeds is set:
         --link: The website URL to parse
         --region: The primary region for data to be found. Supported regions: United States (us), Britain (gb), Hungarian (hu)
     
@@ -37,6 +257,26 @@ def _get_args() -> argparse.Namespace:
         --company: Company name for LinkedIn search
         --sublinks: Maximum number of subpages to visit (default: 0)
         --profiles: Maximum number of LinkedIn profiles to fetch (default: 0)
+        --stream-export: Export the data of every page to the CSV file as soon as the page is parsed
+        --output: Path of the exported file, the export isn't confirmed and the file name isn't asked
+        --format: Format of the exported file. Supported formats: csv, sqlite (default: csv)
+        --overwrite: Overwrite existing export files without asking
+        --no-prompt: Never ask for confirmation, the exports get a timestamped name if --output isn't set
+        --history: Path of the SQLite database of the entities found in earlier runs, the found entities are merged into it
+        --only-new: Only export the entities that weren't found in earlier runs, requires --history
+        --log-mode: Output of the run. Supported modes: rich, quiet, json (default: rich)
+        --log-file: Path of the JSON lines log file, required if --log-mode is json
+        --trace: Path of a Chrome trace file with the time spent in each stage of every page
+        --profile: Write a cProfile report and the allocations of each stage of the crawl to the results_profiling folder
+        --serve: Run the crawl service, which accepts crawl jobs over a local HTTP API
+        --host, --port, --socket: Address of the crawl service, a Unix socket replaces the TCP address
+        --jobs: Number of crawl jobs the service runs at once
+        --queue: Path of the SQLite job queue shared by the worker processes
+        --enqueue: Add the crawl to --queue instead of running it
+        --seeds: JSON lines file of the crawls to add with --enqueue, replaces --link and --region
+        --workers: Number of worker processes running the crawls of --queue
+        --until-empty: Stop the workers when no job is available
+        --webdriver-node: Selenium server the pages are rendered on, as URL or URL=CAPACITY, can be repeated
 
     Returns:
         argparse.Namespace: The parsed arguments
@@ -49,15 +289,16 @@ def _get_args() -> argparse.Namespace:
     )
     parser.add_argument(
         '-l', '--link',
-        required=True,
         type=str,
-        help="Website URL to parse (required)"
+        default=None,
+        help="Website URL to parse (required unless --serve, --workers or --seeds is set)"
     )
     parser.add_argument(
         '-r', '--region',
-        required=True,
         type=str,
-        help="The primary region for data to be found. Supported regions: United States (us), Britain (gb), Hungarian (hu) (required)"
+        default=None,
+        help="The primary region for data to be found. Supported regions: United States (us), Britain (gb), Hungarian (hu) " \
+        "(required unless --serve, --workers or --seeds is set)"
     )
     parser.add_argument(
         '-s', '--sublinks',
@@ -79,8 +320,198 @@ def _get_args() -> argparse.Namespace:
         default=None,
         help="Company name for LinkedIn search (default: None, required if --profiles argument is set)"
     )
+    parser.add_argument(
+        '--stream-export',
+        action='store_true',
+        help="Ask for the CSV file before parsing and export the data of every page as soon as it's parsed, " \
+        "one row per entity with its type and source URL, so the results survive an interruption"
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help="Path of the exported file, the export isn't confirmed and the file name isn't asked. " \
+        "LinkedIn profiles are exported next to a CSV file with a '_profiles' suffix, or into the same SQLite database " \
+        "(default: None, ask the user)"
+    )
+    parser.add_argument(
+        '--format',
+        type=str,
+        default=ExportFormat.CSV.value,
+        choices=[export_format.value for export_format in ExportFormat],
+        help="Format of the exported file. An existing SQLite database is merged with, " \
+        "entities are deduplicated by type, value and domain (default: csv)"
+    )
+    parser.add_argument(
+        '--overwrite',
+        action='store_true',
+        help="Overwrite existing export files without asking"
+    )
+    parser.add_argument(
+        '--no-prompt',
+        action='store_true',
+        help="Never ask for confirmation, e.g. for cron jobs and CI. " \
+        "Without --output the exports get a timestamped name in the results folder"
+    )
+
+    parser.add_argument(
+        '--history',
+        type=str,
+        default=None,
+        help="Path of the SQLite database of the entities found in earlier runs, created if it doesn't exist. " \
+        "Emails, phone numbers, names and addresses are deduplicated by their normalized form " \
+        "and the time they were first and last seen is kept (default: None, no history)"
+    )
+    parser.add_argument(
+        '--only-new',
+        action='store_true',
+        help="Only export the entities that weren't found in earlier runs, requires --history"
+    )
+    parser.add_argument(
+        '--search-cache',
+        type=str,
+        default=None,
+        help="Path of the SQLite cache of the LinkedIn profile searches, created if it doesn't exist. " \
+        "A search is answered from the cache for a week, also if fewer --profiles are asked for (default: None, no cache)"
+    )
+    parser.add_argument(
+        '--log-mode',
+        type=str,
+        default=LogMode.RICH.value,
+        choices=[log_mode.value for log_mode in LogMode],
+        help="Output of the run: rich logs every found entity to the console, quiet only prints the warnings, errors and the summary, " \
+        "json prints like quiet and writes every event to --log-file as JSON lines (default: rich)"
+    )
+    parser.add_argument(
+        '--log-file',
+        type=str,
+        default=None,
+        help="Path of the JSON lines log file, appended to if it exists (default: None, required if --log-mode is json)"
+    )
+    parser.add_argument(
+        '--trace',
+        type=str,
+        default=None,
+        help="Write the time spent in each stage of every page (fetch, parse, each extractor, export) to a Chrome trace file, " \
+        "which can be opened in chrome://tracing or https://ui.perfetto.dev (default: None, no trace)"
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="Profile the crawl and the export of the parsed data: write a cProfile report and the allocations " \
+        "of each stage (tracemalloc top lines) to the results_profiling folder. Slows the crawl down, " \
+        "use --no-prompt to keep the export prompts out of the report"
+    )
+
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help="Run the crawl service instead of a single crawl. The NLP models and the browser sessions stay loaded, " \
+        "crawl jobs are submitted with POST /jobs and their results streamed from GET /jobs/<id>/results as JSON lines"
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default=None,
+        help="Address of the crawl service (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=None,
+        help="Port of the crawl service (default: 8765)"
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        default=None,
+        help="Path of a Unix socket the crawl service listens on instead of --host and --port (default: None)"
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help="Number of crawl jobs the service runs at once, each with its own browser session (default: 2)"
+    )
+
+    parser.add_argument(
+        '--queue',
+        type=str,
+        default=None,
+        help="Path of the SQLite job queue, created if it doesn't exist. The queue can be shared by the worker processes " \
+        "of a single machine and must be on a local file system (default: None, required by --enqueue and --workers)"
+    )
+    parser.add_argument(
+        '--enqueue',
+        action='store_true',
+        help="Add the crawl of --link, --region, --sublinks, --company and --profiles to --queue instead of running it"
+    )
+    parser.add_argument(
+        '--seeds',
+        type=str,
+        default=None,
+        help="JSON lines file of the crawls to add with --enqueue, one object per line with the fields of POST /jobs, " \
+        'e.g. {"link": "https://example.com", "region": "hu", "sublinks": 10} (default: None, add the crawl of the arguments)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Run the given number of worker processes on --queue. Every worker claims a job, renews its lease while crawling " \
+        "and stores the results in the queue, failed jobs are retried (default: None)"
+    )
+    parser.add_argument(
+        '--until-empty',
+        action='store_true',
+        help="Stop the workers when no job is available instead of waiting for new jobs"
+    )
+
+    parser.add_argument(
+        '--webdriver-node',
+        type=str,
+        action='append',
+        default=None,
+        metavar='URL[=CAPACITY]',
+        help="Selenium server the pages are rendered on, with the maximum number of its sessions (default capacity: 2). " \
+        "Can be repeated, the sessions are opened on the least loaded healthy node and a page of a node that dies is retried " \
+        "on another one (default: None, the single Selenium server for a crawl, the docker-compose nodes for --serve and --workers)"
+    )
 
     args = parser.parse_args()
+
+    args.log_mode = LogMode(args.log_mode)
+    if args.log_mode == LogMode.JSON and args.log_file is None:
+        raise ValueError("Argument --log-mode is json but --log-file isn't set. The JSON lines are written to the log file.")
+    if args.log_mode != LogMode.JSON and args.log_file is not None:
+        raise ValueError("Argument --log-file is set but --log-mode isn't json. Only the JSON lines are written to the log file.")
+    if sum((args.serve, args.enqueue, args.workers is not None)) > 1:
+        raise ValueError("Only one of the arguments --serve, --enqueue and --workers can be set.")
+    if (args.enqueue or args.workers is not None) and args.queue is None:
+        raise ValueError("Arguments --enqueue and --workers require --queue, the path of the job queue.")
+    if args.queue is not None and not args.enqueue and args.workers is None:
+        raise ValueError("Argument --queue is set but neither --enqueue nor --workers is. Set one of them to use the job queue.")
+    if args.seeds is not None and not args.enqueue:
+        raise ValueError("Argument --seeds is set but --enqueue isn't. The seeds are added to the job queue.")
+    if args.until_empty and args.workers is None:
+        raise ValueError("Argument --until-empty is set but --workers isn't. Only the workers stop when the queue is empty.")
+    if args.serve:
+        if args.port is not None and not 0 <= args.port <= 65535:
+            raise ValueError("The port must be between 0 and 65535")
+        if args.jobs is not None and args.jobs < 1:
+            raise ValueError("The number of concurrent jobs must be at least 1")
+        return args
+    if args.host is not None or args.port is not None or args.socket is not None or args.jobs is not None:
+        raise ValueError("Arguments --host, --port, --socket and --jobs are only used by the crawl service, set --serve.")
+    if args.workers is not None:
+        if args.workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        return args
+    if args.seeds is not None:
+        if args.link is not None or args.region is not None:
+            raise ValueError("Arguments --link and --region are replaced by the crawls of --seeds.")
+        return args
+    if args.link is None or args.region is None:
+        raise ValueError("Arguments --link and --region are required unless --serve, --workers or --seeds is set.")
     
     if not validators.url(args.link):
         raise ValueError(f"URL '{args.link}' is invalid. Example of a valid URL: 'https://www.company.com/subpage'")
@@ -99,6 +530,14 @@ def _get_args() -> argparse.Namespace:
     if args.region.lower() not in [DataRegion.UNITED_STATES.value, DataRegion.GREAT_BRITAIN.value, DataRegion.HUNGARY.value]:
         raise ValueError("Unsupported region. Supported regions: United States (us), Great Britain (gb), Hungary (hu)")
     
+    args.format = ExportFormat(args.format)
+    if args.output is not None and not args.output.strip():
+        raise ValueError("The output path must not be empty")
+    if args.search_cache is not None and args.profiles == 0:
+        raise ValueError("Argument --search-cache is set but --profiles isn't. The cache is only used by the LinkedIn profile search.")
+    if args.only_new and args.history is None:
+        raise ValueError("Argument --only-new is set but --history isn't. The history is required to find the new entities.")
+
     if args.region:
         match args.region.lower():
             case DataRegion.HUNGARY.value:
@@ -1,7 +1,24 @@
 from .website import (
     WebsiteInfo,
+    PageResult,
     parse,
     parse_all,
+    iter_parse,
+    aiter_parse,
+)
+
+from .models import (
+    WebsiteInfoAccumulator,
+    PageContent,
+    ExtractionLimits,
+    WebDriverNode,
+)
+
+from .fetchers import (
+    Fetcher,
+    WebDriverFetcher,
+    PooledWebDriverFetcher,
+    HttpFetcher,
 )
 
 from .data_extractors import (
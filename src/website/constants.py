@@ -1,5 +1,19 @@
 WEBDRIVER_HEADLESS_ARGUMENT = "--headless"
 WEBDRIVER_REMOTE_URL = "http://chrome_selenium:4444/wd/hub"
+WEBDRIVER_MAX_SESSIONS = 2
+WEBDRIVER_NODE_CAPACITY = 2
+WEBDRIVER_NODE_URLS = (
+    "http://chrome_selenium:4444/wd/hub",
+    "http://chrome_selenium_2:4444/wd/hub",
+    "http://chrome_selenium_3:4444/wd/hub",
+)
+WEBDRIVER_STATUS_PATH = "/status"
+WEBDRIVER_HEALTH_CHECK_TIMEOUT_SECONDS = 5
+WEBDRIVER_HEALTH_CHECK_INTERVAL_SECONDS = 30
+WEBDRIVER_FETCH_ATTEMPTS = 2
+HTTP_FETCH_TIMEOUT_SECONDS = 30
+HTTP_FETCH_USER_AGENT = "webparser"
+HTTP_DEFAULT_CHARSET = "utf-8"
 BEAUTIFULSOUP_HTML_PARSER = "html.parser"
 WEBPAGE_EXTENSIONS: set[str] = {"html", "htm", "php", "asp", "aspx", "jsp"}
 # EMAIL_REGEX regex was created by GitHub Copilot
@@ -8,6 +22,8 @@ SPACY_ENTITY_PERSON_HUNGARIAN = "PER"
 SPACY_ENTITY_PERSON_ENGLISH = "PERSON"
 SPACY_MODEL_HU = "hu_core_news_lg"
 SPACY_MODEL_EN = "en_core_web_lg"
+LIBPOSTAL_MODEL_NAME = "libpostal"
+MODEL_WARM_UP_THREAD_NAME = "model-warm-up"
 # NAME_REGEX regex was created by GitHub Copilot
 NAME_REGEX = r"^([A-Z][a-záéíóöőúüű'’]*(?:-[A-Z][a-záéíóöőúüű'’]*)*(?: [A-Z][a-záéíóöőúüű'’]*(?:[A-Z][a-záéíóöőúüű'’]*)?(?:-[A-Z][a-záéíóöőúüű'’]*)*)+)$"
 # HTML_TEXT_TAGS was created by GitHub Copilot
@@ -42,21 +58,17 @@ HTML_TEXT_TAGS: set[str] = {
     "summary",
 }
 PHONE_NUMBER_UNKNOWN_REGION = "ZZ"
-# HEARTBEAT_MESSAGES was created by GitHub Copilot
-HEARTBEAT_MESSAGES = [
-    "Finding the best results for you...",
-    "Sit tight and grab a cup of coffee...",
-    "Operation in progress...",
-    "Analyzing data...",
-    "Don't worry, the program didn't freeze...yet...",
-    "Loading... (insert elevator music here)",
-    "Still parsing the website 4 real no cap",
-    "Did you know? The password for the first computer was 'password'.",
-    "Interesting fact: CAPTCHA stands for 'Completely Automated Public Turing test to tell Computers and Humans Apart'.",
-    "Some interesting trivia: The first domain name ever registered was symbolics.com in 1985.",
-]
 ESSENTIAL_ADDRESS_COMPONENTS = ["city", "road", "postcode"]
-LRU_CACHE_MAXSIZE = 2
 MIN_ADDRESS_COMPONENTS = 3
 MAX_ADDRESS_COMPONENTS = 10
-HEARTBEAT_INTERVAL_SECONDS = 20
\ No newline at end of file
+PAGE_TRACE_NAME = "page"
+# Characters of a page given to each NLP model, the rest of the page is skipped
+MAX_PAGE_CHARACTERS = 1_000_000
+# Longest text given to spaCy's named entity recognition at once, spaCy's own max_length is 1 000 000
+MAX_NER_SEGMENT_CHARACTERS = 10_000
+SPACY_MAX_LENGTH = 1_000_000
+# Longest text given to libpostal's address parser at once
+MAX_ADDRESS_SEGMENT_CHARACTERS = 500
+# A sentence ends with a punctuation mark followed by whitespace
+SENTENCE_BOUNDARY_REGEX = r"(?<=[.!?])\s+"
+NER_BATCH_SIZE = 32
\ No newline at end of file
@@ -1,43 +1,85 @@
-from bs4 import BeautifulSoup, Tag, ResultSet
-from functools import lru_cache
-from globals.enums import DataRegion
-from postal.parser import parse_address
-from rich.console import Console
-from spacy.language import Language
-from spacy.tokens.doc import Doc
+from bs4 import BeautifulSoup
+from collections.abc import Iterator
+from globals.enums import DataRegion, LogLevel
+from globals.run_logger import run_logger
+from globals.tracing import tracer
+from typing import TYPE_CHECKING
 from urllib import parse as urlparse
 from website import constants as Constants
-from .models import WebsiteInfo
-import phonenumbers
+from .enums import EntityType, Extractor, PipelineStage
+from .model_registry import model_registry
+from .models import ExtractionLimits, PageContent, PageResult, WebsiteInfoAccumulator
 import re
-import spacy
-import threading
+import time
 import validators
 
-console = Console(log_path=False)
-information_printed = threading.Event()
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens.doc import Doc
 
 def get_data_from_content(
-    info: WebsiteInfo, website_url: str, content: BeautifulSoup, region: DataRegion
-) -> WebsiteInfo:
-    """Parse the given HTML content for information.
+    info: WebsiteInfoAccumulator,
+    website_url: str,
+    content: BeautifulSoup | PageContent,
+    region: DataRegion,
+    limits: ExtractionLimits | None = None,
+) -> PageResult:
+    """Parse the given HTML content for information and add the new findings to the accumulator.
+    The previously found data is not copied, only the new entries are added.
 
     Arguments:
-        info (WebsiteInfo): Object of the already found information
+        info (WebsiteInfoAccumulator): Accumulator of the already found information
         website_url (str): The website's URL
-        content (BeautifulSoup): The HTML content to parse
+        content (BeautifulSoup | PageContent): The HTML content to parse, or its texts and links
         region (DataRegion): The primary region for data to be found
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models, the defaults if None
 
     Returns:
-        WebsiteInfo: The information found during the parsing process
+        PageResult: The entities and links found for the first time on the page and the time spent in each extractor
     """
-    found_links = get_sublinks(website_url, content, info.found_urls)
-    found_emails = get_emails(website_url, content, info.found_emails)
-    found_names = get_names(website_url, content, info.found_names, region)
-    found_phone_numbers = get_phone_numbers(website_url, content, info.found_phone_numbers, region)
-    found_addresses = get_addresses(website_url, content, info.found_addresses, region)
+    if not isinstance(info, WebsiteInfoAccumulator):
+        raise TypeError(f"Invalid info type. Expected type: WebsiteInfoAccumulator, actual type: {type(info)}")
+    if not validators.url(website_url):
+        raise ValueError(f"Invalid URL: {website_url}")
+    if not isinstance(content, (BeautifulSoup, PageContent)):
+        raise TypeError(f"Invalid content type, Expected type: BeautifulSoup | PageContent, actual type: {type(content)}")
+    if not isinstance(region, DataRegion):
+        raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+    if isinstance(content, BeautifulSoup):
+        content = PageContent.from_soup(content)
+    limits = _get_limits(limits)
 
-    return WebsiteInfo(found_links, found_emails, found_names, found_phone_numbers, found_addresses)
+    website_url_stripped: str = _get_stripped_link(website_url)
+    new_urls: list[str] = []
+    new_entities: dict[EntityType, list[str]] = {entity_type: [] for entity_type in EntityType}
+    timings: dict[str, float] = dict()
+
+    start_time = time.perf_counter()
+    for found_url in _find_sublinks(website_url, content):
+        if info.add_url(found_url):
+            new_urls.append(found_url)
+    timings[PipelineStage.SUBLINKS.value] = time.perf_counter() - start_time
+    tracer.record(PipelineStage.SUBLINKS.value, start_time, timings[PipelineStage.SUBLINKS.value], url=website_url)
+
+    extractors = [
+        (PipelineStage.EMAILS, EntityType.EMAIL, info.add_email, _find_emails(content)),
+        (PipelineStage.NAMES, EntityType.NAME, info.add_name, _find_names(content, region, limits)),
+        (PipelineStage.PHONE_NUMBERS, EntityType.PHONE_NUMBER, info.add_phone_number, _find_phone_numbers(content, region)),
+        (PipelineStage.ADDRESSES, EntityType.ADDRESS, info.add_address, _find_addresses(content, region, limits)),
+    ]
+    # The finders are generators, so the extraction itself runs inside the timed loops
+    for stage, entity_type, add_entity, found_entities in extractors:
+        start_time = time.perf_counter()
+        for entity in found_entities:
+            if add_entity(entity, website_url_stripped):
+                new_entities[entity_type].append(entity)
+        timings[stage.value] = time.perf_counter() - start_time
+        tracer.record(stage.value, start_time, timings[stage.value], url=website_url)
+
+    # Logged once per page, outside of the timed extractor loops
+    _log_found_entities(new_entities, website_url)
+
+    return PageResult(website_url, new_entities, new_urls, timings)
 
 def get_sublinks(
     website_url: str, content: BeautifulSoup, previous_urls: set[str]
@@ -60,41 +102,7 @@ def get_sublinks(
         raise TypeError(f"Invalid previous_urls type. Expected type: set, actual type: {type(previous_urls)}")
 
     new_urls: set[str] = set(previous_urls)
-    hostname: str | None = urlparse.urlparse(website_url).hostname
-    website_url_stripped: str = _get_stripped_link(website_url)
-
-    # Loop through all the 'a' tags in the content and extract the links
-    for link_tag in content.find_all("a"):
-        if not isinstance(link_tag, Tag):
-            raise TypeError(f"Invalid link_tag type. Expected type: Tag, actual type: {type(link_tag)}")
-        if not link_tag.has_attr("href"):
-            continue
-
-        href: str = str(link_tag.attrs["href"])
-        href_stripped: str = _get_stripped_link(href)
-        # Extract link that starts with a slash, like "/about"
-        # File links are skipped
-        if href.startswith("/") and not _is_file_url(href):
-            if "#" in href:
-                href_stripped: str = href.split("#")[0].rstrip(
-                    " /"
-                )
-                found_url: str = website_url_stripped + href_stripped
-            else:
-                found_url: str = website_url_stripped + href_stripped
-            new_urls.add(found_url)
-
-        # Extract full link
-        # File links are skipped
-        if hostname is not None and hostname in href and not _is_file_url(href):
-            if "#" in href:
-                href_stripped: str = href.split("#")[0].rstrip(
-                    " /"
-                )
-                found_url: str = href_stripped.split("#")[0]
-            else:
-                found_url: str = href_stripped
-            new_urls.add(found_url)
+    new_urls.update(_find_sublinks(website_url, PageContent.from_soup(content)))
 
     return new_urls
 
@@ -119,30 +127,22 @@ def get_emails(
         raise TypeError(f"Invalid previous_emails type. Expected type: dict, actual type: {type(previous_emails)}")
 
     new_emails: dict[str, str] = dict(previous_emails)
-    text_tags: ResultSet[Tag] = content.find_all(Constants.HTML_TEXT_TAGS)
-
-    for tag in text_tags:
-        if not isinstance(tag, Tag):
-            raise TypeError(f"Invalid tag type. Expected type: Tag, actual type: {type(tag)}")
+    found_entities: list[str] = []
 
-        tag_text: str = tag.text.strip()
-        if not tag_text:
-            continue
-
-        emails: list[str] = re.findall(Constants.EMAIL_REGEX, tag_text)
-
-        for email in emails:
-            if email not in new_emails.keys():
-                new_emails[email] = website_url.rstrip(" /")
-                console.log(
-                    f"[yellow]FOUND EMAIL[/]: [cyan]{email}[/] on [link={website_url}]{website_url}[/link]"
-                )
-                set_information_printed()
+    for email in _find_emails(PageContent.from_soup(content)):
+        if email not in new_emails.keys():
+            new_emails[email] = website_url.rstrip(" /")
+            found_entities.append(email)
 
+    _log_found_entities({EntityType.EMAIL: found_entities}, website_url)
     return new_emails
 
 def get_names(
-    website_url: str, content: BeautifulSoup, previous_names: dict[str, str], region: DataRegion
+    website_url: str,
+    content: BeautifulSoup,
+    previous_names: dict[str, str],
+    region: DataRegion,
+    limits: ExtractionLimits | None = None,
 ) -> dict[str, str]:
     """Parse the given HTML content for names.
 
@@ -151,6 +151,7 @@ def get_names(
         content (BeautifulSoup): The HTML content to parse
         found_names (dict): Previously found names
         region (DataRegion): The primary region for data to be found
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP model, the defaults if None
 
     Returns:
         A dictionary of all the names found in the HTML content. Key: name, Value: URL where the name was found
@@ -165,35 +166,14 @@ def get_names(
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
 
     new_names: dict[str, str] = dict(previous_names)
-    nlp: Language = _get_spacy_model(region)
-    name_regex: re.Pattern[str] = re.compile(Constants.NAME_REGEX)
-    text_tags: ResultSet[Tag] = content.find_all(Constants.HTML_TEXT_TAGS)
+    found_entities: list[str] = []
 
-    # Get all the relevant tags in the HTML content
-    for tag in text_tags:
-        if not isinstance(tag, Tag):
-            raise TypeError(f"Invalid tag type. Expected type: Tag, actual type: {type(tag)}")
-
-        tag_text: str = tag.text.strip()
-        if not tag_text:
-            continue
-
-        doc: Doc = nlp(tag_text)
-
-        # Loop through the entities to find names and add them to the dictionary
-        for ent in doc.ents:
-            name: str = ent.text
-            if (
-                ent.label_ in (Constants.SPACY_ENTITY_PERSON_HUNGARIAN, Constants.SPACY_ENTITY_PERSON_ENGLISH)
-                and name_regex.match(name)
-                and name not in new_names.keys()
-            ):
-                new_names[name] = website_url.rstrip(" /")
-                console.log(
-                    f"[yellow]FOUND NAME[/]: [cyan]{name}[/] on [link={website_url}]{website_url}[/link]"
-                )
-                set_information_printed()
+    for name in _find_names(PageContent.from_soup(content), region, _get_limits(limits)):
+        if name not in new_names.keys():
+            new_names[name] = website_url.rstrip(" /")
+            found_entities.append(name)
 
+    _log_found_entities({EntityType.NAME: found_entities}, website_url)
     return new_names
 
 def get_phone_numbers(
@@ -220,32 +200,23 @@ def get_phone_numbers(
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
 
     new_phone_numbers: dict[str, str] = dict(previous_phone_numbers)
-    html_content: str = content.decode()
-
+    found_entities: list[str] = []
     website_url_stripped: str = _get_stripped_link(website_url)
 
-    # Iterate through the phone number matches
-    for phone_number_match in phonenumbers.PhoneNumberMatcher(
-        html_content, region.value.upper()
-    ):
-        if not isinstance(phone_number_match, phonenumbers.PhoneNumberMatch):
-            raise TypeError(f"Invalid phone_number_match type. Expected type: PhoneNumberMatch, actual type: {type(phone_number_match)}")
-
-        # Format the phone number for consistency
-        phone_number: str = phonenumbers.format_number(
-            phone_number_match.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-        )
+    for phone_number in _find_phone_numbers(PageContent.from_soup(content), region):
         if phone_number not in new_phone_numbers.keys():
             new_phone_numbers[phone_number] = website_url_stripped
-            console.log(
-                f"[yellow]FOUND PHONE NUMBER[/]: [cyan]{phone_number}[/] on [link={website_url}]{website_url}[/link]"
-            )
-            set_information_printed()
+            found_entities.append(phone_number)
 
+    _log_found_entities({EntityType.PHONE_NUMBER: found_entities}, website_url)
     return new_phone_numbers
 
 def get_addresses(
-    website_url: str, content: BeautifulSoup, previous_addresses: dict[str, str], region: DataRegion
+    website_url: str,
+    content: BeautifulSoup,
+    previous_addresses: dict[str, str],
+    region: DataRegion,
+    limits: ExtractionLimits | None = None,
 ) -> dict[str, str]:
     """Parse the given HTML content for addresses.
 
@@ -254,6 +225,7 @@ def get_addresses(
         content (BeautifulSoup): The HTML content to parse
         found_addresses (dict): Previously found addresses
         region (DataRegion): The primary region for data to be found
+        limits (ExtractionLimits | None): Size limits of the text given to the address parser, the defaults if None
 
     Returns:
         A dictionary of all the addresses found in the HTML content. Key: address, Value: URL where the address was found
@@ -268,19 +240,127 @@ def get_addresses(
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
 
     new_addresses: dict[str, str] = dict(previous_addresses)
-    text_tags: ResultSet[Tag] = content.find_all(Constants.HTML_TEXT_TAGS)
+    found_entities: list[str] = []
 
-    # Get all the relevant tags in the HTML content
-    for tag in text_tags:
-        if not isinstance(tag, Tag):
-            raise TypeError(f"Invalid tag type. Expected type: Tag, actual type: {type(tag)}")
+    for full_address in _find_addresses(PageContent.from_soup(content), region, _get_limits(limits)):
+        if full_address not in new_addresses.keys():
+            new_addresses[full_address] = _get_stripped_link(website_url)
+            found_entities.append(full_address)
 
-        tag_text: str = tag.text.strip()
-        if not tag_text:
-            continue
+    _log_found_entities({EntityType.ADDRESS: found_entities}, website_url)
+    return new_addresses
+
+def _find_sublinks(website_url: str, content: PageContent) -> Iterator[str]:
+    """Yield every link of the given page content that points to the website, including duplicates.
+
+    Arguments:
+        website_url (str): The website's URL
+        content (PageContent): The texts and links of the page
+    """
+    hostname: str | None = urlparse.urlparse(website_url).hostname
+    website_url_stripped: str = _get_stripped_link(website_url)
+
+    # Loop through the links of the 'a' tags
+    for href in content.links:
+        href_stripped: str = _get_stripped_link(href)
+        # Extract link that starts with a slash, like "/about"
+        # File links are skipped
+        if href.startswith("/") and not _is_file_url(href):
+            if "#" in href:
+                href_stripped: str = href.split("#")[0].rstrip(
+                    " /"
+                )
+                found_url: str = website_url_stripped + href_stripped
+            else:
+                found_url: str = website_url_stripped + href_stripped
+            yield found_url
+
+        # Extract full link
+        # File links are skipped
+        if hostname is not None and hostname in href and not _is_file_url(href):
+            if "#" in href:
+                href_stripped: str = href.split("#")[0].rstrip(
+                    " /"
+                )
+                found_url: str = href_stripped.split("#")[0]
+            else:
+                found_url: str = href_stripped
+            yield found_url
+
+def _find_emails(content: PageContent) -> Iterator[str]:
+    """Yield every email of the given page content, including duplicates.
+
+    Arguments:
+        content (PageContent): The texts and links of the page
+    """
+    for tag_text in content.texts:
+        yield from re.findall(Constants.EMAIL_REGEX, tag_text)
+
+def _find_names(content: PageContent, region: DataRegion, limits: ExtractionLimits) -> Iterator[str]:
+    """Yield every name of the given page content, including duplicates.
+
+    Arguments:
+        content (PageContent): The texts and links of the page
+        region (DataRegion): The primary region for data to be found
+        limits (ExtractionLimits): Size limits of the text given to the NLP model
+    """
+    nlp: Language = model_registry.get_spacy_model(region)
+    name_regex: re.Pattern[str] = re.compile(Constants.NAME_REGEX)
+    segments: Iterator[str] = _iter_page_segments(
+        content.texts, limits.max_page_characters, limits.max_ner_segment_characters, Extractor.NAMES
+    )
+
+    # The segments of all the relevant tags are processed in batches
+    docs: Iterator[Doc] = nlp.pipe(segments, batch_size=Constants.NER_BATCH_SIZE)
+    for doc in docs:
+        # Loop through the entities to find names
+        for ent in doc.ents:
+            name: str = ent.text
+            if (
+                ent.label_ in (Constants.SPACY_ENTITY_PERSON_HUNGARIAN, Constants.SPACY_ENTITY_PERSON_ENGLISH)
+                and name_regex.match(name)
+            ):
+                yield name
+
+def _find_phone_numbers(content: PageContent, region: DataRegion) -> Iterator[str]:
+    """Yield every phone number of the given page content in international format, including duplicates.
+    The text of the whole document is searched, so no copy of the HTML is needed.
+
+    Arguments:
+        content (PageContent): The texts and links of the page
+        region (DataRegion): The primary region for data to be found
+    """
+    import phonenumbers
+
+    # Iterate through the phone number matches
+    for phone_number_match in phonenumbers.PhoneNumberMatcher(
+        content.text, region.value.upper()
+    ):
+        if not isinstance(phone_number_match, phonenumbers.PhoneNumberMatch):
+            raise TypeError(f"Invalid phone_number_match type. Expected type: PhoneNumberMatch, actual type: {type(phone_number_match)}")
+
+        # Format the phone number for consistency
+        yield phonenumbers.format_number(
+            phone_number_match.number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+        )
+
+def _find_addresses(content: PageContent, region: DataRegion, limits: ExtractionLimits) -> Iterator[str]:
+    """Yield every address of the given page content, including duplicates.
+
+    Arguments:
+        content (PageContent): The texts and links of the page
+        region (DataRegion): The primary region for data to be found
+        limits (ExtractionLimits): Size limits of the text given to the address parser
+    """
+    parse_address = model_registry.get_address_parser()
+    segments: Iterator[str] = _iter_page_segments(
+        content.texts, limits.max_page_characters, limits.max_address_segment_characters, Extractor.ADDRESSES
+    )
+
+    # Get the segments of all the relevant tags
+    for segment in segments:
+        parsed_address = parse_address(segment, country=region.value.upper())
 
-        parsed_address = parse_address(tag_text, country=region.value.upper())
-        
         # Skip empty results
         if not parsed_address:
             continue
@@ -291,21 +371,106 @@ def get_addresses(
             # Min and Max are an arbitrary threshold to filter out non-addresses
             if len(parsed_address) > Constants.MIN_ADDRESS_COMPONENTS and len(parsed_address) < Constants.MAX_ADDRESS_COMPONENTS:
                 # Reconstruct the address from the parsed components
-                full_address = " ".join(component for component, label in parsed_address)
+                yield " ".join(component for component, label in parsed_address)
 
-                if full_address not in new_addresses.keys():
-                    new_addresses[full_address] = _get_stripped_link(website_url)
-                    console.log(
-                        f"[yellow]FOUND ADDRESS[/]: [cyan]{full_address}[/] on [link={website_url}]{website_url}[/link]"
-                    )
-                    set_information_printed()
+def _iter_page_segments(
+    texts: list[str], max_page_characters: int, max_segment_characters: int, extractor: Extractor
+) -> Iterator[str]:
+    """Yield the texts of a page split into segments, until the characters of the page run out.
 
-    return new_addresses
+    Arguments:
+        texts (list[str]): The texts of the page
+        max_page_characters (int): Characters of the page to yield, the rest of the page is skipped with a warning.
+            The page is cut on the last whitespace before the limit, or at the limit if there is none
+        max_segment_characters (int): Length of the longest segment
+        extractor (Extractor): The extractor reading the segments, named in the warning
+    """
+    characters_left: int = max_page_characters
+    for text in texts:
+        if len(text) > characters_left:
+            # Cut on the last whitespace that fits, like the segments, so the last word isn't given to the models in half
+            cut: int = max(text.rfind(" ", 0, characters_left + 1), text.rfind("\n", 0, characters_left + 1))
+            text = text[:cut] if cut > 0 else text[:characters_left]
+            run_logger.log_message(
+                f"The page is longer than {max_page_characters} characters, the rest is skipped by the {extractor.value} extractor",
+                LogLevel.WARNING,
+            )
+            characters_left = 0
+        else:
+            characters_left -= len(text)
+
+        yield from _iter_segments(text, max_segment_characters)
+        if characters_left == 0:
+            return
+
+def _iter_segments(text: str, max_characters: int) -> Iterator[str]:
+    """Split the text into segments of at most max_characters.
+    Whole lines are kept together if they fit, then whole sentences, and the longest sentences are split on whitespace.
+    Consecutive short lines and sentences are joined into a single segment.
+
+    Arguments:
+        text (str): The text to split
+        max_characters (int): Length of the longest segment
+    """
+    if len(text) <= max_characters:
+        yield text
+        return
+
+    segment: str = ""
+    for piece in _iter_pieces(text, max_characters):
+        if not segment:
+            segment = piece
+        elif len(segment) + 1 + len(piece) <= max_characters:
+            segment = f"{segment}\n{piece}"
+        else:
+            yield segment
+            segment = piece
+    if segment:
+        yield segment
+
+def _iter_pieces(text: str, max_characters: int) -> Iterator[str]:
+    """Yield the non-empty lines of the text, the lines longer than max_characters split into sentences or words."""
+    for line in text.splitlines():
+        line = line.strip()
+        if len(line) <= max_characters:
+            if line:
+                yield line
+            continue
+
+        for sentence in re.split(Constants.SENTENCE_BOUNDARY_REGEX, line):
+            # Split the sentence on the last whitespace that fits, or anywhere if it's a single word
+            while len(sentence) > max_characters:
+                cut: int = sentence.rfind(" ", 0, max_characters + 1)
+                if cut <= 0:
+                    cut = max_characters
+                yield sentence[:cut]
+                sentence = sentence[cut:].lstrip()
+            if sentence:
+                yield sentence
+
+def _get_limits(limits: ExtractionLimits | None) -> ExtractionLimits:
+    """Validate the given extraction limits.
+
+    Arguments:
+        limits (ExtractionLimits | None): The limits given by the caller
 
-def set_information_printed():
-    """Set the data found flag to indicate that some data has been found during the parsing process."""
-    global information_printed
-    information_printed.set()
+    Returns:
+        ExtractionLimits: The given limits, or the default limits if None
+    """
+    if limits is None:
+        return ExtractionLimits()
+    if not isinstance(limits, ExtractionLimits):
+        raise TypeError(f"Invalid limits type. Expected type: ExtractionLimits, actual type: {type(limits)}")
+    return limits
+
+def _log_found_entities(new_entities: dict[EntityType, list[str]], website_url: str):
+    """Log the newly found entities of a page.
+
+    Arguments:
+        new_entities (dict[EntityType, list[str]]): The newly found entities by their type
+        website_url (str): The website's URL where the entities were found
+    """
+    run_logger.log_entities(website_url, new_entities)
 
 def _is_file_url(url: str) -> bool:
     """Check if the given URL is a file or not.
@@ -318,7 +483,7 @@ def _is_file_url(url: str) -> bool:
     """
     if not isinstance(url, str):
         raise TypeError(f"Invalid URL type. Expected type: str, actual type: {type(url)}")
-    
+
     valid_webpage_extensions: set[str] = Constants.WEBPAGE_EXTENSIONS
     path: str = urlparse.urlparse(url).path
     if "." in path:
@@ -328,23 +493,6 @@ def _is_file_url(url: str) -> bool:
 
     return False
 
-@lru_cache(maxsize=Constants.LRU_CACHE_MAXSIZE)
-def _get_spacy_model(region: DataRegion) -> Language:
-    """Return the Spacy model based on the region.
-
-    Arguments:
-        region (DataRegion): The region of the website
-
-    Returns:
-        The Spacy model to be returned
-    """
-    if not isinstance(region, DataRegion):
-        raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
-    
-    if region == DataRegion.HUNGARY:
-        return spacy.load(Constants.SPACY_MODEL_HU)
-    return spacy.load(Constants.SPACY_MODEL_EN)
-
 def _get_stripped_link(link: str) -> str:
     """Get the stripped version of the given link.
 
@@ -353,4 +501,4 @@ def _get_stripped_link(link: str) -> str:
     Returns:
         str: Stripped version of the link
     """
-    return link.rstrip(" /")
\ No newline at end of file
+    return link.rstrip(" /")
@@ -0,0 +1,232 @@
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from .enums import EntityType, Extractor
+
+_ENTITY_TYPES: tuple[EntityType, ...] = tuple(EntityType)
+# Extractors are stored by their index in the typecode 'B' array
+_EXTRACTORS: tuple[Extractor, ...] = tuple(Extractor)
+_EXTRACTOR_IDS: dict[Extractor, int] = {extractor: extractor_id for extractor_id, extractor in enumerate(_EXTRACTORS)}
+_NO_OCCURRENCE = -1
+
+@dataclass(frozen=True)
+class EntityOccurrence:
+    """An occurrence of an entity on a single page.
+
+    Attributes:
+        website_url (str): The website's URL where the entity was found
+        extractor (Extractor): The extractor that found the entity
+        count (int): Number of times the entity was found on the page by the extractor
+    """
+
+    website_url: str
+    extractor: Extractor
+    count: int
+
+class EntityStore:
+    """Compact store of the found entities and every occurrence of them.
+    URLs are interned and referenced by their page ID. The occurrences of all the entities are kept in flat arrays
+    as linked lists, one (page ID, extractor, count) record per entity, page and extractor.
+
+    Methods:
+        add(entity_type, entity, website_url, extractor) -> bool: Record an occurrence, return True if the entity is new
+        contains(entity_type, entity) -> bool: Check if the entity has been found
+        entities(entity_type) -> Iterator[str]: Iterate over the entities of the type in the order they were found
+        urls() -> Iterator[str]: Iterate over the URLs where entities were found in the order they were first seen
+        entity_count(entity_type) -> int: Return the number of distinct entities of the type
+        count(entity_type, entity) -> int: Return the number of times the entity was found
+        first_url(entity_type, entity) -> str: Return the URL of the page where the entity was first found
+        occurrences(entity_type, entity) -> list[EntityOccurrence]: Return every occurrence of the entity
+        first_urls(entity_type) -> dict[str, str]: Return the entities of the type and the URL where they were first found
+        rank(entity_type, limit) -> list[tuple[str, int]]: Return the entities of the type ordered by frequency
+        copy() -> EntityStore: Return an independent copy of the store
+    """
+
+    __slots__ = (
+        "_urls",
+        "_url_ids",
+        "_entity_ids",
+        "_heads",
+        "_tails",
+        "_totals",
+        "_occurrence_pages",
+        "_occurrence_extractors",
+        "_occurrence_counts",
+        "_occurrence_next",
+    )
+
+    def __init__(self):
+        self._urls: list[str] = []
+        self._url_ids: dict[str, int] = dict()
+        self._entity_ids: dict[EntityType, dict[str, int]] = {entity_type: dict() for entity_type in _ENTITY_TYPES}
+        # Per entity: first and last occurrence index, total number of occurrences
+        self._heads: array = array("i")
+        self._tails: array = array("i")
+        self._totals: array = array("I")
+        # Per occurrence: page ID, extractor ID, count on the page and the index of the next occurrence of the entity
+        self._occurrence_pages: array = array("I")
+        self._occurrence_extractors: array = array("B")
+        self._occurrence_counts: array = array("I")
+        self._occurrence_next: array = array("i")
+
+    def __len__(self) -> int:
+        return len(self._heads)
+
+    @property
+    def page_count(self) -> int:
+        """Number of distinct URLs where entities were found."""
+        return len(self._urls)
+
+    def add(self, entity_type: EntityType, entity: str, website_url: str, extractor: Extractor) -> bool:
+        """Record an occurrence of the entity on the given website.
+        Repeated occurrences on the same page by the same extractor only increase the count of the occurrence.
+
+        Arguments:
+            entity_type (EntityType): Type of the entity
+            entity (str): The found entity
+            website_url (str): The website's URL where the entity was found
+            extractor (Extractor): The extractor that found the entity
+
+        Returns:
+            bool: True if the entity wasn't found before, False otherwise
+        """
+        # The lookups double as the type checks, add() runs for every entity found on every page
+        entity_ids = self._entity_ids.get(entity_type)
+        if entity_ids is None:
+            raise TypeError(f"Invalid entity_type type. Expected type: EntityType, actual type: {type(entity_type)}")
+        extractor_id = _EXTRACTOR_IDS.get(extractor)
+        if extractor_id is None:
+            raise TypeError(f"Invalid extractor type. Expected type: Extractor, actual type: {type(extractor)}")
+
+        page_id = self._url_ids.get(website_url)
+        if page_id is None:
+            page_id = self._intern_url(website_url)
+        entity_id = entity_ids.get(entity)
+        occurrence_pages = self._occurrence_pages
+
+        if entity_id is None:
+            occurrence_index = len(occurrence_pages)
+            occurrence_pages.append(page_id)
+            self._occurrence_extractors.append(extractor_id)
+            self._occurrence_counts.append(1)
+            self._occurrence_next.append(_NO_OCCURRENCE)
+            entity_ids[entity] = len(self._heads)
+            self._heads.append(occurrence_index)
+            self._tails.append(occurrence_index)
+            self._totals.append(1)
+            return True
+
+        self._totals[entity_id] += 1
+        tail = self._tails[entity_id]
+        # Entities are found page by page, so a repeated occurrence on the same page is always the last one
+        if occurrence_pages[tail] == page_id and self._occurrence_extractors[tail] == extractor_id:
+            self._occurrence_counts[tail] += 1
+            return False
+
+        occurrence_index = len(occurrence_pages)
+        occurrence_pages.append(page_id)
+        self._occurrence_extractors.append(extractor_id)
+        self._occurrence_counts.append(1)
+        self._occurrence_next.append(_NO_OCCURRENCE)
+        self._occurrence_next[tail] = occurrence_index
+        self._tails[entity_id] = occurrence_index
+        return False
+
+    def contains(self, entity_type: EntityType, entity: str) -> bool:
+        """Check if the entity of the given type has been found."""
+        return entity in self._entity_ids[entity_type]
+
+    def entities(self, entity_type: EntityType) -> Iterator[str]:
+        """Iterate over the entities of the given type in the order they were found."""
+        return iter(self._entity_ids[entity_type])
+
+    def urls(self) -> Iterator[str]:
+        """Iterate over the URLs where entities were found in the order they were first seen."""
+        return iter(self._urls)
+
+    def entity_count(self, entity_type: EntityType) -> int:
+        """Return the number of distinct entities of the given type."""
+        return len(self._entity_ids[entity_type])
+
+    def count(self, entity_type: EntityType, entity: str) -> int:
+        """Return the number of times the entity was found, 0 if it wasn't found."""
+        entity_id = self._entity_ids[entity_type].get(entity)
+        if entity_id is None:
+            return 0
+        return self._totals[entity_id]
+
+    def first_url(self, entity_type: EntityType, entity: str) -> str:
+        """Return the URL of the page where the entity was first found.
+
+        Raises:
+            KeyError: If the entity wasn't found
+        """
+        entity_id = self._entity_ids[entity_type][entity]
+        return self._urls[self._occurrence_pages[self._heads[entity_id]]]
+
+    def occurrences(self, entity_type: EntityType, entity: str) -> list[EntityOccurrence]:
+        """Return every occurrence of the entity in the order they were found.
+
+        Raises:
+            KeyError: If the entity wasn't found
+        """
+        entity_id = self._entity_ids[entity_type][entity]
+        occurrences = []
+        occurrence_index = self._heads[entity_id]
+        while occurrence_index != _NO_OCCURRENCE:
+            occurrences.append(EntityOccurrence(
+                self._urls[self._occurrence_pages[occurrence_index]],
+                _EXTRACTORS[self._occurrence_extractors[occurrence_index]],
+                self._occurrence_counts[occurrence_index],
+            ))
+            occurrence_index = self._occurrence_next[occurrence_index]
+        return occurrences
+
+    def first_urls(self, entity_type: EntityType) -> dict[str, str]:
+        """Return the entities of the given type and the URL of the page where they were first found.
+
+        Returns:
+            dict[str, str]: Key: entity, Value: Website URL
+        """
+        return {
+            entity: self._urls[self._occurrence_pages[self._heads[entity_id]]]
+            for entity, entity_id in self._entity_ids[entity_type].items()
+        }
+
+    def rank(self, entity_type: EntityType, limit: int | None = None) -> list[tuple[str, int]]:
+        """Return the entities of the given type ordered by the number of times they were found.
+        Entities found the same number of times keep the order they were found in.
+
+        Arguments:
+            entity_type (EntityType): Type of the entities
+            limit (int | None): Maximum number of entities to return, None returns all of them
+
+        Returns:
+            list[tuple[str, int]]: The entities and their number of occurrences
+        """
+        if limit is not None and (not isinstance(limit, int) or limit < 0):
+            raise ValueError("The limit must be a non-negative integer or None")
+
+        ranked = sorted(
+            ((entity, self._totals[entity_id]) for entity, entity_id in self._entity_ids[entity_type].items()),
+            key=lambda entity_count: entity_count[1],
+            reverse=True,
+        )
+        return ranked if limit is None else ranked[:limit]
+
+    def copy(self) -> "EntityStore":
+        """Return an independent copy of the store."""
+        store = EntityStore()
+        store._urls = list(self._urls)
+        store._url_ids = dict(self._url_ids)
+        store._entity_ids = {entity_type: dict(entity_ids) for entity_type, entity_ids in self._entity_ids.items()}
+        for attribute in ("_heads", "_tails", "_totals", "_occurrence_pages", "_occurrence_extractors", "_occurrence_counts", "_occurrence_next"):
+            setattr(store, attribute, array(getattr(self, attribute).typecode, getattr(self, attribute)))
+        return store
+
+    def _intern_url(self, website_url: str) -> int:
+        """Intern a new URL and return its page ID."""
+        page_id = len(self._urls)
+        self._url_ids[website_url] = page_id
+        self._urls.append(website_url)
+        return page_id
\ No newline at end of file
@@ -0,0 +1,23 @@
+from enum import Enum
+
+class EntityType(Enum):
+    EMAIL = 'email'
+    NAME = 'name'
+    PHONE_NUMBER = 'phone_number'
+    ADDRESS = 'address'
+
+class Extractor(Enum):
+    EMAILS = 'emails'
+    NAMES = 'names'
+    PHONE_NUMBERS = 'phone_numbers'
+    ADDRESSES = 'addresses'
+
+class PipelineStage(Enum):
+    FETCH = 'fetch'
+    PARSE = 'parse'
+    SUBLINKS = 'sublinks'
+    EMAILS = 'emails'
+    NAMES = 'names'
+    PHONE_NUMBERS = 'phone_numbers'
+    ADDRESSES = 'addresses'
+    EXPORT = 'export'
\ No newline at end of file
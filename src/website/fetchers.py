@@ -0,0 +1,366 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from website import constants as Constants
+from .models import WebDriverNode
+import json
+import random
+import threading
+import time
+import urllib.request
+import validators
+
+# An unreachable node fails the session requests with urllib3 or socket errors instead of a WebDriverException
+_SESSION_ERRORS = (WebDriverException, Urllib3HTTPError, OSError)
+
+class Fetcher(ABC):
+    """Source of the HTML of the crawled pages.
+
+    Methods:
+        fetch(url) -> str: Return the HTML source of the page
+        warm_up(): Prepare the fetcher ahead of the first page
+        close(): Release the resources of the fetcher
+    """
+
+    def fetch(self, url: str) -> str:
+        """Return the HTML source of the given page.
+
+        Arguments:
+            url (str): The page's URL
+
+        Returns:
+            str: The HTML source of the page
+        """
+        if not validators.url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        return self._fetch(url)
+
+    def warm_up(self):
+        """Prepare the fetcher ahead of the first page, e.g. open the browser sessions. Does nothing by default."""
+
+    def close(self):
+        """Release the resources of the fetcher, e.g. the open browser sessions. Does nothing by default."""
+
+    @abstractmethod
+    def _fetch(self, url: str) -> str:
+        """Return the HTML source of the given page, the URL is already validated."""
+
+class WebDriverFetcher(Fetcher):
+    """Fetcher rendering every page in a remote Selenium browser, so the content added by JavaScript is parsed too.
+
+    Attributes:
+        remote_url (str): URL of the Selenium server
+    """
+
+    def __init__(self, remote_url: str = Constants.WEBDRIVER_REMOTE_URL):
+        if not isinstance(remote_url, str):
+            raise TypeError(f"Invalid remote_url type. Expected type: str, actual type: {type(remote_url)}")
+
+        self.remote_url = remote_url
+
+    def _fetch(self, url: str) -> str:
+        driver = _create_session(self.remote_url)
+        try:
+            driver.get(url)
+            website_page_source: str = driver.page_source
+        finally:
+            driver.quit()
+
+        return website_page_source
+
+class PooledWebDriverFetcher(Fetcher):
+    """Fetcher keeping its Selenium browser sessions open between the pages, for long-running processes.
+    Opening a session takes longer than rendering most pages, so the sessions are reused until the fetcher is closed.
+    The sessions are spread over the WebDriver nodes: a page gets an idle session of the least loaded healthy node,
+    or a new session if that node has capacity left. A session renders one page at a time.
+    A page whose session fails is retried on another session. If the node of the failed session doesn't answer its
+    status endpoint, the node is left out until a later health check finds it up again.
+
+    Attributes:
+        nodes (tuple[WebDriverNode, ...]): The Selenium servers the sessions are opened on
+        max_sessions (int): Maximum number of pages rendered at once over all the nodes
+        health_check_interval_seconds (float): Time between the health checks of a node that is down
+    """
+
+    def __init__(
+        self,
+        remote_url: str | None = None,
+        max_sessions: int | None = None,
+        nodes: Iterable[WebDriverNode] | None = None,
+        health_check_interval_seconds: float = Constants.WEBDRIVER_HEALTH_CHECK_INTERVAL_SECONDS,
+    ):
+        if remote_url is not None and nodes is not None:
+            raise ValueError("Either a remote URL or the nodes can be given, not both")
+        if remote_url is not None and not isinstance(remote_url, str):
+            raise TypeError(f"Invalid remote_url type. Expected type: str, actual type: {type(remote_url)}")
+        if max_sessions is not None and (not isinstance(max_sessions, int) or max_sessions < 1):
+            raise ValueError("The maximum number of sessions must be a positive integer")
+        if not isinstance(health_check_interval_seconds, (int, float)) or health_check_interval_seconds <= 0:
+            raise ValueError("The health check interval must be a positive number of seconds")
+
+        if remote_url is not None:
+            nodes = (WebDriverNode(remote_url, max_sessions or Constants.WEBDRIVER_MAX_SESSIONS),)
+        elif nodes is None:
+            nodes = tuple(WebDriverNode(url) for url in Constants.WEBDRIVER_NODE_URLS)
+        self.nodes = tuple(nodes)
+        for node in self.nodes:
+            if not isinstance(node, WebDriverNode):
+                raise TypeError(f"Invalid node type. Expected type: WebDriverNode, actual type: {type(node)}")
+        if not self.nodes:
+            raise ValueError("At least one WebDriver node is required")
+
+        total_capacity = sum(node.capacity for node in self.nodes)
+        self.max_sessions = min(max_sessions, total_capacity) if max_sessions is not None else total_capacity
+        self.health_check_interval_seconds = health_check_interval_seconds
+        # Equally loaded nodes are taken in a random order, so the fetchers of separate processes don't all start on the same node
+        self._node_states = [_NodeState(node) for node in random.sample(self.nodes, len(self.nodes))]
+        self._busy_sessions = 0
+        self._condition = threading.Condition()
+
+    def warm_up(self):
+        """Check the health of the nodes and open the sessions ahead of the first pages."""
+        self._check_nodes(force=True)
+        while True:
+            with self._condition:
+                node_state = self._select_node(opening=True)
+                if node_state is None or self._get_open_sessions() >= self.max_sessions:
+                    return
+                node_state.opening_sessions += 1
+            try:
+                session = _create_session(node_state.node.url)
+            except _SESSION_ERRORS:
+                with self._condition:
+                    node_state.opening_sessions -= 1
+                self._mark_down(node_state)
+                continue
+            with self._condition:
+                node_state.opening_sessions -= 1
+                node_state.idle_sessions.append(session)
+                self._condition.notify_all()
+
+    def close(self):
+        """Quit the idle sessions, the sessions rendering a page are quit when they are returned."""
+        with self._condition:
+            sessions = [session for node_state in self._node_states for session in node_state.idle_sessions]
+            for node_state in self._node_states:
+                node_state.idle_sessions = []
+        for session in sessions:
+            _quit_session(session)
+
+    def get_node_loads(self) -> dict[str, dict[str, int | bool | None]]:
+        """Return the health and the sessions of every node.
+
+        Returns:
+            dict[str, dict[str, int | bool | None]]: Key: node URL, Value: healthy (None if not checked yet),
+                busy and idle sessions, and capacity
+        """
+        with self._condition:
+            return {
+                node_state.node.url: {
+                    "healthy": node_state.is_healthy,
+                    "busy": node_state.busy_sessions,
+                    "idle": len(node_state.idle_sessions),
+                    "capacity": node_state.node.capacity,
+                }
+                for node_state in self._node_states
+            }
+
+    def _fetch(self, url: str) -> str:
+        last_error: Exception | None = None
+        for _ in range(Constants.WEBDRIVER_FETCH_ATTEMPTS):
+            node_state, session = self._acquire_session()
+            try:
+                if session is None:
+                    session = _create_session(node_state.node.url)
+                website_page_source = _render_page(session, url)
+            except _SESSION_ERRORS as e:
+                # The session may have timed out, its browser crashed or its node died, the page gets another session
+                last_error = e
+                self._release_session(node_state, session, is_failed=True)
+                continue
+            except Exception:
+                self._release_session(node_state, session, is_failed=True)
+                raise
+
+            self._release_session(node_state, session)
+            return website_page_source
+
+        raise last_error
+
+    def _acquire_session(self) -> tuple["_NodeState", webdriver.Remote | None]:
+        """Reserve a session of the least loaded healthy node, waiting while every session is busy.
+
+        Returns:
+            tuple[_NodeState, webdriver.Remote | None]: The node and its idle session, None if a new session has to be opened
+
+        Raises:
+            WebDriverException: If every node is down
+        """
+        while True:
+            self._check_nodes()
+            with self._condition:
+                node_state = self._select_node()
+                if node_state is not None and self._busy_sessions < self.max_sessions:
+                    node_state.busy_sessions += 1
+                    self._busy_sessions += 1
+                    return node_state, node_state.idle_sessions.pop() if node_state.idle_sessions else None
+                if all(node_state.is_healthy is False and not node_state.is_checking for node_state in self._node_states):
+                    raise WebDriverException(f"Every WebDriver node is down: {', '.join(node.url for node in self.nodes)}")
+                # Woken up by a returned session, or by the timeout to check the nodes that are down again
+                self._condition.wait(self.health_check_interval_seconds)
+
+    def _release_session(self, node_state: "_NodeState", session: webdriver.Remote | None, is_failed: bool = False):
+        """Return a session to its node, a failed session is quit and its node checked."""
+        if is_failed:
+            if session is not None:
+                _quit_session(session)
+            if not _is_node_healthy(node_state.node.url):
+                self._mark_down(node_state)
+
+        quit_session = None
+        with self._condition:
+            node_state.busy_sessions -= 1
+            self._busy_sessions -= 1
+            if not is_failed:
+                if node_state.is_healthy is False:
+                    quit_session = session
+                else:
+                    node_state.idle_sessions.append(session)
+            self._condition.notify_all()
+        if quit_session is not None:
+            _quit_session(quit_session)
+
+    def _select_node(self, opening: bool = False) -> "_NodeState | None":
+        """Return the least loaded healthy node with an idle session or capacity left, the lock must be held.
+
+        Arguments:
+            opening (bool): Only consider the nodes with capacity left for a new session, e.g. during the warm-up
+        """
+        available_nodes = [
+            node_state for node_state in self._node_states
+            if node_state.is_healthy
+            and ((node_state.idle_sessions and not opening) or node_state.open_sessions < node_state.node.capacity)
+        ]
+        if not available_nodes:
+            return None
+        # min keeps the first of the equally loaded nodes, the nodes with an idle session are preferred among them
+        return min(available_nodes, key=lambda node_state: (node_state.load, not node_state.idle_sessions))
+
+    def _get_open_sessions(self) -> int:
+        """Return the number of open and opening sessions over all the nodes, the lock must be held."""
+        return sum(node_state.open_sessions for node_state in self._node_states)
+
+    def _check_nodes(self, force: bool = False):
+        """Check the health of the nodes that weren't checked yet or are down and due for a check.
+
+        Arguments:
+            force (bool): Check every node, also the healthy ones
+        """
+        now = time.monotonic()
+        with self._condition:
+            due_nodes = [
+                node_state for node_state in self._node_states
+                if force or (not node_state.is_healthy and node_state.next_check_at <= now and not node_state.is_checking)
+            ]
+            for node_state in due_nodes:
+                node_state.is_checking = True
+        if not due_nodes:
+            return
+
+        # The checks run outside the lock, the other pages keep using the healthy nodes meanwhile
+        health = {id(node_state): _is_node_healthy(node_state.node.url) for node_state in due_nodes}
+        down_sessions = []
+        with self._condition:
+            for node_state in due_nodes:
+                node_state.is_checking = False
+                node_state.is_healthy = health[id(node_state)]
+                if not node_state.is_healthy:
+                    node_state.next_check_at = now + self.health_check_interval_seconds
+                    down_sessions.extend(node_state.idle_sessions)
+                    node_state.idle_sessions = []
+            self._condition.notify_all()
+        for session in down_sessions:
+            _quit_session(session)
+
+    def _mark_down(self, node_state: "_NodeState"):
+        """Leave a node out until its next health check, its idle sessions are quit."""
+        with self._condition:
+            node_state.is_healthy = False
+            node_state.next_check_at = time.monotonic() + self.health_check_interval_seconds
+            sessions = node_state.idle_sessions
+            node_state.idle_sessions = []
+            self._condition.notify_all()
+        for session in sessions:
+            _quit_session(session)
+
+class _NodeState:
+    """The health and the sessions of a WebDriver node of a PooledWebDriverFetcher, guarded by the fetcher's lock."""
+
+    def __init__(self, node: WebDriverNode):
+        self.node = node
+        self.is_healthy: bool | None = None
+        self.is_checking = False
+        self.next_check_at = 0.0
+        self.idle_sessions: list[webdriver.Remote] = []
+        self.busy_sessions = 0
+        self.opening_sessions = 0
+
+    @property
+    def open_sessions(self) -> int:
+        return len(self.idle_sessions) + self.busy_sessions + self.opening_sessions
+
+    @property
+    def load(self) -> float:
+        return self.busy_sessions / self.node.capacity
+
+class HttpFetcher(Fetcher):
+    """Fetcher downloading the HTML with plain HTTP requests, without rendering it.
+    Much faster than a browser, but only suited to static websites, e.g. the local benchmark sites.
+
+    Attributes:
+        timeout_seconds (float): Timeout of a request
+    """
+
+    def __init__(self, timeout_seconds: float = Constants.HTTP_FETCH_TIMEOUT_SECONDS):
+        if not isinstance(timeout_seconds, (int, float)) or timeout_seconds <= 0:
+            raise ValueError("The timeout must be a positive number")
+
+        self.timeout_seconds = timeout_seconds
+
+    def _fetch(self, url: str) -> str:
+        request = urllib.request.Request(url, headers={"User-Agent": Constants.HTTP_FETCH_USER_AGENT})
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            charset = response.headers.get_content_charset() or Constants.HTTP_DEFAULT_CHARSET
+            return response.read().decode(charset, errors="replace")
+
+def _create_session(remote_url: str) -> webdriver.Remote:
+    """Open a headless Chrome session on the Selenium server."""
+    options = webdriver.ChromeOptions()
+    options.add_argument(Constants.WEBDRIVER_HEADLESS_ARGUMENT)
+    return webdriver.Remote(remote_url, options=options)
+
+def _render_page(session: webdriver.Remote, url: str) -> str:
+    """Load the page in the session and return its rendered HTML source."""
+    session.get(url)
+    return session.page_source
+
+def _is_node_healthy(remote_url: str) -> bool:
+    """Check if the WebDriver node answers its status endpoint.
+    A busy Selenium node reports that it isn't ready for new sessions, so only the answer itself is checked.
+    """
+    try:
+        status_url = remote_url.rstrip("/") + Constants.WEBDRIVER_STATUS_PATH
+        with urllib.request.urlopen(status_url, timeout=Constants.WEBDRIVER_HEALTH_CHECK_TIMEOUT_SECONDS) as response:
+            return "value" in json.loads(response.read())
+    except (OSError, ValueError):
+        return False
+
+def _quit_session(session: webdriver.Remote):
+    """Quit the session, ignoring the errors of sessions that are already gone."""
+    try:
+        session.quit()
+    except Exception:
+        pass
\ No newline at end of file
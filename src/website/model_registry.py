@@ -0,0 +1,135 @@
+from collections.abc import Callable, Iterable
+from globals.enums import DataRegion, LogLevel
+from globals.run_logger import run_logger
+from typing import TYPE_CHECKING
+from website import constants as Constants
+import threading
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+class ModelRegistry:
+    """Thread-safe registry of the NLP models used by the data extractors.
+    Every model is loaded at most once per process and kept loaded for the whole run,
+    so switching between regions never reloads a model.
+
+    Methods:
+        get_spacy_model(region) -> Language: Return the loaded Spacy model of the region
+        get_address_parser() -> Callable: Return libpostal's address parser
+        warm_up(regions) -> threading.Thread: Load the models of the regions in a background thread
+    """
+
+    def __init__(self):
+        self._spacy_models: dict[str, "Language"] = {}
+        self._model_locks: dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self._address_parser: Callable | None = None
+
+    def get_spacy_model(self, region: DataRegion) -> "Language":
+        """Return the Spacy model of the given region, loading it on first use.
+        Spacy itself is also only imported here, as importing it takes a considerable amount of time.
+        If the model is being loaded by another thread, wait for that load instead of loading it again.
+
+        Arguments:
+            region (DataRegion): The primary region for data to be found
+
+        Returns:
+            Language: The loaded Spacy model
+        """
+        if not isinstance(region, DataRegion):
+            raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+
+        model_name = get_spacy_model_name(region)
+        model = self._spacy_models.get(model_name)
+        if model is not None:
+            return model
+
+        with self._get_lock(model_name):
+            if model_name not in self._spacy_models:
+                import spacy
+                self._spacy_models[model_name] = spacy.load(model_name)
+            return self._spacy_models[model_name]
+
+    def get_address_parser(self) -> Callable:
+        """Return libpostal's address parser function.
+        Importing the parser loads the libpostal data files, so it's only done once.
+
+        Returns:
+            Callable: The postal.parser.parse_address function
+        """
+        if self._address_parser is not None:
+            return self._address_parser
+
+        with self._get_lock(Constants.LIBPOSTAL_MODEL_NAME):
+            if self._address_parser is None:
+                from postal.parser import parse_address
+                self._address_parser = parse_address
+            return self._address_parser
+
+    def warm_up(self, regions: Iterable[DataRegion]) -> threading.Thread:
+        """Load the models needed for the given regions in a background daemon thread.
+        Models requested while the warm-up is running are shared with it, not loaded twice.
+
+        Arguments:
+            regions (Iterable[DataRegion]): The regions whose models should be loaded
+
+        Returns:
+            threading.Thread: The started warm-up thread
+        """
+        regions = tuple(regions)
+        for region in regions:
+            if not isinstance(region, DataRegion):
+                raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+
+        warm_up_thread = threading.Thread(
+            target=self._warm_up, args=(regions,), name=Constants.MODEL_WARM_UP_THREAD_NAME, daemon=True
+        )
+        warm_up_thread.start()
+        return warm_up_thread
+
+    def _warm_up(self, regions: tuple[DataRegion, ...]):
+        """Load the models of the given regions. Errors are only logged here,
+        the extractors raise them again when they request the model.
+
+        Arguments:
+            regions (tuple[DataRegion, ...]): The regions whose models should be loaded
+        """
+        for region in regions:
+            try:
+                self.get_spacy_model(region)
+            except Exception as e:
+                run_logger.log_message(f"Failed to load Spacy model {get_spacy_model_name(region)}: {e}", LogLevel.ERROR)
+
+        try:
+            self.get_address_parser()
+        except Exception as e:
+            run_logger.log_message(f"Failed to load libpostal: {e}", LogLevel.ERROR)
+
+    def _get_lock(self, model_name: str) -> threading.Lock:
+        """Return the lock guarding the loading of the given model.
+
+        Arguments:
+            model_name (str): Name of the model
+
+        Returns:
+            threading.Lock: The lock of the model
+        """
+        with self._registry_lock:
+            if model_name not in self._model_locks:
+                self._model_locks[model_name] = threading.Lock()
+            return self._model_locks[model_name]
+
+def get_spacy_model_name(region: DataRegion) -> str:
+    """Return the name of the Spacy model used for the region.
+
+    Arguments:
+        region (DataRegion): The primary region for data to be found
+
+    Returns:
+        str: Name of the Spacy model
+    """
+    if region == DataRegion.HUNGARY:
+        return Constants.SPACY_MODEL_HU
+    return Constants.SPACY_MODEL_EN
+
+model_registry = ModelRegistry()
\ No newline at end of file
@@ -1,4 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+from website import constants as Constants
+from .entity_store import EntityStore
+from .enums import EntityType, Extractor
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 @dataclass(frozen=True)
 class WebsiteInfo:
@@ -10,6 +18,7 @@ class WebsiteInfo:
         found_names (dict[str, str]): A dictionary of all the names found in the HTML content. Key: name, Value: Website URL
         found_phone_numbers (dict[str, str]): A dictionary of all the phone numbers found in the HTML content. Key: name, Value: Website URL
         found_addresses (dict[str, str]): A dictionary of all the addresses found in the HTML content. Key: name, Value: Website URL
+        entity_store (EntityStore | None): Every occurrence of the found entities, if it was collected during the parsing process
 
     Methods:
         has_data() -> bool: Check if any data has been found during the parsing process. Links are not considered as data
@@ -20,6 +29,7 @@ class WebsiteInfo:
     found_names: dict[str, str]
     found_phone_numbers: dict[str, str]
     found_addresses: dict[str, str]
+    entity_store: EntityStore | None = field(default=None, compare=False, repr=False)
 
     def has_data(self) -> bool:
         """Check if any data has been found during the parsing process.
@@ -33,4 +43,285 @@ class WebsiteInfo:
             self.found_emails,
             self.found_names,
             self.found_phone_numbers,
-        ])
\ No newline at end of file
+        ])
+
+@dataclass(frozen=True)
+class PageResult:
+    """The result of parsing a single page of the website.
+
+    Attributes:
+        url (str): The URL of the parsed page
+        new_entities (dict[EntityType, list[str]]): The entities found for the first time on this page, in the order of their appearance
+        discovered_links (list[str]): The links found for the first time on this page, in the order of their appearance
+        timings (dict[str, float]): Time spent in every stage of the page pipeline. Key: PipelineStage value, Value: seconds
+
+    Methods:
+        has_data() -> bool: Check if any new data has been found on the page. Links are not considered as data
+    """
+
+    url: str
+    new_entities: dict[EntityType, list[str]]
+    discovered_links: list[str]
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def has_data(self) -> bool:
+        """Check if any new data has been found on the page.
+        Only check for emails, names, phone numbers, and addresses.
+
+        Returns:
+            bool: True if any new data has been found, False otherwise
+        """
+        return any(self.new_entities.values())
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """Size limits of the text given to the NLP models on a page, bounding the time and memory a page can take.
+    Longer texts are split into segments on line and sentence boundaries, or on whitespace if a sentence is too long.
+
+    Attributes:
+        max_page_characters (int): Characters of a page given to each model, the rest of the page is skipped
+        max_ner_segment_characters (int): Longest text given to the named entity recognition at once
+        max_address_segment_characters (int): Longest text given to the address parser at once
+    """
+
+    max_page_characters: int = Constants.MAX_PAGE_CHARACTERS
+    max_ner_segment_characters: int = Constants.MAX_NER_SEGMENT_CHARACTERS
+    max_address_segment_characters: int = Constants.MAX_ADDRESS_SEGMENT_CHARACTERS
+
+    def __post_init__(self):
+        for name in ("max_page_characters", "max_ner_segment_characters", "max_address_segment_characters"):
+            value = getattr(self, name)
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"The {name} limit must be a positive integer")
+        if self.max_ner_segment_characters > Constants.SPACY_MAX_LENGTH:
+            raise ValueError(f"The named entity recognition segments can't be longer than {Constants.SPACY_MAX_LENGTH} characters")
+
+@dataclass(frozen=True)
+class WebDriverNode:
+    """A Selenium server the browser sessions can be opened on, e.g. a Chrome container of docker-compose.
+
+    Attributes:
+        url (str): URL of the WebDriver endpoint, e.g. http://chrome_selenium:4444/wd/hub
+        capacity (int): Maximum number of sessions open on the node at once
+
+    Methods:
+        from_string(node) -> WebDriverNode: Parse a node given as URL or URL=CAPACITY
+    """
+
+    url: str
+    capacity: int = Constants.WEBDRIVER_NODE_CAPACITY
+
+    def __post_init__(self):
+        if not isinstance(self.url, str):
+            raise TypeError(f"Invalid url type. Expected type: str, actual type: {type(self.url)}")
+        # The host names of docker-compose services may contain underscores, which validators.url rejects
+        split_url = urlsplit(self.url)
+        if split_url.scheme not in ("http", "https") or not split_url.netloc:
+            raise ValueError(f"Invalid WebDriver URL: {self.url}")
+        if not isinstance(self.capacity, int) or self.capacity < 1:
+            raise ValueError("The capacity of a WebDriver node must be a positive integer")
+
+    @classmethod
+    def from_string(cls, node: str) -> "WebDriverNode":
+        """Parse a node given as URL or URL=CAPACITY, e.g. on the command line.
+
+        Arguments:
+            node (str): The node, e.g. http://chrome_selenium_2:4444/wd/hub=2
+
+        Returns:
+            WebDriverNode: The node, with the default capacity if none is given
+        """
+        if not isinstance(node, str):
+            raise TypeError(f"Invalid node type. Expected type: str, actual type: {type(node)}")
+
+        url, separator, capacity = node.rpartition("=")
+        if separator and capacity.strip().isdigit():
+            return cls(url.strip(), int(capacity))
+        return cls(node.strip())
+
+@dataclass(frozen=True)
+class PageContent:
+    """The parts of a page's HTML read by the extractors.
+    Created right after the HTML is parsed, so the BeautifulSoup tree, often 10-50 times the size of the HTML,
+    can be released before the extractors run.
+
+    Attributes:
+        links (list[str]): The href of every link, in the order of their appearance
+        texts (list[str]): The stripped, non-empty text of every text tag, in the order of their appearance.
+            The text of nested tags is also part of their parents' text, like when the extractors read the tree
+        text (str): The text of the whole document, its scripts and its attribute values, searched for phone numbers
+
+    Methods:
+        from_soup(content) -> PageContent: Create the page content from a parsed HTML tree
+    """
+
+    links: list[str]
+    texts: list[str]
+    text: str
+
+    @classmethod
+    def from_soup(cls, content: "BeautifulSoup") -> "PageContent":
+        """Create the page content from a parsed HTML tree. The tree isn't modified.
+
+        Arguments:
+            content (BeautifulSoup): The parsed HTML content
+
+        Returns:
+            PageContent: The links and the texts of the page
+        """
+        links = [str(link_tag.attrs["href"]) for link_tag in content.find_all("a") if link_tag.has_attr("href")]
+        texts = []
+        for tag in content.find_all(Constants.HTML_TEXT_TAGS):
+            tag_text: str = tag.text.strip()
+            if tag_text:
+                texts.append(tag_text)
+        # Phone numbers are also searched where the whole HTML was searched before, outside of the visible text:
+        # in scripts like the schema.org telephone of JSON-LD, and in attributes like tel: links and data-phone
+        script_texts = [script.string for script in content.find_all("script") if script.string]
+        attribute_values = [value for tag in content.find_all(True) for value in tag.attrs.values() if isinstance(value, str)]
+        text = "\n".join([content.get_text(" "), *script_texts, *attribute_values])
+
+        return cls(links, texts, text)
+
+class WebsiteInfoAccumulator:
+    """Append-only collector of the information found during the parsing process.
+    The extractors add their findings to the accumulator page by page, so the previously found data
+    is never copied. A WebsiteInfo object is only created when a snapshot is requested.
+    Every occurrence of the entities is kept in an EntityStore, not just the first one.
+
+    Attributes:
+        found_urls (set[str]): A set of all the URLs found during the parsing process
+        entity_store (EntityStore): Every occurrence of the emails, names, phone numbers and addresses found so far
+
+    Methods:
+        from_info(info) -> WebsiteInfoAccumulator: Create an accumulator containing the data of a WebsiteInfo object
+        add_url(url) -> bool: Add a URL, return True if it wasn't found before
+        add_email(email, website_url) -> bool: Add an email, return True if it wasn't found before
+        add_name(name, website_url) -> bool: Add a name, return True if it wasn't found before
+        add_phone_number(phone_number, website_url) -> bool: Add a phone number, return True if it wasn't found before
+        add_address(address, website_url) -> bool: Add an address, return True if it wasn't found before
+        has_data() -> bool: Check if any data has been found during the parsing process. Links are not considered as data
+        snapshot() -> WebsiteInfo: Return an immutable copy of the data found so far
+    """
+
+    __slots__ = ("found_urls", "entity_store", "_entity_store_shared")
+
+    def __init__(self):
+        self.found_urls: set[str] = set()
+        self.entity_store: EntityStore = EntityStore()
+        # The entity store is shared with the last snapshot until the next addition
+        self._entity_store_shared: bool = False
+
+    @classmethod
+    def from_info(cls, info: WebsiteInfo) -> "WebsiteInfoAccumulator":
+        """Create an accumulator containing the data of the given WebsiteInfo object.
+
+        Arguments:
+            info (WebsiteInfo): Object of the already found information
+
+        Returns:
+            WebsiteInfoAccumulator: The accumulator containing a copy of the data
+        """
+        if not isinstance(info, WebsiteInfo):
+            raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
+
+        accumulator = cls()
+        accumulator.found_urls.update(info.found_urls)
+        if info.entity_store is not None:
+            accumulator.entity_store = info.entity_store.copy()
+            return accumulator
+
+        for email, website_url in info.found_emails.items():
+            accumulator.add_email(email, website_url)
+        for name, website_url in info.found_names.items():
+            accumulator.add_name(name, website_url)
+        for phone_number, website_url in info.found_phone_numbers.items():
+            accumulator.add_phone_number(phone_number, website_url)
+        for address, website_url in info.found_addresses.items():
+            accumulator.add_address(address, website_url)
+        return accumulator
+
+    def add_url(self, url: str) -> bool:
+        """Add a URL found during the parsing process.
+
+        Returns:
+            bool: True if the URL wasn't found before, False otherwise
+        """
+        if url in self.found_urls:
+            return False
+        self.found_urls.add(url)
+        return True
+
+    def add_email(self, email: str, website_url: str) -> bool:
+        """Add an occurrence of an email on the given website.
+
+        Returns:
+            bool: True if the email wasn't found before, False otherwise
+        """
+        entity_store = self.entity_store if not self._entity_store_shared else self._get_writable_entity_store()
+        return entity_store.add(EntityType.EMAIL, email, website_url, Extractor.EMAILS)
+
+    def add_name(self, name: str, website_url: str) -> bool:
+        """Add an occurrence of a name on the given website.
+
+        Returns:
+            bool: True if the name wasn't found before, False otherwise
+        """
+        entity_store = self.entity_store if not self._entity_store_shared else self._get_writable_entity_store()
+        return entity_store.add(EntityType.NAME, name, website_url, Extractor.NAMES)
+
+    def add_phone_number(self, phone_number: str, website_url: str) -> bool:
+        """Add an occurrence of a phone number on the given website.
+
+        Returns:
+            bool: True if the phone number wasn't found before, False otherwise
+        """
+        entity_store = self.entity_store if not self._entity_store_shared else self._get_writable_entity_store()
+        return entity_store.add(EntityType.PHONE_NUMBER, phone_number, website_url, Extractor.PHONE_NUMBERS)
+
+    def add_address(self, address: str, website_url: str) -> bool:
+        """Add an occurrence of an address on the given website.
+
+        Returns:
+            bool: True if the address wasn't found before, False otherwise
+        """
+        entity_store = self.entity_store if not self._entity_store_shared else self._get_writable_entity_store()
+        return entity_store.add(EntityType.ADDRESS, address, website_url, Extractor.ADDRESSES)
+
+    def has_data(self) -> bool:
+        """Check if any data has been found during the parsing process.
+        Only check for emails, names, phone numbers, and addresses.
+
+        Returns:
+            bool: True if any data has been found, False otherwise
+        """
+        return len(self.entity_store) > 0
+
+    def snapshot(self) -> WebsiteInfo:
+        """Return an immutable copy of the data found so far.
+        Later additions to the accumulator don't change the returned object.
+        The entity store is shared with the snapshot and only copied if the accumulator is modified afterwards.
+
+        Returns:
+            WebsiteInfo: The information found during the parsing process
+        """
+        self._entity_store_shared = True
+        return WebsiteInfo(
+            set(self.found_urls),
+            self.entity_store.first_urls(EntityType.EMAIL),
+            self.entity_store.first_urls(EntityType.NAME),
+            self.entity_store.first_urls(EntityType.PHONE_NUMBER),
+            self.entity_store.first_urls(EntityType.ADDRESS),
+            self.entity_store,
+        )
+
+    def _get_writable_entity_store(self) -> EntityStore:
+        """Return the entity store, copying it first if it's shared with a snapshot.
+
+        Returns:
+            EntityStore: The entity store that can be modified
+        """
+        if self._entity_store_shared:
+            self.entity_store = self.entity_store.copy()
+            self._entity_store_shared = False
+        return self.entity_store
\ No newline at end of file
@@ -1,27 +1,36 @@
 from bs4 import BeautifulSoup
 from collections import deque
-from .data_extractors import information_printed, set_information_printed
-from globals.enums import DataRegion
-from rich.console import Console
-from selenium import webdriver
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import replace
+from globals.enums import DataRegion, LogLevel
+from globals.progress import ProgressReporter
+from globals.run_logger import run_logger
+from globals.tracing import StageTimings, tracer
 from website import constants as Constants
-from .models import WebsiteInfo
+from .enums import EntityType, PipelineStage
+from .models import ExtractionLimits, PageContent, PageResult, WebsiteInfo, WebsiteInfoAccumulator
 from .data_extractors import get_data_from_content
-import random
+from .fetchers import Fetcher, WebDriverFetcher
+from .model_registry import model_registry
+import asyncio
 import time
-import threading
 import validators
 
-console = Console(log_path=False)
-parsing_finished = threading.Event()
-
-def parse(website_url: str, info: WebsiteInfo, region: DataRegion) -> WebsiteInfo:
+def parse(
+    website_url: str,
+    info: WebsiteInfo,
+    region: DataRegion,
+    fetcher: Fetcher | None = None,
+    limits: ExtractionLimits | None = None,
+) -> WebsiteInfo:
     """Parse the given website for information.
 
     Arguments:
         website_url (str): The website's URL to parse
         info (WebsiteInfo): Object of the already found information
         region (DataRegion): The primary region for data to be found
+        fetcher (Fetcher | None): Source of the HTML of the page, rendered by the Selenium browser if None
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models, the defaults if None
 
     Returns:
         WebsiteInfo: The information found during the parsing process
@@ -32,31 +41,63 @@ def parse(website_url: str, info: WebsiteInfo, region: DataRegion) -> WebsiteInf
         raise TypeError(f"Invalid info type. Expected type: WebsiteInfo, actual type: {type(info)}")
     if not isinstance(region, DataRegion):
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+    fetcher = _get_fetcher(fetcher)
+    if limits is not None and not isinstance(limits, ExtractionLimits):
+        raise TypeError(f"Invalid limits type. Expected type: ExtractionLimits, actual type: {type(limits)}")
 
-    # Starting heartbeat thread with local stop event
-    stop_event = threading.Event()
-    heartbeat_thread = threading.Thread(target=_print_heartbeat_message, args=(stop_event,), daemon=True)
-    heartbeat_thread.start()
-
-    try:
-        content: BeautifulSoup = _get_website_content(website_url)
-        data = get_data_from_content(info, website_url, content, region)
-    finally:
-        stop_event.set()
-        heartbeat_thread.join(timeout=1)
-    return data
+    accumulator = WebsiteInfoAccumulator.from_info(info)
+    _parse_page(website_url, accumulator, region, fetcher, limits)
+    return accumulator.snapshot()
 
-def parse_all(website_url: str, sublinks_to_visit: int, region: DataRegion) -> WebsiteInfo:
+def parse_all(
+    website_url: str,
+    sublinks_to_visit: int,
+    region: DataRegion,
+    fetcher: Fetcher | None = None,
+    limits: ExtractionLimits | None = None,
+) -> WebsiteInfo:
     """Parse for links in the given website, then recursively parse the found links for information.
+    Built on iter_parse, the pages are consumed as they are parsed and only the accumulated result is kept.
 
     Arguments:
         website_url (str): The website's URL to parse
         number_of_links_to_visit (int): The maximum number of links to visit and parse
         region (DataRegion): The primary region for data to be found
+        fetcher (Fetcher | None): Source of the HTML of the pages, rendered by the Selenium browser if None
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models on every page, the defaults if None
 
     Returns:
         WebsiteInfo: The information found during the parsing process
     """
+    info: WebsiteInfoAccumulator = WebsiteInfoAccumulator()
+    for _ in iter_parse(website_url, sublinks_to_visit, region, info, fetcher, limits):
+        pass
+
+    return info.snapshot()
+
+def iter_parse(
+    website_url: str,
+    sublinks_to_visit: int,
+    region: DataRegion,
+    info: WebsiteInfoAccumulator | None = None,
+    fetcher: Fetcher | None = None,
+    limits: ExtractionLimits | None = None,
+) -> Iterator[PageResult]:
+    """Parse for links in the given website, then recursively parse the found links for information.
+    The result of every page is yielded as soon as the page is processed.
+    The arguments are validated when the function is called, not when the iteration starts.
+
+    Arguments:
+        website_url (str): The website's URL to parse
+        sublinks_to_visit (int): The maximum number of links to visit and parse
+        region (DataRegion): The primary region for data to be found
+        info (WebsiteInfoAccumulator | None): Accumulator to collect all the found information into, a new one is used if None
+        fetcher (Fetcher | None): Source of the HTML of the pages, rendered by the Selenium browser if None
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models on every page, the defaults if None
+
+    Returns:
+        Iterator[PageResult]: The results of the parsed pages in the order they were parsed
+    """
     if not validators.url(website_url):
         raise ValueError(f"Invalid URL: {website_url}")
     if not isinstance(sublinks_to_visit, int):
@@ -65,11 +106,60 @@ def parse_all(website_url: str, sublinks_to_visit: int, region: DataRegion) -> W
         raise ValueError("The maximum number of subpages to visit must be at least 0 or more")
     if not isinstance(region, DataRegion):
         raise TypeError(f"Invalid region type. Expected type: DataRegion, actual type: {type(region)}")
+    if info is None:
+        info = WebsiteInfoAccumulator()
+    if not isinstance(info, WebsiteInfoAccumulator):
+        raise TypeError(f"Invalid info type. Expected type: WebsiteInfoAccumulator, actual type: {type(info)}")
+    fetcher = _get_fetcher(fetcher)
+    if limits is not None and not isinstance(limits, ExtractionLimits):
+        raise TypeError(f"Invalid limits type. Expected type: ExtractionLimits, actual type: {type(limits)}")
+
+    return _iter_pages(website_url, sublinks_to_visit, region, info, fetcher, limits)
+
+async def aiter_parse(
+    website_url: str,
+    sublinks_to_visit: int,
+    region: DataRegion,
+    info: WebsiteInfoAccumulator | None = None,
+    fetcher: Fetcher | None = None,
+    limits: ExtractionLimits | None = None,
+) -> AsyncIterator[PageResult]:
+    """Asynchronous version of iter_parse. The pages are parsed in a worker thread, so the event loop isn't blocked.
+
+    Arguments:
+        website_url (str): The website's URL to parse
+        sublinks_to_visit (int): The maximum number of links to visit and parse
+        region (DataRegion): The primary region for data to be found
+        info (WebsiteInfoAccumulator | None): Accumulator to collect all the found information into, a new one is used if None
+        fetcher (Fetcher | None): Source of the HTML of the pages, rendered by the Selenium browser if None
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models on every page, the defaults if None
+
+    Returns:
+        AsyncIterator[PageResult]: The results of the parsed pages in the order they were parsed
+    """
+    pages = iter_parse(website_url, sublinks_to_visit, region, info, fetcher, limits)
+    while True:
+        page_result = await asyncio.to_thread(next, pages, None)
+        if page_result is None:
+            break
+        yield page_result
+
+def _iter_pages(
+    website_url: str,
+    sublinks_to_visit: int,
+    region: DataRegion,
+    info: WebsiteInfoAccumulator,
+    fetcher: Fetcher,
+    limits: ExtractionLimits | None,
+) -> Iterator[PageResult]:
+    """Generator doing the parsing of iter_parse after the arguments are validated."""
+    # Load the NLP models in the background while the first page is being fetched
+    model_registry.warm_up([region])
 
     visited_urls: set = set()
     url_queue: deque[str] = deque([website_url])
-    info: WebsiteInfo = WebsiteInfo(set(), dict(), dict(), dict(), dict())
     websites_parsed: int = 0
+    stage_timings = StageTimings()
 
     # If sublinks to visit 0, only visit the main page
     # If it's 1 or more, visit the main page + the given number of sublinks
@@ -78,69 +168,104 @@ def parse_all(website_url: str, sublinks_to_visit: int, region: DataRegion) -> W
     else:
         max_visits = sublinks_to_visit + 1
 
-    while url_queue and websites_parsed < max_visits:
-        # Get the next URL from the queue
-        url = url_queue.popleft()
-        if url in visited_urls:
-            continue
-
-        console.log(f"Parsing [link={url}]{url}[/link]")
-        set_information_printed()
-        info = parse(url, info, region)
-        console.log(f"[green]Parsing completed[/green]")
-        set_information_printed()
-        visited_urls.add(url)
-        websites_parsed += 1
-
-        # Add the found URLs to the queue if they haven't been visited yet
-        for found_url in info.found_urls:
-            if found_url not in visited_urls and found_url not in url_queue:
-                url_queue.append(found_url)
+    # A single reporter shows the progress of the whole run
+    with ProgressReporter(max_visits, EntityType) as progress:
+        progress.set_pages_queued(len(url_queue))
+        while url_queue and websites_parsed < max_visits:
+            # Get the next URL from the queue
+            url = url_queue.popleft()
+            if url in visited_urls:
+                continue
+
+            run_logger.log_page(url)
+            page_result = _parse_page(url, info, region, fetcher, limits)
+            run_logger.log_message("Parsing completed", LogLevel.SUCCESS)
+            visited_urls.add(url)
+            websites_parsed += 1
+
+            # Add the newly found URLs to the queue if they haven't been visited yet
+            # URLs found on earlier pages are already queued or visited
+            for found_url in page_result.discovered_links:
+                if found_url not in visited_urls:
+                    url_queue.append(found_url)
+            progress.page_finished(page_result.new_entities, len(url_queue))
+            stage_timings.add(page_result.timings)
+
+            yield page_result
 
     if websites_parsed < sublinks_to_visit:
-        console.log(f"[yellow]Only {websites_parsed} subpages could be parsed.[/yellow]")
-    
+        run_logger.log_message(f"Only {websites_parsed} subpages could be parsed.", LogLevel.WARNING)
+
     if not info.has_data():
-        console.log("[red]No data found during the parsing process :([/red]")
+        run_logger.log_message("No data found during the parsing process :(", LogLevel.ERROR)
 
-    return info
+    entity_store = info.entity_store
+    run_logger.log_summary("Parsing summary", {
+        "pages": websites_parsed,
+        **{entity_type.value: entity_store.entity_count(entity_type) for entity_type in EntityType},
+    })
+    for stage, statistics in stage_timings.summary().items():
+        run_logger.log_summary(f"Stage {stage}", statistics)
 
-def _get_website_content(url: str) -> BeautifulSoup:
-    """Get the HTML content of the given website.
+def _parse_page(
+    website_url: str, info: WebsiteInfoAccumulator, region: DataRegion, fetcher: Fetcher, limits: ExtractionLimits | None
+) -> PageResult:
+    """Parse the given website and add the found information to the accumulator.
+    Only the texts and links of the page are kept for the extractors, the HTML tree is released as soon as they're read.
 
     Arguments:
-        url (str): The website's URL
+        website_url (str): The website's URL to parse
+        info (WebsiteInfoAccumulator): Accumulator of the already found information
+        region (DataRegion): The primary region for data to be found
+        fetcher (Fetcher): Source of the HTML of the page
+        limits (ExtractionLimits | None): Size limits of the text given to the NLP models, the defaults if None
 
     Returns:
-        BeautifulSoup: The HTML content of the website
+        PageResult: The result of the page, including the time spent fetching and parsing it
     """
-    if not validators.url(url):
-        raise ValueError(f"Invalid URL: {url}")
+    page_start_time = time.perf_counter()
+    website_page_source: str = fetcher.fetch(website_url)
+    fetch_seconds = time.perf_counter() - page_start_time
+    tracer.record(PipelineStage.FETCH.value, page_start_time, fetch_seconds, url=website_url)
+
+    start_time = time.perf_counter()
+    soup = BeautifulSoup(website_page_source, Constants.BEAUTIFULSOUP_HTML_PARSER)
+    del website_page_source
+    content = PageContent.from_soup(soup)
+    _release_tree(soup)
+    del soup
+    parse_seconds = time.perf_counter() - start_time
+    tracer.record(PipelineStage.PARSE.value, start_time, parse_seconds, url=website_url)
 
-    options = webdriver.ChromeOptions()
-    options.add_argument(Constants.WEBDRIVER_HEADLESS_ARGUMENT)
+    page_result = get_data_from_content(info, website_url, content, region, limits)
+    tracer.record(Constants.PAGE_TRACE_NAME, page_start_time, time.perf_counter() - page_start_time, url=website_url)
 
-    driver = webdriver.Remote(Constants.WEBDRIVER_REMOTE_URL, options=options)
-    driver.get(url)
-    website_page_source: str = driver.page_source
-    content = BeautifulSoup(website_page_source, Constants.BEAUTIFULSOUP_HTML_PARSER)
-    driver.quit()
+    timings = {PipelineStage.FETCH.value: fetch_seconds, PipelineStage.PARSE.value: parse_seconds, **page_result.timings}
+    return replace(page_result, timings=timings)
 
-    return content
+def _release_tree(soup: BeautifulSoup):
+    """Free the parsed HTML tree now instead of at the next full garbage collection.
+    The elements reference each other in cycles, which decompose breaks. Decomposing the root object itself
+    doesn't reach its descendants, so its children are decomposed one by one.
 
-def _print_heartbeat_message(stop_event: threading.Event):
-    """Print random heartbeat messages at regular intervals to indicate that parsing is still ongoing.
-    
     Arguments:
-        stop_event (threading.Event): Event to signal the thread to stop
+        soup (BeautifulSoup): The parsed HTML tree, unusable afterwards
     """
-    # Run until stop event is set
-    while not stop_event.is_set():
-        time.sleep(Constants.HEARTBEAT_INTERVAL_SECONDS)
-        if stop_event.is_set():
-            break
+    for child in list(soup.contents):
+        child.decompose()
+    soup.decompose()
+
+def _get_fetcher(fetcher: Fetcher | None) -> Fetcher:
+    """Validate the given fetcher.
 
-        # Skip printing heartbeat message if information was printed recently to avoid cluttering the console
-        if not information_printed.is_set():
-            console.print(random.choice(Constants.HEARTBEAT_MESSAGES))
-        information_printed.clear()
+    Arguments:
+        fetcher (Fetcher | None): The fetcher given by the caller
+
+    Returns:
+        Fetcher: The given fetcher, or a fetcher rendering the pages in the Selenium browser if None
+    """
+    if fetcher is None:
+        return WebDriverFetcher()
+    if not isinstance(fetcher, Fetcher):
+        raise TypeError(f"Invalid fetcher type. Expected type: Fetcher, actual type: {type(fetcher)}")
+    return fetcher
\ No newline at end of file
@@ -0,0 +1,12 @@
+import os
+import unittest
+
+# The wall-clock and memory thresholds depend on the machine, the benchmarks only run when asked for
+BENCHMARKS_ENV_VAR = "WEBPARSER_BENCHMARKS"
+
+def benchmark(test):
+    """Skip the decorated benchmark test or class unless the WEBPARSER_BENCHMARKS environment variable is set to 1."""
+    return unittest.skipUnless(
+        os.environ.get(BENCHMARKS_ENV_VAR) == "1",
+        f"Benchmark, set {BENCHMARKS_ENV_VAR}=1 to run it",
+    )(test)
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""End-to-end crawl benchmark against a generated website served by a local HTTP server.
+
+The real crawl path (iter_parse) is driven with the plain HTTP fetcher, or with the Selenium browser if
+a remote WebDriver URL is given. The browser must be able to reach the local server, see --host.
+Run it from the repository root:
+    python -m tests.benchmarks.crawl_benchmark --pages 200 --fan-out 5 --duplicates 3
+"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from globals.tracing import StageTimings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from website import Fetcher, HttpFetcher, WebDriverFetcher, iter_parse
+from website.enums import PipelineStage
+from .synthetic_html import SyntheticHtmlOptions, get_synthetic_html
+import argparse
+import re
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, the peak RSS isn't reported there
+    resource = None
+
+_PAGE_PATH_REGEX = re.compile(r"^/(?:page(\d+))?/?$")
+
+@dataclass(frozen=True)
+class SyntheticSite:
+    """Shape of a generated website. Page 0 is served on /, every other page on /page<number>.
+
+    Attributes:
+        page_count (int): Number of pages of the website
+        fan_out (int): Number of links on every page to the following pages
+        duplicate_links (int): Number of links on every page to already linked pages, e.g. the home page or fragments
+        slow_page_interval (int): Every slow_page_interval-th page is slow, no page is slow if 0
+        slow_seconds (float): Delay of the slow pages
+        page_options (SyntheticHtmlOptions): Shape of the content of every page
+    """
+
+    page_count: int = 100
+    fan_out: int = 5
+    duplicate_links: int = 3
+    slow_page_interval: int = 0
+    slow_seconds: float = 0.2
+    page_options: SyntheticHtmlOptions = SyntheticHtmlOptions(DataRegion.HUNGARY, 10, 3, 0.3)
+
+    def get_links(self, base_url: str, page_index: int) -> list[str]:
+        """Return the links of a page, the duplicates are repeated links, fragment links and home page links."""
+        links = [
+            f"{base_url}/page{(page_index * self.fan_out + offset) % self.page_count}"
+            for offset in range(1, self.fan_out + 1)
+        ]
+        for duplicate_index in range(self.duplicate_links):
+            if not links:
+                break
+            if duplicate_index % 3 == 0:
+                links.append(f"{base_url}/")
+            elif duplicate_index % 3 == 1:
+                links.append(f"{links[0]}#section{duplicate_index}")
+            else:
+                links.append(links[duplicate_index % self.fan_out])
+        return links
+
+    def is_slow(self, page_index: int) -> bool:
+        return self.slow_page_interval > 0 and page_index % self.slow_page_interval == self.slow_page_interval - 1
+
+@dataclass(frozen=True)
+class CrawlBenchmarkResult:
+    """Result of a crawl of the generated website.
+
+    Attributes:
+        pages (int): Number of parsed pages
+        wall_seconds (float): Time of the whole crawl
+        peak_rss_mib (float | None): Peak resident memory of the process, None if it can't be measured
+        stage_summary (dict[str, dict[str, float]]): Statistics of every stage of the pages, see StageTimings.summary
+    """
+
+    pages: int
+    wall_seconds: float
+    peak_rss_mib: float | None
+    stage_summary: dict[str, dict[str, float]]
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    def describe(self) -> str:
+        """Return the result as text."""
+        peak_rss = f"{self.peak_rss_mib:.1f} MiB" if self.peak_rss_mib is not None else "-"
+        lines = [f"{self.pages} pages in {self.wall_seconds:.2f} s, {self.pages_per_second:.1f} pages/s, peak RSS {peak_rss}"]
+        for stage, statistics in self.stage_summary.items():
+            lines.append(f"  {stage}: " + ", ".join(f"{name}: {value}" for name, value in statistics.items()))
+        return "\n".join(lines)
+
+@contextmanager
+def serve_synthetic_site(site: SyntheticSite, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve the generated website from a background thread while the context manager is open.
+
+    Arguments:
+        site (SyntheticSite): Shape of the website
+        host (str): Address the server listens on, also used in the links of the pages
+        port (int): Port of the server, a free port is chosen if 0
+
+    Returns:
+        Iterator[str]: The URL of the home page, without a trailing slash
+    """
+    server = ThreadingHTTPServer((host, port), _get_request_handler(site))
+    server.daemon_threads = True
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        server_thread.join()
+
+def run_crawl_benchmark(site: SyntheticSite, fetcher: Fetcher | None = None, host: str = "127.0.0.1") -> CrawlBenchmarkResult:
+    """Crawl every page of the generated website through iter_parse.
+
+    Arguments:
+        site (SyntheticSite): Shape of the website
+        fetcher (Fetcher | None): Source of the HTML of the pages, plain HTTP requests if None
+        host (str): Address the server listens on
+
+    Returns:
+        CrawlBenchmarkResult: Throughput, wall time and peak memory of the crawl
+    """
+    fetcher = fetcher if fetcher is not None else HttpFetcher()
+    stage_timings = StageTimings()
+    pages = 0
+
+    # The pages and the found entities aren't printed, so the console output isn't measured
+    is_logger_reconfigured = run_logger.mode == LogMode.RICH
+    if is_logger_reconfigured:
+        run_logger.configure(LogMode.QUIET)
+    try:
+        with serve_synthetic_site(site, host) as base_url:
+            start_time = time.perf_counter()
+            for page_result in iter_parse(base_url, site.page_count - 1, site.page_options.region, fetcher=fetcher):
+                pages += 1
+                stage_timings.add(page_result.timings)
+            wall_seconds = time.perf_counter() - start_time
+    finally:
+        if is_logger_reconfigured:
+            run_logger.close()
+
+    return CrawlBenchmarkResult(pages, wall_seconds, get_peak_rss_mib(), stage_timings.summary())
+
+def get_peak_rss_mib() -> float | None:
+    """Return the peak resident memory of the process since it started.
+
+    Returns:
+        float | None: The peak RSS in MiB, None if it can't be measured on this platform
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak_rss / 1024 / 1024 if sys.platform == "darwin" else peak_rss / 1024
+
+def _get_request_handler(site: SyntheticSite) -> type[BaseHTTPRequestHandler]:
+    """Return the request handler class serving the pages of the website."""
+
+    class SyntheticSiteHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path_match = _PAGE_PATH_REGEX.match(self.path.split("#")[0])
+            page_index = int(path_match.group(1) or 0) if path_match else None
+            if page_index is None or page_index >= site.page_count:
+                self.send_error(404)
+                return
+
+            if site.is_slow(page_index):
+                time.sleep(site.slow_seconds)
+            base_url = f"http://{self.headers['Host']}"
+            body = get_synthetic_html(site.page_options, seed=page_index, links=site.get_links(base_url, page_index)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # The requests aren't logged, the console output would slow the benchmark down
+            pass
+
+    return SyntheticSiteHandler
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end crawl benchmark against a generated local website")
+    parser.add_argument("--pages", type=int, default=100, help="Number of pages of the website")
+    parser.add_argument("--fan-out", type=int, default=5, help="Links on every page to the following pages")
+    parser.add_argument("--duplicates", type=int, default=3, help="Links on every page to already linked pages")
+    parser.add_argument("--slow-every", type=int, default=0, help="Every n-th page is slow, no page is slow if 0")
+    parser.add_argument("--slow-seconds", type=float, default=0.2, help="Delay of the slow pages")
+    parser.add_argument("--region", choices=[region.value for region in DataRegion], default=DataRegion.HUNGARY.value)
+    parser.add_argument("--host", default="127.0.0.1", help="Address of the local server, reachable by the browser")
+    parser.add_argument("--webdriver", help="URL of a remote Selenium WebDriver, plain HTTP requests are used if not given")
+    args = parser.parse_args()
+
+    site = SyntheticSite(
+        page_count=args.pages,
+        fan_out=args.fan_out,
+        duplicate_links=args.duplicates,
+        slow_page_interval=args.slow_every,
+        slow_seconds=args.slow_seconds,
+        page_options=SyntheticHtmlOptions(DataRegion(args.region), 10, 3, 0.3),
+    )
+    fetcher = WebDriverFetcher(args.webdriver) if args.webdriver else HttpFetcher()
+    result = run_crawl_benchmark(site, fetcher, args.host)
+    print(result.describe())
+    print(f"Fetch share of the wall time: {result.stage_summary[PipelineStage.FETCH.value]['total ms'] / 1000 / result.wall_seconds:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""Offline micro-benchmark of the data extractors over a synthetic HTML corpus.
+
+Run it from the repository root, optionally saving or comparing against a baseline:
+    python -m tests.benchmarks.extractor_benchmark --save-baseline extractor_baseline.json
+    python -m tests.benchmarks.extractor_benchmark --baseline extractor_baseline.json
+"""
+from bs4 import BeautifulSoup
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from globals.tracing import StageTimings
+from website import get_addresses, get_emails, get_names, get_phone_numbers, get_sublinks
+from website import constants as WebsiteConstants
+from website.enums import PipelineStage
+from website.model_registry import model_registry
+from .synthetic_html import SyntheticHtmlOptions, get_synthetic_html_corpus
+import argparse
+import json
+import sys
+import time
+
+BENCHMARK_URL = "https://example.com"
+DEFAULT_TOLERANCE = 0.25
+
+# Every extractor is called with an empty history, like on the first page of a crawl
+EXTRACTORS: dict[PipelineStage, Callable[[BeautifulSoup, DataRegion], object]] = {
+    PipelineStage.SUBLINKS: lambda content, region: get_sublinks(BENCHMARK_URL, content, set()),
+    PipelineStage.EMAILS: lambda content, region: get_emails(BENCHMARK_URL, content, {}),
+    PipelineStage.NAMES: lambda content, region: get_names(BENCHMARK_URL, content, {}, region),
+    PipelineStage.PHONE_NUMBERS: lambda content, region: get_phone_numbers(BENCHMARK_URL, content, {}, region),
+    PipelineStage.ADDRESSES: lambda content, region: get_addresses(BENCHMARK_URL, content, {}, region),
+}
+
+@dataclass(frozen=True)
+class ExtractorResult:
+    """Throughput and latency of an extractor on the pages of a region.
+
+    Attributes:
+        extractor (str): Name of the extractor
+        region (str): Code of the region
+        pages (int): Number of measured pages
+        kib (float): Size of the measured pages in KiB
+        total_seconds (float): Time spent extracting all the pages
+        p50_ms (float): Median latency of a page
+        p90_ms (float): 90th percentile latency of a page
+        p99_ms (float): 99th percentile latency of a page
+    """
+
+    extractor: str
+    region: str
+    pages: int
+    kib: float
+    total_seconds: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+    @property
+    def key(self) -> str:
+        """Key of the result in the baseline."""
+        return f"{self.extractor}/{self.region}"
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.total_seconds if self.total_seconds > 0 else float("inf")
+
+    @property
+    def kib_per_second(self) -> float:
+        return self.kib / self.total_seconds if self.total_seconds > 0 else float("inf")
+
+@dataclass
+class ExtractorBenchmarkReport:
+    """Results of an extractor benchmark run.
+
+    Attributes:
+        results (list[ExtractorResult]): Result of every measured extractor and region
+        skipped (dict[str, str]): Key: extractor/region, Value: reason, e.g. the NLP model isn't installed
+    """
+
+    results: list[ExtractorResult] = field(default_factory=list)
+    skipped: dict[str, str] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        """Return the results as a text table."""
+        lines = [f"{'extractor/region':<22}{'pages':>6}{'pages/s':>11}{'KiB/s':>11}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"]
+        for result in self.results:
+            lines.append(
+                f"{result.key:<22}{result.pages:>6}{result.pages_per_second:>11.1f}{result.kib_per_second:>11.1f}"
+                f"{result.p50_ms:>9.2f}{result.p90_ms:>9.2f}{result.p99_ms:>9.2f}"
+            )
+        for key, reason in self.skipped.items():
+            lines.append(f"{key:<22}skipped: {reason}")
+        return "\n".join(lines)
+
+    def to_baseline(self) -> dict:
+        """Return the results in the format of a baseline file."""
+        return {"results": {result.key: asdict(result) for result in self.results}}
+
+def run_extractor_benchmark(
+    corpus: Iterable[tuple[SyntheticHtmlOptions, str]],
+    extractors: Iterable[PipelineStage] = tuple(EXTRACTORS),
+    repeats: int = 3,
+) -> ExtractorBenchmarkReport:
+    """Measure every extractor on every page of the corpus, grouped by the region of the pages.
+    The HTML is parsed once per page outside of the measurement. The latency of a page is the best of the repeats.
+    The extractors whose models can't be loaded are skipped.
+
+    Arguments:
+        corpus (Iterable[tuple[SyntheticHtmlOptions, str]]): The options and the HTML of every page
+        extractors (Iterable[PipelineStage]): The extractors to measure
+        repeats (int): Number of times every extractor is run on every page
+
+    Returns:
+        ExtractorBenchmarkReport: The throughput and latency of every extractor and region
+    """
+    if repeats < 1:
+        raise ValueError("The number of repeats must be a positive integer")
+
+    pages_by_region: dict[DataRegion, list[tuple[BeautifulSoup, int]]] = dict()
+    for options, html in corpus:
+        content = BeautifulSoup(html, WebsiteConstants.BEAUTIFULSOUP_HTML_PARSER)
+        pages_by_region.setdefault(options.region, []).append((content, len(html.encode())))
+
+    report = ExtractorBenchmarkReport()
+    # The found entities aren't printed, so the console output isn't measured
+    is_logger_reconfigured = run_logger.mode == LogMode.RICH
+    if is_logger_reconfigured:
+        run_logger.configure(LogMode.QUIET)
+    try:
+        for stage in extractors:
+            for region, pages in pages_by_region.items():
+                key = f"{stage.value}/{region.value}"
+                skip_reason = _load_models(stage, region)
+                if skip_reason is not None:
+                    report.skipped[key] = skip_reason
+                    continue
+
+                timings = StageTimings()
+                total_seconds = 0.0
+                for content, _ in pages:
+                    seconds = _measure_best_seconds(EXTRACTORS[stage], content, region, repeats)
+                    timings.add({stage.value: seconds})
+                    total_seconds += seconds
+                report.results.append(ExtractorResult(
+                    extractor=stage.value,
+                    region=region.value,
+                    pages=len(pages),
+                    kib=round(sum(size for _, size in pages) / 1024, 1),
+                    total_seconds=total_seconds,
+                    p50_ms=timings.percentile(stage.value, 50) * 1000,
+                    p90_ms=timings.percentile(stage.value, 90) * 1000,
+                    p99_ms=timings.percentile(stage.value, 99) * 1000,
+                ))
+    finally:
+        if is_logger_reconfigured:
+            run_logger.close()
+
+    return report
+
+def compare_to_baseline(report: ExtractorBenchmarkReport, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Compare the results with a saved baseline of the same machine.
+
+    Arguments:
+        report (ExtractorBenchmarkReport): The results of the current run
+        baseline (dict): The baseline returned by load_baseline
+        tolerance (float): Allowed relative slowdown before a result counts as a regression
+
+    Returns:
+        list[str]: Description of every regression, empty if there are none
+    """
+    regressions = []
+    baseline_results: dict = baseline.get("results", {})
+    for result in report.results:
+        baseline_result = baseline_results.get(result.key)
+        if baseline_result is None:
+            continue
+
+        baseline_throughput = baseline_result["pages"] / baseline_result["total_seconds"] if baseline_result["total_seconds"] > 0 else float("inf")
+        if result.pages_per_second < baseline_throughput * (1 - tolerance):
+            regressions.append(f"{result.key}: {result.pages_per_second:.1f} pages/s, baseline {baseline_throughput:.1f} pages/s")
+        if result.p90_ms > baseline_result["p90_ms"] * (1 + tolerance):
+            regressions.append(f"{result.key}: p90 {result.p90_ms:.2f} ms, baseline {baseline_result['p90_ms']:.2f} ms")
+    return regressions
+
+def save_baseline(report: ExtractorBenchmarkReport, file_path: str):
+    """Save the results as a baseline file.
+
+    Arguments:
+        report (ExtractorBenchmarkReport): The results to save
+        file_path (str): Path of the JSON baseline file
+    """
+    with open(file_path, mode='w', encoding='utf-8') as baseline_file:
+        json.dump(report.to_baseline(), baseline_file, indent=2)
+
+def load_baseline(file_path: str) -> dict:
+    """Load a baseline file saved with save_baseline.
+
+    Arguments:
+        file_path (str): Path of the JSON baseline file
+
+    Returns:
+        dict: The baseline
+    """
+    with open(file_path, mode='r', encoding='utf-8') as baseline_file:
+        return json.load(baseline_file)
+
+def _load_models(stage: PipelineStage, region: DataRegion) -> str | None:
+    """Load the models of the extractor before the measurement.
+
+    Returns:
+        str | None: The reason the extractor can't run, None if it can
+    """
+    try:
+        if stage == PipelineStage.NAMES:
+            model_registry.get_spacy_model(region)
+        elif stage == PipelineStage.ADDRESSES:
+            model_registry.get_address_parser()
+    except (ImportError, OSError) as e:
+        return f"model not available ({type(e).__name__})"
+    return None
+
+def _measure_best_seconds(extract: Callable, content: BeautifulSoup, region: DataRegion, repeats: int) -> float:
+    """Return the best elapsed seconds of the extractor on a page out of the given number of runs."""
+    best_seconds = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        extract(content, region)
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+    return best_seconds
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark of the data extractors over a synthetic HTML corpus")
+    parser.add_argument("--extractors", nargs="+", choices=[stage.value for stage in EXTRACTORS], default=[stage.value for stage in EXTRACTORS])
+    parser.add_argument("--regions", nargs="+", choices=[region.value for region in DataRegion], default=[region.value for region in DataRegion])
+    parser.add_argument("--repeats", type=int, default=3, help="Runs of every extractor on every page, the best one is kept")
+    parser.add_argument("--save-baseline", help="Save the results to this baseline file")
+    parser.add_argument("--baseline", help="Compare the results with this baseline file, exit with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative slowdown compared to the baseline")
+    args = parser.parse_args()
+
+    corpus = get_synthetic_html_corpus(regions=tuple(DataRegion(region) for region in args.regions))
+    report = run_extractor_benchmark(corpus, [PipelineStage(stage) for stage in args.extractors], args.repeats)
+    print(report.describe())
+
+    if args.save_baseline:
+        save_baseline(report, args.save_baseline)
+        print(f"Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        regressions = compare_to_baseline(report, load_baseline(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions compared to the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
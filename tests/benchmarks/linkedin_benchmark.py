@@ -0,0 +1,184 @@
+"""Offline benchmark of the LinkedIn profile search against recorded or generated result sets.
+
+The batch search path (fetch_links_batch) is driven with the fixture search backend, the latency of the backend
+simulates the round trip to the search engine. The filtering of the search results is measured separately.
+Run it from the repository root, optionally replaying result sets recorded with RecordingSearchBackend:
+    python -m tests.benchmarks.linkedin_benchmark --companies 50 --profiles 10 --latency 0.2
+    python -m tests.benchmarks.linkedin_benchmark --fixture recorded_searches.json --company "Example Ltd"
+"""
+from dataclasses import dataclass
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from linkedin_links import FixtureSearchBackend, SearchResult, fetch_links_batch
+from linkedin_links.find_linkedin_links import _get_profiles_from_results, _get_search_queries
+import argparse
+import random
+import sys
+import time
+
+SYNTHETIC_FIRST_NAMES = ("John", "Jane", "Anna", "Péter", "Zoltán", "Mary", "Gábor", "Emma")
+SYNTHETIC_LAST_NAMES = ("Doe", "Smith", "Kiss", "Nagy", "Kovács", "Brown", "Tóth", "Taylor")
+# Non-profile results of a real search, dropped by the filtering
+SYNTHETIC_NOISE_PATHS = ("company", "jobs/view", "posts", "pulse")
+
+@dataclass(frozen=True)
+class LinkedinBenchmarkResult:
+    """Result of a batch search against the fixture backend.
+
+    Attributes:
+        companies (int): Number of searched companies
+        profiles (int): Number of found profiles
+        searches (int): Number of searches sent to the backend
+        wall_seconds (float): Time of the whole batch
+        filtered_results (int): Number of search results filtered in the filtering measurement
+        filter_seconds (float): Time spent filtering the search results
+    """
+
+    companies: int
+    profiles: int
+    searches: int
+    wall_seconds: float
+    filtered_results: int
+    filter_seconds: float
+
+    @property
+    def companies_per_second(self) -> float:
+        return self.companies / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    @property
+    def profiles_per_second(self) -> float:
+        return self.profiles / self.wall_seconds if self.wall_seconds > 0 else float("inf")
+
+    @property
+    def filter_microseconds_per_result(self) -> float:
+        return self.filter_seconds / self.filtered_results * 1_000_000 if self.filtered_results > 0 else 0.0
+
+    def describe(self) -> str:
+        """Return the result as text."""
+        return (
+            f"{self.companies} companies, {self.profiles} profiles, {self.searches} searches in {self.wall_seconds:.2f} s: "
+            f"{self.companies_per_second:.1f} companies/s, {self.profiles_per_second:.1f} profiles/s\n"
+            f"Filtering: {self.filtered_results} results in {self.filter_seconds * 1000:.1f} ms, "
+            f"{self.filter_microseconds_per_result:.2f} µs/result"
+        )
+
+def get_synthetic_result_sets(
+    companies: list[str], region: DataRegion, results_per_query: int = 10, noise_ratio: float = 0.3, seed: int = 0
+) -> dict[str, list[SearchResult]]:
+    """Generate the result sets of every query variant of the companies.
+    The variants of a company return overlapping profiles with differently written URLs, like a real search engine.
+
+    Arguments:
+        companies (list[str]): The searched companies
+        region (DataRegion): The region of the searches
+        results_per_query (int): Number of results of every query
+        noise_ratio (float): Share of the results that aren't profiles
+        seed (int): Seed of the random generator, the same seed generates the same result sets
+
+    Returns:
+        dict[str, list[SearchResult]]: Key: search query, Value: the results of the query
+    """
+    randomizer = random.Random(seed)
+    result_sets = dict()
+    for company_index, company in enumerate(companies):
+        company_slug = f"company{company_index}"
+        for query in _get_search_queries(company, region):
+            results = []
+            for _ in range(results_per_query):
+                if randomizer.random() < noise_ratio:
+                    noise_path = randomizer.choice(SYNTHETIC_NOISE_PATHS)
+                    results.append(SearchResult(f"https://www.linkedin.com/{noise_path}/{company_slug}", f"{company} | LinkedIn"))
+                    continue
+
+                # A small pool of employees per company, so the variants find the same profiles
+                employee_index = randomizer.randrange(results_per_query * 2)
+                name = f"{SYNTHETIC_FIRST_NAMES[employee_index % len(SYNTHETIC_FIRST_NAMES)]} " \
+                    f"{SYNTHETIC_LAST_NAMES[employee_index // len(SYNTHETIC_FIRST_NAMES) % len(SYNTHETIC_LAST_NAMES)]}"
+                subdomain = randomizer.choice(("hu", "www", "uk"))
+                results.append(SearchResult(
+                    f"https://{subdomain}.linkedin.com/in/{company_slug}-employee-{employee_index}/",
+                    f"{name} - Engineer at {company}",
+                ))
+            result_sets[query] = results
+    return result_sets
+
+def run_linkedin_benchmark(
+    backend: FixtureSearchBackend,
+    companies: list[str],
+    profile_count: int,
+    region: DataRegion,
+    max_workers: int = 4,
+    requests_per_second: float = 1000.0,
+) -> LinkedinBenchmarkResult:
+    """Search the profiles of the companies with fetch_links_batch, then measure the filtering of every result set.
+
+    Arguments:
+        backend (FixtureSearchBackend): The backend replaying the result sets
+        companies (list[str]): The searched companies
+        profile_count (int): The maximum number of profiles per company
+        region (DataRegion): The region of the searches
+        max_workers (int): Number of concurrent company searches
+        requests_per_second (float): Rate limit of the searches, high by default so only the latency is measured
+
+    Returns:
+        LinkedinBenchmarkResult: Throughput of the batch and cost of the filtering
+    """
+    # The progress of the batch isn't printed, so the console output isn't measured
+    is_logger_reconfigured = run_logger.mode == LogMode.RICH
+    if is_logger_reconfigured:
+        run_logger.configure(LogMode.QUIET)
+    try:
+        search_count = backend.search_count
+        start_time = time.perf_counter()
+        profiles = sum(
+            len(company_profiles.profiles)
+            for company_profiles in fetch_links_batch(
+                companies, profile_count, region, max_workers=max_workers, requests_per_second=requests_per_second,
+                backend=backend,
+            )
+        )
+        wall_seconds = time.perf_counter() - start_time
+        search_count = backend.search_count - search_count
+    finally:
+        if is_logger_reconfigured:
+            run_logger.close()
+
+    # The filtering is measured without the latency, over the results of every query variant
+    result_sets = [
+        backend.result_sets.get(query, [])[:profile_count * 2] for company in companies for query in _get_search_queries(company, region)
+    ]
+    start_time = time.perf_counter()
+    for results in result_sets:
+        _get_profiles_from_results(results, profile_count)
+    filter_seconds = time.perf_counter() - start_time
+
+    return LinkedinBenchmarkResult(
+        len(companies), profiles, search_count, wall_seconds, sum(len(results) for results in result_sets), filter_seconds
+    )
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmark of the LinkedIn profile search")
+    parser.add_argument("--companies", type=int, default=20, help="Number of generated companies")
+    parser.add_argument("--company", action="append", help="Company of the fixture to search, can be repeated")
+    parser.add_argument("--fixture", help="Result sets recorded with RecordingSearchBackend, generated if not given")
+    parser.add_argument("--profiles", type=int, default=10, help="Maximum number of profiles per company")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds of every search")
+    parser.add_argument("--workers", type=int, default=4, help="Number of concurrent company searches")
+    parser.add_argument("--region", choices=[region.value for region in DataRegion], default=DataRegion.HUNGARY.value)
+    args = parser.parse_args()
+
+    region = DataRegion(args.region)
+    if args.fixture:
+        if not args.company:
+            parser.error("--company is required with --fixture")
+        companies = args.company
+        backend = FixtureSearchBackend.from_file(args.fixture, args.latency)
+    else:
+        companies = args.company or [f"Company {index} Kft." for index in range(args.companies)]
+        backend = FixtureSearchBackend(get_synthetic_result_sets(companies, region, args.profiles), args.latency)
+
+    print(run_linkedin_benchmark(backend, companies, args.profiles, region, args.workers).describe())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
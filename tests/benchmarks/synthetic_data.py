@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class SyntheticPage:
+    """Findings of a single page of a synthetic crawl, as the extractors would return them.
+
+    Attributes:
+        url (str): URL of the page
+        urls (list[str]): Links found on the page
+        emails (list[str]): Emails found on the page
+        names (list[str]): Names found on the page
+        phone_numbers (list[str]): Phone numbers found on the page
+        addresses (list[str]): Addresses found on the page
+    """
+
+    url: str
+    urls: list[str]
+    emails: list[str]
+    names: list[str]
+    phone_numbers: list[str]
+    addresses: list[str]
+
+def get_synthetic_crawl(page_count: int, new_entities_per_page: int = 2, repeated_entities_per_page: int = 5) -> list[SyntheticPage]:
+    """Generate the findings of a crawl over a synthetic website.
+    Every page contains new entities of every type, plus entities that were already found on earlier pages,
+    like the contact details in the footer of a real website.
+
+    Arguments:
+        page_count (int): Number of pages in the crawl
+        new_entities_per_page (int): Number of new entities of every type on each page
+        repeated_entities_per_page (int): Number of already found entities of every type on each page
+
+    Returns:
+        list[SyntheticPage]: The findings of the pages in crawl order
+    """
+    pages = []
+    for page_index in range(page_count):
+        page_url = f"https://example.com/page{page_index}"
+        new_ids = [page_index * new_entities_per_page + offset for offset in range(new_entities_per_page)]
+        repeated_ids = [entity_id for entity_id in range(min(repeated_entities_per_page, page_index * new_entities_per_page))]
+        entity_ids = new_ids + repeated_ids
+
+        pages.append(SyntheticPage(
+            url=page_url,
+            urls=[f"https://example.com/page{entity_id}" for entity_id in entity_ids],
+            emails=[f"employee{entity_id}@example.com" for entity_id in entity_ids],
+            names=[f"Employee Number{entity_id}" for entity_id in entity_ids],
+            phone_numbers=[f"+36 30 {entity_id:07d}" for entity_id in entity_ids],
+            addresses=[f"{entity_id} Main Street Springfield 6270{entity_id % 10}" for entity_id in entity_ids],
+        ))
+
+    return pages
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from globals.enums import DataRegion
+import random
+
+# Entities and filler text written the way the websites of each region write them
+_REGION_CONTENT: dict[DataRegion, dict[str, list[str]]] = {
+    DataRegion.HUNGARY: {
+        "names": ["Kovács Péter", "Nagy Anna", "Szabó-Tóth Gábor", "Horváth Éva", "Kiss Zoltán", "Varga Júlia"],
+        "phone_numbers": ["+36 30 123 4567", "06 1 234 5678", "+36-20-987-6543", "(06 70) 555 1234"],
+        "addresses": ["1051 Budapest, Nádor utca 12.", "6720 Szeged, Kárász utca 5.", "4025 Debrecen, Piac utca 20."],
+        "sentences": [
+            "Cégünk több mint húsz éve foglalkozik szoftverfejlesztéssel.",
+            "Ügyfélszolgálatunk hétköznap reggel nyolctól délután négyig érhető el.",
+            "Kérjük, vegye fel velünk a kapcsolatot az alábbi elérhetőségeken.",
+            "A termékeinkre két év garanciát vállalunk.",
+        ],
+    },
+    DataRegion.UNITED_STATES: {
+        "names": ["John Smith", "Mary Johnson", "Robert Williams", "Patricia Brown", "Michael Davis", "Linda Miller"],
+        "phone_numbers": ["(212) 555-0198", "+1 415 555 0134", "312-555-0176", "1-800-555-0155"],
+        "addresses": ["350 Fifth Avenue, New York, NY 10118", "1600 Amphitheatre Parkway, Mountain View, CA 94043"],
+        "sentences": [
+            "Our company has been building software for more than twenty years.",
+            "Customer support is available on weekdays from eight to four.",
+            "Please contact us using the details below.",
+            "All of our products come with a two-year warranty.",
+        ],
+    },
+    DataRegion.GREAT_BRITAIN: {
+        "names": ["Oliver Taylor", "Amelia Wilson", "Harry Evans", "Isla Thomas", "George Roberts", "Emily Walker"],
+        "phone_numbers": ["020 7946 0958", "+44 161 496 0734", "0113 496 0521", "+44 7700 900123"],
+        "addresses": ["10 Downing Street, London SW1A 2AA", "221B Baker Street, London NW1 6XE"],
+        "sentences": [
+            "Our company has been developing software for over twenty years.",
+            "Our customer service team is available Monday to Friday, nine till five.",
+            "Please get in touch using the details below.",
+            "All our products are covered by a two-year guarantee.",
+        ],
+    },
+}
+
+_NESTING_TAGS = ("div", "section", "article", "span")
+
+@dataclass(frozen=True)
+class SyntheticHtmlOptions:
+    """Shape of a synthetic HTML page.
+
+    Attributes:
+        region (DataRegion): Region of the text and the entities
+        paragraph_count (int): Number of text paragraphs, sets the size of the page
+        nesting_depth (int): Number of elements every paragraph is nested in
+        entity_density (float): Chance of a paragraph containing an entity of every type, between 0 and 1
+    """
+
+    region: DataRegion
+    paragraph_count: int
+    nesting_depth: int
+    entity_density: float
+
+    def describe(self) -> str:
+        """Return the options as a short label."""
+        return (
+            f"{self.region.value} {self.paragraph_count} paragraphs, "
+            f"depth {self.nesting_depth}, density {self.entity_density:.2f}"
+        )
+
+def get_synthetic_html(options: SyntheticHtmlOptions, seed: int = 0, links: list[str] | None = None) -> str:
+    """Generate a synthetic HTML page with links, emails, names, phone numbers and addresses in its text.
+    The same options and seed always generate the same page.
+
+    Arguments:
+        options (SyntheticHtmlOptions): Shape of the page
+        seed (int): Seed of the random choices
+        links (list[str] | None): Links of the navigation, every paragraph links to a /page path if None
+
+    Returns:
+        str: The HTML page
+    """
+    if options.region not in _REGION_CONTENT:
+        raise ValueError(f"No synthetic content for region {options.region}")
+    if options.paragraph_count < 1 or options.nesting_depth < 0 or not 0 <= options.entity_density <= 1:
+        raise ValueError(f"Invalid synthetic HTML options: {options}")
+
+    randomizer = random.Random(seed)
+    content = _REGION_CONTENT[options.region]
+    body = []
+    for paragraph_index in range(options.paragraph_count):
+        parts = [randomizer.choice(content["sentences"]) for _ in range(3)]
+        if randomizer.random() < options.entity_density:
+            parts.append(f"Email: employee{paragraph_index}@example.com")
+        if randomizer.random() < options.entity_density:
+            parts.append(randomizer.choice(content["names"]))
+        if randomizer.random() < options.entity_density:
+            parts.append(f"Tel: {randomizer.choice(content['phone_numbers'])}")
+        if randomizer.random() < options.entity_density:
+            parts.append(randomizer.choice(content["addresses"]))
+
+        paragraph = f"<p>{' '.join(parts)}</p>"
+        if links is None:
+            paragraph += f"<a href=\"/page{paragraph_index}\">{parts[0]}</a>"
+        for depth in range(options.nesting_depth):
+            tag = _NESTING_TAGS[depth % len(_NESTING_TAGS)]
+            paragraph = f"<{tag} class=\"level{depth}\">{paragraph}</{tag}>"
+        body.append(paragraph)
+
+    if links is None:
+        links = ["https://example.com/about", "/files/report.pdf"]
+    navigation = "".join(f"<a href=\"{link}\">Link {link_index}</a>" for link_index, link in enumerate(links))
+    return (
+        f"<!DOCTYPE html><html lang=\"{options.region.value}\"><head><title>Synthetic page</title></head>"
+        f"<body><nav>{navigation}</nav>{''.join(body)}</body></html>"
+    )
+
+def get_synthetic_html_corpus(
+    regions: tuple[DataRegion, ...] = tuple(_REGION_CONTENT),
+    paragraph_counts: tuple[int, ...] = (5, 50),
+    nesting_depths: tuple[int, ...] = (1, 10),
+    entity_densities: tuple[float, ...] = (0.1, 0.8),
+) -> list[tuple[SyntheticHtmlOptions, str]]:
+    """Generate a page for every combination of the given options.
+
+    Arguments:
+        regions (tuple[DataRegion, ...]): Regions of the pages
+        paragraph_counts (tuple[int, ...]): Sizes of the pages
+        nesting_depths (tuple[int, ...]): Nesting depths of the paragraphs
+        entity_densities (tuple[float, ...]): Entity densities of the paragraphs
+
+    Returns:
+        list[tuple[SyntheticHtmlOptions, str]]: The options and the HTML of every page
+    """
+    corpus = []
+    for region in regions:
+        for paragraph_count in paragraph_counts:
+            for nesting_depth in nesting_depths:
+                for entity_density in entity_densities:
+                    options = SyntheticHtmlOptions(region, paragraph_count, nesting_depth, entity_density)
+                    corpus.append((options, get_synthetic_html(options, seed=len(corpus))))
+    return corpus
\ No newline at end of file
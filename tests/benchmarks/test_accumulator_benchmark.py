@@ -0,0 +1,111 @@
+import time
+import tracemalloc
+import unittest
+from website.enums import EntityType
+from website.models import WebsiteInfo, WebsiteInfoAccumulator
+from . import benchmark
+from .synthetic_data import SyntheticPage, get_synthetic_crawl
+
+PAGE_COUNT = 1000
+# Copying grows with pages x entities, it falls behind the accumulator on larger crawls
+LARGE_PAGE_COUNT = 4000
+# The 13 bytes of arrays per occurrence, plus the per-entity arrays and IDs spread over the 3-4 pages of every entity
+MAX_BYTES_PER_OCCURRENCE = 32
+
+def _crawl_with_copies(pages: list[SyntheticPage]) -> WebsiteInfo:
+    """Collect the findings the way the extractors did before the accumulator,
+    by copying all the previously found data on every page."""
+    info = WebsiteInfo(set(), dict(), dict(), dict(), dict())
+    for page in pages:
+        found_urls = set(info.found_urls)
+        found_urls.update(page.urls)
+        found_emails = dict(info.found_emails)
+        for email in page.emails:
+            found_emails.setdefault(email, page.url)
+        found_names = dict(info.found_names)
+        for name in page.names:
+            found_names.setdefault(name, page.url)
+        found_phone_numbers = dict(info.found_phone_numbers)
+        for phone_number in page.phone_numbers:
+            found_phone_numbers.setdefault(phone_number, page.url)
+        found_addresses = dict(info.found_addresses)
+        for address in page.addresses:
+            found_addresses.setdefault(address, page.url)
+        info = WebsiteInfo(found_urls, found_emails, found_names, found_phone_numbers, found_addresses)
+    return info
+
+def _crawl_with_accumulator(pages: list[SyntheticPage]) -> WebsiteInfo:
+    """Collect the findings into an accumulator and take a single snapshot at the end."""
+    accumulator = WebsiteInfoAccumulator()
+    for page in pages:
+        for url in page.urls:
+            accumulator.add_url(url)
+        for email in page.emails:
+            accumulator.add_email(email, page.url)
+        for name in page.names:
+            accumulator.add_name(name, page.url)
+        for phone_number in page.phone_numbers:
+            accumulator.add_phone_number(phone_number, page.url)
+        for address in page.addresses:
+            accumulator.add_address(address, page.url)
+    return accumulator.snapshot()
+
+def _measure_seconds(crawl, pages: list[SyntheticPage], repeats: int = 3) -> float:
+    """Return the best elapsed seconds of the crawl function out of the given number of runs."""
+    best_seconds = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        crawl(pages)
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+    return best_seconds
+
+def _measure_peak_memory(crawl, pages: list[SyntheticPage]) -> tuple[WebsiteInfo, int]:
+    """Run the crawl function while tracing the memory allocations.
+
+    Returns:
+        tuple: The result and the peak traced memory in bytes
+    """
+    tracemalloc.start()
+    result = crawl(pages)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak_memory
+
+@benchmark
+class AccumulatorBenchmark(unittest.TestCase):
+    """Memory and time benchmark of the WebsiteInfoAccumulator over a synthetic crawl."""
+
+    def test_accumulator_over_synthetic_crawl(self):
+        pages = get_synthetic_crawl(PAGE_COUNT)
+        large_pages = get_synthetic_crawl(LARGE_PAGE_COUNT)
+
+        copied_info, copies_peak = _measure_peak_memory(_crawl_with_copies, pages)
+        accumulated_info, accumulator_peak = _measure_peak_memory(_crawl_with_accumulator, pages)
+        copies_seconds = _measure_seconds(_crawl_with_copies, pages)
+        copies_large_seconds = _measure_seconds(_crawl_with_copies, large_pages)
+        accumulator_seconds = _measure_seconds(_crawl_with_accumulator, pages)
+        accumulator_large_seconds = _measure_seconds(_crawl_with_accumulator, large_pages)
+        entity_store = accumulated_info.entity_store
+        occurrence_count = sum(
+            len(entity_store.occurrences(entity_type, entity)) for entity_type in EntityType for entity in entity_store.entities(entity_type)
+        )
+
+        print(
+            f"\n{PAGE_COUNT} pages, {len(accumulated_info.found_emails)} entities per type, {occurrence_count} occurrences\n"
+            f"copying:     {copies_seconds * 1000:9.1f} ms ({copies_large_seconds * 1000:7.1f} ms for {LARGE_PAGE_COUNT} pages), "
+            f"peak {copies_peak / 1024:9.1f} KiB\n"
+            f"accumulator: {accumulator_seconds * 1000:9.1f} ms ({accumulator_large_seconds * 1000:7.1f} ms for {LARGE_PAGE_COUNT} pages), "
+            f"peak {accumulator_peak / 1024:9.1f} KiB"
+        )
+
+        self.assertEqual(copied_info, accumulated_info)
+        # Keeping every occurrence costs about as much time as copying the first ones on every page of a small crawl
+        self.assertLess(accumulator_seconds, copies_seconds * 1.25)
+        # Copying is O(pages x entities), the accumulator is O(entities)
+        self.assertLess(accumulator_large_seconds * 2, copies_large_seconds)
+        self.assertLess(accumulator_large_seconds, accumulator_seconds * LARGE_PAGE_COUNT / PAGE_COUNT * 2)
+        # The memory on top of the copied dictionaries is the occurrence records of the entity store
+        self.assertLessEqual(accumulator_peak - copies_peak, occurrence_count * MAX_BYTES_PER_OCCURRENCE)
+
+if __name__ == "__main__":
+    unittest.main()
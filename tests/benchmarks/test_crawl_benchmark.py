@@ -0,0 +1,48 @@
+import time
+import unittest
+import urllib.error
+from bs4 import BeautifulSoup
+from globals.enums import DataRegion
+from website import HttpFetcher, get_sublinks
+from website.model_registry import model_registry
+from . import benchmark
+from .crawl_benchmark import SyntheticSite, run_crawl_benchmark, serve_synthetic_site
+from .synthetic_html import SyntheticHtmlOptions
+
+class CrawlBenchmark(unittest.TestCase):
+    """End-to-end crawl benchmark against a generated website served locally."""
+
+    def test_synthetic_site(self):
+        site = SyntheticSite(page_count=10, fan_out=3, duplicate_links=3, slow_page_interval=5, slow_seconds=0.2)
+        fetcher = HttpFetcher(timeout_seconds=5)
+        with serve_synthetic_site(site) as base_url:
+            home_page = fetcher.fetch(f"{base_url}/")
+            start_time = time.perf_counter()
+            fetcher.fetch(f"{base_url}/page4")
+            slow_seconds = time.perf_counter() - start_time
+            with self.assertRaises(urllib.error.HTTPError):
+                fetcher.fetch(f"{base_url}/page10")
+
+        links = get_sublinks(base_url, BeautifulSoup(home_page, "html.parser"), set())
+        # The fan-out links and the home page, the duplicates and the fragments are found only once
+        self.assertEqual(links, {base_url, f"{base_url}/page1", f"{base_url}/page2", f"{base_url}/page3"})
+        self.assertGreaterEqual(slow_seconds, 0.2)
+
+    @benchmark
+    def test_crawl(self):
+        try:
+            model_registry.get_spacy_model(DataRegion.GREAT_BRITAIN)
+            model_registry.get_address_parser()
+        except (ImportError, OSError):
+            self.skipTest("The NLP models of the extractors aren't installed")
+
+        site = SyntheticSite(page_count=30, page_options=SyntheticHtmlOptions(DataRegion.GREAT_BRITAIN, 5, 3, 0.5))
+        result = run_crawl_benchmark(site)
+        print(f"\n{result.describe()}")
+
+        self.assertEqual(result.pages, 30)
+        self.assertGreater(result.pages_per_second, 0)
+        self.assertEqual(result.stage_summary["fetch"]["count"], 30)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
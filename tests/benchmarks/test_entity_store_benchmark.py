@@ -0,0 +1,63 @@
+import tracemalloc
+import unittest
+from website.entity_store import EntityStore
+from website.enums import EntityType, Extractor
+from . import benchmark
+from .synthetic_data import SyntheticPage, get_synthetic_crawl
+
+PAGE_COUNT = 1000
+# Contact details in headers and footers are repeated on every page of a real website
+REPEATED_ENTITIES_PER_PAGE = 30
+# The 13 bytes of arrays per occurrence, plus the per-entity arrays and IDs and the interned URLs
+MAX_BYTES_PER_OCCURRENCE = 20
+
+def _collect_first_urls(pages: list[SyntheticPage]) -> dict[str, str]:
+    """Keep the URL of the first page of every email, like the dictionaries of WebsiteInfo."""
+    found_emails = dict()
+    for page in pages:
+        for email in page.emails:
+            if email not in found_emails:
+                found_emails[email] = page.url.rstrip(" /")
+    return found_emails
+
+def _collect_entity_store(pages: list[SyntheticPage]) -> EntityStore:
+    """Keep every occurrence of every email in an EntityStore."""
+    store = EntityStore()
+    for page in pages:
+        for email in page.emails:
+            store.add(EntityType.EMAIL, email, page.url.rstrip(" /"), Extractor.EMAILS)
+    return store
+
+def _measure_memory(collect, pages: list[SyntheticPage]):
+    """Return the result of the collect function and the memory it keeps allocated in bytes."""
+    tracemalloc.start()
+    result = collect(pages)
+    current_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current_memory
+
+@benchmark
+class EntityStoreBenchmark(unittest.TestCase):
+    """Memory benchmark of the EntityStore over a synthetic crawl."""
+
+    def test_entity_store_memory(self):
+        pages = get_synthetic_crawl(PAGE_COUNT, repeated_entities_per_page=REPEATED_ENTITIES_PER_PAGE)
+
+        first_urls, first_urls_memory = _measure_memory(_collect_first_urls, pages)
+        store, store_memory = _measure_memory(_collect_entity_store, pages)
+        occurrence_count = sum(len(store.occurrences(EntityType.EMAIL, email)) for email in store.entities(EntityType.EMAIL))
+
+        print(
+            f"\n{PAGE_COUNT} pages, {len(store)} emails, {occurrence_count} occurrences\n"
+            f"first URL only (dict of strings):  {first_urls_memory / 1024:9.1f} KiB\n"
+            f"full provenance (EntityStore):     {store_memory / 1024:9.1f} KiB "
+            f"({(store_memory - first_urls_memory) / occurrence_count:4.1f} bytes per occurrence on top)"
+        )
+
+        self.assertEqual(store.first_urls(EntityType.EMAIL), first_urls)
+        self.assertEqual(store.count(EntityType.EMAIL, "employee0@example.com"), PAGE_COUNT)
+        # A list of (URL, extractor, count) tuples takes about 80 bytes per occurrence
+        self.assertLessEqual(store_memory - first_urls_memory, occurrence_count * MAX_BYTES_PER_OCCURRENCE)
+
+if __name__ == "__main__":
+    unittest.main()
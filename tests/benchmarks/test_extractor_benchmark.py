@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+from bs4 import BeautifulSoup
+from dataclasses import replace
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from website import get_emails, get_sublinks
+from website.enums import PipelineStage
+from . import benchmark
+from .extractor_benchmark import compare_to_baseline, load_baseline, run_extractor_benchmark, save_baseline
+from .synthetic_html import SyntheticHtmlOptions, get_synthetic_html, get_synthetic_html_corpus
+
+class ExtractorBenchmark(unittest.TestCase):
+    """Throughput and latency benchmark of the offline extractors over a synthetic HTML corpus."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+
+    def tearDown(self):
+        run_logger.close()
+
+    def test_synthetic_html(self):
+        options = SyntheticHtmlOptions(DataRegion.GREAT_BRITAIN, paragraph_count=20, nesting_depth=8, entity_density=1.0)
+        html = get_synthetic_html(options, seed=1)
+        content = BeautifulSoup(html, "html.parser")
+
+        self.assertEqual(html, get_synthetic_html(options, seed=1))
+        self.assertEqual(len(get_emails("https://example.com", content, {})), 20)
+        # The relative page links and the absolute link are found, the PDF isn't
+        self.assertEqual(len(get_sublinks("https://example.com", content, set())), 21)
+        self.assertEqual(len(content.find_all("p")[0].find_parents("section")), 2)
+        with self.assertRaises(ValueError):
+            get_synthetic_html(replace(options, entity_density=2.0))
+
+    @benchmark
+    def test_offline_extractors(self):
+        corpus = get_synthetic_html_corpus(paragraph_counts=(5, 40), nesting_depths=(1, 6), entity_densities=(0.5,))
+        extractors = (PipelineStage.SUBLINKS, PipelineStage.EMAILS, PipelineStage.PHONE_NUMBERS)
+        report = run_extractor_benchmark(corpus, extractors, repeats=1)
+        print(f"\n{report.describe()}")
+
+        self.assertEqual(len(report.results), len(extractors) * len(DataRegion))
+        self.assertEqual(report.skipped, {})
+        for result in report.results:
+            self.assertEqual(result.pages, 4)
+            self.assertGreater(result.pages_per_second, 0)
+            self.assertLessEqual(result.p50_ms, result.p99_ms)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = os.path.join(temp_dir, "baseline.json")
+            save_baseline(report, baseline_path)
+            baseline = load_baseline(baseline_path)
+
+        self.assertEqual(compare_to_baseline(report, baseline), [])
+        # A baseline twice as fast makes every result a regression
+        faster_baseline = json.loads(json.dumps(baseline))
+        for baseline_result in faster_baseline["results"].values():
+            baseline_result["total_seconds"] /= 2
+            baseline_result["p90_ms"] /= 2
+        self.assertEqual(len(compare_to_baseline(report, faster_baseline)), 2 * len(report.results))
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+from globals.enums import DataRegion
+from linkedin_links import FixtureSearchBackend, RecordingSearchBackend
+from . import benchmark
+from .linkedin_benchmark import get_synthetic_result_sets, run_linkedin_benchmark
+
+class LinkedinBenchmark(unittest.TestCase):
+    """Offline benchmark of the LinkedIn profile search with the fixture backend."""
+
+    @benchmark
+    def test_batch_search(self):
+        companies = [f"Company {index} Kft." for index in range(8)]
+        backend = FixtureSearchBackend(get_synthetic_result_sets(companies, DataRegion.HUNGARY), latency_seconds=0.05)
+        result = run_linkedin_benchmark(backend, companies, 5, DataRegion.HUNGARY)
+        print(f"\n{result.describe()}")
+
+        self.assertEqual(result.companies, 8)
+        self.assertEqual(result.profiles, 40)
+        # The fan-out stops before every query variant of every company is searched
+        self.assertLess(result.searches, len(get_synthetic_result_sets(companies, DataRegion.HUNGARY)))
+        self.assertGreater(result.filtered_results, 0)
+
+    def test_recorded_result_sets(self):
+        result_sets = get_synthetic_result_sets(["Example Ltd"], DataRegion.GREAT_BRITAIN, results_per_query=4)
+        recorder = RecordingSearchBackend(FixtureSearchBackend(result_sets))
+        query = next(iter(result_sets))
+        recorded_results = recorder.search(query, 3, "uk-en")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fixture_path = os.path.join(temp_dir, "searches.json")
+            recorder.save(fixture_path)
+            replayed_results = FixtureSearchBackend.from_file(fixture_path).search(query, 10, "uk-en")
+
+        self.assertEqual(recorded_results, result_sets[query][:3])
+        self.assertEqual(replayed_results, recorded_results)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from export_data.sqlite_export import WebparserSqliteWriter
+from website.enums import EntityType
+from . import benchmark
+
+SITE_COUNT = 1000
+EMAILS_PER_SITE = 100
+LOOKUP_COUNT = 100
+
+@benchmark
+class SqliteExportBenchmark(unittest.TestCase):
+    """Ingest and lookup benchmark of the SQLite export over many synthetic websites."""
+
+    def test_sqlite_ingest_and_lookup(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "benchmark.sqlite")
+
+            start_time = time.perf_counter()
+            with WebparserSqliteWriter(database_path) as writer:
+                for site_index in range(SITE_COUNT):
+                    for email_index in range(EMAILS_PER_SITE):
+                        writer.write_entity(EntityType.EMAIL, f"employee{email_index}@site{site_index}.com", f"https://site{site_index}.com")
+            ingest_seconds = time.perf_counter() - start_time
+
+            with sqlite3.connect(database_path) as connection:
+                start_time = time.perf_counter()
+                for site_index in range(0, SITE_COUNT, SITE_COUNT // LOOKUP_COUNT):
+                    rows = connection.execute(
+                        "SELECT value FROM entities WHERE domain = ? AND entity_type = ?",
+                        (f"site{site_index}.com", EntityType.EMAIL.value),
+                    ).fetchall()
+                    self.assertEqual(len(rows), EMAILS_PER_SITE)
+                lookup_seconds = (time.perf_counter() - start_time) / LOOKUP_COUNT
+
+        row_count = SITE_COUNT * EMAILS_PER_SITE
+        print(
+            f"\n{row_count} entities: ingest {ingest_seconds:6.2f} s ({row_count / ingest_seconds:9.0f} rows/s), "
+            f"lookup by domain {lookup_seconds * 1000:6.3f} ms"
+        )
+
+        # Indexed lookups return a hundred rows out of a hundred thousand in well under a few milliseconds
+        self.assertLess(lookup_seconds, 0.01)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,146 @@
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from collections.abc import Iterator
+from unittest.mock import patch
+from crawl_service import CrawlJobRequest, CrawlService, create_server
+from globals.enums import DataRegion, JobStatus, LogMode
+from globals.run_logger import run_logger
+from website import Fetcher
+from website.enums import EntityType
+from website.models import PageResult
+
+class _StaticFetcher(Fetcher):
+    """Fetcher counting its warm-ups and closes, the pages are never fetched by the stand-in crawl."""
+
+    def __init__(self):
+        self.warm_ups = 0
+        self.closes = 0
+
+    def warm_up(self):
+        self.warm_ups += 1
+
+    def close(self):
+        self.closes += 1
+
+    def _fetch(self, url: str) -> str:
+        return "<html></html>"
+
+def _iter_parse(website_url: str, sublinks_to_visit: int, region: DataRegion, info=None, fetcher=None) -> Iterator[PageResult]:
+    """Stand-in of the crawl yielding a page per visited link, the models aren't needed."""
+    if "fail" in website_url:
+        raise RuntimeError("The website is down")
+    for page_index in range(sublinks_to_visit + 1):
+        yield PageResult(f"{website_url}/page{page_index}", {EntityType.EMAIL: [f"user{page_index}@example.com"]}, [], {"fetch": 0.01})
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+@patch("crawl_service.crawl_service.model_registry.warm_up")
+@patch("crawl_service.crawl_service.iter_parse", _iter_parse)
+class CrawlServiceTest(unittest.TestCase):
+    """Test class for the crawl service and its HTTP API."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+        self.fetcher = _StaticFetcher()
+
+    def tearDown(self):
+        run_logger.close()
+
+    def _request(self, connection: http.client.HTTPConnection, method: str, path: str, body: dict | None = None):
+        connection.request(method, path, body=json.dumps(body) if body is not None else None)
+        response = connection.getresponse()
+        return response.status, response.read()
+
+    def test_submit_and_stream_results(self, mock_warm_up):
+        with CrawlService(self.fetcher, max_finished_jobs=1) as service:
+            server = create_server(service, port=0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+                status, body = self._request(connection, "POST", "/jobs", {"link": "https://example.com", "region": "hu", "sublinks": 2})
+                self.assertEqual(status, 202)
+                job_id = json.loads(body)["id"]
+
+                status, body = self._request(connection, "GET", f"/jobs/{job_id}/results")
+                events = [json.loads(line) for line in body.splitlines()]
+                self.assertEqual(status, 200)
+                self.assertEqual([event["url"] for event in events[:-1]], [f"https://example.com/page{index}" for index in range(3)])
+                self.assertEqual(events[1]["entities"], {"email": ["user1@example.com"]})
+                self.assertEqual(events[-1], {"event": "end", "status": "succeeded", "error": None})
+
+                # A reader can continue from the last received event
+                connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+                status, body = self._request(connection, "GET", f"/jobs/{job_id}/results?start=3")
+                self.assertEqual([json.loads(line)["event"] for line in body.splitlines()], ["end"])
+
+                status, body = self._request(connection, "GET", f"/jobs/{job_id}")
+                self.assertEqual((json.loads(body)["status"], json.loads(body)["pages"]), ("succeeded", 3))
+
+                status, body = self._request(connection, "POST", "/jobs", {"link": "not a url", "region": "hu"})
+                self.assertEqual(status, 400)
+                status, body = self._request(connection, "GET", "/jobs/0123abcd")
+                self.assertEqual(status, 404)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+            failed_job = service.submit(CrawlJobRequest("https://fail.example.com", DataRegion.HUNGARY))
+            self.assertEqual(list(service.iter_events(failed_job.id))[-1]["status"], "failed")
+            self.assertEqual(failed_job.error, "RuntimeError: The website is down")
+            # Only the last finished job is kept
+            self.assertEqual([job.id for job in service.list_jobs()], [failed_job.id])
+
+        mock_warm_up.assert_called_once_with(tuple(DataRegion))
+        self.assertEqual((self.fetcher.warm_ups, self.fetcher.closes), (1, 1))
+
+    def test_unix_socket(self, mock_warm_up):
+        with tempfile.TemporaryDirectory() as temp_dir, CrawlService(self.fetcher) as service:
+            socket_path = os.path.join(temp_dir, "crawl_service.sock")
+            server = create_server(service, socket_path=socket_path)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                job = service.submit(CrawlJobRequest("https://example.com", DataRegion.GREAT_BRITAIN))
+                list(service.iter_events(job.id))
+                status, body = self._request(_UnixHTTPConnection(socket_path), "GET", "/health")
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"status": "ok", "jobs": {JobStatus.SUCCEEDED.value: 1}})
+
+    def test_failed_profile_search_keeps_the_pages(self, mock_warm_up):
+        with patch("crawl_service.crawl_service.fetch_links", side_effect=RuntimeError("Searching Example failed")), CrawlService(self.fetcher) as service:
+            job = service.submit(CrawlJobRequest("https://example.com", DataRegion.GREAT_BRITAIN, 1, "Example", 5))
+            events = list(service.iter_events(job.id))
+
+        self.assertEqual([event["event"] for event in events], ["page", "page", "profiles", "end"])
+        self.assertEqual(events[2], {"event": "profiles", "profiles": {}, "matches": [], "error": "RuntimeError: Searching Example failed"})
+        self.assertEqual(events[-1]["status"], "succeeded")
+
+    def test_job_request_validation(self, mock_warm_up):
+        request = CrawlJobRequest.from_dict({"link": "https://example.com", "region": "GB", "company": "Example", "profiles": 5})
+        self.assertEqual(request, CrawlJobRequest("https://example.com", DataRegion.GREAT_BRITAIN, 0, "Example", 5))
+        for data in (
+            {"link": "https://example.com", "region": "xx"},
+            {"link": "https://example.com", "region": "hu", "sublinks": 201},
+            {"link": "https://example.com", "region": "hu", "profiles": 5},
+            ["https://example.com"],
+        ):
+            with self.assertRaises(ValueError):
+                CrawlJobRequest.from_dict(data)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from collections.abc import Iterator
+from unittest.mock import patch
+from crawl_service import CrawlJobRequest, CrawlWorker, JobQueue
+from crawl_service.worker import _keep_lease
+from globals.enums import DataRegion, JobStatus, LogMode
+from globals.run_logger import run_logger
+from website import Fetcher
+from website.enums import EntityType
+from website.models import PageResult
+
+class _StaticFetcher(Fetcher):
+    def _fetch(self, url: str) -> str:
+        return "<html></html>"
+
+def _iter_parse(website_url: str, sublinks_to_visit: int, region: DataRegion, info=None, fetcher=None) -> Iterator[PageResult]:
+    """Stand-in of the crawl yielding a page per visited link, the models aren't needed."""
+    if "fail" in website_url:
+        raise RuntimeError("The website is down")
+    for page_index in range(sublinks_to_visit + 1):
+        yield PageResult(f"{website_url}/page{page_index}", {EntityType.EMAIL: [f"user{page_index}@example.com"]}, [], {"fetch": 0.01})
+
+class _LockedQueue:
+    """Stand-in of the queue whose lease renewals return the given results, or raise them if they are errors."""
+
+    def __init__(self, renewal_results: list[bool | Exception]):
+        self.renewal_results = list(renewal_results)
+        self.renewal_count = 0
+
+    def renew_lease(self, job_id: int, worker_id: str) -> bool:
+        self.renewal_count += 1
+        result = self.renewal_results.pop(0) if self.renewal_results else True
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+class JobQueueTest(unittest.TestCase):
+    """Test class for the persistent job queue and its workers."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "jobs.db")
+
+    def tearDown(self):
+        run_logger.close()
+        self.temp_dir.cleanup()
+
+    def test_claim_complete_and_retry(self):
+        with JobQueue(self.database_path, max_attempts=2, retry_delay_seconds=0) as queue:
+            first_id, second_id = queue.enqueue_many([
+                CrawlJobRequest("https://example.com", DataRegion.HUNGARY),
+                CrawlJobRequest("https://example.org", DataRegion.GREAT_BRITAIN, 3),
+            ])
+
+            job = queue.claim("worker-a")
+            self.assertEqual((job.id, job.status, job.attempts, job.worker_id), (first_id, JobStatus.RUNNING, 1, "worker-a"))
+            self.assertTrue(queue.renew_lease(first_id, "worker-a"))
+            self.assertFalse(queue.renew_lease(first_id, "worker-b"))
+            self.assertTrue(queue.complete(first_id, "worker-a", [{"event": "page", "url": "https://example.com"}]))
+            self.assertEqual(queue.get_events(first_id), [{"event": "page", "url": "https://example.com"}])
+            self.assertFalse(queue.complete(first_id, "worker-a", []))
+
+            self.assertEqual(queue.claim("worker-a").request.sublinks, 3)
+            self.assertEqual(queue.fail(second_id, "worker-a", "RuntimeError: down"), JobStatus.QUEUED)
+            self.assertEqual(queue.claim("worker-b").attempts, 2)
+            self.assertEqual(queue.fail(second_id, "worker-b", "RuntimeError: down"), JobStatus.FAILED)
+            self.assertIsNone(queue.claim("worker-a"))
+            self.assertEqual(queue.get_job(second_id).error, "RuntimeError: down")
+            self.assertEqual(queue.count_jobs(), {
+                JobStatus.QUEUED: 0, JobStatus.RUNNING: 0, JobStatus.SUCCEEDED: 1, JobStatus.FAILED: 1,
+            })
+            with self.assertRaises(KeyError):
+                queue.get_job(100)
+
+    def test_expired_lease_is_claimed_again(self):
+        with JobQueue(self.database_path, lease_seconds=0.05, max_attempts=2) as queue:
+            job_id = queue.enqueue(CrawlJobRequest("https://example.com", DataRegion.HUNGARY))
+            queue.claim("worker-a")
+            self.assertIsNone(queue.claim("worker-b"))
+
+            time.sleep(0.1)
+            self.assertEqual(queue.claim("worker-b").worker_id, "worker-b")
+            # The results of the worker that lost the lease are discarded
+            self.assertFalse(queue.complete(job_id, "worker-a", [{"event": "page"}]))
+
+            time.sleep(0.1)
+            self.assertIsNone(queue.claim("worker-c"))
+            self.assertEqual(queue.get_job(job_id).status, JobStatus.FAILED)
+
+    def test_concurrent_claims(self):
+        with JobQueue(self.database_path) as queue:
+            queue.enqueue_many(CrawlJobRequest(f"https://example.com/{index}", DataRegion.HUNGARY) for index in range(50))
+
+        # Every worker has its own connection, like the worker processes
+        claimed_ids: list[int] = []
+        claimed_lock = threading.Lock()
+
+        def claim_all(worker_id: str):
+            with JobQueue(self.database_path) as worker_queue:
+                while (job := worker_queue.claim(worker_id)) is not None:
+                    with claimed_lock:
+                        claimed_ids.append(job.id)
+
+        threads = [threading.Thread(target=claim_all, args=(f"worker-{index}",)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(claimed_ids), list(range(1, 51)))
+
+    def test_failed_lease_renewal_is_retried(self):
+        queue = _LockedQueue([sqlite3.OperationalError("database is locked"), True, False])
+        with _keep_lease(queue, 1, "worker-a", 0.01) as lease_lost:
+            self.assertTrue(lease_lost.wait(1))
+
+        # The renewal thread survived the locked database and noticed the lost lease afterwards
+        self.assertEqual(queue.renewal_count, 3)
+
+    @patch("crawl_service.crawl_service.iter_parse", _iter_parse)
+    def test_worker(self):
+        with JobQueue(self.database_path, max_attempts=1) as queue:
+            succeeded_id, failed_id = queue.enqueue_many([
+                CrawlJobRequest("https://example.com", DataRegion.HUNGARY, 1),
+                CrawlJobRequest("https://fail.example.com", DataRegion.HUNGARY),
+            ])
+            worker = CrawlWorker(queue, _StaticFetcher(), "worker-a")
+            self.assertEqual(worker.run(exit_when_idle=True), 2)
+
+            self.assertEqual([event["url"] for event in queue.get_events(succeeded_id)], [
+                "https://example.com/page0", "https://example.com/page1",
+            ])
+            self.assertEqual(queue.get_job(succeeded_id).status, JobStatus.SUCCEEDED)
+            self.assertEqual(queue.get_job(failed_id).status, JobStatus.FAILED)
+            self.assertEqual(queue.get_job(failed_id).error, "RuntimeError: The website is down")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
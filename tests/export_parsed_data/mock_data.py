@@ -1,4 +1,5 @@
-from website.models import WebsiteInfo
+from website.enums import EntityType
+from website.models import PageResult, WebsiteInfo
 
 # get_mock_website_info_with_all_data() was created by GitHub Copilot and manually edited
 def get_mock_website_info_with_all_data() -> WebsiteInfo:
@@ -65,4 +66,39 @@ def get_mock_website_info_with_multiple_data_types() -> WebsiteInfo:
         found_addresses={
             "789 Oak Ave, New York, NY 10001": "https://example.com/contact",
         },
-    )
\ No newline at end of file
+    )
+
+def get_mock_page_results() -> list[PageResult]:
+    """Return the results of two parsed pages, as yielded by website.iter_parse."""
+    return [
+        PageResult(
+            url="https://example.com/",
+            new_entities={
+                EntityType.EMAIL: ["john@example.com"],
+                EntityType.NAME: ["John Doe"],
+                EntityType.PHONE_NUMBER: [],
+                EntityType.ADDRESS: [],
+            },
+            discovered_links=["https://example.com/page1"],
+        ),
+        PageResult(
+            url="https://example.com/page1",
+            new_entities={
+                EntityType.EMAIL: ["jane@example.com"],
+                EntityType.NAME: [],
+                EntityType.PHONE_NUMBER: ["+36 30 123 4567"],
+                EntityType.ADDRESS: [],
+            },
+            discovered_links=[],
+        ),
+    ]
+
+def get_mock_page_results_empty() -> list[PageResult]:
+    """Return the result of a parsed page without any data."""
+    return [
+        PageResult(
+            url="https://example.com",
+            new_entities={entity_type: [] for entity_type in EntityType},
+            discovered_links=["https://example.com/page1"],
+        ),
+    ]
\ No newline at end of file
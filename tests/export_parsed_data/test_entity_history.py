@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from export_data.entity_history import EntityHistory
+from globals.enums import DataRegion
+from website.enums import EntityType
+from website.models import WebsiteInfo
+from .mock_data import get_mock_page_results, get_mock_website_info_with_all_data
+
+class EntityHistoryTest(unittest.TestCase):
+    """Test class for the entity_history module."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "history.sqlite")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_merge_returns_only_new_entities(self):
+        """Test that entities seen in an earlier run aren't returned, even if they are written differently."""
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            first_run = history.merge(get_mock_website_info_with_all_data())
+            self.assertEqual(first_run, get_mock_website_info_with_all_data())
+
+        second_info = WebsiteInfo(
+            found_urls={"https://other.com"},
+            found_emails={"JOHN@example.com": "https://other.com", "new@other.com": "https://other.com"},
+            found_names={"john  doe": "https://other.com"},
+            found_phone_numbers={"06 30 123 4567": "https://other.com"},
+            found_addresses={},
+        )
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            second_run = history.merge(second_info)
+            record = history.get(EntityType.EMAIL, "john@EXAMPLE.com")
+
+        self.assertEqual(second_run.found_emails, {"new@other.com": "https://other.com"})
+        self.assertEqual(second_run.found_names, {})
+        self.assertEqual(second_run.found_phone_numbers, {})
+        self.assertEqual(second_run.found_urls, {"https://other.com"})
+        # The entity keeps the form and the URL it was first found with
+        self.assertEqual(record.value, "john@example.com")
+        self.assertEqual(record.source_url, "https://example.com")
+        self.assertEqual(record.run_count, 2)
+        self.assertLessEqual(record.first_seen, record.last_seen)
+
+    def test_merge_page(self):
+        """Test that the pages are merged one by one and keep only the entities that weren't seen before."""
+        first_page, second_page = get_mock_page_results()
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            history.merge(WebsiteInfo(set(), {"jane@example.com": "https://example.com"}, {}, {}, {}))
+
+            self.assertEqual(history.merge_page(first_page), first_page)
+            merged_second_page = history.merge_page(second_page)
+            self.assertIsNone(history.get(EntityType.EMAIL, "missing@example.com"))
+
+        self.assertEqual(merged_second_page.new_entities[EntityType.EMAIL], [])
+        self.assertEqual(merged_second_page.new_entities[EntityType.PHONE_NUMBER], ["+36 30 123 4567"])
+        with sqlite3.connect(self.database_path) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM entity_history").fetchone(), (4,))
+
+    def test_pending_entities_are_recorded_on_request(self):
+        """Test that entities merged without recording are only added to the history by record_pending."""
+        first_page, second_page = get_mock_page_results()
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            self.assertEqual(history.merge_page(first_page, record=False), first_page)
+            # A pending entity isn't new anymore for the rest of the run
+            self.assertEqual(history.merge(WebsiteInfo(set(), {"JOHN@example.com": "https://example.com/page1"}, {}, {}, {}), record=False).found_emails, {})
+            self.assertIsNone(history.get(EntityType.EMAIL, "john@example.com"))
+
+        # The pending entities of a closed history are discarded, e.g. after a failed export
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            self.assertEqual(history.merge_page(first_page, record=False), first_page)
+            history.merge_page(second_page, record=False)
+            history.record_pending()
+            record = history.get(EntityType.EMAIL, "john@example.com")
+
+        self.assertEqual(record.run_count, 1)
+        with sqlite3.connect(self.database_path) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM entity_history").fetchone(), (4,))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            EntityHistory(self.database_path, "hu")
+        with EntityHistory(self.database_path, DataRegion.HUNGARY) as history:
+            with self.assertRaises(TypeError):
+                history.merge({})
+            with self.assertRaises(TypeError):
+                history.get_key("email", "john@example.com")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
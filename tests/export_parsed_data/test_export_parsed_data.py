@@ -1,11 +1,17 @@
 import csv
 import os
+import tempfile
 import unittest
 from datetime import datetime
 from unittest.mock import patch
+from website.enums import EntityType
 from export_data.export import _export_webparser_data_to_csv, _get_export_confirmation, _get_export_path, _get_file_name
-from export_data.export import export_webparser_data
+from export_data.export import export_webparser_data, export_webparser_data_stream, export_profiles, WebparserCsvStreamWriter
+from export_data.models import ExportOptions
+from linkedin_links.models import NameMatch
 from .mock_data import (
+    get_mock_page_results,
+    get_mock_page_results_empty,
     get_mock_website_info_with_all_data,
     get_mock_website_info_with_names_only,
     get_mock_website_info_empty,
@@ -19,11 +25,14 @@ class ExportDataTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up the results directory."""
-        cls.csv_export_dir = os.path.normpath(
-            os.path.join(os.path.dirname(__file__), "../../results")
-        )
-        os.makedirs(cls.csv_export_dir, exist_ok=True)
+        """Set up a temporary results directory."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.csv_export_dir = cls.temp_dir.name
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary results directory."""
+        cls.temp_dir.cleanup()
 
     def _get_timestamped_filename(self, test_name: str) -> str:
         """Generate filename containing timestamp of current time."""
@@ -50,11 +59,13 @@ class ExportDataTest(unittest.TestCase):
 
     def test_get_export_path(self):
         """Test getting export path returns valid results folder path."""
-        result = _get_export_path("results")
+        # An absolute folder name replaces the project root, so the folder is created in the temporary directory
+        results_folder = os.path.join(self.csv_export_dir, "results")
+        result = _get_export_path(results_folder)
         
         # Should be a string path ending in results
         self.assertIsInstance(result, str)
-        self.assertEqual(result, self.csv_export_dir)
+        self.assertEqual(result, results_folder)
         
         # Verify the results folder exists and is accessible
         self.assertTrue(os.path.exists(result))
@@ -265,7 +276,7 @@ class ExportDataTest(unittest.TestCase):
         website_info = get_mock_website_info_with_all_data()
         
         with patch('export_data.export._export_webparser_data_to_csv') as mock_export_to_csv:
-            export_webparser_data(website_info)
+            self.assertFalse(export_webparser_data(website_info))
             # _export_webparser_data_to_csv should not be called if file_name is None
             mock_export_to_csv.assert_not_called()
     
@@ -307,7 +318,7 @@ class ExportDataTest(unittest.TestCase):
         website_info = get_mock_website_info_with_all_data()
         initial_file_count = len([f for f in os.listdir(self.csv_export_dir) if f.endswith('.csv')])
 
-        export_webparser_data(website_info)
+        self.assertTrue(export_webparser_data(website_info))
 
         csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
         self.assertTrue(os.path.exists(csv_path))
@@ -315,5 +326,183 @@ class ExportDataTest(unittest.TestCase):
         file_count_difference = final_file_count - initial_file_count
         self.assertEqual(file_count_difference, 1)
 
+    def test_stream_writer_persists_rows_per_page(self):
+        """Test that the rows of a page are readable from the file before the writer is closed."""
+        file_name = self._get_timestamped_filename("test_stream_per_page")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        first_page, second_page = get_mock_page_results()
+
+        with WebparserCsvStreamWriter(csv_path) as writer:
+            self.assertEqual(writer.write_page(first_page), 2)
+            self.assertFalse(os.path.exists(csv_path))
+            with open(writer.partial_path, 'r', encoding='utf-8') as f:
+                rows = list(csv.reader(f, delimiter=';'))
+            self.assertEqual(rows[0], ["Entity type", "Value", "Source URL"])
+            self.assertEqual(rows[1:], [["email", "john@example.com", "https://example.com"], ["name", "John Doe", "https://example.com"]])
+
+            self.assertEqual(writer.write_page(second_page), 2)
+
+        self.assertFalse(os.path.exists(writer.partial_path))
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f, delimiter=';'))
+        self.assertEqual(len(rows), 5)
+        self.assertIn(["phone_number", "+36 30 123 4567", "https://example.com/page1"], rows)
+        self.assertEqual(writer.rows_written, 4)
+
+    def test_stream_writer_flushes_periodically(self):
+        """Test that the rows are flushed after the flush interval is reached, even within a page."""
+        file_name = self._get_timestamped_filename("test_stream_flush_interval")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+
+        with WebparserCsvStreamWriter(csv_path, flush_interval_rows=2) as writer:
+            for index in range(3):
+                writer.write_entity(EntityType.EMAIL, f"user{index}@example.com", "https://example.com")
+            with open(writer.partial_path, 'r', encoding='utf-8') as f:
+                rows = list(csv.reader(f, delimiter=';'))
+            self.assertEqual(len(rows), 3)
+
+        with self.assertRaises(ValueError):
+            WebparserCsvStreamWriter(csv_path, flush_interval_rows=0)
+        with self.assertRaises(TypeError):
+            writer.write_entity("email", "user@example.com", "https://example.com")
+
+    def test_stream_writer_removes_empty_file(self):
+        """Test that the file is removed if no data was found on any page."""
+        file_name = self._get_timestamped_filename("test_stream_empty")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+
+        with WebparserCsvStreamWriter(csv_path) as writer:
+            for page_result in get_mock_page_results_empty():
+                writer.write_page(page_result)
+
+        self.assertFalse(os.path.exists(csv_path))
+        self.assertFalse(os.path.exists(writer.partial_path))
+
+    @patch('csv.writer')
+    def test_stream_writer_keeps_rows_on_write_error(self, mock_csv_writer):
+        """Test that a failing row doesn't raise and the rows written before are kept."""
+        mock_csv_writer.return_value.writerow.side_effect = [None, None, Exception("Write error")]
+        file_name = self._get_timestamped_filename("test_stream_write_error")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+
+        with WebparserCsvStreamWriter(csv_path) as writer:
+            for page_result in get_mock_page_results():
+                writer.write_page(page_result)
+
+        self.assertTrue(writer.failed)
+        self.assertEqual(writer.rows_written, 1)
+        self.assertFalse(os.path.exists(csv_path))
+        self.assertTrue(os.path.exists(writer.partial_path))
+
+    def test_stream_writer_keeps_partial_file_on_exception(self):
+        """Test that an exception leaves the existing file untouched and keeps the rows written so far in the partial file."""
+        file_name = self._get_timestamped_filename("test_stream_interrupted")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        with open(csv_path, 'w') as f:
+            f.write("test")
+
+        with self.assertRaises(KeyboardInterrupt):
+            with WebparserCsvStreamWriter(csv_path) as writer:
+                writer.write_page(get_mock_page_results()[0])
+                raise KeyboardInterrupt()
+
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "test")
+        with open(writer.partial_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.reader(f, delimiter=';'))), 3)
+
+    @patch('export_data.export._get_export_confirmation', return_value=True)
+    @patch('export_data.export._get_export_path')
+    @patch('export_data.export._get_file_name')
+    def test_export_webparser_data_stream(self, mock_file_name, mock_path, mock_confirmation):
+        """Test that the stream export writes the rows of every page while the pages are consumed."""
+        file_name = self._get_timestamped_filename("test_stream_export")
+        mock_file_name.return_value = file_name
+        mock_path.return_value = self.csv_export_dir
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        rows_seen_after_first_page = []
+
+        def pages():
+            page_results = get_mock_page_results()
+            yield page_results[0]
+            # The first page must already be in the partial file when the second page is being parsed
+            with open(csv_path + ".part", 'r', encoding='utf-8') as f:
+                rows_seen_after_first_page.extend(csv.reader(f, delimiter=';'))
+            yield page_results[1]
+
+        self.assertTrue(export_webparser_data_stream(pages()))
+
+        self.assertEqual(len(rows_seen_after_first_page), 3)
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.reader(f, delimiter=';'))), 5)
+
+    @patch('export_data.export._get_export_confirmation', return_value=False)
+    def test_export_webparser_data_stream_declined_consumes_pages(self, mock_confirmation):
+        """Test that the pages are still consumed if the user declines the export."""
+        pages = iter(get_mock_page_results())
+
+        self.assertFalse(export_webparser_data_stream(pages))
+
+        self.assertEqual(list(pages), [])
+        with self.assertRaises(TypeError):
+            export_webparser_data_stream(123)
+
+    @patch('builtins.input')
+    def test_export_webparser_data_no_prompt(self, mock_input):
+        """Test that the export writes to the given output without asking the user."""
+        file_name = self._get_timestamped_filename("test_no_prompt")
+        output = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        options = ExportOptions(output=output, no_prompt=True)
+
+        export_webparser_data(get_mock_website_info_with_all_data(), options)
+        match = NameMatch("Doe John", "https://example.com/team", "https://linkedin.com/in/johndoe", "John Doe", 1.0)
+        export_profiles({"https://linkedin.com/in/johndoe": "John Doe", "https://linkedin.com/in/janedoe": "Jane Doe"}, options, [match])
+
+        mock_input.assert_not_called()
+        self.assertTrue(os.path.exists(output))
+        self.assertFalse(os.path.exists(output + ".tmp"))
+        with open(os.path.join(self.csv_export_dir, f"{file_name}_profiles.csv"), newline='', encoding="utf-8") as csv_file:
+            rows = list(csv.reader(csv_file, delimiter=";"))
+        # The matched names are an extra column, empty for the profiles without a match
+        self.assertEqual(rows[0][2], "Names on the website (found at link)")
+        self.assertEqual(rows[1][2], "Doe John (https://example.com/team)")
+        self.assertEqual(rows[2][2], "")
+
+    @patch('builtins.input')
+    def test_export_webparser_data_no_prompt_existing_file(self, mock_input):
+        """Test that an existing file is only replaced if overwrite is set."""
+        file_name = self._get_timestamped_filename("test_no_prompt_existing")
+        output = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        with open(output, 'w') as f:
+            f.write("test")
+
+        export_webparser_data(get_mock_website_info_with_all_data(), ExportOptions(output=output, no_prompt=True))
+        with open(output, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "test")
+
+        export_webparser_data(get_mock_website_info_with_all_data(), ExportOptions(output=output, overwrite=True, no_prompt=True))
+        with open(output, 'r', encoding='utf-8') as f:
+            self.assertNotEqual(f.read(), "test")
+        mock_input.assert_not_called()
+
+    def test_export_to_csv_keeps_existing_file_on_exception(self):
+        """Test that a failed export removes the temporary file and leaves the existing file untouched."""
+        file_name = self._get_timestamped_filename("test_atomic_export")
+        csv_path = os.path.join(self.csv_export_dir, f"{file_name}.csv")
+        with open(csv_path, 'w') as f:
+            f.write("test")
+
+        with patch('csv.DictWriter.writerow', side_effect=Exception("Write error")):
+            self.assertFalse(_export_webparser_data_to_csv(get_mock_website_info_with_all_data(), self.csv_export_dir, file_name))
+
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "test")
+        self.assertFalse(os.path.exists(csv_path + ".tmp"))
+
+    def test_export_options_validation(self):
+        """Test that invalid export options are rejected."""
+        with self.assertRaises(TypeError):
+            export_webparser_data(get_mock_website_info_with_all_data(), "csv")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
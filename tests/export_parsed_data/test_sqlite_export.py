@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+from export_data.export import export_profiles, export_webparser_data, export_webparser_data_stream
+from export_data.models import ExportOptions
+from export_data.sqlite_export import WebparserSqliteWriter, get_domain
+from globals.enums import ExportFormat
+from linkedin_links.models import NameMatch
+from website.entity_store import EntityStore
+from website.enums import EntityType, Extractor
+from .mock_data import get_mock_page_results, get_mock_website_info_with_all_data
+
+class SqliteExportTest(unittest.TestCase):
+    """Test class for the sqlite_export module."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "results.sqlite")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _query(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with sqlite3.connect(self.database_path) as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def test_get_domain(self):
+        self.assertEqual(get_domain("https://www.Example.com/contact/"), "example.com")
+        self.assertEqual(get_domain("https://sub.example.hu"), "sub.example.hu")
+        with self.assertRaises(TypeError):
+            get_domain(None)
+
+    def test_write_pages_and_upsert(self):
+        """Test that the pages and entities are written once, and written again as upserts."""
+        with WebparserSqliteWriter(self.database_path) as writer:
+            for page_result in get_mock_page_results():
+                writer.write_page(page_result)
+        with WebparserSqliteWriter(self.database_path) as writer:
+            self.assertEqual(writer.write_info(get_mock_website_info_with_all_data()), 9)
+
+        self.assertEqual(self._query("PRAGMA journal_mode"), [("wal",)])
+        # The page where only the entities of the website information were found is added
+        self.assertEqual(
+            self._query("SELECT url FROM pages ORDER BY url"),
+            [("https://example.com",), ("https://example.com/page1",), ("https://example.com/page2",)],
+        )
+        self.assertEqual(self._query("SELECT COUNT(*) FROM entities"), [(9,)])
+        # The URL where the entity was first found is kept
+        self.assertEqual(
+            self._query("SELECT source_url, domain FROM entities WHERE entity_type = ? AND value = ?", (EntityType.EMAIL.value, "john@example.com")),
+            [("https://example.com", "example.com")],
+        )
+
+    def test_write_info_pages_from_entity_store(self):
+        """Test that the pages of the entity store are written, including those where only known entities were found."""
+        store = EntityStore()
+        for website_url in ("https://example.com/", "https://example.com/page1", "https://example.com/page3"):
+            store.add(EntityType.EMAIL, "john@example.com", website_url, Extractor.EMAILS)
+        info = replace(get_mock_website_info_with_all_data(), entity_store=store)
+        with WebparserSqliteWriter(self.database_path) as writer:
+            writer.write_info(info)
+
+        self.assertEqual(
+            self._query("SELECT url, domain FROM pages ORDER BY url"),
+            [("https://example.com", "example.com"), ("https://example.com/page1", "example.com"), ("https://example.com/page3", "example.com")],
+        )
+
+    def test_lookups_use_indexes(self):
+        """Test that the lookups by domain and entity type, and by entity don't scan the tables."""
+        with WebparserSqliteWriter(self.database_path):
+            pass
+
+        domain_plan = self._query("EXPLAIN QUERY PLAN SELECT value FROM entities WHERE domain = ? AND entity_type = ?", ("example.com", "email"))
+        entity_plan = self._query("EXPLAIN QUERY PLAN SELECT domain FROM entities WHERE entity_type = ? AND value = ?", ("email", "john@example.com"))
+        self.assertIn("entities_domain_type_index", domain_plan[0][-1])
+        self.assertIn("entities_type_value_domain_index", entity_plan[0][-1])
+
+    def test_batches_are_committed(self):
+        """Test that full batches are committed before the writer is flushed."""
+        with WebparserSqliteWriter(self.database_path, batch_size=2) as writer:
+            for index in range(3):
+                writer.write_entity(EntityType.EMAIL, f"user{index}@example.com", "https://example.com")
+            self.assertEqual(self._query("SELECT COUNT(*) FROM entities"), [(2,)])
+
+        self.assertEqual(self._query("SELECT COUNT(*) FROM entities"), [(3,)])
+        with self.assertRaises(ValueError):
+            WebparserSqliteWriter(self.database_path, batch_size=0)
+        with self.assertRaises(TypeError):
+            writer.write_entity("email", "user@example.com", "https://example.com")
+
+    @patch('builtins.input')
+    def test_export_to_sqlite_merges_runs(self, mock_input):
+        """Test that the exports of several runs and the profiles are merged into the same database."""
+        options = ExportOptions(output=self.database_path, export_format=ExportFormat.SQLITE, no_prompt=True)
+
+        export_webparser_data(get_mock_website_info_with_all_data(), options)
+        export_webparser_data_stream(iter(get_mock_page_results()), options)
+        match = NameMatch("Doe John", "https://example.com/team", "https://linkedin.com/in/johndoe", "John Doe", 1.0)
+        export_profiles({"https://linkedin.com/in/johndoe": "John Doe"}, options, [match])
+        export_profiles({"https://linkedin.com/in/johndoe": "John Doe"}, options, [match])
+
+        mock_input.assert_not_called()
+        self.assertEqual(self._query("SELECT COUNT(*) FROM entities"), [(9,)])
+        self.assertEqual(self._query("SELECT name FROM profiles"), [("John Doe",)])
+        self.assertEqual(
+            self._query("SELECT profile_url, name, source_url FROM name_matches"),
+            [("https://linkedin.com/in/johndoe", "Doe John", "https://example.com/team")],
+        )
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,29 @@
+import unittest
+from globals.enums import DataRegion
+from globals.normalization import normalize_email, normalize_phone_number, normalize_text
+
+class NormalizationTest(unittest.TestCase):
+    """Test class for the normalization module."""
+
+    def test_normalize_email(self):
+        self.assertEqual(normalize_email(" John.Doe@Example.COM "), "john.doe@example.com")
+        with self.assertRaises(TypeError):
+            normalize_email(None)
+
+    def test_normalize_phone_number(self):
+        self.assertEqual(normalize_phone_number("+36 30 123 4567", DataRegion.HUNGARY), "+36301234567")
+        self.assertEqual(normalize_phone_number("06 30 123 4567", DataRegion.HUNGARY), "+36301234567")
+        self.assertEqual(normalize_phone_number("(202) 555-0143", DataRegion.UNITED_STATES), "+12025550143")
+        self.assertEqual(normalize_phone_number("+0 12-34", DataRegion.HUNGARY), "+01234")
+        with self.assertRaises(TypeError):
+            normalize_phone_number("+36 30 123 4567", "hu")
+
+    def test_normalize_text(self):
+        self.assertEqual(normalize_text("Kovács  Péter"), "kovacs peter")
+        self.assertEqual(normalize_text(" KOVACS Peter\n"), "kovacs peter")
+        self.assertEqual(normalize_text("Őrház utca 1, Győr"), "orhaz utca 1, gyor")
+        with self.assertRaises(TypeError):
+            normalize_text(123)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
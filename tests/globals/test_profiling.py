@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+import unittest
+from globals.profiling import CrawlProfiler
+from globals.tracing import Tracer
+
+def _allocate_stage(tracer: Tracer, name: str, size: int) -> list:
+    """Allocate memory that is kept alive and end the span of the stage."""
+    start_time = time.perf_counter()
+    allocated = [bytearray(size)]
+    tracer.record(name, start_time, time.perf_counter() - start_time)
+    return allocated
+
+class CrawlProfilerTest(unittest.TestCase):
+    """Test class for the profiling module."""
+
+    def test_allocations_are_attributed_to_stages(self):
+        tracer = Tracer()
+        kept_alive = []
+        with CrawlProfiler(tracer, top_n=5, snapshot_pages=1) as profiler:
+            for _ in range(2):
+                kept_alive += _allocate_stage(tracer, "fetch", 10_000)
+                kept_alive += _allocate_stage(tracer, "names", 200_000)
+
+        report = profiler.get_allocations_report()
+        self.assertIn("Stage fetch: 2 spans", report)
+        self.assertIn("Stage names: 2 spans", report)
+        names_report = report[report.index("Stage names"):]
+        # Only the first page is compared with snapshots, the allocating line is the one in _allocate_stage
+        self.assertIn("Top 5 allocating lines of the first 1 pages", names_report)
+        self.assertIn("test_profiling.py", names_report)
+        names_net_kib = float(names_report.split("net ")[1].split(" KiB")[0])
+        self.assertGreaterEqual(names_net_kib, 2 * 200_000 / 1024)
+
+        # The tracer stops notifying the stopped profiler
+        _allocate_stage(tracer, "names", 10)
+        self.assertIn("Stage names: 2 spans", profiler.get_allocations_report())
+
+    def test_write_reports(self):
+        tracer = Tracer()
+        with CrawlProfiler(tracer) as profiler:
+            _allocate_stage(tracer, "fetch", 1000)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_paths = profiler.write_reports(temp_dir)
+            self.assertEqual(len(report_paths), 3)
+            for report_path in report_paths:
+                self.assertTrue(os.path.getsize(report_path) > 0)
+            with open(report_paths[1], 'r', encoding='utf-8') as f:
+                self.assertIn("_allocate_stage", f.read())
+
+        with self.assertRaises(ValueError):
+            CrawlProfiler(tracer, top_n=0)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from rich.console import Console
+from globals.enums import LogMode, ProgressDisplay
+from globals.progress import ProgressReporter
+from globals.run_logger import run_logger
+from website.enums import EntityType
+
+class ProgressReporterTest(unittest.TestCase):
+    """Test class for the progress module."""
+
+    def test_concurrent_updates(self):
+        """Test that the pages and entities reported by several workers are all counted."""
+        reporter = ProgressReporter(max_pages=400, entity_types=EntityType, display=ProgressDisplay.NONE)
+
+        def worker():
+            for _ in range(100):
+                reporter.page_finished({EntityType.EMAIL: ["john@example.com"], EntityType.NAME: []})
+
+        with reporter:
+            workers = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            reporter.set_pages_queued(10)
+            snapshot = reporter.snapshot()
+
+        self.assertEqual(snapshot.pages_done, 400)
+        self.assertEqual(snapshot.entity_counts, {"email": 400, "name": 0, "phone_number": 0, "address": 0})
+        # No pages are left, even though some are queued
+        self.assertEqual(snapshot.eta_seconds, 0)
+        self.assertGreater(snapshot.pages_per_second, 0)
+
+    def test_eta(self):
+        with patch('globals.progress.time.perf_counter', side_effect=[0.0, 0.0, 2.0]):
+            reporter = ProgressReporter(max_pages=5, display=ProgressDisplay.NONE)
+            reporter.start()
+            reporter.page_finished(pages_queued=20)
+            snapshot = reporter.snapshot()
+
+        self.assertEqual(snapshot.pages_per_second, 0.5)
+        self.assertEqual(snapshot.eta_seconds, 8)
+        self.assertIn("Pages 1/5 done, 20 queued, 0.50 pages/s, ETA 8s", snapshot.describe())
+
+    def test_plain_text_display(self):
+        output = io.StringIO()
+        with patch('globals.progress.console', Console(file=output, width=200)):
+            with ProgressReporter(max_pages=2, display=ProgressDisplay.PLAIN_TEXT, refresh_seconds=0.01) as reporter:
+                reporter.page_finished()
+                deadline = time.monotonic() + 2
+                while "Pages 1/2 done" not in output.getvalue() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+        self.assertIn("Pages 1/2 done, 0 queued", output.getvalue())
+
+    def test_default_display(self):
+        self.addCleanup(run_logger.close)
+        run_logger.configure(LogMode.QUIET)
+        self.assertEqual(ProgressReporter().display, ProgressDisplay.NONE)
+        with self.assertRaises(ValueError):
+            ProgressReporter(max_pages=-1)
+        with self.assertRaises(TypeError):
+            ProgressReporter(display="rich")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from rich.console import Console
+from globals import constants as Constants
+from globals.enums import LogLevel, LogMode
+from globals.run_logger import RunLogger
+from website.enums import EntityType
+
+class RunLoggerTest(unittest.TestCase):
+    """Test class for the run_logger module."""
+
+    def setUp(self):
+        self.output = io.StringIO()
+        console_patcher = patch('globals.run_logger.console', Console(file=self.output, log_path=False, width=200))
+        console_patcher.start()
+        self.addCleanup(console_patcher.stop)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log_file_path = os.path.join(self.temp_dir.name, "run.jsonl")
+        self.logger = RunLogger()
+        self.addCleanup(self.logger.close)
+
+    def _log_run(self):
+        self.logger.log_page("https://example.com")
+        self.logger.log_entities("https://example.com", {EntityType.EMAIL: ["john@example.com"], EntityType.PHONE_NUMBER: ["+36 30 123 4567"]})
+        self.logger.log_message("Parsing completed", LogLevel.SUCCESS)
+        self.logger.log_message("Only 1 subpages could be parsed.", LogLevel.WARNING)
+        self.logger.log_summary("Parsing summary", {"pages": 1, "email": 1})
+
+    def test_rich_mode(self):
+        self._log_run()
+
+        output = self.output.getvalue()
+        self.assertIn("FOUND EMAIL: john@example.com", output)
+        self.assertIn("FOUND PHONE NUMBER: +36 30 123 4567", output)
+        self.assertIn("Parsing completed", output)
+
+    def test_quiet_mode(self):
+        self.logger.configure(LogMode.QUIET)
+        self._log_run()
+
+        output = self.output.getvalue()
+        self.assertNotIn("john@example.com", output)
+        self.assertNotIn("Parsing completed", output)
+        self.assertIn("Only 1 subpages could be parsed.", output)
+        self.assertIn("Parsing summary: pages: 1, email: 1", output)
+
+    def test_json_mode(self):
+        self.logger.configure(LogMode.JSON, self.log_file_path)
+        self._log_run()
+        # The lines are buffered until the buffer is full or the logger is flushed
+        self.assertEqual(os.path.getsize(self.log_file_path), 0)
+        self.logger.close()
+
+        with open(self.log_file_path, 'r', encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([event["event"] for event in events], ["page", "entity", "entity", "message", "message", "summary"])
+        self.assertEqual(events[1]["type"], "email")
+        self.assertEqual(events[1]["value"], "john@example.com")
+        self.assertEqual(events[5]["counts"], {"pages": 1, "email": 1})
+        self.assertNotIn("john@example.com", self.output.getvalue())
+        self.assertEqual(self.logger.mode, LogMode.RICH)
+
+    @patch.object(Constants, 'LOG_BUFFER_SIZE', 2)
+    def test_json_mode_flushes_full_buffer(self):
+        self.logger.configure(LogMode.JSON, self.log_file_path)
+        self.logger.log_entities("https://example.com", {EntityType.NAME: ["John Doe", "Jane Doe", "Jack Doe"]})
+
+        with open(self.log_file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            self.logger.configure(LogMode.JSON)
+        with self.assertRaises(TypeError):
+            self.logger.configure("quiet")
+        with self.assertRaises(TypeError):
+            self.logger.log_message("message", "info")
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from globals.tracing import StageTimings, Tracer
+
+class TracingTest(unittest.TestCase):
+    """Test class for the tracing module."""
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer()
+        tracer.record("fetch", time.perf_counter(), 0.5)
+        with tracer.span("export"):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = os.path.join(temp_dir, "trace.json")
+            tracer.write(trace_path)
+            with open(trace_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(json.load(f)["traceEvents"], [])
+
+    def test_chrome_trace(self):
+        tracer = Tracer()
+        tracer.enable()
+        start_time = time.perf_counter()
+        tracer.record("fetch", start_time, 0.25, url="https://example.com")
+        worker = threading.Thread(target=lambda: tracer.record("names", start_time + 0.25, 0.125))
+        worker.start()
+        worker.join()
+        with tracer.span("export", format="csv"):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = os.path.join(temp_dir, "trace.json")
+            tracer.write(trace_path)
+            with open(trace_path, 'r', encoding='utf-8') as f:
+                events = json.load(f)["traceEvents"]
+
+        self.assertEqual([event["name"] for event in events], ["fetch", "names", "export"])
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        self.assertEqual(events[0]["dur"], 250_000)
+        self.assertAlmostEqual(events[1]["ts"] - events[0]["ts"], 250_000, places=3)
+        self.assertEqual(events[0]["args"], {"url": "https://example.com"})
+        self.assertNotEqual(events[0]["tid"], events[1]["tid"])
+
+        tracer.disable()
+        tracer.record("fetch", start_time, 0.25)
+        self.assertFalse(tracer.enabled)
+
+    def test_stage_timings(self):
+        timings = StageTimings()
+        for index in range(1, 101):
+            timings.add({"fetch": index / 1000, "parse": 0.002})
+
+        self.assertEqual(timings.percentile("fetch", 50), 0.05)
+        self.assertEqual(timings.percentile("fetch", 99), 0.099)
+        self.assertEqual(timings.percentile("fetch", 0), 0.001)
+        summary = timings.summary()
+        self.assertEqual(list(summary), ["fetch", "parse"])
+        self.assertEqual(summary["fetch"], {"count": 100, "total ms": 5050.0, "p50 ms": 50.0, "p90 ms": 90.0, "p99 ms": 99.0, "max ms": 100.0})
+
+        with self.assertRaises(KeyError):
+            timings.percentile("export", 50)
+        with self.assertRaises(ValueError):
+            timings.percentile("fetch", 101)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
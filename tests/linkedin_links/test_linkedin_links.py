@@ -0,0 +1,214 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from ddgs.exceptions import RatelimitException
+from unittest.mock import patch
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from linkedin_links import CompanyProfiles, FixtureSearchBackend, RateLimiter, SearchCache, SearchResult, fetch_links, fetch_links_batch
+from linkedin_links.find_linkedin_links import _get_company_name_variants, _get_profile_key, _get_search_queries
+
+class _FakeSearch:
+    """Stand-in of the company search, throttled on the first calls of the given companies."""
+
+    def __init__(self, seconds: float = 0.0, throttled_calls: dict[str, int] | None = None):
+        self.seconds = seconds
+        self.throttled_calls = dict(throttled_calls or {})
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, company: str, profile_count: int, region: DataRegion, rate_limiter: RateLimiter, backend, cache=None, allow_partial=False) -> dict[str, str]:
+        rate_limiter.acquire()
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            is_throttled = self.throttled_calls.get(company, 0) > 0
+            if is_throttled:
+                self.throttled_calls[company] -= 1
+        try:
+            time.sleep(self.seconds)
+            if is_throttled:
+                raise RatelimitException("202 Ratelimit")
+            return {f"https://hu.linkedin.com/in/{company.lower()}-{index}": f"Employee {index}" for index in range(profile_count)}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+class _FailingQueryBackend(FixtureSearchBackend):
+    """Fixture backend raising the given error on the first searches of a query."""
+
+    def __init__(self, result_sets: dict[str, list[SearchResult]], failing_query: str, error: Exception, failure_count: int = 1):
+        super().__init__(result_sets)
+        self.failing_query = failing_query
+        self.error = error
+        self.failure_count = failure_count
+
+    def _search(self, search_query: str, max_results: int, search_region: str) -> list[SearchResult]:
+        with self._lock:
+            is_failing = search_query == self.failing_query and self.failure_count > 0
+            if is_failing:
+                self.failure_count -= 1
+        if is_failing:
+            raise self.error
+        return super()._search(search_query, max_results, search_region)
+
+@patch("linkedin_links.constants.SEARCH_BACKOFF_SECONDS", 0.01)
+class LinkedinLinksTest(unittest.TestCase):
+    """Test class for the concurrent batch search of the LinkedIn profile links."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+
+    def tearDown(self):
+        run_logger.close()
+
+    def test_batch_runs_concurrently(self):
+        companies = [f"Company{index}" for index in range(8)]
+        search = _FakeSearch(seconds=0.2)
+        with patch("linkedin_links.find_linkedin_links._search_company", search):
+            start_time = time.perf_counter()
+            results = list(fetch_links_batch(companies + ["Company0"], 2, DataRegion.HUNGARY, max_workers=4, requests_per_second=100))
+            elapsed_seconds = time.perf_counter() - start_time
+
+        self.assertEqual(sorted(result.company for result in results), companies)
+        self.assertTrue(all(len(result.profiles) == 2 and result.error is None for result in results))
+        self.assertEqual(search.max_running, 4)
+        # Eight searches of 0.2 seconds take 1.6 seconds one after the other
+        self.assertLess(elapsed_seconds, 1.0)
+
+    def test_throttled_searches_are_retried(self):
+        search = _FakeSearch(throttled_calls={"Throttled": 2, "Blocked": 10})
+        with patch("linkedin_links.find_linkedin_links._search_company", search):
+            results = {
+                result.company: result
+                for result in fetch_links_batch(["Throttled", "Blocked", "Fine"], 1, DataRegion.GREAT_BRITAIN, max_retries=3, requests_per_second=100)
+            }
+
+        self.assertEqual(results["Throttled"].attempts, 3)
+        self.assertEqual(len(results["Throttled"].profiles), 1)
+        self.assertEqual(results["Blocked"], CompanyProfiles("Blocked", {}, "RatelimitException: 202 Ratelimit", 4))
+        self.assertEqual(results["Fine"].attempts, 1)
+
+    def test_failed_query_variants(self):
+        """Test that a throttled query variant makes the whole search back off and that incomplete results aren't cached."""
+        queries = _get_search_queries("Example Ltd", DataRegion.GREAT_BRITAIN)
+        result_sets = {queries[0]: [SearchResult("https://www.linkedin.com/in/john-doe", "John Doe - Example Ltd")]}
+        throttled_backend = _FailingQueryBackend(result_sets, queries[1], RatelimitException("202 Ratelimit"))
+        failing_backend = _FailingQueryBackend(result_sets, queries[1], ValueError("Invalid response"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with SearchCache(os.path.join(temp_dir, "search_cache.sqlite")) as cache:
+                with patch("linkedin_links.constants.SEARCH_REQUESTS_PER_SECOND", 20):
+                    failed_profiles = fetch_links("Example Ltd", 3, DataRegion.GREAT_BRITAIN, cache, failing_backend)
+                self.assertEqual(len(failed_profiles), 1)
+                self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+                result = next(fetch_links_batch(["Example Ltd"], 3, DataRegion.GREAT_BRITAIN, requests_per_second=20, cache=cache, backend=throttled_backend))
+                cached_profiles = fetch_links("Example Ltd", 3, DataRegion.GREAT_BRITAIN, cache, throttled_backend)
+
+        self.assertEqual((result.attempts, result.error), (2, None))
+        self.assertEqual(result.profiles, failed_profiles)
+        # The retry found every variant, its result was cached
+        self.assertEqual(cached_profiles, failed_profiles)
+        self.assertEqual(cache.hits, 1)
+
+    def test_throttled_query_variant_keeps_the_other_profiles(self):
+        """Test that a query variant throttled after every retry doesn't drop the profiles of the other variants."""
+        queries = _get_search_queries("Example Ltd", DataRegion.GREAT_BRITAIN)
+        result_sets = {
+            query: [SearchResult(f"https://www.linkedin.com/in/employee-{index}", f"Employee {index} - Example Ltd")]
+            for index, query in enumerate(queries[:5])
+        }
+        backend = _FailingQueryBackend(result_sets, queries[-1], RatelimitException("202 Ratelimit"), failure_count=100)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with SearchCache(os.path.join(temp_dir, "search_cache.sqlite")) as cache:
+                with patch("linkedin_links.constants.SEARCH_REQUESTS_PER_SECOND", 100):
+                    profiles = fetch_links("Example Ltd", 10, DataRegion.GREAT_BRITAIN, cache, backend)
+                    # The incomplete result wasn't cached, the search is sent again
+                    fetch_links("Example Ltd", 10, DataRegion.GREAT_BRITAIN, cache, backend)
+
+        self.assertEqual(len(profiles), 5)
+        self.assertEqual(cache.hits, 0)
+
+    def test_throttled_search_without_profiles_raises(self):
+        queries = _get_search_queries("Example Ltd", DataRegion.GREAT_BRITAIN)
+        backend = _FailingQueryBackend({}, queries[0], RatelimitException("202 Ratelimit"), failure_count=100)
+
+        with patch("linkedin_links.constants.SEARCH_REQUESTS_PER_SECOND", 100):
+            with self.assertRaises(RuntimeError):
+                fetch_links("Example Ltd", 10, DataRegion.GREAT_BRITAIN, backend=backend)
+
+    def test_query_fan_out_deduplicates_profiles(self):
+        queries = _get_search_queries("Példa Kft.", DataRegion.HUNGARY)
+        backend = FixtureSearchBackend({
+            # The same profile is returned with a different subdomain, letter case and trailing slash
+            queries[0]: [
+                SearchResult("https://hu.linkedin.com/in/john-doe", "John Doe - Példa Kft."),
+                SearchResult("https://hu.linkedin.com/company/pelda", "Példa Kft. | LinkedIn"),
+                SearchResult("https://hu.linkedin.com/in/jane-doe", "Jane Doe – Mérnök"),
+            ],
+            queries[1]: [
+                SearchResult("https://www.linkedin.com/in/John-Doe/", "John Doe"),
+                SearchResult("https://www.linkedin.com/in/anna-kiss", "Anna Kiss, PhD"),
+            ],
+        })
+
+        with patch("linkedin_links.constants.SEARCH_REQUESTS_PER_SECOND", 20):
+            profiles = fetch_links("Példa Kft.", 3, DataRegion.HUNGARY, backend=backend)
+
+        self.assertEqual(
+            {_get_profile_key(url): name for url, name in profiles.items()},
+            {"/in/john-doe": "John Doe", "/in/jane-doe": "Jane Doe", "/in/anna-kiss": "Anna Kiss"},
+        )
+        # The variants that weren't started before the profile count was reached are never searched
+        self.assertLess(backend.search_count, len(queries))
+
+    def test_search_queries(self):
+        queries = _get_search_queries("Példa Kft.", DataRegion.HUNGARY)
+        self.assertEqual(queries[0], '"Példa Kft." site:hu.linkedin.com/in -jobs -company -posts')
+        self.assertEqual(queries[1], '"Példa Kft." site:linkedin.com/in -jobs -company -posts')
+        self.assertIn('"Pelda" site:hu.linkedin.com/in -jobs -company -posts', queries)
+        self.assertIn('"Példa Kft." mérnök site:hu.linkedin.com/in -jobs -company -posts', queries)
+        self.assertEqual(len(queries), len(set(queries)))
+        self.assertTrue(all("hu.linkedin.com" not in query for query in _get_search_queries("Example Ltd", DataRegion.GREAT_BRITAIN)))
+        self.assertEqual(_get_company_name_variants("Példa Kft."), ["Példa", "Pelda Kft.", "Pelda"])
+        self.assertEqual(_get_company_name_variants("Example"), [])
+
+    def test_rate_limiter(self):
+        rate_limiter = RateLimiter(requests_per_second=20)
+        start_time = time.perf_counter()
+        threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # The first request starts immediately, the others 50 ms apart
+        self.assertGreaterEqual(time.perf_counter() - start_time, 0.19)
+
+        rate_limiter.pause(0.1)
+        start_time = time.perf_counter()
+        rate_limiter.acquire()
+        self.assertGreaterEqual(time.perf_counter() - start_time, 0.09)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            fetch_links_batch("Company", 1, DataRegion.HUNGARY)
+        with self.assertRaises(TypeError):
+            fetch_links_batch(["Company", 1], 1, DataRegion.HUNGARY)
+        with self.assertRaises(ValueError):
+            fetch_links_batch(["Company"], 0, DataRegion.HUNGARY)
+        with self.assertRaises(ValueError):
+            fetch_links_batch(["Company"], 1, DataRegion.HUNGARY, max_workers=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+        with self.assertRaises(TypeError):
+            fetch_links("Company", 1, DataRegion.HUNGARY, backend={})
+        with self.assertRaises(ValueError):
+            FixtureSearchBackend({}, latency_seconds=-1)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
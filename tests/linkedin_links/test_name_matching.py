@@ -0,0 +1,72 @@
+import time
+import unittest
+from linkedin_links import NameMatch, ProfileNameIndex, match_names
+from linkedin_links.name_matching import get_name_tokens
+
+PROFILES = {
+    "https://hu.linkedin.com/in/peter-kovacs": "Péter Kovács",
+    "https://hu.linkedin.com/in/anna-kovacs": "Kovács Anna",
+    "https://hu.linkedin.com/in/gabor-nagy": "Dr. Nagy Gábor",
+    "https://www.linkedin.com/in/john-smith": "John Smith",
+}
+
+def _get_synthetic_name(index: int) -> str:
+    """Return a distinct two-word name made of letters, names are tokenized without digits."""
+    syllables = ("ka", "lo", "mi", "ne", "ro", "su", "ta", "vi", "ze", "bo")
+    first_name = "".join(syllables[int(digit)] for digit in f"{index:05d}")
+    return f"{first_name.capitalize()} {syllables[index % 10].capitalize()}{syllables[index // 10 % 10]}ny"
+
+class NameMatchingTest(unittest.TestCase):
+    """Test class for the name_matching module."""
+
+    def test_match_names(self):
+        names = {
+            "Kovács Péter": "https://example.com/team",
+            "P. Kovacs": "https://example.com/contact",
+            "Nagy Gabor": "https://example.com/team",
+            "Kovacz Péter": "https://example.com/about",
+            "Kiss Béla": "https://example.com/team",
+            "A. K.": "https://example.com/team",
+        }
+        matches = {match.name: match for match in match_names(names, PROFILES)}
+
+        self.assertEqual(
+            matches["Kovács Péter"],
+            NameMatch("Kovács Péter", "https://example.com/team", "https://hu.linkedin.com/in/peter-kovacs", "Péter Kovács", 1.0),
+        )
+        # The initial and the misspelled surname match with a lower score
+        self.assertEqual(matches["P. Kovacs"].profile_url, "https://hu.linkedin.com/in/peter-kovacs")
+        self.assertLess(matches["P. Kovacs"].score, 1.0)
+        self.assertEqual(matches["Kovacz Péter"].profile_url, "https://hu.linkedin.com/in/peter-kovacs")
+        self.assertEqual(matches["Nagy Gabor"].profile_url, "https://hu.linkedin.com/in/gabor-nagy")
+        # A shared surname isn't enough, and two initials never match on their own
+        self.assertNotIn("Kiss Béla", matches)
+        self.assertNotIn("A. K.", matches)
+
+    def test_get_name_tokens(self):
+        self.assertEqual(get_name_tokens("Dr. Kovács  P."), ["kovacs", "p."])
+        self.assertEqual(get_name_tokens("ifj. Nagy-Tóth Gábor"), ["nagy", "toth", "gabor"])
+
+    def test_index_is_faster_than_pairwise_comparison(self):
+        profiles = {f"https://hu.linkedin.com/in/employee-{index}": _get_synthetic_name(index) for index in range(20000)}
+        names = {" ".join(reversed(_get_synthetic_name(index).split())): "https://example.com/team" for index in range(0, 20000, 10)}
+
+        start_time = time.perf_counter()
+        matches = match_names(names, profiles)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        self.assertEqual(len(matches), 2000)
+        self.assertTrue(all(match.score == 1.0 for match in matches))
+        # 40 million pairwise comparisons would take minutes
+        self.assertLess(elapsed_seconds, 5)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            match_names(["John Smith"], PROFILES)
+        with self.assertRaises(TypeError):
+            ProfileNameIndex(list(PROFILES))
+        with self.assertRaises(ValueError):
+            ProfileNameIndex(PROFILES, min_score=0)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from linkedin_links import SearchCache, fetch_links, fetch_links_batch
+
+def _get_profiles(count: int) -> dict[str, str]:
+    return {f"https://hu.linkedin.com/in/employee-{index}": f"Employee {index}" for index in range(count)}
+
+class SearchCacheTest(unittest.TestCase):
+    """Test class for the search_cache module."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temp_dir.name, "search_cache.sqlite")
+
+    def tearDown(self):
+        run_logger.close()
+        self.temp_dir.cleanup()
+
+    def test_smaller_profile_count_is_answered_from_larger_result(self):
+        with SearchCache(self.database_path) as cache:
+            cache.put('"Company" site:linkedin.com/in', "hu-hu", 5, _get_profiles(5))
+
+        with SearchCache(self.database_path) as cache:
+            self.assertEqual(cache.get('"company"   SITE:linkedin.com/in', "hu-hu", 3), _get_profiles(3))
+            self.assertEqual(cache.get('"Company" site:linkedin.com/in', "hu-hu", 5), _get_profiles(5))
+            self.assertIsNone(cache.get('"Company" site:linkedin.com/in', "hu-hu", 6))
+            self.assertIsNone(cache.get('"Company" site:linkedin.com/in', "us-en", 3))
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_expired_results_are_not_returned(self):
+        with SearchCache(self.database_path, ttl_seconds=0.1) as cache:
+            cache.put("company", "hu-hu", 2, _get_profiles(2))
+            self.assertIsNotNone(cache.get("company", "hu-hu", 2))
+            time.sleep(0.15)
+            self.assertIsNone(cache.get("company", "hu-hu", 2))
+
+    def test_least_recently_used_results_are_evicted(self):
+        with SearchCache(self.database_path) as cache:
+            cache.put("company0", "hu-hu", 2, _get_profiles(2))
+            result_size = cache._connection.execute("SELECT size FROM search_results").fetchone()[0]
+
+        with SearchCache(self.database_path, max_bytes=2 * result_size) as cache:
+            cache.put("company1", "hu-hu", 2, _get_profiles(2))
+            # Using the first result makes the second one the least recently used
+            self.assertIsNotNone(cache.get("company0", "hu-hu", 2))
+            cache.put("company2", "hu-hu", 2, _get_profiles(2))
+
+            self.assertIsNotNone(cache.get("company0", "hu-hu", 2))
+            self.assertIsNone(cache.get("company1", "hu-hu", 2))
+            self.assertIsNotNone(cache.get("company2", "hu-hu", 2))
+
+    def test_cached_searches_are_not_repeated(self):
+        with SearchCache(self.database_path) as cache, \
+                patch("linkedin_links.find_linkedin_links._get_profile_results", side_effect=lambda query, count, region, backend: _get_profiles(count)) as search:
+            self.assertEqual(fetch_links("Company", 4, DataRegion.HUNGARY, cache), _get_profiles(4))
+            self.assertEqual(fetch_links("Company", 2, DataRegion.HUNGARY, cache), _get_profiles(2))
+            results = list(fetch_links_batch(["Company", "Other"], 3, DataRegion.HUNGARY, requests_per_second=10, cache=cache))
+
+        # Only the first search of each company is sent to the search engine
+        self.assertEqual(search.call_count, 2)
+        results_by_company = {result.company: result for result in results}
+        self.assertTrue(results_by_company["Company"].is_cached)
+        self.assertEqual(results_by_company["Company"].attempts, 0)
+        self.assertEqual(results_by_company["Company"].profiles, _get_profiles(3))
+        self.assertFalse(results_by_company["Other"].is_cached)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            SearchCache(None)
+        with self.assertRaises(ValueError):
+            SearchCache(self.database_path, ttl_seconds=0)
+        with self.assertRaises(ValueError):
+            SearchCache(self.database_path, max_bytes=0)
+        with self.assertRaises(TypeError):
+            fetch_links("Company", 2, DataRegion.HUNGARY, cache=self.database_path)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
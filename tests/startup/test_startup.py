@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "../../src"))
+# Modules that take seconds to import or load large data files, they must only be imported at first use
+HEAVY_MODULES = ["spacy", "postal", "phonenumbers", "ddgs", "selenium"]
+# Cumulative import time budgets in microseconds, as reported by python -X importtime
+MAIN_IMPORT_BUDGET_US = 300_000
+PACKAGES_IMPORT_BUDGET_US = 1_000_000
+
+class StartupTest(unittest.TestCase):
+    """Test class guarding the startup time of the command line interface."""
+
+    def _run_with_importtime(self, *args: str) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+        """Run Python with -X importtime from the src folder.
+
+        Returns:
+            tuple: The finished process and the cumulative import times. Key: module name, Value: microseconds
+        """
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=120,
+        )
+
+        import_times = dict()
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, module_name = line.split("|")
+            import_times[module_name.strip()] = int(cumulative.strip())
+
+        return process, import_times
+
+    def _assert_no_heavy_modules(self, import_times: dict[str, int]):
+        for module_name in import_times:
+            self.assertNotIn(module_name.split(".")[0], HEAVY_MODULES, f"{module_name} is imported at startup")
+
+    def test_import_main_within_budget(self):
+        process, import_times = self._run_with_importtime("-c", "import main")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self._assert_no_heavy_modules(import_times)
+        self.assertLess(import_times["main"], MAIN_IMPORT_BUDGET_US)
+
+    def test_help_does_not_import_heavy_modules(self):
+        process, import_times = self._run_with_importtime("main.py", "--help")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertIn("--region", process.stdout)
+        self._assert_no_heavy_modules(import_times)
+
+    def test_invalid_region_does_not_import_heavy_modules(self):
+        process, import_times = self._run_with_importtime("main.py", "--link", "https://example.com", "--region", "xx")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertIn("Unsupported region", process.stdout)
+        self._assert_no_heavy_modules(import_times)
+
+    def test_import_packages_within_budget(self):
+        process, import_times = self._run_with_importtime("-c", "import website, linkedin_links, export_data")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+        for module_name in import_times:
+            self.assertNotIn(module_name.split(".")[0], ["spacy", "postal", "phonenumbers", "ddgs"], f"{module_name} is imported by the packages")
+        total_import_time = import_times["website"] + import_times["linkedin_links"] + import_times["export_data"]
+        self.assertLess(total_import_time, PACKAGES_IMPORT_BUDGET_US)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
-from website.models import WebsiteInfo
+from website.enums import EntityType
+from website.models import PageResult, WebsiteInfo
 
 # get_mock_parse() was created by GitHub Copilot
 def get_mock_parse():
@@ -29,6 +30,18 @@ def get_mock_parse_all():
         ),
     ]
 
+def get_mock_parse_page():
+    """Return a side effect for _parse_page that adds the data of get_mock_parse_all() to the accumulator page by page."""
+    mock_infos = iter(get_mock_parse_all())
+
+    def mock_parse_page(website_url, info, region, fetcher, limits):
+        mock_info = next(mock_infos)
+        new_urls = [url for url in sorted(mock_info.found_urls) if info.add_url(url)]
+        new_emails = [email for email, url in mock_info.found_emails.items() if info.add_email(email, url)]
+        return PageResult(website_url, {EntityType.EMAIL: new_emails}, new_urls)
+
+    return mock_parse_page
+
 def get_html_content_basic():
     return HTML_CONTENT_BASIC
 
@@ -0,0 +1,82 @@
+import unittest
+from website.entity_store import EntityOccurrence, EntityStore
+from website.enums import EntityType, Extractor
+from website.models import WebsiteInfo, WebsiteInfoAccumulator
+
+class EntityStoreTest(unittest.TestCase):
+    """Test class for the entity_store module."""
+
+    def test_add_and_occurrences(self):
+        store = EntityStore()
+
+        self.assertTrue(store.add(EntityType.EMAIL, "info@example.com", "https://example.com", Extractor.EMAILS))
+        self.assertFalse(store.add(EntityType.EMAIL, "info@example.com", "https://example.com", Extractor.EMAILS))
+        self.assertFalse(store.add(EntityType.EMAIL, "info@example.com", "https://example.com/page1", Extractor.EMAILS))
+        self.assertTrue(store.add(EntityType.NAME, "John Doe", "https://example.com/page1", Extractor.NAMES))
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.page_count, 2)
+        self.assertEqual(list(store.urls()), ["https://example.com", "https://example.com/page1"])
+        self.assertTrue(store.contains(EntityType.EMAIL, "info@example.com"))
+        self.assertFalse(store.contains(EntityType.NAME, "info@example.com"))
+        self.assertEqual(store.count(EntityType.EMAIL, "info@example.com"), 3)
+        self.assertEqual(store.count(EntityType.EMAIL, "missing@example.com"), 0)
+        self.assertEqual(store.first_url(EntityType.EMAIL, "info@example.com"), "https://example.com")
+        self.assertEqual(store.occurrences(EntityType.EMAIL, "info@example.com"), [
+            EntityOccurrence("https://example.com", Extractor.EMAILS, 2),
+            EntityOccurrence("https://example.com/page1", Extractor.EMAILS, 1),
+        ])
+        self.assertEqual(store.first_urls(EntityType.NAME), {"John Doe": "https://example.com/page1"})
+
+        with self.assertRaises(KeyError):
+            store.occurrences(EntityType.EMAIL, "missing@example.com")
+        with self.assertRaises(TypeError):
+            store.add("email", "info@example.com", "https://example.com", Extractor.EMAILS)
+        with self.assertRaises(TypeError):
+            store.add(EntityType.EMAIL, "info@example.com", "https://example.com", "emails")
+
+    def test_rank(self):
+        store = EntityStore()
+        for page_index in range(3):
+            store.add(EntityType.EMAIL, "footer@example.com", f"https://example.com/page{page_index}", Extractor.EMAILS)
+        store.add(EntityType.EMAIL, "first@example.com", "https://example.com/page0", Extractor.EMAILS)
+        store.add(EntityType.EMAIL, "second@example.com", "https://example.com/page1", Extractor.EMAILS)
+
+        self.assertEqual(store.rank(EntityType.EMAIL), [
+            ("footer@example.com", 3),
+            ("first@example.com", 1),
+            ("second@example.com", 1),
+        ])
+        self.assertEqual(store.rank(EntityType.EMAIL, limit=1), [("footer@example.com", 3)])
+        self.assertEqual(store.rank(EntityType.ADDRESS), [])
+
+        with self.assertRaises(ValueError):
+            store.rank(EntityType.EMAIL, limit=-1)
+
+    def test_copy_is_independent(self):
+        store = EntityStore()
+        store.add(EntityType.PHONE_NUMBER, "+36 30 123 4567", "https://example.hu", Extractor.PHONE_NUMBERS)
+        store_copy = store.copy()
+        store.add(EntityType.PHONE_NUMBER, "+36 30 123 4567", "https://example.hu/page1", Extractor.PHONE_NUMBERS)
+        store.add(EntityType.PHONE_NUMBER, "+36 20 987 6543", "https://example.hu/page1", Extractor.PHONE_NUMBERS)
+
+        self.assertEqual(len(store_copy), 1)
+        self.assertEqual(store_copy.count(EntityType.PHONE_NUMBER, "+36 30 123 4567"), 1)
+        self.assertEqual(store.count(EntityType.PHONE_NUMBER, "+36 30 123 4567"), 2)
+
+    def test_accumulator_snapshot_is_immutable(self):
+        accumulator = WebsiteInfoAccumulator()
+        accumulator.add_email("info@example.com", "https://example.com")
+        snapshot = accumulator.snapshot()
+        accumulator.add_email("info@example.com", "https://example.com/page1")
+        accumulator.add_name("John Doe", "https://example.com/page1")
+
+        self.assertEqual(snapshot.found_names, {})
+        self.assertEqual(snapshot.entity_store.count(EntityType.EMAIL, "info@example.com"), 1)
+        self.assertEqual(accumulator.entity_store.count(EntityType.EMAIL, "info@example.com"), 2)
+
+        restored = WebsiteInfoAccumulator.from_info(WebsiteInfo(set(), {"info@example.com": "https://example.com"}, {}, {}, {}))
+        self.assertEqual(restored.snapshot().found_emails, {"info@example.com": "https://example.com"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from bs4 import BeautifulSoup
+from types import SimpleNamespace
+from unittest.mock import patch
+from globals.enums import DataRegion, LogLevel
+from website import ExtractionLimits, get_addresses, get_names
+from website.enums import Extractor
+from website.data_extractors import _iter_page_segments, _iter_segments
+
+class _RecordingModel:
+    """Stand-in of a spaCy model recording the texts it was given."""
+
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def pipe(self, texts, batch_size):
+        for text in texts:
+            self.texts.append(text)
+            yield SimpleNamespace(ents=[])
+
+class ExtractionLimitsTest(unittest.TestCase):
+    """Test class for the size limits of the text given to the NLP models."""
+
+    def test_segments(self):
+        text = "First line.\nSecond line is here. It has two sentences.\n\n" + "word " * 30 + "\n" + "x" * 25
+        segments = list(_iter_segments(text, 24))
+
+        self.assertTrue(all(0 < len(segment) <= 24 for segment in segments))
+        # Short lines are joined, long lines are split into sentences, then on whitespace, then anywhere
+        self.assertEqual(segments[0], "First line.")
+        self.assertEqual(segments[1], "Second line is here.")
+        self.assertEqual(segments[2], "It has two sentences.")
+        self.assertEqual(segments[3], "word word word word word")
+        self.assertEqual(segments[-2:], ["x" * 24, "x"])
+        self.assertEqual(" ".join(segments).split().count("word"), 30)
+        self.assertEqual(list(_iter_segments("Short text", 24)), ["Short text"])
+
+    @patch("website.data_extractors.run_logger.log_message")
+    def test_page_limit_keeps_whole_words(self, mock_log_message):
+        texts = ["First paragraph", "Kovács Péter ügyvezető"]
+
+        # The limit falls in the middle of "Péter"
+        segments = list(_iter_page_segments(texts, 24, 100, Extractor.NAMES))
+
+        self.assertEqual(segments, ["First paragraph", "Kovács"])
+        self.assertEqual(list(_iter_page_segments(["x" * 30], 10, 100, Extractor.NAMES)), ["x" * 10])
+        self.assertEqual(mock_log_message.call_count, 2)
+
+    @patch("website.data_extractors.run_logger.log_message")
+    @patch("website.model_registry.model_registry.get_spacy_model")
+    def test_names_are_chunked_and_the_page_is_limited(self, mock_spacy_model, mock_log_message):
+        model = _RecordingModel()
+        mock_spacy_model.return_value = model
+        sentence = "Kovács Péter a cég ügyvezetője, Nagy Anna a pénzügyi vezető. "
+        content = BeautifulSoup(f"<p>{sentence * 1000}</p><p>Szabó Gábor</p>", "html.parser")
+        limits = ExtractionLimits(max_page_characters=20_000, max_ner_segment_characters=1000)
+
+        get_names("https://example.hu", content, {}, DataRegion.HUNGARY, limits)
+
+        self.assertGreater(len(model.texts), 1)
+        self.assertTrue(all(len(text) <= 1000 for text in model.texts))
+        self.assertLessEqual(sum(len(text) for text in model.texts), 20_000)
+        # The sentences aren't cut in half, and the text after the page limit isn't given to the model
+        self.assertTrue(all(text.endswith(".") for text in model.texts[:-1]))
+        self.assertNotIn("Szabó Gábor", model.texts)
+        mock_log_message.assert_called_once()
+        self.assertEqual(mock_log_message.call_args.args[1], LogLevel.WARNING)
+
+    @patch("website.model_registry.model_registry.get_address_parser")
+    def test_addresses_are_chunked_by_lines(self, mock_address_parser):
+        parsed_texts = []
+        mock_address_parser.return_value = lambda text, country: parsed_texts.append(text) or []
+        lines = [f"Line {index} of a long listing of the offices" for index in range(100)]
+        content = BeautifulSoup(f"<pre>{chr(10).join(lines)}</pre>", "html.parser")
+
+        get_addresses("https://example.com", content, {}, DataRegion.GREAT_BRITAIN, ExtractionLimits(max_address_segment_characters=200))
+
+        self.assertTrue(all(len(text) <= 200 for text in parsed_texts))
+        self.assertEqual("\n".join(parsed_texts).splitlines(), lines)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            ExtractionLimits(max_page_characters=0)
+        with self.assertRaises(ValueError):
+            ExtractionLimits(max_ner_segment_characters=2_000_000)
+        with self.assertRaises(TypeError):
+            get_names("https://example.com", BeautifulSoup("<p>Text</p>", "html.parser"), {}, DataRegion.HUNGARY, {"max_page_characters": 10})
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,121 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from selenium.common.exceptions import WebDriverException
+from website import PooledWebDriverFetcher, WebDriverNode
+
+_FIRST_NODE_URL = "http://chrome_selenium:4444/wd/hub"
+_SECOND_NODE_URL = "http://chrome_selenium_2:4444/wd/hub"
+
+@patch("website.fetchers.webdriver.Remote")
+@patch("website.fetchers._is_node_healthy")
+class PooledWebDriverFetcherTest(unittest.TestCase):
+    """Test class for the PooledWebDriverFetcher class."""
+
+    def setUp(self):
+        self.sessions: list[MagicMock] = []
+        self.down_urls: set[str] = set()
+
+    def _create_session(self, remote_url: str, options=None) -> MagicMock:
+        if remote_url in self.down_urls:
+            raise WebDriverException(f"Failed to connect to {remote_url}")
+        session = MagicMock()
+        session.remote_url = remote_url
+        session.page_source = "<html></html>"
+        self.sessions.append(session)
+        return session
+
+    def _is_node_healthy(self, remote_url: str) -> bool:
+        return remote_url not in self.down_urls
+
+    def _mock_nodes(self, mock_is_node_healthy: MagicMock, mock_remote: MagicMock):
+        mock_is_node_healthy.side_effect = self._is_node_healthy
+        mock_remote.side_effect = self._create_session
+
+    def test_sessions_are_reused(self, mock_is_node_healthy, mock_remote):
+        self._mock_nodes(mock_is_node_healthy, mock_remote)
+        fetcher = PooledWebDriverFetcher(_FIRST_NODE_URL, max_sessions=2)
+        fetcher.warm_up()
+        self.assertEqual(len(self.sessions), 2)
+
+        threads = [threading.Thread(target=fetcher.fetch, args=(f"https://example.com/page{index}",)) for index in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.sessions), 2)
+        self.assertEqual(sum(session.get.call_count for session in self.sessions), 6)
+
+        fetcher.close()
+        self.assertTrue(all(session.quit.called for session in self.sessions))
+
+    def test_failed_session_is_replaced(self, mock_is_node_healthy, mock_remote):
+        self._mock_nodes(mock_is_node_healthy, mock_remote)
+        fetcher = PooledWebDriverFetcher(_FIRST_NODE_URL, max_sessions=1)
+        fetcher.warm_up()
+        self.sessions[0].get.side_effect = WebDriverException("invalid session id")
+
+        self.assertEqual(fetcher.fetch("https://example.com"), "<html></html>")
+        self.assertEqual(len(self.sessions), 2)
+        self.sessions[0].quit.assert_called_once()
+        self.sessions[1].quit.assert_not_called()
+
+    def test_sessions_are_spread_over_the_nodes(self, mock_is_node_healthy, mock_remote):
+        self._mock_nodes(mock_is_node_healthy, mock_remote)
+        fetcher = PooledWebDriverFetcher(nodes=[WebDriverNode(_FIRST_NODE_URL, 2), WebDriverNode(_SECOND_NODE_URL, 2)])
+        self.assertEqual(fetcher.max_sessions, 4)
+
+        # Every page waits until four pages are rendered at once, so each needs its own session
+        barrier = threading.Barrier(4)
+        def render(url: str):
+            barrier.wait(timeout=5)
+        threads = [threading.Thread(target=fetcher.fetch, args=(f"https://example.com/page{index}",)) for index in range(4)]
+        with patch("website.fetchers._render_page", lambda session, url: render(url) or session.page_source):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(session.remote_url for session in self.sessions), [_FIRST_NODE_URL] * 2 + [_SECOND_NODE_URL] * 2)
+        self.assertEqual({url: load["idle"] for url, load in fetcher.get_node_loads().items()}, {_FIRST_NODE_URL: 2, _SECOND_NODE_URL: 2})
+
+    def test_failover_to_a_healthy_node(self, mock_is_node_healthy, mock_remote):
+        self._mock_nodes(mock_is_node_healthy, mock_remote)
+        # The equally loaded nodes are taken in the given order, so the pages start on the node that dies
+        with patch("website.fetchers.random.sample", lambda nodes, count: list(nodes)):
+            fetcher = PooledWebDriverFetcher(nodes=[WebDriverNode(_FIRST_NODE_URL, 1), WebDriverNode(_SECOND_NODE_URL, 1)])
+        fetcher.warm_up()
+        dead_session = next(session for session in self.sessions if session.remote_url == _FIRST_NODE_URL)
+        dead_session.get.side_effect = WebDriverException("Connection refused")
+        self.down_urls.add(_FIRST_NODE_URL)
+
+        for index in range(3):
+            self.assertEqual(fetcher.fetch(f"https://example.com/page{index}"), "<html></html>")
+        node_loads = fetcher.get_node_loads()
+        self.assertFalse(node_loads[_FIRST_NODE_URL]["healthy"])
+        self.assertEqual(node_loads[_SECOND_NODE_URL], {"healthy": True, "busy": 0, "idle": 1, "capacity": 1})
+        dead_session.quit.assert_called_once()
+
+        self.down_urls.add(_SECOND_NODE_URL)
+        fetcher.close()
+        fetcher = PooledWebDriverFetcher(nodes=[WebDriverNode(_FIRST_NODE_URL), WebDriverNode(_SECOND_NODE_URL)])
+        with self.assertRaises(WebDriverException):
+            fetcher.fetch("https://example.com")
+
+    def test_invalid_arguments(self, mock_is_node_healthy, mock_remote):
+        with self.assertRaises(ValueError):
+            PooledWebDriverFetcher(max_sessions=0)
+        with self.assertRaises(ValueError):
+            PooledWebDriverFetcher(_FIRST_NODE_URL, nodes=[WebDriverNode(_SECOND_NODE_URL)])
+        with self.assertRaises(ValueError):
+            PooledWebDriverFetcher(nodes=[])
+
+    def test_node_from_string(self, mock_is_node_healthy, mock_remote):
+        self.assertEqual(WebDriverNode.from_string(f"{_SECOND_NODE_URL}=4"), WebDriverNode(_SECOND_NODE_URL, 4))
+        self.assertEqual(WebDriverNode.from_string(_FIRST_NODE_URL), WebDriverNode(_FIRST_NODE_URL, 2))
+        for node in ("chrome_selenium:4444", f"{_FIRST_NODE_URL}=0"):
+            with self.assertRaises(ValueError):
+                WebDriverNode.from_string(node)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
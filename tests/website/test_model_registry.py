@@ -0,0 +1,60 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from globals.enums import DataRegion
+from website import constants as Constants
+from website.model_registry import ModelRegistry
+
+class ModelRegistryTest(unittest.TestCase):
+    """Test class for the model_registry module."""
+
+    @patch("spacy.load")
+    def test_get_spacy_model_loads_each_model_once(self, mock_load):
+        mock_load.side_effect = lambda name: MagicMock(name=name)
+        registry = ModelRegistry()
+
+        # Cycling through every region must not reload any model
+        for _ in range(3):
+            for region in DataRegion:
+                registry.get_spacy_model(region)
+
+        loaded_models = sorted(call.args[0] for call in mock_load.call_args_list)
+        self.assertEqual(loaded_models, sorted([Constants.SPACY_MODEL_EN, Constants.SPACY_MODEL_HU]))
+        self.assertIs(registry.get_spacy_model(DataRegion.UNITED_STATES), registry.get_spacy_model(DataRegion.GREAT_BRITAIN))
+
+        with self.assertRaises(TypeError):
+            registry.get_spacy_model("hu")
+
+    @patch("spacy.load")
+    def test_warm_up_shares_model_with_concurrent_request(self, mock_load):
+        load_started = threading.Event()
+        release_load = threading.Event()
+
+        def slow_load(name):
+            load_started.set()
+            release_load.wait(timeout=5)
+            return MagicMock(name=name)
+
+        mock_load.side_effect = slow_load
+        registry = ModelRegistry()
+
+        with patch.object(ModelRegistry, "get_address_parser"):
+            warm_up_thread = registry.warm_up([DataRegion.HUNGARY])
+            self.assertTrue(load_started.wait(timeout=5))
+
+            # Request the model while the warm-up is still loading it
+            result = {}
+            request_thread = threading.Thread(target=lambda: result.setdefault("model", registry.get_spacy_model(DataRegion.HUNGARY)))
+            request_thread.start()
+            release_load.set()
+            request_thread.join(timeout=5)
+            warm_up_thread.join(timeout=5)
+
+        mock_load.assert_called_once_with(Constants.SPACY_MODEL_HU)
+        self.assertIs(result["model"], registry.get_spacy_model(DataRegion.HUNGARY))
+
+        with self.assertRaises(TypeError):
+            registry.warm_up(["hu"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import gc
+import tracemalloc
+import unittest
+from bs4 import BeautifulSoup
+from unittest.mock import MagicMock, patch
+from globals.enums import DataRegion, LogMode
+from globals.run_logger import run_logger
+from globals.tracing import tracer
+from website import Fetcher, PageContent, get_phone_numbers, parse
+from website.enums import PipelineStage
+from website.models import WebsiteInfo
+from ..benchmarks import benchmark
+
+PAGE_SIZES = (100, 1000)
+
+def _get_page_html(paragraph_count: int) -> str:
+    """Generate a page with a contact paragraph, a link and a table row per paragraph."""
+    rows = "".join(
+        f"<div><p>Contact employee{index}@example.com or call +44 20 7946 {index % 10000:04d}.</p>"
+        f"<a href=\"/team/{index}\">Team {index}</a><table><tr><td>Row {index}</td></tr></table></div>"
+        for index in range(paragraph_count)
+    )
+    return f"<html><body>{rows}<a href=\"tel:+442079460000\">Call us</a></body></html>"
+
+class _StaticFetcher(Fetcher):
+    """Fetcher returning the same HTML for every URL."""
+
+    def __init__(self, html: str):
+        self.html = html
+
+    def _fetch(self, url: str) -> str:
+        return self.html
+
+class PageContentTest(unittest.TestCase):
+    """Test class for the PageContent model and the memory used by a page."""
+
+    def setUp(self):
+        run_logger.configure(LogMode.QUIET)
+
+    def tearDown(self):
+        run_logger.close()
+
+    def test_from_soup(self):
+        content = PageContent.from_soup(BeautifulSoup(_get_page_html(2), "html.parser"))
+
+        self.assertEqual(content.links, ["/team/0", "/team/1", "tel:+442079460000"])
+        self.assertIn("Contact employee1@example.com or call +44 20 7946 0001.", content.texts)
+        self.assertIn("Row 0", content.texts)
+        self.assertNotIn("", content.texts)
+        self.assertTrue(content.text.endswith("\ntel:+442079460000"))
+
+    def test_phone_numbers_outside_the_visible_text(self):
+        """Test that the phone numbers of JSON-LD scripts and of attributes are found, like when the whole HTML was searched."""
+        html = (
+            "<html><head><script type=\"application/ld+json\">"
+            "{\"@context\": \"https://schema.org\", \"@type\": \"Organization\", \"telephone\": \"+36 1 234 5678\"}"
+            "</script></head><body><p>Call +36 30 123 4567</p>"
+            "<button data-phone=\"+44 20 7946 0958\">Call our London office</button></body></html>"
+        )
+
+        phone_numbers = get_phone_numbers("https://example.hu", BeautifulSoup(html, "html.parser"), {}, DataRegion.HUNGARY)
+
+        self.assertEqual(set(phone_numbers), {"+36 1 234 5678", "+36 30 123 4567", "+44 20 7946 0958"})
+
+    @benchmark
+    @patch("website.model_registry.model_registry.get_address_parser", return_value=lambda text, country: [])
+    @patch("website.model_registry.model_registry.get_spacy_model", return_value=MagicMock(return_value=MagicMock(ents=[])))
+    def test_tree_is_released_before_the_extractors(self, mock_spacy_model, mock_address_parser):
+        """Test that only the lightweight page content is alive while the extractors run, for every page size."""
+        # The modules imported and the caches filled by the first page aren't measured
+        parse("https://example.com", WebsiteInfo(set(), {}, {}, {}, {}), DataRegion.GREAT_BRITAIN, _StaticFetcher(_get_page_html(1)))
+
+        for paragraph_count in PAGE_SIZES:
+            html = _get_page_html(paragraph_count)
+            html_bytes = len(html)
+            extraction_memory: dict[str, int] = {}
+
+            def on_span_end(name: str, args: dict):
+                if name == PipelineStage.SUBLINKS.value:
+                    extraction_memory["traced"] = tracemalloc.get_traced_memory()[0]
+
+            gc.collect()
+            tracemalloc.start()
+            try:
+                tree = BeautifulSoup(html, "html.parser")
+                tree_bytes = tracemalloc.get_traced_memory()[0]
+                tree.decompose()
+                del tree
+
+                start_bytes = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                tracer.add_listener(on_span_end)
+                try:
+                    info = parse("https://example.com", WebsiteInfo(set(), {}, {}, {}, {}), DataRegion.GREAT_BRITAIN, _StaticFetcher(html))
+                finally:
+                    tracer.remove_listener(on_span_end)
+                peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+            finally:
+                tracemalloc.stop()
+
+            retained_bytes = extraction_memory["traced"] - start_bytes
+            print(
+                f"\n{html_bytes / 1024:8.1f} KiB HTML: tree {tree_bytes / 1024:9.1f} KiB, "
+                f"while extracting {retained_bytes / 1024:9.1f} KiB, peak {peak_bytes / 1024:9.1f} KiB"
+            )
+            self.assertEqual(len(info.found_emails), paragraph_count)
+            self.assertIn("+44 20 7946 0000", info.found_phone_numbers)
+            # The texts and links of the page take a fraction of the memory of the tree
+            self.assertLess(retained_bytes, tree_bytes / 4)
+            # The peak is reached while the tree is built, no other copy of the whole document is made
+            self.assertLess(peak_bytes, tree_bytes * 1.5)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
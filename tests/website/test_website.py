@@ -3,9 +3,13 @@ from bs4 import BeautifulSoup
 from unittest.mock import patch
 from .mock_data import *
 from globals.enums import DataRegion
+from website.enums import EntityType
+from website.models import WebsiteInfoAccumulator
 from website import (
     parse,
     parse_all,
+    iter_parse,
+    PageResult,
     get_sublinks,
     get_names,
     get_emails,
@@ -18,7 +22,7 @@ from website import (
 class WebsiteTest(unittest.TestCase):
     """Test class for the website module."""
 
-    @patch("website.website.webdriver.Remote")
+    @patch("website.fetchers.webdriver.Remote")
     def test_parse(self, mock_remote):
         mock_remote.return_value = get_mock_parse()
         website_url = "https://example.com"
@@ -36,9 +40,9 @@ class WebsiteTest(unittest.TestCase):
             parse("Invalid URL", info, region)
 
     @patch("builtins.input", return_value="n")
-    @patch("website.website.parse")
-    def test_parse_all(self, mock_parse, mock_input):
-        mock_parse.side_effect = get_mock_parse_all()
+    @patch("website.website._parse_page")
+    def test_parse_all(self, mock_parse_page, mock_input):
+        mock_parse_page.side_effect = get_mock_parse_page()
 
         region = DataRegion.HUNGARY
         result = parse_all("https://example.com", 1, region)
@@ -54,6 +58,33 @@ class WebsiteTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_all("https://example.com", -1, region)
 
+    @patch("website.website._parse_page")
+    def test_iter_parse(self, mock_parse_page):
+        mock_parse_page.side_effect = get_mock_parse_page()
+
+        region = DataRegion.HUNGARY
+        info = WebsiteInfoAccumulator()
+        pages = iter_parse("https://example.com", 1, region, info)
+        mock_parse_page.assert_not_called()
+
+        first_page = next(pages)
+        self.assertIsInstance(first_page, PageResult)
+        self.assertEqual(first_page.url, "https://example.com")
+        self.assertEqual(first_page.new_entities[EntityType.EMAIL], ["email1@example.com"])
+        self.assertIn("https://example.com/page1", first_page.discovered_links)
+
+        second_page = next(pages)
+        self.assertEqual(second_page.new_entities[EntityType.EMAIL], ["email2@example.com"])
+        self.assertEqual(second_page.discovered_links, ["https://example.com/page2"])
+        self.assertEqual(list(pages), [])
+        self.assertEqual(len(info.snapshot().found_emails), 2)
+
+        # Arguments are validated before the iteration starts
+        with self.assertRaises(ValueError):
+            iter_parse("Invalid URL", 1, region)
+        with self.assertRaises(TypeError):
+            iter_parse("https://example.com", 1, region, WebsiteInfo(set(), {}, {}, {}, {}))
+
     def test_get_sublinks(self):
         html_content = get_html_content_sublinks()
         found_urls_empty = set()